@@ -0,0 +1,8 @@
+"""
+PySNT benchmark suite.
+
+Run with ``python -m benchmarks run`` from the repository root; see README.md.
+"""
+
+# Benchmark modules, in run order ('startup' initializes SNT for the Java benchmarks)
+BENCHMARK_MODULES = ('bench_startup', 'bench_conversion', 'bench_display', 'bench_io', 'bench_tracing')
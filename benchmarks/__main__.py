@@ -0,0 +1,79 @@
+"""
+Command line interface of the PySNT benchmark suite.
+
+Examples
+--------
+$ python -m benchmarks run --output results/0.2.0.json
+$ python -m benchmarks run --java --filter tree_to --quick
+$ python -m benchmarks compare results/0.1.0.json results/0.2.0.json --threshold 1.2
+$ python -m benchmarks compare results/0.1.0.json results/0.2.0.json --metric nodes_per_second
+$ python -m benchmarks list
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT / 'src'))
+sys.path.insert(0, str(_ROOT))
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+from benchmarks import BENCHMARK_MODULES  # noqa: E402
+from benchmarks.harness import (  # noqa: E402
+    BENCHMARKS, DEFAULT_THRESHOLD, compare_results, format_comparison, run_benchmarks, save_results,
+)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='PySNT benchmark suite')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='run benchmarks and save results as JSON')
+    run.add_argument('-o', '--output', default='benchmark-results.json', help='results file')
+    run.add_argument('-f', '--filter', help='run only benchmarks whose name contains this text')
+    run.add_argument('-r', '--repeat', type=int, default=5, help='timing samples per case (default: 5)')
+    run.add_argument('--quick', action='store_true', help='run only the two smallest sizes of each benchmark')
+    run.add_argument('--java', action='store_true', help='initialize SNT and run the Java benchmarks')
+
+    compare = commands.add_parser('compare', help='compare two results files')
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('-t', '--threshold', type=float, default=DEFAULT_THRESHOLD,
+                         help=f'ratio of medians reported as a regression (default: {DEFAULT_THRESHOLD})')
+    compare.add_argument('-m', '--metric', help='compare this metric (e.g., nodes_per_second) instead of times')
+
+    commands.add_parser('list', help='list benchmarks')
+    args = parser.parse_args(argv)
+
+    for module in BENCHMARK_MODULES:
+        importlib.import_module(f'benchmarks.{module}')
+
+    if args.command == 'list':
+        for bench in BENCHMARKS:
+            requires = f"  (requires: {', '.join(bench.requires)})" if bench.requires else ''
+            print(f"{bench.name}{requires}")
+        return 0
+
+    if args.command == 'compare':
+        baseline, current = (json.loads(Path(p).read_text()) for p in (args.baseline, args.current))
+        rows = compare_results(baseline, current, args.threshold, args.metric)
+        print(format_comparison(rows, args.metric))
+        regressions = [row for row in rows if row['status'] == 'regression']
+        print(f"\n{len(rows)} case(s) compared, {len(regressions)} regression(s) (threshold {args.threshold}x)")
+        return 1 if regressions else 0
+
+    print(f"Running benchmarks (repeat={args.repeat}{', quick' if args.quick else ''}"
+          f"{', java' if args.java else ''})")
+    results = run_benchmarks(BENCHMARKS, repeat=args.repeat, quick=args.quick, pattern=args.filter,
+                             java=args.java)
+    save_results(results, args.output, java=args.java, quick=args.quick)
+    print(f"Results saved to {args.output}")
+    return 1 if any('error' in r for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Conversion benchmarks: Tree, SNTTable, SNTGraph and SNTChart to Python objects.
+
+The offline cases convert the synthetic stand-ins and measure pysnt's own overhead;
+the 'java_*' cases convert real SNT objects built from the same synthetic data.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from benchmarks import synthetic
+from benchmarks.harness import benchmark
+
+NODE_COUNTS = (1_000, 10_000, 100_000)
+GRAPH_NODE_COUNTS = (1_000, 10_000, 50_000)
+TABLE_ROWS = (100, 1_000, 10_000)
+TABLE_COLUMNS = 20
+CHART_SIZES = (400, 800, 1600)
+
+
+@benchmark(params={'n_nodes': NODE_COUNTS})
+def tree_to_points(n_nodes):
+    import pysnt
+    tree = synthetic.Tree(n_nodes)
+    return lambda: pysnt.tree_to_points(tree)
+
+
+@benchmark(params={'n_nodes': NODE_COUNTS})
+def tree_to_arrays(n_nodes):
+    import pysnt
+    tree = synthetic.Tree(n_nodes)
+    return lambda: pysnt.tree_to_arrays(tree)
+
+
+@benchmark(params={'n_rows': TABLE_ROWS}, requires=('pandas',))
+def snt_table(n_rows):
+    from pysnt.converters.structured_data_converters import _convert_snt_table
+    table = synthetic.SNTTable(n_rows, TABLE_COLUMNS)
+    return lambda: _convert_snt_table(table)
+
+
+@benchmark(params={'n_nodes': GRAPH_NODE_COUNTS}, requires=('networkx',))
+def snt_graph(n_nodes):
+    from pysnt.converters.graph_converters import _convert_snt_graph
+    graph = synthetic.DirectedWeightedGraph(synthetic.Tree(n_nodes))
+    return lambda: _convert_snt_graph(graph)
+
+
+@benchmark(params={'width': CHART_SIZES})
+def snt_chart(width):
+    """In-memory chart conversion, with the JFreeChart export replaced by fixed PNG bytes."""
+    from pysnt.converters import chart_converters
+
+    chart = synthetic.SNTChart(width, width * 3 // 4)
+
+    def convert():
+        import matplotlib.pyplot as plt
+        with mock.patch.object(chart_converters, '_export_chart_bytes', return_value=chart.png):
+            result = chart_converters._convert_snt_chart(chart, format='png', in_memory=True)
+        plt.close(result['data'])
+    return convert
+
+
+@benchmark(params={'n_nodes': NODE_COUNTS}, requires=('java',))
+def java_tree_to_points(n_nodes):
+    import pysnt
+    tree = _load_java_tree(n_nodes)
+    return lambda: pysnt.tree_to_points(tree)
+
+
+@benchmark(requires=('java',))
+def java_demo_tree_to_points():
+    import pysnt
+    tree = pysnt.SNTService().demoTree('fractal')
+    return lambda: pysnt.tree_to_points(tree)
+
+
+@benchmark(params={'n_nodes': NODE_COUNTS}, requires=('java',))
+def java_tree_to_arrays(n_nodes):
+    import pysnt
+    tree = _load_java_tree(n_nodes)
+    return lambda: pysnt.tree_to_arrays(tree)
+
+
+@benchmark(params={'n_rows': TABLE_ROWS}, requires=('java', 'pandas'))
+def java_snt_table(n_rows):
+    import numpy as np
+    import scyjava
+    from pysnt.converters.structured_data_converters import _convert_snt_table
+
+    table = scyjava.jimport('sc.fiji.snt.analysis.SNTTable')()
+    values = np.random.default_rng(synthetic.DEFAULT_SEED).normal(size=(n_rows, TABLE_COLUMNS))
+    for row in values:
+        table.appendRow()
+        for column, value in enumerate(row):
+            table.appendToLastRow(f"Metric {column}", float(value))
+    return lambda: _convert_snt_table(table)
+
+
+@benchmark(params={'n_nodes': GRAPH_NODE_COUNTS}, requires=('java', 'networkx'))
+def java_snt_graph(n_nodes):
+    from pysnt.converters.graph_converters import _convert_snt_graph
+    graph = _load_java_tree(n_nodes).getGraph()
+    return lambda: _convert_snt_graph(graph)
+
+
+@benchmark(params={'format': ('png', 'svg')}, requires=('java',))
+def java_snt_chart(format):
+    import scyjava
+    from pysnt.converters.chart_converters import _convert_snt_chart
+
+    stats = scyjava.jimport('sc.fiji.snt.analysis.TreeStatistics')(_load_java_tree(10_000))
+    chart = stats.getHistogram('Branch length')
+    return lambda: _convert_snt_chart(chart, format=format, in_memory=True)
+
+
+def _load_java_tree(n_nodes):
+    """Load a synthetic reconstruction as an SNT Tree (through an SWC file)."""
+    import scyjava
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = synthetic.write_swc(Path(tmp) / f"synthetic_{n_nodes}.swc", n_nodes)
+        tree = scyjava.jimport('sc.fiji.snt.Tree')(str(path))
+    if tree.isEmpty():
+        raise RuntimeError(f"Could not load synthetic reconstruction with {n_nodes} nodes")
+    return tree
@@ -0,0 +1,69 @@
+"""
+Display benchmarks: rendering of converted Trees, tables and graphs with matplotlib.
+
+Figures are drawn on the Agg canvas so that the timings include rasterization.
+"""
+
+from benchmarks import synthetic
+from benchmarks.harness import benchmark
+
+NODE_COUNTS = (1_000, 10_000, 100_000)
+GRAPH_NODE_COUNTS = (250, 1_000)
+LOD_GRAPH_NODE_COUNTS = (1_000, 10_000, 50_000)
+HEATMAP_ROWS = (10_000, 100_000, 1_000_000)
+HEATMAP_COLUMNS = 20
+
+
+@benchmark(params={'n_nodes': NODE_COUNTS, 'color_by': (None, 'path_distance')})
+def plot_trees(n_nodes, color_by):
+    import pysnt
+    arrays = pysnt.tree_to_arrays(synthetic.Tree(n_nodes))
+
+    def render():
+        fig = pysnt.plot_trees(arrays, color_by=color_by)
+        fig.canvas.draw()
+        _close(fig)
+    return render
+
+
+@benchmark(params={'n_rows': HEATMAP_ROWS, 'row_order': ('table', 'pc1')}, requires=('pandas',))
+def binned_heatmap(n_rows, row_order):
+    import numpy as np
+    import xarray as xr
+    from pysnt.display.data_display import _display_dataset_as_binned_heatmap
+
+    values = np.random.default_rng(synthetic.DEFAULT_SEED).normal(size=(n_rows, HEATMAP_COLUMNS))
+    dataset = xr.Dataset({f"Metric {i}": ('index', values[:, i]) for i in range(HEATMAP_COLUMNS)})
+
+    def render():
+        if not _display_dataset_as_binned_heatmap(dataset, row_order=row_order):
+            raise RuntimeError("Binned heatmap display failed")
+    return render
+
+
+@benchmark(params={'n_nodes': GRAPH_NODE_COUNTS}, requires=('networkx',))
+def graph(n_nodes):
+    return _graph_renderer(n_nodes, lod=False)
+
+
+@benchmark(params={'n_nodes': LOD_GRAPH_NODE_COUNTS}, requires=('networkx',))
+def graph_lod(n_nodes):
+    return _graph_renderer(n_nodes, lod=True)
+
+
+def _graph_renderer(n_nodes, lod):
+    from pysnt.converters.graph_converters import _convert_snt_graph
+    from pysnt.display.visual_display import _graph_to_matplotlib
+
+    nx_graph = _convert_snt_graph(synthetic.DirectedWeightedGraph(synthetic.Tree(n_nodes)))['data']
+
+    def render():
+        fig = _graph_to_matplotlib(nx_graph, lod=lod, graph_type='DirectedWeightedGraph')
+        fig.canvas.draw()
+        _close(fig)
+    return render
+
+
+def _close(fig):
+    import matplotlib.pyplot as plt
+    plt.close(fig)
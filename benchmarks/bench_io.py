@@ -0,0 +1,34 @@
+"""
+I/O benchmarks: loading OME-Zarr volumes as ImgPlus.
+"""
+
+import atexit
+import shutil
+import tempfile
+from pathlib import Path
+
+from benchmarks import synthetic
+from benchmarks.harness import benchmark
+
+# (z, y, x) volume shapes; chunks are 32 planes of the full XY extent
+VOLUME_SHAPES = ((32, 256, 256), (64, 512, 512), (128, 1024, 1024))
+
+
+@benchmark(params={'shape': VOLUME_SHAPES}, requires=('java', 'zarr'))
+def imgplus_from_zarr(shape):
+    from pysnt.io import imgplus_from_zarr as load
+
+    store = synthetic.write_ome_zarr(_scratch_dir() / f"volume_{'x'.join(map(str, shape))}.ome.zarr",
+                                     shape, chunks=(min(32, shape[0]),) + tuple(shape[1:]))
+    return lambda: load(str(store))
+
+
+_SCRATCH = []
+
+
+def _scratch_dir() -> Path:
+    """Temporary directory shared by this module's benchmarks, removed at exit."""
+    if not _SCRATCH:
+        _SCRATCH.append(Path(tempfile.mkdtemp(prefix='pysnt-bench-')))
+        atexit.register(shutil.rmtree, _SCRATCH[0], ignore_errors=True)
+    return _SCRATCH[0]
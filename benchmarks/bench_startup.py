@@ -0,0 +1,40 @@
+"""
+Startup benchmarks: importing pysnt and initializing SNT.
+
+'import pysnt' runs in fresh interpreters (timed inside the subprocess, so that
+interpreter startup is excluded). 'initialize' is timed once and leaves SNT running
+for the Java benchmarks that follow it.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.harness import benchmark
+
+_SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+
+_IMPORT_SCRIPT = f"""
+import sys, time
+sys.path.insert(0, {str(_SRC_DIR)!r})
+t0 = time.perf_counter()
+import pysnt
+print(time.perf_counter() - t0)
+"""
+
+
+@benchmark(self_timed=True)
+def import_pysnt():
+    def run():
+        result = subprocess.run([sys.executable, '-c', _IMPORT_SCRIPT], capture_output=True, text=True, check=True)
+        return float(result.stdout.strip().splitlines()[-1])
+    return run
+
+
+@benchmark(requires=('fiji',), one_shot=True)
+def initialize():
+    from pysnt.core import initialize as initialize_snt, is_initialized
+
+    if is_initialized():
+        raise RuntimeError("SNT is already initialized; initialize must run first")
+    return lambda: initialize_snt(interactive=False, mode='headless')
@@ -0,0 +1,162 @@
+"""
+Tracing benchmarks: point-to-point searches on synthetic tubular volumes.
+
+Each case traces a tube of known centerline (synthetic.tubular_volume()) from one
+end to the other with TracerThread or BiSearch, for each combination of cost
+function, heuristic and search image. Besides the time to path (the timed
+duration), cases record the nodes expanded (per second), the peak JVM heap growth
+during the search and the accuracy of the path against the centerline.
+"""
+
+import threading
+import time
+from typing import Any, Dict
+
+import numpy as np
+
+from benchmarks import synthetic
+from benchmarks.harness import benchmark
+
+# (z, y, x) volume shapes
+VOLUME_SHAPES = ((32, 128, 128), (64, 256, 256), (64, 512, 512))
+SEARCHES = ('tracer', 'bisearch')
+COSTS = ('reciprocal', 'difference', 'difference_sq', 'one_minus_erf')
+HEURISTICS = ('euclidean', 'dijkstra')
+SEARCH_IMAGES = ('map', 'array')
+
+TUBE_RADIUS = 2.0
+NOISE = 0.2
+
+# Interval (seconds) between JVM heap samples during a search
+_HEAP_SAMPLE_INTERVAL = 0.005
+
+_VOLUMES = {}
+
+
+@benchmark(params={'shape': VOLUME_SHAPES, 'search': SEARCHES, 'cost': COSTS, 'heuristic': HEURISTICS,
+                   'search_image': SEARCH_IMAGES}, requires=('java',), repeat=3, self_timed=True)
+def search(shape, search, cost, heuristic, search_image):
+    import scyjava
+    from pysnt.tracing.batch import _search_factory
+
+    volume, centerline, image = _volume(shape)
+    calibration = scyjava.jimport('ij.measure.Calibration')()
+    new_search = _search_factory(image, calibration, _cost(cost, volume), _heuristic(heuristic, calibration),
+                                 search == 'bisearch', search_image, 0)
+    start, goal = np.rint(centerline[0]).astype(int), np.rint(centerline[-1]).astype(int)
+
+    def run():
+        tracer = new_search(start, goal)
+        with HeapSampler() as heap:
+            t0 = time.perf_counter()
+            tracer.run()
+            seconds = time.perf_counter() - t0
+        return dict(trace_metrics(tracer, centerline, seconds), peak_heap_bytes=heap.peak)
+    return run
+
+
+def trace_metrics(tracer: Any, centerline: np.ndarray, seconds: float) -> Dict[str, float]:
+    """Return the throughput and accuracy measurements of a finished search."""
+    from pysnt.tracing.batch import _explored, path_nodes
+
+    expanded = _explored(tracer)
+    path = tracer.getResult()
+    metrics = {
+        'seconds': seconds,
+        'nodes_expanded': float('nan') if expanded is None else expanded,
+        'nodes_per_second': float('nan') if expanded is None else expanded / max(seconds, 1e-9),
+        'found': float(path is not None),
+    }
+    metrics.update(path_accuracy(path_nodes(path) if path is not None else np.empty((0, 3)), centerline))
+    return metrics
+
+
+def path_accuracy(nodes: np.ndarray, centerline: np.ndarray, tolerance: float = TUBE_RADIUS) -> Dict[str, float]:
+    """
+    Compare a traced path with the ground-truth centerline.
+
+    Parameters
+    ----------
+    nodes : np.ndarray
+        (M, 3) path node coordinates (x, y, z)
+    centerline : np.ndarray
+        (N, 3) densely sampled centerline (x, y, z)
+    tolerance : float
+        Distance within which a centerline sample counts as covered by the path
+
+    Returns
+    -------
+    dict
+        'mean_error' and 'max_error' (distances of path nodes to the centerline)
+        and 'coverage' (fraction of the centerline within tolerance of the path);
+        errors are NaN and coverage 0 for an empty path
+    """
+    if not len(nodes):
+        return {'mean_error': float('nan'), 'max_error': float('nan'), 'coverage': 0.0}
+    distances = np.linalg.norm(nodes[:, None, :] - centerline[None, :, :], axis=2)
+    to_centerline = distances.min(axis=1)
+    return {
+        'mean_error': float(to_centerline.mean()),
+        'max_error': float(to_centerline.max()),
+        'coverage': float((distances.min(axis=0) <= tolerance).mean()),
+    }
+
+
+class HeapSampler:
+    """Sample the used JVM heap on a background thread; 'peak' is the growth over the starting level."""
+
+    def __init__(self, interval: float = _HEAP_SAMPLE_INTERVAL):
+        import scyjava
+
+        self.interval = interval
+        self.peak = 0
+        self._runtime = scyjava.jimport('java.lang.Runtime').getRuntime()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def __enter__(self) -> 'HeapSampler':
+        self._runtime.gc()
+        self._baseline = self._used()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self._used() - self._baseline)
+
+    def _used(self) -> int:
+        return int(self._runtime.totalMemory()) - int(self._runtime.freeMemory())
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, self._used() - self._baseline)
+
+
+def _volume(shape):
+    """Synthetic volume, its centerline and its ImgLib2 copy, cached per shape."""
+    if shape not in _VOLUMES:
+        from pysnt.tracing.cost_volumes import _to_java
+
+        volume, centerline = synthetic.tubular_volume(shape, radius=TUBE_RADIUS, noise=NOISE)
+        _VOLUMES[shape] = (volume, centerline, _to_java(volume, copy=True))
+    return _VOLUMES[shape]
+
+
+def _cost(name: str, volume: np.ndarray) -> Any:
+    import scyjava
+
+    low, high = float(volume.min()), float(volume.max())
+    if name == 'one_minus_erf':
+        OneMinusErf = scyjava.jimport('sc.fiji.snt.tracing.cost.OneMinusErf')
+        return OneMinusErf(high, float(volume.mean()), float(volume.std()))
+    classes = {'reciprocal': 'Reciprocal', 'difference': 'Difference', 'difference_sq': 'DifferenceSq'}
+    return scyjava.jimport(f'sc.fiji.snt.tracing.cost.{classes[name]}')(low, high)
+
+
+def _heuristic(name: str, calibration: Any) -> Any:
+    import scyjava
+
+    if name == 'dijkstra':
+        return scyjava.jimport('sc.fiji.snt.tracing.heuristic.Dijkstra')()
+    return scyjava.jimport('sc.fiji.snt.tracing.heuristic.Euclidean')(calibration)
@@ -0,0 +1,341 @@
+"""
+Benchmark registry, timing and result comparison for the PySNT benchmark suite.
+
+Benchmarks are functions decorated with @benchmark. They receive one value per
+declared parameter, do their setup, and return a zero-argument callable: only that
+callable is timed. Self-timed callables may also return other measurements (e.g.,
+throughput or accuracy), recorded as per-case 'metrics'. Results are stored as JSON
+so that runs from different releases can be compared with compare_results().
+"""
+
+import itertools
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Format version of the results JSON
+RESULTS_VERSION = 1
+
+# Ratio of medians above (below) which a benchmark is reported as a regression (improvement)
+DEFAULT_THRESHOLD = 1.25
+
+# Metrics for which higher values are better (all others, like times, are better lower)
+HIGHER_IS_BETTER = ('nodes_per_second', 'coverage', 'found')
+
+# Minimum total duration of one timing sample (seconds), as in timeit.Timer.autorange()
+_MIN_SAMPLE_TIME = 0.2
+
+_PACKAGES = ('pysnt', 'numpy', 'matplotlib', 'xarray', 'pandas', 'networkx', 'scyjava', 'jpype', 'imagej',
+             'zarr', 'dask')
+
+BENCHMARKS: List['Benchmark'] = []
+
+
+class Benchmark:
+    """A registered benchmark and its parameter grid."""
+
+    def __init__(self, func: Callable, name: str, params: Dict[str, Sequence[Any]], requires: Tuple[str, ...],
+                 repeat: Optional[int], one_shot: bool, self_timed: bool):
+        self.func = func
+        self.name = name
+        self.params = params
+        self.requires = requires
+        self.repeat = repeat
+        self.one_shot = one_shot
+        self.self_timed = self_timed
+
+    def cases(self, quick: bool = False) -> List[Dict[str, Any]]:
+        """Parameter combinations to run (the two smallest values per parameter if quick)."""
+        names = list(self.params)
+        values = [list(self.params[n])[:2] if quick else list(self.params[n]) for n in names]
+        return [dict(zip(names, combo)) for combo in itertools.product(*values)]
+
+
+def benchmark(name: Optional[str] = None, params: Optional[Dict[str, Sequence[Any]]] = None,
+              requires: Iterable[str] = (), repeat: Optional[int] = None, one_shot: bool = False,
+              self_timed: bool = False):
+    """
+    Register a benchmark.
+
+    Parameters
+    ----------
+    name : str, optional
+        Benchmark name (default: '<module>.<function>' without the 'bench_' prefix)
+    params : dict, optional
+        Parameter grid: each key is passed to the function as a keyword argument
+    requires : iterable of str
+        Requirements checked before running: 'fiji' (Java benchmarks enabled and a
+        configured Fiji installation), 'java' (an initialized SNT context) or an
+        importable module name
+    repeat : int, optional
+        Number of timing samples (default: the runner's setting)
+    one_shot : bool, default False
+        Time a single call (for operations that cannot be repeated, e.g., initialize)
+    self_timed : bool, default False
+        The returned callable measures and returns its own duration in seconds
+        (e.g., to time a subprocess without its interpreter startup), or a dict
+        of measurements holding the duration as 'seconds'
+    """
+    def decorator(func):
+        module = func.__module__.rsplit('.', 1)[-1].replace('bench_', '')
+        BENCHMARKS.append(Benchmark(func, name or f"{module}.{func.__name__}", dict(params or {}),
+                                    tuple(requires), repeat, one_shot, self_timed))
+        return func
+    return decorator
+
+
+def missing_requirement(requires: Iterable[str], java: bool = False) -> Optional[str]:
+    """Return the first unmet requirement, or None if all are met."""
+    for requirement in requires:
+        if requirement in ('java', 'fiji') and not java:
+            return 'Java benchmarks disabled (run with --java)'
+        if requirement == 'java':
+            from pysnt.core import is_initialized
+            if not is_initialized():
+                return 'SNT not initialized'
+        elif requirement == 'fiji':
+            from pysnt import setup_utils
+            if not setup_utils.is_fiji_valid():
+                return 'no valid Fiji installation configured'
+        else:
+            try:
+                __import__(requirement)
+            except ImportError:
+                return f"module '{requirement}' not installed"
+    return None
+
+
+def time_callable(func: Callable, repeat: int, one_shot: bool = False, self_timed: bool = False) -> Dict[str, Any]:
+    """
+    Time a callable.
+
+    After one warm-up call, the number of calls per sample is calibrated so that each
+    sample lasts at least 0.2 s; reported times are per call.
+
+    Returns
+    -------
+    dict
+        'number' (calls per sample), 'repeat' and per-call 'min', 'median', 'mean'
+        and 'stdev' in seconds, and the median of each other measurement returned
+        by a self-timed callable as 'metrics'
+    """
+    metrics = None
+    if self_timed:
+        samples = [func() for _ in range(1 if one_shot else repeat)]
+        number = 1
+        if samples and isinstance(samples[0], dict):
+            metrics = {name: statistics.median(float(sample[name]) for sample in samples)
+                       for name in samples[0] if name != 'seconds'}
+            samples = [sample['seconds'] for sample in samples]
+    elif one_shot:
+        t0 = time.perf_counter()
+        func()
+        samples, number = [time.perf_counter() - t0], 1
+    else:
+        func()  # warm-up: first-call costs (imports, caches) are not representative
+        timer = timeit.Timer(func)
+        number = 1
+        while True:
+            elapsed = timer.timeit(number)
+            if elapsed >= _MIN_SAMPLE_TIME or number >= 10 ** 6:
+                break
+            number *= 10 if elapsed < _MIN_SAMPLE_TIME / 10 else 2
+        samples = [elapsed / number] + [t / number for t in timer.repeat(repeat=repeat - 1, number=number)]
+    timing = {
+        'number': number,
+        'repeat': len(samples),
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.fmean(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+    if metrics is not None:
+        timing['metrics'] = metrics
+    return timing
+
+
+def run_benchmarks(benchmarks: Sequence[Benchmark], repeat: int = 5, quick: bool = False,
+                   pattern: Optional[str] = None, java: bool = False) -> List[Dict[str, Any]]:
+    """
+    Run benchmarks and return one result record per parameter combination.
+
+    Parameters
+    ----------
+    benchmarks : sequence of Benchmark
+        Benchmarks to run, in order
+    repeat : int, default 5
+        Number of timing samples per case
+    quick : bool, default False
+        Run only the two smallest values of each parameter
+    pattern : str, optional
+        Run only benchmarks whose name contains this substring
+    java : bool, default False
+        Enable benchmarks requiring Java (SNT is initialized by 'startup.initialize')
+    """
+    results = []
+    for bench in benchmarks:
+        if pattern and pattern not in bench.name:
+            continue
+        for case in bench.cases(quick):
+            record = {'name': bench.name, 'params': case}
+            reason = missing_requirement(bench.requires, java)
+            if reason:
+                record['skipped'] = reason
+                print(f"  {_case_label(record):<50} skipped: {reason}")
+                results.append(record)
+                continue
+            try:
+                func = bench.func(**case)
+                record.update(time_callable(func, bench.repeat or repeat, bench.one_shot, bench.self_timed))
+                print(f"  {_case_label(record):<50} {_format_seconds(record['median']):>10} "
+                      f"(±{_format_seconds(record['stdev'])}, n={record['number']}x{record['repeat']})")
+            except Exception as e:
+                record['error'] = f"{type(e).__name__}: {e}"
+                print(f"  {_case_label(record):<50} error: {record['error']}")
+            finally:
+                _close_figures()
+            results.append(record)
+    return results
+
+
+def environment_info() -> Dict[str, Any]:
+    """Describe the machine, package versions and source revision of a run."""
+    versions = {}
+    for package in _PACKAGES:
+        try:
+            module = __import__(package)
+            versions[package] = getattr(module, '__version__', 'unknown')
+        except Exception:
+            versions[package] = None
+    versions['snt'] = _snt_version()
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'versions': versions,
+        'git_commit': _git_commit(),
+    }
+
+
+def save_results(results: List[Dict[str, Any]], path: os.PathLike, java: bool, quick: bool) -> Dict[str, Any]:
+    """Write results and environment information to a JSON file."""
+    document = {
+        'version': RESULTS_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'java': java,
+        'quick': quick,
+        'environment': environment_info(),
+        'results': results,
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, default=str))
+    return document
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = DEFAULT_THRESHOLD, metric: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Compare two result documents by median time, or by another metric.
+
+    Parameters
+    ----------
+    metric : str, optional
+        Compare this per-case metric (e.g., 'nodes_per_second') instead of the
+        median time. For metrics in HIGHER_IS_BETTER, a regression is a ratio
+        below 1 / threshold
+
+    Returns
+    -------
+    list of dict
+        One row per benchmark case measured in both runs, with 'name', 'params',
+        'baseline', 'current', 'ratio' and 'status' ('regression', 'improvement'
+        or 'unchanged')
+    """
+    base_values = {_case_key(r): v for r in baseline['results'] if (v := _value(r, metric)) is not None}
+    higher_is_better = metric in HIGHER_IS_BETTER
+    rows = []
+    for record in current['results']:
+        key = _case_key(record)
+        value = _value(record, metric)
+        if value is None or key not in base_values or base_values[key] <= 0:
+            continue
+        ratio = value / base_values[key]
+        worse, better = (ratio < 1 / threshold, ratio > threshold) if higher_is_better else \
+            (ratio > threshold, ratio < 1 / threshold)
+        status = 'regression' if worse else 'improvement' if better else 'unchanged'
+        rows.append({'name': record['name'], 'params': record['params'], 'baseline': base_values[key],
+                     'current': value, 'ratio': ratio, 'status': status})
+    return rows
+
+
+def format_comparison(rows: List[Dict[str, Any]], metric: Optional[str] = None) -> str:
+    """Format compare_results() rows as a text table."""
+    formatter = _format_seconds if metric is None else '{:.4g}'.format
+    lines = [f"{'benchmark':<50}{'baseline':>12}{'current':>12}{'ratio':>8}  status"]
+    for row in rows:
+        lines.append(f"{_case_label(row):<50}{formatter(row['baseline']):>12}"
+                     f"{formatter(row['current']):>12}{row['ratio']:>8.2f}  {row['status']}")
+    return '\n'.join(lines)
+
+
+def _value(record: Dict[str, Any], metric: Optional[str]) -> Optional[float]:
+    """Return the median time of a result record, or one of its metrics."""
+    if metric is None:
+        return record.get('median')
+    return record.get('metrics', {}).get(metric)
+
+
+def _case_key(record: Dict[str, Any]) -> str:
+    return f"{record['name']}{json.dumps(record['params'], sort_keys=True)}"
+
+
+def _case_label(record: Dict[str, Any]) -> str:
+    params = ','.join(f"{k}={v}" for k, v in record['params'].items())
+    return f"{record['name']}[{params}]" if params else record['name']
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def _snt_version() -> Optional[str]:
+    """Return the version of SNT if it is running in this process."""
+    try:
+        from pysnt.core import is_initialized
+        if not is_initialized():
+            return None
+        import scyjava
+        return str(scyjava.jimport('sc.fiji.snt.SNTUtils').VERSION)
+    except Exception:
+        return None
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, timeout=10,
+                              cwd=Path(__file__).parent).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def _close_figures() -> None:
+    if 'matplotlib.pyplot' in sys.modules:
+        sys.modules['matplotlib.pyplot'].close('all')
@@ -0,0 +1,288 @@
+"""
+Synthetic, seeded test data for the PySNT benchmark suite.
+
+The Python-side objects mimic the SNT classes the converters and displays consume
+(Tree, SWCPoint, SNTTable, DirectedWeightedGraph, SNTChart), so that pysnt's own
+overhead can be measured offline, without a JVM. write_swc() and write_ome_zarr()
+create files for the Java benchmarks, and tubular_volume() images with a known
+centerline for the tracing benchmarks.
+"""
+
+import io
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_SEED = 42
+
+# Probability that a node continues its parent's branch rather than starting a new one
+_CONTINUATION_PROBABILITY = 0.97
+
+
+def swc_table(n_nodes: int, seed: int = DEFAULT_SEED) -> np.ndarray:
+    """
+    Generate a random, connected neuron-like reconstruction.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n_nodes, 7) with SWC columns id, type, x, y, z, radius, parent
+        (ids are 1-based; the root's parent is -1)
+    """
+    rng = np.random.default_rng(seed)
+    parents = np.arange(-1, n_nodes - 1)
+    branch = rng.random(n_nodes) > _CONTINUATION_PROBABILITY
+    branch[:2] = False
+    parents[branch] = (rng.random(branch.sum()) * np.flatnonzero(branch)).astype(int)
+
+    steps = rng.normal(size=(n_nodes, 3))
+    steps /= np.linalg.norm(steps, axis=1, keepdims=True)
+    xyz = np.zeros((n_nodes, 3))
+    for i in range(1, n_nodes):
+        xyz[i] = xyz[parents[i]] + steps[i]
+
+    table = np.empty((n_nodes, 7))
+    table[:, 0] = np.arange(1, n_nodes + 1)
+    table[:, 1] = np.where(np.arange(n_nodes) == 0, 1, rng.choice([2, 3], size=n_nodes))
+    table[:, 2:5] = xyz
+    table[:, 5] = rng.uniform(0.2, 2.0, size=n_nodes)
+    table[:, 6] = np.where(parents < 0, -1, parents + 1)
+    return table
+
+
+def write_swc(path: Path, n_nodes: int, seed: int = DEFAULT_SEED) -> Path:
+    """Write a synthetic reconstruction to an SWC file."""
+    table = swc_table(n_nodes, seed)
+    lines = [f"{int(r[0])} {int(r[1])} {r[2]:.4f} {r[3]:.4f} {r[4]:.4f} {r[5]:.4f} {int(r[6])}" for r in table]
+    path = Path(path)
+    path.write_text("# synthetic reconstruction\n" + "\n".join(lines) + "\n")
+    return path
+
+
+def write_ome_zarr(path: Path, shape: Tuple[int, ...], chunks: Tuple[int, ...], seed: int = DEFAULT_SEED) -> Path:
+    """Write a single-level OME-NGFF (0.4) store holding a random uint16 (z, y, x) volume."""
+    import zarr
+
+    data = np.random.default_rng(seed).integers(0, 4096, size=shape, dtype=np.uint16)
+    root = zarr.open_group(str(path), mode='w')
+    create = getattr(root, 'create_array', None) or root.create_dataset
+    create('0', shape=shape, chunks=chunks, dtype=data.dtype)[...] = data
+    root.attrs['multiscales'] = [{
+        'version': '0.4',
+        'axes': [{'name': name, 'type': 'space', 'unit': 'micrometer'} for name in 'zyx'[-len(shape):]],
+        'datasets': [{'path': '0', 'coordinateTransformations': [{'type': 'scale', 'scale': [1.0] * len(shape)}]}],
+    }]
+    return Path(path)
+
+
+def tubular_volume(shape: Tuple[int, ...], radius: float = 2.0, noise: float = 0.2, background: float = 0.1,
+                   seed: int = DEFAULT_SEED) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Render a bright, smoothly curving tube crossing a noisy volume along X.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        (z, y, x) or (y, x) volume shape
+    radius : float, default 2.0
+        Tube radius (standard deviation of its Gaussian profile, in voxels)
+    noise : float, default 0.2
+        Standard deviation of the additive Gaussian noise, relative to the tube's
+        contrast over the background
+    background : float, default 0.1
+        Background intensity, relative to the tube's peak
+    seed : int
+        Random seed (centerline shape and noise)
+
+    Returns
+    -------
+    tuple
+        (volume, centerline): the float32 volume (intensities in [0, 255]) and
+        the (N, 3) ground-truth centerline in (x, y, z) voxel coordinates,
+        sampled every half voxel from one end to the other
+    """
+    rng = np.random.default_rng(seed)
+    zyx = (1,) * (3 - len(shape)) + tuple(shape)
+    margin = int(np.ceil(3 * radius)) + 1
+    if zyx[2] <= 2 * margin or zyx[1] <= 2 * margin:
+        raise ValueError(f"Volume {shape} is too small for a tube of radius {radius}")
+
+    # Sinusoidal excursions in Y (and Z), within the volume's margins
+    t = np.linspace(0, 1, 4 * zyx[2])
+    points = [margin + t * (zyx[2] - 1 - 2 * margin)]
+    for extent in (zyx[1], zyx[0]):
+        amplitude = max(0.0, (extent - 1) / 2 - margin) * rng.uniform(0.3, 0.8)
+        frequency, phase = rng.uniform(0.5, 1.5), rng.uniform(0, 2 * np.pi)
+        points.append((extent - 1) / 2 + amplitude * np.sin(2 * np.pi * frequency * t + phase))
+    curve = np.column_stack(points)
+    arc = np.concatenate(([0.0], np.cumsum(np.linalg.norm(np.diff(curve, axis=0), axis=1))))
+    samples = np.arange(0, arc[-1], 0.5)
+    centerline = np.column_stack([np.interp(samples, arc, curve[:, d]) for d in range(3)])
+
+    tube = np.zeros(zyx, dtype=np.float32)
+    reach = int(np.ceil(3 * radius))
+    for x, y, z in centerline:
+        lo = np.maximum(np.floor([z, y, x]).astype(int) - reach, 0)
+        hi = np.minimum(np.floor([z, y, x]).astype(int) + reach + 1, zyx)
+        zz, yy, xx = np.ogrid[lo[0]:hi[0], lo[1]:hi[1], lo[2]:hi[2]]
+        profile = np.exp(-((xx - x) ** 2 + (yy - y) ** 2 + (zz - z) ** 2) / (2 * radius ** 2))
+        block = tube[lo[0]:hi[0], lo[1]:hi[1], lo[2]:hi[2]]
+        np.maximum(block, profile, out=block)
+    volume = background + (1 - background) * tube + rng.normal(0, noise * (1 - background), size=zyx)
+    volume = (np.clip(volume, 0, 1) * 255).astype(np.float32)
+    return volume.reshape(shape), centerline
+
+
+class SWCPoint:
+    """Stand-in for sc.fiji.snt.util.SWCPoint (public fields plus coordinate getters)."""
+
+    __slots__ = ('id', 'type', 'x', 'y', 'z', 'radius', 'parent')
+
+    def __init__(self, row: Sequence[float]):
+        self.id, self.type = int(row[0]), int(row[1])
+        self.x, self.y, self.z, self.radius = float(row[2]), float(row[3]), float(row[4]), float(row[5])
+        self.parent = int(row[6])
+
+    def getX(self) -> float:
+        return self.x
+
+    def getY(self) -> float:
+        return self.y
+
+    def getZ(self) -> float:
+        return self.z
+
+    def getAnnotation(self):
+        return None
+
+    def getColor(self):
+        return None
+
+
+class SWCWeightedEdge:
+    """Stand-in for sc.fiji.snt.analysis.graph.SWCWeightedEdge."""
+
+    __slots__ = ('source', 'target', 'weight')
+
+    def __init__(self, source: SWCPoint, target: SWCPoint):
+        self.source, self.target = source, target
+        self.weight = float(np.sqrt((source.x - target.x) ** 2 + (source.y - target.y) ** 2
+                                    + (source.z - target.z) ** 2))
+
+    def getWeight(self) -> float:
+        return self.weight
+
+    def getLength(self) -> float:
+        return self.weight
+
+
+class Tree:
+    """Stand-in for sc.fiji.snt.Tree."""
+
+    def __init__(self, n_nodes: int, seed: int = DEFAULT_SEED):
+        self.table = swc_table(n_nodes, seed)
+        self.nodes: List[SWCPoint] = [SWCPoint(row) for row in self.table]
+
+    def getRoot(self) -> SWCPoint:
+        return self.nodes[0]
+
+    def getNodes(self) -> List[SWCPoint]:
+        return self.nodes
+
+    def getNodesAsSWCPoints(self) -> List[SWCPoint]:
+        return self.nodes
+
+    def getLabel(self) -> str:
+        return f"synthetic-{len(self.nodes)}"
+
+    def setRadii(self, radius: float) -> None:
+        for node in self.nodes:
+            node.radius = radius
+
+
+class DirectedWeightedGraph:
+    """Stand-in for sc.fiji.snt.analysis.graph.DirectedWeightedGraph built from a Tree."""
+
+    def __init__(self, tree: Tree):
+        self.vertices = tree.nodes
+        index = {node.id: node for node in tree.nodes}
+        self.edges = [SWCWeightedEdge(index[node.parent], node) for node in tree.nodes if node.parent in index]
+
+    def vertexSet(self) -> List[SWCPoint]:
+        return self.vertices
+
+    def edgeSet(self) -> List[SWCWeightedEdge]:
+        return self.edges
+
+    def getEdgeSource(self, edge: SWCWeightedEdge) -> SWCPoint:
+        return edge.source
+
+    def getEdgeTarget(self, edge: SWCWeightedEdge) -> SWCPoint:
+        return edge.target
+
+
+class SNTTable:
+    """Stand-in for sc.fiji.snt.analysis.SNTTable holding random measurements."""
+
+    def __init__(self, n_rows: int, n_columns: int, seed: int = DEFAULT_SEED):
+        self.headers = [f"Metric {i}" for i in range(n_columns)]
+        values = np.random.default_rng(seed).normal(size=(n_columns, n_rows))
+        self.columns = {header: column.tolist() for header, column in zip(self.headers, values)}
+
+    def getRowCount(self) -> int:
+        return len(self.columns[self.headers[0]]) if self.headers else 0
+
+    def getColumnCount(self) -> int:
+        return len(self.headers)
+
+    def getColumnHeader(self, index: int) -> str:
+        return self.headers[index]
+
+    def get(self, column: str, row: int) -> float:
+        return self.columns[column][row]
+
+    def getTitle(self) -> str:
+        return "synthetic"
+
+
+class SNTChart:
+    """Stand-in for sc.fiji.snt.analysis.SNTChart whose export yields a fixed PNG."""
+
+    def __init__(self, width: int, height: int):
+        self.width, self.height = width, height
+        self.png = chart_png(width, height)
+
+    def show(self) -> None:
+        pass
+
+    def save(self, path: str) -> None:
+        Path(path).write_bytes(self.png)
+
+    def getChart(self) -> 'SNTChart':
+        return self
+
+    def getWidth(self) -> int:
+        return self.width
+
+    def getHeight(self) -> int:
+        return self.height
+
+    def getTitle(self) -> str:
+        return "synthetic"
+
+    def isCombined(self) -> bool:
+        return False
+
+
+def chart_png(width: int, height: int) -> bytes:
+    """Render a simple line plot as PNG bytes of the given pixel size."""
+    from matplotlib.figure import Figure
+
+    dpi = 100
+    fig = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    x = np.linspace(0, 10, 500)
+    fig.add_subplot().plot(x, np.sin(x) * np.exp(-x / 5))
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi)
+    return buffer.getvalue()
@@ -15,16 +15,26 @@ from typing import Dict, Any, List
 logger = logging.getLogger(__name__)
 
 # Import main initialization
-from .core import initialize, dispose, FijiNotFoundError, ij, is_initialized, get_mode
+from .core import initialize, dispose, FijiNotFoundError, ij, is_initialized, get_mode, get_jvm_settings
+from .jvm_profiles import list_jvm_profiles
+from .cds import build_cds_archive
+from .lean import LeanClasspathError
 
 # Import PyImageJ integration functions
 from .core import to_python, from_java, show, extract_figure
 
 # Import converter utilities
 from .converters import (
-    register_snt_converters, register_display_handler, list_converters, display, enhance_java_object, tree_to_points
+    register_snt_converters, register_display_handler, list_converters, display, enhance_java_object, tree_to_points,
+    tree_to_arrays, plot_trees
 )
 
+# Import batch figure export
+from .export import export_figures
+
+# Import Java boundary-crossing profiler
+from .profiling import profile_java
+
 # Import Java utilities
 from .java_utils import inspect, get_methods, get_fields, get_inner_classes, find_members
 
@@ -109,6 +119,9 @@ from . import io
 from . import util
 from . import viewer
 from . import tracing
+from . import diagnostics
+from . import lean
+from . import async_utils
 
 # Setup common module functionality
 _module_funcs = setup_module_classes(
@@ -253,15 +266,24 @@ def _get_detailed_version_info() -> str:
     lines.append(f"\n🔬 SNT/Fiji Environment:")
 
     try:
-        from .core import is_initialized, ij
+        from .core import is_initialized, ij, get_mode
 
         if is_initialized():
             lines.append(f"  ✅ PySNT initialized: Yes")
 
+            from .core import get_jvm_settings
+            from .jvm_profiles import format_jvm_settings
+            if get_jvm_settings() is not None:
+                for line in format_jvm_settings(get_jvm_settings()):
+                    lines.append(f"  ⚙️  {line}")
+
             try:
-                ij_instance = ij()
-                ij_version = ij_instance.getVersion() if ij_instance else "Unknown"
-                lines.append(f"  ℹ️ ImageJ version: {ij_version}")
+                if get_mode() == "lean":
+                    lines.append(f"  ℹ️ ImageJ version: Not loaded (lean mode)")
+                else:
+                    ij_instance = ij()
+                    ij_version = ij_instance.getVersion() if ij_instance else "Unknown"
+                    lines.append(f"  ℹ️ ImageJ version: {ij_version}")
 
                 # Try to get SNT version
                 try:
@@ -361,6 +383,9 @@ __all__ = [
     "ij",
     "is_initialized",
     "get_mode",
+    "get_jvm_settings",
+    "list_jvm_profiles",
+    "build_cds_archive",
     "inspect",
     "get_methods",
     "get_fields",
@@ -378,6 +403,10 @@ __all__ = [
     "display",
     "enhance_java_object",
     "tree_to_points",
+    "tree_to_arrays",
+    "plot_trees",
+    "export_figures",
+    "profile_java",
     # Configuration system
     "get_option",
     "set_option", 
@@ -393,6 +422,7 @@ __all__ = [
     "is_macos",
     # Exceptions
     "FijiNotFoundError",
+    "LeanClasspathError",
     "OptionError",
     "version",
     "print_version",
@@ -426,4 +456,7 @@ __all__ = [
     "util",
     "viewer",
     "tracing",
+    "diagnostics",
+    "lean",
+    "async_utils",
 ]
@@ -1247,13 +1247,18 @@ def info() -> Any: ...
 # Imported functions
 def analysis(*args: Any, **kwargs: Any) -> Any: ...
 def annotation(*args: Any, **kwargs: Any) -> Any: ...
+def async_utils(*args: Any, **kwargs: Any) -> Any: ...
 def auto_detect_and_configure(*args: Any, **kwargs: Any) -> Any: ...
+def build_cds_archive(fiji_path: Optional[str] = None, cds_dir: Optional[str] = None, workload: bool = True, timeout: float = 900) -> Dict[str, Any]: ...
 def clear_fiji_path(*args: Any, **kwargs: Any) -> Any: ...
 def configure_gui_safety(*args: Any, **kwargs: Any) -> Any: ...
 def describe_option(*args: Any, **kwargs: Any) -> Any: ...
+def diagnostics(*args: Any, **kwargs: Any) -> Any: ...
 def display(obj: Any, **kwargs: Any) -> Any: ...
 def dispose() -> None: ...
 def enhance_java_object(obj: Any) -> Any: ...
+def export_figures(*args: Any, **kwargs: Any) -> Any: ...
+def profile_java(*args: Any, **kwargs: Any) -> Any: ...
 def extract_figure(*args: Any, **kwargs: Any) -> Any: ...
 def find_members(*args: Any, **kwargs: Any) -> Any: ...
 def from_java(obj: Any) -> Any: ...
@@ -1262,21 +1267,25 @@ def get_fields() -> Any: ...
 def get_fiji_path() -> Any: ...
 def get_fiji_status() -> Any: ...
 def get_inner_classes() -> Any: ...
+def get_jvm_settings() -> Optional[Dict[str, Any]]: ...
 def get_methods() -> Any: ...
 def get_mode() -> Any: ...
 def get_option() -> Any: ...
 def ij() -> Any: ...
-def initialize(fiji_path: Optional[str] = None, interactive: bool = True, ensure_java: bool = True, mode: str = "headless", max_heap: Optional[str] = None, min_heap: Optional[str] = None, jvm_args: Optional[List[str]] = None) -> None: ...
+def initialize(fiji_path: Optional[str] = None, interactive: bool = True, ensure_java: bool = True, mode: str = "headless", max_heap: Optional[str] = None, min_heap: Optional[str] = None, jvm_args: Optional[List[str]] = None, jvm_profile: Optional[str] = None) -> None: ...
 def inspect(*args: Any, **kwargs: Any) -> Any: ...
 def io(*args: Any, **kwargs: Any) -> Any: ...
 def is_fiji_valid() -> bool: ...
 def is_initialized() -> bool: ...
 def is_macos() -> bool: ...
 def is_main_thread() -> bool: ...
+def lean(*args: Any, **kwargs: Any) -> Any: ...
 def list_converters() -> List[str]: ...
+def list_jvm_profiles() -> Dict[str, str]: ...
 def list_options(*args: Any, **kwargs: Any) -> Any: ...
 def option_context(*args: Any, **kwargs: Any) -> Any: ...
 def options(*args: Any, **kwargs: Any) -> Any: ...
+def plot_trees(*args: Any, **kwargs: Any) -> Any: ...
 def register_display_handler(obj_type: str, handler_func: Callable) -> None: ...
 def register_snt_converters() -> bool: ...
 def reset_fiji_path(*args: Any, **kwargs: Any) -> Any: ...
@@ -1290,6 +1299,7 @@ def show_config_status(*args: Any, **kwargs: Any) -> Any: ...
 def to_python(obj: Any) -> Any: ...
 def tracing(*args: Any, **kwargs: Any) -> Any: ...
 def tree_to_points(*args: Any, **kwargs: Any) -> Any: ...
+def tree_to_arrays(*args: Any, **kwargs: Any) -> Any: ...
 def util(*args: Any, **kwargs: Any) -> Any: ...
 def viewer(*args: Any, **kwargs: Any) -> Any: ...
 
@@ -1300,4 +1310,5 @@ class List: ...
 
 # Exception classes
 class FijiNotFoundError(Exception): ...
+class LeanClasspathError(Exception): ...
 class OptionError(Exception): ...
\ No newline at end of file
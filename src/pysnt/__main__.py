@@ -3,7 +3,8 @@
 Command-line interface for PySNT.
 
 This module provides command-line access to PySNT functionality,
-including version information and system diagnostics.
+including version information, system diagnostics, batch figure export and
+recording of Class Data Sharing archives.
 """
 
 import sys
@@ -55,6 +56,65 @@ def main():
         help='Run interactive Fiji setup wizard'
     )
     
+    export_group = parser.add_argument_group('figure export')
+    export_group.add_argument(
+        '--export',
+        nargs='+',
+        metavar='FILE',
+        help='Export figures for reconstruction files (.swc, .traces, .json, ...)'
+    )
+    export_group.add_argument(
+        '--out-dir',
+        default='figures',
+        help='Output directory for --export (default: figures)'
+    )
+    export_group.add_argument(
+        '--format',
+        choices=['png', 'svg', 'pdf'],
+        default='png',
+        help='Output format for --export (default: png)'
+    )
+    export_group.add_argument(
+        '--dpi',
+        type=int,
+        default=None,
+        help='Output resolution for --export (default: display.chart_dpi option)'
+    )
+    export_group.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of export worker threads (default: display.conversion_workers option)'
+    )
+    export_group.add_argument(
+        '--overwrite',
+        action='store_true',
+        help='Re-export figures that are already up to date'
+    )
+    export_group.add_argument(
+        '--renderer',
+        choices=['viewer2d', 'native'],
+        default=None,
+        help='Tree renderer for --export (default: display.tree_renderer option)'
+    )
+    
+    cds_group = parser.add_argument_group('class data sharing')
+    cds_group.add_argument(
+        '--build-cds',
+        action='store_true',
+        help='Record a Class Data Sharing archive to speed up JVM startup in initialize()'
+    )
+    cds_group.add_argument(
+        '--fiji-path',
+        default=None,
+        help='Fiji installation for --build-cds (default: the configured one)'
+    )
+    cds_group.add_argument(
+        '--no-workload',
+        action='store_true',
+        help='Only archive the classes loaded by initialize(), without running a typical SNT workload'
+    )
+    
     args = parser.parse_args()
     
     # If no arguments provided, show help
@@ -133,7 +193,45 @@ def main():
         except ImportError as e:
             print(f"❌ Fiji setup utilities not available: {e}")
         return
+    
+    # Handle CDS archive recording
+    if args.build_cds:
+        from .cds import build_cds_archive
+        
+        print("⏳ Recording Class Data Sharing archive (this starts SNT in a separate process)...")
+        try:
+            manifest = build_cds_archive(args.fiji_path, workload=not args.no_workload)
+        except Exception as e:
+            print(f"❌ Could not build CDS archive: {e}")
+            return 1
+        print(f"✅ CDS archive for {manifest['fiji_path']} ({manifest['jar_count']} jars, "
+              f"{manifest['archive_size'] / 1024 ** 2:.1f} MB) written to {manifest['archive']} "
+              f"in {manifest['build_seconds']:.1f}s")
+        print("It will be used by initialize() until the Fiji installation changes.")
+        return 0
+    
+    # Handle figure export
+    if args.export:
+        from .export import export_figures
+        
+        render_kwargs = {'renderer': args.renderer} if args.renderer else {}
+        manifest = export_figures(
+            args.export,
+            args.out_dir,
+            format=args.format,
+            dpi=args.dpi,
+            overwrite=args.overwrite,
+            max_workers=args.workers,
+            **render_kwargs
+        )
+        counts = manifest['counts']
+        print(f"Exported {counts['exported']}, skipped {counts['skipped']} (up to date), "
+              f"failed {counts['error']} in {manifest['total_seconds']:.2f}s -> {manifest['out_dir']}")
+        for item in manifest['items']:
+            if item['status'] == 'error':
+                print(f"❌ {item['source']}: {item['error']}")
+        return 1 if counts['error'] else 0
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
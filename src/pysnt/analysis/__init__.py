@@ -56,6 +56,9 @@ get_extended_classes = _module_funcs['get_extended_classes']  # type: Callable[[
 # Import submodules for easy access
 from . import growth
 
+# Import tiled skeletonization utilities
+from .tiled_skeleton import skeletonize_tiled
+
 # Create module-level __getattr__ and __dir__
 __getattr__ = _module_funcs['create_getattr']('pysnt.analysis', submodules=['growth'])
 __dir__ = _module_funcs['create_dir']()
@@ -70,6 +73,7 @@ __all__ = [
     "list_classes",
     "get_curated_classes",
     "get_extended_classes",
+    "skeletonize_tiled",
     # Constants
     "CURATED_CLASSES",
     "EXTENDED_CLASSES",
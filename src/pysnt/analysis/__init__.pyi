@@ -1380,6 +1380,7 @@ class SNTTable:
 # Imported functions
 def growth(*args: Any, **kwargs: Any) -> Any: ...
 def setup_module_classes(*args: Any, **kwargs: Any) -> Any: ...
+def skeletonize_tiled(volume: Any, threshold: Optional[float] = None, block_size: Any = None, overlap: int = 16, spacing: Optional[Any] = None, stitch_distance: float = 2.0, min_length: float = 0.0, workers: Optional[int] = None, output: str = 'tree', progress: Optional[Callable[[int, int], None]] = None, return_report: bool = False) -> Any: ...
 
 # Imported classes
 class Any: ...
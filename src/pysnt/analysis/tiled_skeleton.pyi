@@ -0,0 +1,34 @@
+"""
+Type stubs for tiled_skeleton.py
+
+Auto-generated stub file.
+"""
+
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple, Sequence
+import numpy as np
+
+logger: Any
+OUTPUT_FORMATS: Any
+DEFAULT_OVERLAP: Any
+def skeletonize_tiled(volume: Any, threshold: Optional[float], block_size: Union[int, Sequence[int], None], overlap: int, spacing: Optional[Sequence[float]], stitch_distance: float, min_length: float, workers: Optional[int], output: str, progress: Optional[Callable[[int, int], None]], return_report: bool) -> Union[List[Any], Tuple[List[Any], Dict[str, Any]]]: ...
+
+class _MemoryTracker:
+    def __init__(self) -> None: ...
+    def add(self, nbytes: int) -> None: ...
+    def sample_heap(self) -> None: ...
+
+def _skeletonize_block(volume: Any, shape: Tuple[int, ...], core: Tuple[slice, ...], overlap: int, threshold: Optional[float], tracker: _MemoryTracker) -> np.ndarray: ...
+
+def _stitch(edges: np.ndarray, block_size: Sequence[int], shape: Tuple[int, ...], stitch_distance: float) -> Dict[str, Any]: ...
+
+def _segments(parent: np.ndarray) -> np.ndarray: ...
+
+def _block_grid(shape: Tuple[int, ...], block_size: Sequence[int]) -> List[Tuple[slice, ...]]: ...
+
+def _per_axis(value: Union[int, Sequence[int]], ndim: int) -> Tuple[int, ...]: ...
+
+def _open_volume(volume: Any) -> Any: ...
+
+def _block_trees(mask: np.ndarray) -> List[Dict[str, np.ndarray]]: ...
+
+def _build_tree(arrays: Dict[str, np.ndarray], label: str) -> Any: ...
@@ -0,0 +1,470 @@
+"""
+Asynchronous execution of long-running SNT operations.
+
+Remote loading, Sholl parsing of large images, path searches (TracerThread,
+FillerThread), Viewer3D snapshots and chart export block the calling thread.
+The functions in this module run them on a shared worker pool and return a
+JavaTask, which behaves like a concurrent.futures.Future and can be awaited
+from asyncio code:
+
+>>> task = pysnt.async_utils.search_async(tracer, progress=print)
+>>> path = await task          # or task.result() outside asyncio
+
+Cancelling a task (task.cancel(), or cancelling the awaiting asyncio task)
+stops the Java side too: searches receive requestStop(), Sholl parsers
+terminate(), and other operations have their Java thread interrupted. Progress
+reported by SNT's listeners (e.g., SearchProgressCallback) is forwarded to
+Python callbacks as dicts. Callbacks run on the worker thread; asyncio users
+should hand results over with loop.call_soon_threadsafe().
+
+Worker threads are attached to the JVM as daemon threads, so they never keep the
+JVM alive. The pool size is set by the 'async.max_workers' option.
+"""
+
+import asyncio
+import logging
+import queue
+import sys
+import threading
+import weakref
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Shared worker pool (created on first use)
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Unfinished tasks, cancelled when the pool is shut down
+_tasks: 'weakref.WeakSet[JavaTask]' = weakref.WeakSet()
+
+# SearchThread.threadStatus() codes
+_SEARCH_STATUS = {0: 'running', 1: 'paused', 2: 'stopping'}
+
+
+class JavaTask:
+    """
+    Handle on an operation running on the pysnt worker pool.
+
+    Wraps a concurrent.futures.Future (see the ``future`` attribute) and adds
+    cancellation of the Java operation and progress callbacks. Instances are
+    awaitable.
+
+    Parameters
+    ----------
+    name : str
+        Task description (used in logs and progress events)
+    stop : callable, optional
+        Called (without arguments) to stop the Java operation on cancel()
+    """
+
+    def __init__(self, name: str, stop: Optional[Callable[[], None]] = None):
+        self.name = name
+        self.future: Future = Future()
+        self._stop = stop
+        self._progress_callbacks: List[Callable[[Dict[str, Any]], None]] = []
+        self._cancel_requested = threading.Event()
+        self._java_thread = None
+
+    def __repr__(self) -> str:
+        state = 'cancelled' if self.cancelled() else 'done' if self.done() else 'running' \
+            if self.future.running() else 'pending'
+        return f"<JavaTask {self.name!r} {state}>"
+
+    def __await__(self):
+        return self._wait().__await__()
+
+    async def _wait(self) -> Any:
+        try:
+            return await asyncio.wrap_future(self.future)
+        except asyncio.CancelledError:
+            self.cancel()
+            raise
+
+    def add_progress_callback(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Register a function receiving progress events (dicts with at least 'task' and 'event').
+
+        Parameters
+        ----------
+        callback : callable
+            Function taking a progress event dict
+        """
+        if not callable(callback):
+            raise TypeError(f"Progress callback must be callable, got {type(callback).__name__}")
+        self._progress_callbacks.append(callback)
+
+    def report(self, event: str, **details: Any) -> None:
+        """Forward a progress event to the registered callbacks (errors are logged, not raised)."""
+        payload = {'task': self.name, 'event': event, **details}
+        for callback in list(self._progress_callbacks):
+            try:
+                callback(payload)
+            except Exception as e:
+                logger.warning(f"Progress callback for {self.name} failed: {e}")
+
+    def cancel(self) -> bool:
+        """
+        Cancel the task, stopping the Java operation if it is running.
+
+        Returns
+        -------
+        bool
+            True if the task was cancelled or a stop was requested, False if it
+            had already finished
+        """
+        if self.future.done():
+            return self.future.cancelled()
+        self._cancel_requested.set()
+        if self.future.cancel():
+            return True  # Not started yet
+        try:
+            if self._stop is not None:
+                self._stop()
+            elif self._java_thread is not None:
+                self._java_thread.interrupt()
+        except Exception as e:
+            logger.warning(f"Could not stop {self.name}: {e}")
+        return True
+
+    @property
+    def cancel_requested(self) -> bool:
+        """True once cancel() was called."""
+        return self._cancel_requested.is_set()
+
+    def cancelled(self) -> bool:
+        """True if the task was cancelled."""
+        return self.future.cancelled() or (self.future.done() and isinstance(self.future.exception(),
+                                                                             CancelledError))
+
+    def done(self) -> bool:
+        """True if the task finished, failed or was cancelled."""
+        return self.future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Wait for and return the result (see concurrent.futures.Future.result())."""
+        return self.future.result(timeout)
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        """Wait for and return the exception raised by the task, if any."""
+        return self.future.exception(timeout)
+
+    def add_done_callback(self, callback: Callable[['JavaTask'], None]) -> None:
+        """Call callback(task) when the task finishes."""
+        self.future.add_done_callback(lambda _: callback(self))
+
+    def _run(self, func: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        """Execute func on the current worker thread, settling the future."""
+        if not self.future.set_running_or_notify_cancel():
+            return
+        self._java_thread = _current_java_thread()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            if self.cancel_requested:
+                self.future.set_exception(CancelledError(f"{self.name} was cancelled"))
+            else:
+                self.future.set_exception(e)
+        else:
+            if self.cancel_requested:
+                self.future.set_exception(CancelledError(f"{self.name} was cancelled"))
+            else:
+                self.future.set_result(result)
+        finally:
+            if self._java_thread is not None:
+                _clear_interrupt()
+            self._java_thread = None
+
+
+def submit(func: Callable[..., Any], *args: Any, name: Optional[str] = None,
+           stop: Optional[Callable[[], None]] = None,
+           progress: Optional[Callable[[Dict[str, Any]], None]] = None, **kwargs: Any) -> JavaTask:
+    """
+    Run a function on the pysnt worker pool.
+
+    Parameters
+    ----------
+    func : callable
+        Function to run (typically calling into Java)
+    *args, **kwargs
+        Arguments passed to func
+    name : str, optional
+        Task description (default: the function name)
+    stop : callable, optional
+        Called to stop the operation when the task is cancelled. By default, the
+        worker's Java thread is interrupted
+    progress : callable, optional
+        Progress callback (see JavaTask.add_progress_callback())
+
+    Returns
+    -------
+    JavaTask
+        Awaitable handle on the operation
+
+    Examples
+    --------
+    >>> task = pysnt.async_utils.submit(tree.getSkeleton, name='skeletonize')
+    >>> imp = task.result()
+    """
+    task = JavaTask(name or getattr(func, '__name__', 'task'), stop)
+    if progress is not None:
+        task.add_progress_callback(progress)
+    return _start(task, func, *args, **kwargs)
+
+
+def search_async(search: Any, progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> JavaTask:
+    """
+    Run an SNT search (TracerThread, FillerThread or any SearchThread) asynchronously.
+
+    Parameters
+    ----------
+    search : SearchThread
+        Configured search that has not been started
+    progress : callable, optional
+        Receives events bridged from SNT's SearchProgressCallback: 'points'
+        (with 'open' and 'closed' node counts), 'status' (with 'status':
+        'running', 'paused' or 'stopping'), 'distance' (FillerThread only, with
+        'distance': the threshold explored so far) and 'finished' (with
+        'success')
+
+    Returns
+    -------
+    JavaTask
+        Resolves to the Path found by the search, or to the search itself if it
+        yields no path (e.g., FillerThread). Cancelling calls requestStop() on
+        the search
+
+    Examples
+    --------
+    >>> tracer = pysnt.tracing.TracerThread(img, 0, 0, 0, 0, 100, 100, 0, 0)
+    >>> path = await pysnt.async_utils.search_async(tracer)
+    """
+    task = JavaTask(type(search).__name__, stop=search.requestStop)
+    if progress is not None:
+        task.add_progress_callback(progress)
+        search.addProgressListener(_search_progress_proxy(task, search))
+
+    def run():
+        search.run()
+        result = search.getResult() if hasattr(search, 'getResult') else None
+        return result if result is not None else search
+
+    return _start(task, run)
+
+
+def sholl_async(parser: Any, progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> JavaTask:
+    """
+    Parse a Sholl profile (e.g., from an ImageParser2D/3D) asynchronously.
+
+    Parameters
+    ----------
+    parser : sholl Parser
+        Configured parser (center, radii, thresholds set)
+    progress : callable, optional
+        Receives 'started' and 'finished' (with 'success') events
+
+    Returns
+    -------
+    JavaTask
+        Resolves to the parsed Profile. Cancelling calls terminate() on the parser
+    """
+    task = JavaTask(type(parser).__name__, stop=parser.terminate)
+    if progress is not None:
+        task.add_progress_callback(progress)
+
+    def run():
+        task.report('started')
+        parser.parse()
+        success = bool(parser.successful())
+        task.report('finished', success=success)
+        if not success and not task.cancel_requested:
+            raise RuntimeError(f"{task.name} did not produce a profile")
+        return parser.getProfile()
+
+    return _start(task, run)
+
+
+def load_tree_async(loader: Any, *args: Any) -> JavaTask:
+    """
+    Download a reconstruction with a remote loader asynchronously.
+
+    Parameters
+    ----------
+    loader : remote loader
+        MouseLightLoader, NeuroMorphoLoader, FlyCircuitLoader, InsectBrainLoader, ...
+    *args
+        Arguments of the loader's getTree() (e.g., a cell ID or compartment)
+
+    Returns
+    -------
+    JavaTask
+        Resolves to the Tree (None if the loader found nothing). Cancelling
+        interrupts the download
+
+    Examples
+    --------
+    >>> loader = pysnt.io.MouseLightLoader('AA0100')
+    >>> tree = await pysnt.async_utils.load_tree_async(loader, 'axon')
+    """
+    return submit(loader.getTree, *args, name=f"{type(loader).__name__}.getTree")
+
+
+def snapshot_async(viewer: Any) -> JavaTask:
+    """
+    Take a Viewer3D (or other viewer) snapshot asynchronously.
+
+    Parameters
+    ----------
+    viewer : Viewer3D
+        Viewer with a snapshot() method
+
+    Returns
+    -------
+    JavaTask
+        Resolves to the snapshot (an ImagePlus for Viewer3D)
+    """
+    return submit(viewer.snapshot, name=f"{type(viewer).__name__}.snapshot")
+
+
+def export_chart_async(chart: Any, output: str, format: Optional[str] = None,
+                       dpi: Optional[int] = None) -> JavaTask:
+    """
+    Export an SNTChart to a file with SNT's exporters asynchronously.
+
+    Parameters
+    ----------
+    chart : SNTChart
+        Chart to export
+    output : str
+        Output file
+    format : str, optional
+        'png', 'svg' or 'pdf' (default: from the file extension)
+    dpi : int, optional
+        Output resolution (default: pysnt.get_option('display.chart_dpi'))
+
+    Returns
+    -------
+    JavaTask
+        Resolves to the output path
+    """
+    from .export import _save_snt_chart
+    from .config import get_option
+
+    output = str(output)
+    format = format or output.rsplit('.', 1)[-1].lower()
+    dpi = dpi or get_option('display.chart_dpi')
+
+    def run():
+        _save_snt_chart(chart, output, format, dpi)
+        return output
+
+    return submit(run, name=f"export {output}")
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the shared worker pool, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            from .config import get_option
+            _executor = ThreadPoolExecutor(max_workers=get_option('async.max_workers'),
+                                           thread_name_prefix='pysnt-async', initializer=_attach_daemon)
+        return _executor
+
+
+def shutdown_executor(wait: bool = True, cancel: bool = True) -> None:
+    """
+    Shut down the shared worker pool (a new one is created on next use).
+
+    Parameters
+    ----------
+    wait : bool, default True
+        Wait for running tasks to finish
+    cancel : bool, default True
+        Cancel unfinished tasks (running Java operations are asked to stop)
+    """
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if cancel:
+        for task in list(_tasks):
+            task.cancel()
+    if executor is not None:
+        _shutdown_pool(executor, wait=wait, cancel=cancel)
+
+
+def _shutdown_pool(executor: ThreadPoolExecutor, wait: bool, cancel: bool) -> None:
+    """Shut down a thread pool, cancelling its queued work items if requested."""
+    if sys.version_info >= (3, 9):
+        executor.shutdown(wait=wait, cancel_futures=cancel)
+        return
+    if cancel:
+        # Python 3.8 has no cancel_futures: drain the work queue as 3.9+ does
+        while True:
+            try:
+                item = executor._work_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item.future.cancel()
+    executor.shutdown(wait=wait)
+
+
+def _start(task: JavaTask, func: Callable[..., Any], *args: Any, **kwargs: Any) -> JavaTask:
+    """Submit func to the worker pool as the body of task."""
+    _tasks.add(task)
+    task.future.add_done_callback(lambda _: _tasks.discard(task))
+    get_executor().submit(task._run, func, args, kwargs)
+    return task
+
+
+def _search_progress_proxy(task: JavaTask, search: Any) -> Any:
+    """Implement SNT's search progress listener interfaces, forwarding events to task."""
+    import jpype
+
+    handlers = {
+        'pointsInSearch': lambda source, in_open, in_closed: task.report(
+            'points', open=int(in_open), closed=int(in_closed)),
+        'finished': lambda source, success: task.report('finished', success=bool(success)),
+        'threadStatus': lambda source, status: task.report(
+            'status', status=_SEARCH_STATUS.get(int(status), int(status))),
+    }
+    interfaces = ['sc.fiji.snt.SearchProgressCallback']
+    if type(search).__name__ == 'FillerThread':
+        handlers['maximumDistanceCompletelyExplored'] = lambda source, distance: task.report(
+            'distance', distance=float(distance))
+        interfaces.append('sc.fiji.snt.FillerProgressCallback')
+    return jpype.JProxy(interfaces, dict=handlers)
+
+
+def _attach_daemon() -> None:
+    """Attach a worker thread to the JVM as a daemon thread, if the JVM is running."""
+    try:
+        import jpype
+        if jpype.isJVMStarted() and not jpype.java.lang.Thread.isAttached():
+            jpype.java.lang.Thread.attachAsDaemon()
+    except Exception as e:
+        logger.debug(f"Could not attach worker thread to JVM: {e}")
+
+
+def _current_java_thread() -> Any:
+    """Return the java.lang.Thread of the current thread, or None without a JVM."""
+    try:
+        import jpype
+        if jpype.isJVMStarted():
+            if not jpype.java.lang.Thread.isAttached():
+                jpype.java.lang.Thread.attachAsDaemon()
+            return jpype.java.lang.Thread.currentThread()
+    except Exception as e:
+        logger.debug(f"Could not access Java thread: {e}")
+    return None
+
+
+def _clear_interrupt() -> None:
+    """Clear the interrupt flag of the current Java thread, so it does not leak into the next task."""
+    try:
+        import jpype
+        jpype.java.lang.Thread.interrupted()
+    except Exception:
+        pass
@@ -0,0 +1,60 @@
+"""
+Type stubs for async_utils.py
+
+Auto-generated stub file.
+"""
+
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+
+logger: Any
+_executor: Any
+_executor_lock: Any
+_tasks: Any
+_SEARCH_STATUS: Any
+class JavaTask:
+    name: str
+    future: Future
+    def __init__(self, name: str, stop: Optional[Callable[[], None]]) -> None: ...
+    def __repr__(self) -> str: ...
+    def __await__(self) -> Any: ...
+    async def _wait(self) -> Any: ...
+    def add_progress_callback(self, callback: Callable[[Dict[str, Any]], None]) -> None: ...
+    def report(self, event: str, **details: Any) -> None: ...
+    def cancel(self) -> bool: ...
+    @property
+    def cancel_requested(self) -> bool: ...
+    def cancelled(self) -> bool: ...
+    def done(self) -> bool: ...
+    def result(self, timeout: Optional[float]) -> Any: ...
+    def exception(self, timeout: Optional[float]) -> Optional[BaseException]: ...
+    def add_done_callback(self, callback: Callable[[JavaTask], None]) -> None: ...
+    def _run(self, func: Callable[..., Any], args: tuple, kwargs: dict) -> None: ...
+
+def submit(func: Callable[..., Any], *args: Any, name: Optional[str], stop: Optional[Callable[[], None]], progress: Optional[Callable[[Dict[str, Any]], None]], **kwargs: Any) -> JavaTask: ...
+
+def search_async(search: Any, progress: Optional[Callable[[Dict[str, Any]], None]]) -> JavaTask: ...
+
+def sholl_async(parser: Any, progress: Optional[Callable[[Dict[str, Any]], None]]) -> JavaTask: ...
+
+def load_tree_async(loader: Any, *args: Any) -> JavaTask: ...
+
+def snapshot_async(viewer: Any) -> JavaTask: ...
+
+def export_chart_async(chart: Any, output: str, format: Optional[str], dpi: Optional[int]) -> JavaTask: ...
+
+def get_executor() -> ThreadPoolExecutor: ...
+
+def shutdown_executor(wait: bool, cancel: bool) -> None: ...
+
+def _shutdown_pool(executor: ThreadPoolExecutor, wait: bool, cancel: bool) -> None: ...
+
+def _start(task: JavaTask, func: Callable[..., Any], *args: Any, **kwargs: Any) -> JavaTask: ...
+
+def _search_progress_proxy(task: JavaTask, search: Any) -> Any: ...
+
+def _attach_daemon() -> None: ...
+
+def _current_java_thread() -> Any: ...
+
+def _clear_interrupt() -> None: ...
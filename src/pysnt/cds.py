@@ -0,0 +1,351 @@
+"""
+Class Data Sharing (CDS) archives for faster JVM startup.
+
+A large part of initialize() is spent loading and verifying the classes of
+ImageJ, SciJava and SNT. An application CDS archive stores these classes in a
+pre-parsed form that the JVM maps into memory at startup. The archive is
+recorded once per Fiji installation (`python -m pysnt --build-cds` or
+build_cds_archive()) by running initialize() and a typical SNT workload in a
+separate process, and is picked up automatically by later initialize() calls
+(see the 'java.cds' option).
+
+Each archive is stored with a manifest holding a fingerprint of the Fiji
+classpath (the jars under jars/ and plugins/). Archives whose fingerprint no
+longer matches, e.g., after a Fiji update, are ignored until rebuilt. Archives
+are used with -Xshare:auto, so the JVM also falls back to normal class loading
+if it rejects an archive (e.g., one recorded with a different Java version).
+Dynamic archives require Java 13 or later.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_NAME = 'snt.jsa'
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+# Dynamic archives (-XX:ArchiveClassesAtExit) were introduced in Java 13
+_MIN_JAVA_VERSION = 13
+
+# Classpath directories of a Fiji installation
+_CLASSPATH_DIRS = ('jars', 'plugins')
+
+# User JVM arguments that already control class data sharing
+_CDS_FLAGS = ('-XX:SharedArchiveFile', '-XX:ArchiveClassesAtExit', '-Xshare')
+
+# Run in the recording process: python -c _RECORD_SCRIPT <archive> <fiji_path> <workload>
+_RECORD_SCRIPT = "import sys; from pysnt.cds import _record; _record(sys.argv[1], sys.argv[2], sys.argv[3] == '1')"
+
+# Warn about each stale archive only once per session
+_warned_stale = set()
+
+
+def default_cds_dir() -> Path:
+    """Return the directory holding CDS archives (a 'cds' folder in the pysnt config directory)."""
+    from .setup_utils import get_config_dir
+    return get_config_dir() / 'cds'
+
+
+def classpath_fingerprint(fiji_path: str) -> str:
+    """
+    Compute a fingerprint of the classpath of a Fiji installation.
+
+    The fingerprint covers the relative path, size and modification time of every
+    jar under jars/ and plugins/, so it changes whenever jars are added, removed
+    or updated.
+
+    Parameters
+    ----------
+    fiji_path : str
+        Path to the Fiji installation
+
+    Returns
+    -------
+    str
+        Hex digest of the classpath
+    """
+    root = Path(fiji_path)
+    digest = hashlib.sha256()
+    for jar in sorted(_classpath_jars(root)):
+        stat = jar.stat()
+        digest.update(f"{jar.relative_to(root).as_posix()}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def archive_dir(fiji_path: str, cds_dir: Optional[str] = None) -> Path:
+    """
+    Return the directory of the CDS archive for a Fiji installation.
+
+    Parameters
+    ----------
+    fiji_path : str
+        Path to the Fiji installation
+    cds_dir : str, optional
+        Base directory for archives (default: default_cds_dir())
+
+    Returns
+    -------
+    Path
+        Archive directory (one per Fiji installation)
+    """
+    key = hashlib.sha1(str(Path(fiji_path).resolve()).encode()).hexdigest()[:12]
+    return Path(cds_dir) / key if cds_dir is not None else default_cds_dir() / key
+
+
+def read_manifest(fiji_path: str, cds_dir: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Read the manifest of the CDS archive for a Fiji installation.
+
+    Parameters
+    ----------
+    fiji_path : str
+        Path to the Fiji installation
+    cds_dir : str, optional
+        Base directory for archives (default: default_cds_dir())
+
+    Returns
+    -------
+    dict or None
+        The manifest ('fiji_path', 'fingerprint', 'jar_count', 'java_version',
+        'pysnt_version', 'workload', 'created', 'build_seconds', 'archive_size'),
+        or None if there is no (readable) manifest
+    """
+    path = archive_dir(fiji_path, cds_dir) / MANIFEST_NAME
+    try:
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get('version') == MANIFEST_VERSION else None
+
+
+def find_cds_archive(fiji_path: str, cds_dir: Optional[str] = None) -> Optional[Path]:
+    """
+    Find a valid CDS archive for a Fiji installation.
+
+    Parameters
+    ----------
+    fiji_path : str
+        Path to the Fiji installation
+    cds_dir : str, optional
+        Base directory for archives (default: default_cds_dir())
+
+    Returns
+    -------
+    Path or None
+        The archive, or None if there is none or its classpath fingerprint no
+        longer matches the installation (a warning suggests rebuilding it)
+    """
+    directory = archive_dir(fiji_path, cds_dir)
+    archive = directory / ARCHIVE_NAME
+    manifest = read_manifest(fiji_path, cds_dir)
+    if manifest is None or not archive.is_file():
+        return None
+    if manifest['fingerprint'] != classpath_fingerprint(fiji_path):
+        if str(archive) not in _warned_stale:
+            _warned_stale.add(str(archive))
+            logger.warning(f"CDS archive {archive} is out of date (the Fiji classpath changed) and will not be "
+                           f"used. Rebuild it with: python -m pysnt --build-cds --fiji-path {fiji_path}")
+        return None
+    return archive
+
+
+def cds_jvm_args(fiji_path: str, jvm_args: Optional[List[str]] = None,
+                 cds_dir: Optional[str] = None) -> List[str]:
+    """
+    Return the JVM arguments that use the CDS archive for a Fiji installation.
+
+    Parameters
+    ----------
+    fiji_path : str
+        Path to the Fiji installation
+    jvm_args : list of str, optional
+        JVM arguments given by the user. No arguments are returned if these
+        already control class data sharing (-XX:SharedArchiveFile,
+        -XX:ArchiveClassesAtExit, -Xshare)
+    cds_dir : str, optional
+        Base directory for archives (default: default_cds_dir())
+
+    Returns
+    -------
+    list of str
+        ['-XX:SharedArchiveFile=<archive>', '-Xshare:auto'], or an empty list if
+        there is no valid archive
+    """
+    if any(arg.startswith(_CDS_FLAGS) for arg in jvm_args or []):
+        return []
+    archive = find_cds_archive(fiji_path, cds_dir)
+    if archive is None:
+        return []
+    return [f"-XX:SharedArchiveFile={archive}", '-Xshare:auto']
+
+
+def build_cds_archive(fiji_path: Optional[str] = None, cds_dir: Optional[str] = None, workload: bool = True,
+                      timeout: float = 900) -> Dict[str, Any]:
+    """
+    Record a CDS archive for a Fiji installation.
+
+    initialize() and, by default, a typical SNT workload (loading a demo tree,
+    computing statistics, filling a table, converting a chart) are run in a
+    separate process started with -XX:ArchiveClassesAtExit, so that all classes
+    loaded along the way end up in the archive. The previous archive is only
+    replaced once recording succeeds.
+
+    Parameters
+    ----------
+    fiji_path : str, optional
+        Path to the Fiji installation (default: the configured one)
+    cds_dir : str, optional
+        Base directory for archives (default: default_cds_dir())
+    workload : bool, default True
+        Run a typical SNT workload after initialize() to archive the classes it
+        uses. If False, only the classes loaded by initialize() are archived
+    timeout : float, default 900
+        Maximum time in seconds for the recording process
+
+    Returns
+    -------
+    dict
+        The archive manifest, with 'archive' set to the archive path
+
+    Raises
+    ------
+    FijiNotFoundError
+        If no Fiji installation is given or configured
+    RuntimeError
+        If Java is too old for dynamic archives or recording fails
+
+    Examples
+    --------
+    >>> manifest = pysnt.build_cds_archive()
+    >>> print(f"{manifest['archive']}: {manifest['archive_size'] / 1024 ** 2:.0f} MB")
+    """
+    from . import __version__
+    from .core import FijiNotFoundError
+    from .jvm_profiles import _detect_java_version
+    from .setup_utils import get_fiji_path
+
+    if fiji_path is None:
+        fiji_path = get_fiji_path()
+    if not fiji_path or not Path(fiji_path).is_dir():
+        raise FijiNotFoundError(f"Fiji installation not found: {fiji_path}. Pass fiji_path or configure it with "
+                                f"pysnt.set_fiji_path()")
+    java_version = _detect_java_version()
+    if java_version is not None and java_version < _MIN_JAVA_VERSION:
+        raise RuntimeError(f"CDS archives require Java {_MIN_JAVA_VERSION} or later (found Java {java_version})")
+
+    directory = archive_dir(fiji_path, cds_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    archive = directory / ARCHIVE_NAME
+    partial = directory / (ARCHIVE_NAME + '.partial')
+    if partial.exists():
+        partial.unlink()
+
+    logger.info(f"Recording CDS archive for {fiji_path}...")
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-c', _RECORD_SCRIPT, str(partial), str(fiji_path),
+                             '1' if workload else '0'],
+                            capture_output=True, text=True, timeout=timeout)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0 or not partial.is_file():
+        if partial.exists():
+            partial.unlink()
+        details = (result.stderr or result.stdout or '').strip().splitlines()[-10:]
+        raise RuntimeError("Recording the CDS archive failed (exit code {}):\n{}".format(
+            result.returncode, '\n'.join(details)))
+
+    os.replace(partial, archive)
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'fiji_path': str(Path(fiji_path).resolve()),
+        'fingerprint': classpath_fingerprint(fiji_path),
+        'jar_count': len(_classpath_jars(Path(fiji_path))),
+        'java_version': java_version,
+        'pysnt_version': __version__,
+        'workload': workload,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'build_seconds': round(elapsed, 1),
+        'archive_size': archive.stat().st_size,
+    }
+    (directory / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
+    _warned_stale.discard(str(archive))
+    logger.info(f"CDS archive written to {archive} in {elapsed:.1f}s")
+    return dict(manifest, archive=str(archive))
+
+
+def remove_cds_archive(fiji_path: str, cds_dir: Optional[str] = None) -> bool:
+    """
+    Remove the CDS archive for a Fiji installation.
+
+    Parameters
+    ----------
+    fiji_path : str
+        Path to the Fiji installation
+    cds_dir : str, optional
+        Base directory for archives (default: default_cds_dir())
+
+    Returns
+    -------
+    bool
+        True if an archive was removed
+    """
+    directory = archive_dir(fiji_path, cds_dir)
+    removed = False
+    for name in (ARCHIVE_NAME, MANIFEST_NAME):
+        path = directory / name
+        if path.exists():
+            path.unlink()
+            removed = True
+    return removed
+
+
+def _classpath_jars(root: Path) -> List[Path]:
+    """Return the jars on the classpath of a Fiji installation."""
+    jars = []
+    for name in _CLASSPATH_DIRS:
+        if (root / name).is_dir():
+            jars.extend((root / name).rglob('*.jar'))
+    return jars
+
+
+def _typical_workload() -> None:
+    """Exercise the SNT classes used by common analyses, so that they are archived."""
+    import scyjava
+    from . import core
+
+    tree = scyjava.jimport('sc.fiji.snt.SNTService')().demoTree('fractal')
+    core.to_python(tree)
+    stats = scyjava.jimport('sc.fiji.snt.analysis.TreeStatistics')(tree)
+    stats.getSummaryStats('Branch length')
+    table = scyjava.jimport('sc.fiji.snt.analysis.SNTTable')()
+    for metric in ('Branch length', 'Path length', 'No. of branches'):
+        table.appendToLastRow(metric, stats.getSummaryStats(metric).getMean())
+    core.to_python(table)
+    core.to_python(tree.getGraph())
+    chart = stats.getHistogram('Branch length')
+    core.to_python(chart)
+    chart.dispose()
+
+
+def _record(archive: str, fiji_path: str, workload: bool) -> None:
+    """Entry point of the recording process started by build_cds_archive()."""
+    logging.basicConfig(level=logging.WARNING)
+    from . import core
+
+    core.initialize(fiji_path, interactive=False, mode='headless',
+                    jvm_args=[f"-XX:ArchiveClassesAtExit={archive}"])
+    if workload:
+        try:
+            _typical_workload()
+        except Exception as e:
+            # A partial workload still yields a useful archive
+            logger.warning(f"CDS workload did not complete: {e}")
+    core.dispose()  # The archive is written when the JVM exits
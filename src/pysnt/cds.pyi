@@ -0,0 +1,39 @@
+"""
+Type stubs for cds.py
+
+Auto-generated stub file.
+"""
+
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple
+from pathlib import Path
+
+logger: Any
+ARCHIVE_NAME: Any
+MANIFEST_NAME: Any
+MANIFEST_VERSION: Any
+_MIN_JAVA_VERSION: Any
+_CLASSPATH_DIRS: Any
+_CDS_FLAGS: Any
+_RECORD_SCRIPT: Any
+_warned_stale: Any
+def default_cds_dir() -> Path: ...
+
+def classpath_fingerprint(fiji_path: str) -> str: ...
+
+def archive_dir(fiji_path: str, cds_dir: Optional[str]) -> Path: ...
+
+def read_manifest(fiji_path: str, cds_dir: Optional[str]) -> Optional[Dict[str, Any]]: ...
+
+def find_cds_archive(fiji_path: str, cds_dir: Optional[str]) -> Optional[Path]: ...
+
+def cds_jvm_args(fiji_path: str, jvm_args: Optional[List[str]], cds_dir: Optional[str]) -> List[str]: ...
+
+def build_cds_archive(fiji_path: Optional[str], cds_dir: Optional[str], workload: bool, timeout: float) -> Dict[str, Any]: ...
+
+def remove_cds_archive(fiji_path: str, cds_dir: Optional[str]) -> bool: ...
+
+def _classpath_jars(root: Path) -> List[Path]: ...
+
+def _typical_workload() -> None: ...
+
+def _record(archive: str, fiji_path: str, workload: bool) -> None: ...
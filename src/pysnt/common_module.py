@@ -47,10 +47,11 @@ def create_dynamic_placeholder_class(java_class_name: str, javadoc_name: str = N
                 if scyjava.jvm_started():
                     java_class = scyjava.jimport(java_class_name)
                     return getattr(java_class, name)
-            except ImportError:
+            except ImportError as e:
                 # JVM not started or class not found
-                pass
+                _raise_if_outside_lean_classpath(java_class_name, e)
             except Exception as e:
+                _raise_if_outside_lean_classpath(java_class_name, e)
                 # JVM is started and class was found, but attribute access failed
                 # Let the Java error bubble up
                 raise e
@@ -213,10 +214,11 @@ def create_dynamic_placeholder_class(java_class_name: str, javadoc_name: str = N
                         return method_wrapper
                     
                     return java_instance
-            except ImportError:
+            except ImportError as e:
                 # JVM not started or class not found
-                pass
+                _raise_if_outside_lean_classpath(java_class_name, e)
             except Exception as e:
+                _raise_if_outside_lean_classpath(java_class_name, e)
                 # JVM is started and class was found, but constructor failed
                 # Let the Java error bubble up (e.g., "Java class has no constructors")
                 raise e
@@ -229,10 +231,11 @@ def create_dynamic_placeholder_class(java_class_name: str, javadoc_name: str = N
                 if scyjava.jvm_started():
                     java_class = scyjava.jimport(java_class_name)
                     return getattr(java_class, name)
-            except ImportError:
+            except ImportError as e:
                 # JVM not started or class not found
-                pass
+                _raise_if_outside_lean_classpath(java_class_name, e)
             except Exception as e:
+                _raise_if_outside_lean_classpath(java_class_name, e)
                 # JVM is started and class was found, but attribute access failed
                 # Let the Java error bubble up
                 raise e
@@ -272,6 +275,14 @@ def create_dynamic_placeholder_class(java_class_name: str, javadoc_name: str = N
     return DynamicPlaceholder
 
 
+def _raise_if_outside_lean_classpath(java_class_name: str, error: Exception) -> None:
+    """Raise LeanClasspathError if error means the class is not on the lean classpath."""
+    from .lean import missing_class_error
+    lean_error = missing_class_error(java_class_name, error)
+    if lean_error is not None:
+        raise lean_error from error
+
+
 def _normalize_class_name_for_python(class_name: str) -> str:
     """
     Convert Java inner class names to Python-friendly names.
@@ -9,6 +9,8 @@ from typing import Any, Dict, List, Optional, Union, Callable, Tuple
 logger: Any
 def create_dynamic_placeholder_class(java_class_name: str, javadoc_name: str) -> Any: ...
 
+def _raise_if_outside_lean_classpath(java_class_name: str, error: Exception) -> None: ...
+
 def _normalize_class_name_for_python(class_name: str) -> str: ...
 
 def _get_java_class_name(class_name: str) -> str: ...
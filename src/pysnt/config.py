@@ -16,6 +16,7 @@ display.chart_format: str
     [default: png] [currently: svg]
 """
 
+import os
 import warnings
 from typing import Any, Dict, List, Optional, Union
 from collections.abc import Callable
@@ -67,9 +68,17 @@ def _chart_format_validator(value: str) -> str:
     return value
 
 
+def _tree_renderer_validator(value: str) -> str:
+    """Validate tree renderer option."""
+    valid_renderers = {'viewer2d', 'native'}
+    if value not in valid_renderers:
+        raise ValueError(f"Invalid tree renderer '{value}'. Must be one of {valid_renderers}")
+    return value
+
+
 def _table_display_validator(value: str) -> str:
     """Validate table display option."""
-    valid_displays = {'pandasgui', 'heatmap', 'heatmap_norm', 'summary'}
+    valid_displays = {'pandasgui', 'heatmap', 'heatmap_norm', 'heatmap_binned', 'summary'}
     if value not in valid_displays:
         raise ValueError(f"Invalid table display '{value}'. Must be one of {valid_displays}")
     return value
@@ -89,6 +98,37 @@ def _dpi_validator(value: int) -> int:
     return value
 
 
+def _positive_number_validator(value: float) -> float:
+    """Validate positive number."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        raise ValueError(f"Value must be a positive number, got {value}")
+    return float(value)
+
+
+def _fraction_validator(value: float) -> float:
+    """Validate fraction in (0, 1]."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not 0 < value <= 1:
+        raise ValueError(f"Value must be a number in (0, 1], got {value}")
+    return float(value)
+
+
+def _jvm_profile_validator(value: Optional[str]) -> Optional[str]:
+    """Validate JVM profile option (None for JVM defaults)."""
+    from .jvm_profiles import JVM_PROFILES
+    if value is not None and value not in JVM_PROFILES:
+        raise ValueError(f"Invalid JVM profile '{value}'. Must be None or one of {set(JVM_PROFILES)}")
+    return value
+
+
+def _string_list_validator(value: Any) -> tuple:
+    """Validate list of strings (stored as a tuple)."""
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, (list, tuple)) or not all(isinstance(v, str) and v for v in value):
+        raise ValueError(f"Value must be a list of non-empty strings, got {value!r}")
+    return tuple(value)
+
+
 def _layout_algorithm_validator(value: str) -> str:
     """Validate layout algorithm option."""
     valid_layouts = {
@@ -100,6 +140,15 @@ def _layout_algorithm_validator(value: str) -> str:
     return value
 
 
+def _lod_validator(value: Any) -> Any:
+    """Validate level-of-detail option ('auto' or boolean)."""
+    if value == 'auto':
+        return value
+    if isinstance(value, bool):
+        return value
+    raise ValueError(f"Invalid level-of-detail mode '{value}'. Must be 'auto', True or False")
+
+
 def _graph_type_validator(value: str) -> str:
     """Validate graph type for layout defaults."""
     valid_types = {
@@ -166,6 +215,23 @@ def _java_logging_callback(key: str, old_value: Any, new_value: Any) -> None:
         logger.debug(f"Failed to auto-configure Java logging after option change: {e}")
 
 
+def _heap_monitor_callback(key: str, old_value: Any, new_value: Any) -> None:
+    """Callback function that starts/stops the JVM heap monitor when the option changes."""
+    import logging
+    logger = logging.getLogger(__name__)
+    try:
+        from .diagnostics import _jvm_running, start_heap_monitor, stop_heap_monitor
+        if not new_value:
+            stop_heap_monitor()
+        elif _jvm_running():
+            start_heap_monitor()
+        else:
+            logger.debug("JVM not started, heap monitor will start when SNT is initialized")
+    except Exception as e:
+        # Don't let monitoring errors break option setting
+        logger.debug(f"Failed to update heap monitor after option change: {e}")
+
+
 def _register_option(key: str, default_value: Any, doc: str, validator: Optional[Callable] = None, callback: Optional[Callable] = None):
     """Register a configuration option."""
     _global_config[key] = _Option(key, default_value, doc, validator, callback)
@@ -186,13 +252,48 @@ _register_option(
     _dpi_validator
 )
 
+_register_option(
+    'display.chart_in_memory',
+    True,
+    'Export SNTCharts to memory (no temporary files) before converting to matplotlib',
+    lambda x: bool(x)
+)
+
+_register_option(
+    'display.conversion_workers',
+    4,
+    'Maximum number of worker threads used to convert lists of objects for display',
+    _positive_int_validator
+)
+
+_register_option(
+    'display.lazy_image_mb',
+    512,
+    'Size (MB) above which ImgPlus/RandomAccessibleInterval images are displayed by reading only the displayed plane',
+    _positive_int_validator
+)
+
+_register_option(
+    'display.tree_renderer',
+    'viewer2d',
+    "Renderer for displaying Trees: 'viewer2d' (SNT's Viewer2D chart) or 'native' (matplotlib LineCollection)",
+    _tree_renderer_validator
+)
+
 _register_option(
     'display.table_mode',
     'summary',
-    'Default display mode for SNTTables (pandasgui, heatmap, heatmap_norm, or summary)',
+    'Default display mode for SNTTables (pandasgui, heatmap, heatmap_norm, heatmap_binned, or summary)',
     _table_display_validator
 )
 
+_register_option(
+    'display.heatmap_max_rows',
+    500,
+    'Maximum number of table rows drawn individually in heatmaps; larger tables are averaged into this many row bins',
+    _positive_int_validator
+)
+
 _register_option(
     'display.max_columns',
     20,
@@ -271,6 +372,21 @@ _register_option(
     _layout_algorithm_validator
 )
 
+# Graph display configuration options
+_register_option(
+    'graph.display.lod',
+    'auto',
+    "Level-of-detail graph rendering: collapse degree-2 chains and simplify sub-pixel segments ('auto', True or False)",
+    _lod_validator
+)
+
+_register_option(
+    'graph.display.lod_threshold',
+    1000,
+    "Node count above which level-of-detail rendering is used when 'graph.display.lod' is 'auto'",
+    _positive_int_validator
+)
+
 # Graph processing configuration options
 _register_option(
     'graph.processing.warn_self_loops',
@@ -279,6 +395,125 @@ _register_option(
     lambda x: bool(x)
 )
 
+# Filter cache options
+_register_option(
+    'filter.cache_dir',
+    None,
+    'Directory of the persistent filter cache (pysnt.filter.cached_filter()); None for the pysnt config directory',
+    lambda x: None if x is None else str(x)
+)
+
+_register_option(
+    'filter.cache_block_size',
+    128,
+    'Edge length (voxels) of the blocks in which filtered images are computed and cached',
+    _positive_int_validator
+)
+
+_register_option(
+    'filter.cache_workers',
+    os.cpu_count() or 4,
+    'Number of filter cache blocks computed in parallel',
+    _positive_int_validator
+)
+
+# Analysis options
+_register_option(
+    'analysis.skeleton_block_size',
+    256,
+    'Edge length (voxels) of the blocks processed by pysnt.analysis.skeletonize_tiled()',
+    _positive_int_validator
+)
+
+_register_option(
+    'analysis.skeleton_workers',
+    os.cpu_count() or 4,
+    'Number of blocks skeletonized in parallel by pysnt.analysis.skeletonize_tiled()',
+    _positive_int_validator
+)
+
+# Tracing options
+_register_option(
+    'tracing.batch_workers',
+    os.cpu_count() or 4,
+    'Number of Java threads running searches in pysnt.tracing.trace_batch()',
+    _positive_int_validator
+)
+
+_register_option(
+    'tracing.dense_threshold',
+    0.25,
+    'Explored fraction of the volume from which searches use dense (array) instead of sparse (map) search images',
+    _fraction_validator
+)
+
+_register_option(
+    'tracing.search_memory_fraction',
+    0.5,
+    'Fraction of the free JVM heap available to search state when choosing search images',
+    _fraction_validator
+)
+
+_register_option(
+    'tracing.prefetch_workers',
+    4,
+    'Number of threads loading image chunks ahead of searches (pysnt.tracing.ChunkPrefetcher)',
+    _positive_int_validator
+)
+
+_register_option(
+    'tracing.prefetch_chunks',
+    256,
+    'Maximum number of image chunks queued or tracked as loaded by pysnt.tracing.ChunkPrefetcher',
+    _positive_int_validator
+)
+
+_register_option(
+    'tracing.prefetch_lookahead',
+    2.0,
+    'Distance ahead of the estimated search frontier, in chunk lengths, prefetched by pysnt.tracing.ChunkPrefetcher',
+    lambda x: max(0.0, float(x))
+)
+
+# Asynchronous execution options
+_register_option(
+    'async.max_workers',
+    4,
+    'Number of worker threads running asynchronous SNT operations (pysnt.async_utils); '
+    'takes effect when the pool is (re)created',
+    _positive_int_validator
+)
+
+# JVM configuration options
+_register_option(
+    'java.jvm_profile',
+    None,
+    "JVM tuning profile used by initialize() when none is given: None (JVM defaults), 'batch-throughput', "
+    "'interactive-low-latency' or 'memory-constrained'",
+    _jvm_profile_validator
+)
+_register_option(
+    'java.cds',
+    True,
+    'Start the JVM with the Class Data Sharing archive of the Fiji installation, if one was built '
+    '(python -m pysnt --build-cds) and its classpath is unchanged',
+    lambda x: bool(x)
+)
+_register_option(
+    'java.lean.services',
+    (),
+    "SciJava service classes started by initialize(mode='lean') in a minimal context "
+    "(e.g., ['org.scijava.log.LogService']). Empty for no context",
+    _string_list_validator
+)
+_register_option(
+    'java.lean.extra_artifacts',
+    (),
+    "Artifact IDs added, with their dependencies, to the classpath of initialize(mode='lean') "
+    "(e.g., ['imagej-ops'])",
+    _string_list_validator
+)
+
 # Java logging configuration options
 _register_option(
     'java.logging.level',
@@ -328,6 +563,36 @@ _register_option(
     _java_logging_callback
 )
 
+# JVM diagnostics options
+_register_option(
+    'diagnostics.monitor',
+    False,
+    'Monitor JVM heap usage in a background thread (started with SNT, or immediately if SNT is running)',
+    lambda x: bool(x),
+    _heap_monitor_callback
+)
+
+_register_option(
+    'diagnostics.monitor_interval',
+    60.0,
+    'Seconds between JVM memory samples taken by the heap monitor',
+    _positive_number_validator
+)
+
+_register_option(
+    'diagnostics.monitor_log',
+    True,
+    'Log every JVM memory sample taken by the heap monitor (INFO level)',
+    lambda x: bool(x)
+)
+
+_register_option(
+    'diagnostics.heap_warning_threshold',
+    0.9,
+    'Fraction of the maximum JVM heap above which the heap monitor warns and notifies heap warning callbacks',
+    _fraction_validator
+)
+
 _register_option(
     'debug_mode',
     False,
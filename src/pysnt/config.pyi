@@ -16,20 +16,34 @@ class _Option:
 
 def _chart_format_validator(value: str) -> str: ...
 
+def _tree_renderer_validator(value: str) -> str: ...
+
 def _table_display_validator(value: str) -> str: ...
 
 def _positive_int_validator(value: int) -> int: ...
 
 def _dpi_validator(value: int) -> int: ...
 
+def _positive_number_validator(value: float) -> float: ...
+
+def _fraction_validator(value: float) -> float: ...
+
+def _jvm_profile_validator(value: Optional[str]) -> Optional[str]: ...
+
+def _string_list_validator(value: Any) -> tuple: ...
+
 def _layout_algorithm_validator(value: str) -> str: ...
 
+def _lod_validator(value: Any) -> Any: ...
+
 def _graph_type_validator(value: str) -> str: ...
 
 def _debug_mode_callback(key: str, old_value: Any, new_value: Any) -> None: ...
 
 def _java_logging_callback(key: str, old_value: Any, new_value: Any) -> None: ...
 
+def _heap_monitor_callback(key: str, old_value: Any, new_value: Any) -> None: ...
+
 def _register_option(key: str, default_value: Any, doc: str, validator: Optional[Callable], callback: Optional[Callable]) -> Any: ...
 
 def get_option(key: str) -> Any: ...
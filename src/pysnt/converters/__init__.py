@@ -19,7 +19,7 @@ import logging
 from typing import Any, Dict, List
 
 # Import main public API functions
-from ..display import display, register_display_handler
+from ..display import display, register_display_handler, plot_trees
 from .enhancement import enhance_java_object, auto_enhance_java_objects
 
 # Import structured data converter functions for backward compatibility
@@ -31,7 +31,7 @@ from .structured_data_converters import (
 )
 
 # Import tree converter functions
-from .tree_converters import tree_to_points
+from .tree_converters import tree_to_points, tree_to_arrays
 
 # Import graph converter functions for backward compatibility
 from .graph_converters import (
@@ -167,6 +167,7 @@ __version__ = "1.0.0"
 __all__ = [
     # Main public API functions
     "display",
+    "plot_trees",
     "register_snt_converters",
     "list_converters",
     
@@ -200,6 +201,7 @@ __all__ = [
     
     # Tree converter functions
     "tree_to_points",
+    "tree_to_arrays",
     
     # Constants
     "HAS_NETWORKX"
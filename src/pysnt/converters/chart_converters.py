@@ -13,10 +13,11 @@ Dependencies: core.py
 
 import logging
 import os
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple, Union
 
 from matplotlib.figure import Figure
 
+from ..profiling import _record_transfer
 from .core import (
     _create_converter_result,
     _create_error_result,
@@ -66,6 +67,8 @@ def _convert_snt_chart(chart: Any, **kwargs) -> SNTObject:
         - scale: scaling factor (default: 1.0)
         - max_panels: maximum number of panels to detect when handling combined (multi-panel) charts (default: 20)
         - panel_layout: 'auto', 'horizontal', 'vertical', or tuple (rows, cols) (default: 'auto')
+        - in_memory: export chart bytes directly from Java, bypassing temporary files
+          (default: uses pysnt.get_option('display.chart_in_memory'))
 
     Returns
     -------
@@ -81,18 +84,28 @@ def _convert_snt_chart(chart: Any, **kwargs) -> SNTObject:
         scale = kwargs.get('scale', DEFAULT_SCALE)
         max_panels = kwargs.get('max_panels', DEFAULT_MAX_PANELS)
         panel_layout = kwargs.get('panel_layout', DEFAULT_PANEL_LAYOUT)
+        in_memory = kwargs.get('in_memory', get_option('display.chart_in_memory'))
 
         # Check if this is a combined chart
         is_combined = chart.isCombined()
         logger.debug(f"Chart isCombined: {is_combined}")
 
-        if is_combined:
-            # Handle combined chart with multiple panels
-            logger.info(f"Processing combined chart")
-            figure_data = _convert_combined_snt_chart(chart, format_type, temp_dir, scale, max_panels, panel_layout)
-        else:
-            # Handle single chart or forced single processing
-            figure_data = _convert_single_snt_chart(chart, format_type, temp_dir, scale)
+        figure_data = None
+        if in_memory:
+            # Fast path: no temporary files. Falls back to file export on failure
+            figure_data = _convert_snt_chart_in_memory(chart, format_type, scale, max_panels, panel_layout,
+                                                       is_combined)
+
+        if figure_data is None:
+            in_memory = False
+            if is_combined:
+                # Handle combined chart with multiple panels
+                logger.info(f"Processing combined chart")
+                figure_data = _convert_combined_snt_chart(chart, format_type, temp_dir, scale, max_panels,
+                                                          panel_layout)
+            else:
+                # Handle single chart or forced single processing
+                figure_data = _convert_single_snt_chart(chart, format_type, temp_dir, scale)
 
         if figure_data is None:
             raise ValueError("Chart conversion produced no data")
@@ -101,7 +114,8 @@ def _convert_snt_chart(chart: Any, **kwargs) -> SNTObject:
         metadata = {
             'format': format_type,
             'scale': scale,
-            'is_combined': is_combined
+            'is_combined': is_combined,
+            'in_memory': bool(in_memory)
         }
         
         # Get additional chart metadata if available
@@ -135,8 +149,8 @@ def _save_chart_by_format(chart: Any, output_path: str, format_type: str, scale:
         chart.saveAsPNG(output_path, scale)
 
 
-def _load_figure_by_format(file_path: str, format_type: str, figsize=None) -> Figure:
-    """Load chart file into a matplotlib Figure using the requested format.
+def _load_figure_by_format(file_path: Union[str, bytes], format_type: str, figsize=None) -> Figure:
+    """Load chart file (or in-memory chart bytes) into a matplotlib Figure using the requested format.
 
     Unknown formats intentionally fall back to PNG for backward compatibility.
     """
@@ -217,7 +231,8 @@ def _discover_panel_files(
     return panel_files
 
 
-def _load_panel_figures_for_layout(panel_files: List[str], format_type: str) -> List[Optional[Figure]]:
+def _load_panel_figures_for_layout(panel_files: List[Union[str, bytes]],
+                                   format_type: str) -> List[Optional[Figure]]:
     """Load panel figures (best effort) for aspect and grid calculations."""
     panel_figures: List[Optional[Figure]] = []
     for panel_file in panel_files:
@@ -265,7 +280,7 @@ def _render_panel_figure(ax: Any, panel_fig: Figure, panel_index: int) -> None:
 
 def _render_combined_panels(
     axes: List[Any],
-    panel_files: List[str],
+    panel_files: List[Union[str, bytes]],
     panel_figures: List[Optional[Figure]],
     format_type: str,
     plt_module: Any,
@@ -285,7 +300,8 @@ def _render_combined_panels(
             if panel_fig:
                 plt_module.close(panel_fig)
         except Exception as e:
-            logger.warning(f"Failed to load panel {i + 1} from {panel_file}: {e}")
+            source = panel_file if isinstance(panel_file, str) else f"<{len(panel_file)} bytes>"
+            logger.warning(f"Failed to load panel {i + 1} from {source}: {e}")
             _setup_error_axis(ax, f'Panel {i + 1}\n(Error)')
 
 
@@ -388,29 +404,214 @@ def _convert_combined_snt_chart(chart: Any, format_type: str, temp_dir: Optional
             max_panels=max_panels,
         )
 
-        # Create subplot grid using new utilities with aspect ratio preservation
-        num_panels = len(panel_files)
-        panel_figures = _load_panel_figures_for_layout(panel_files, format_type)
-
-        # Use new grid creation utility with aspect ratio preservation
-        from ..display.utils import _create_subplot_grid
-        fig, axes, _ = _create_subplot_grid(
-            num_panels,
-            panel_layout,
-            figsize=None,
-            source_figures=panel_figures,
-        )
-        _render_combined_panels(axes, panel_files, panel_figures, format_type, plt)
+        return _assemble_combined_figure(panel_files, format_type, panel_layout, plt)
+
+
+def _assemble_combined_figure(panel_sources: List[Union[str, bytes]], format_type: str, panel_layout: str,
+                              plt_module: Any) -> Figure:
+    """
+    Assemble panel files (or in-memory panel bytes) into a single multipanel figure.
+
+    Parameters
+    ----------
+    panel_sources : list of str or bytes
+        Panel file paths or encoded panel contents
+    format_type : str
+        File format ('svg', 'pdf', 'png')
+    panel_layout : str or tuple
+        Layout for panels ('auto', 'horizontal', 'vertical', or (rows, cols))
+    plt_module : module
+        The matplotlib.pyplot module
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        The assembled multipanel matplotlib figure
+    """
+    # Create subplot grid using new utilities with aspect ratio preservation
+    num_panels = len(panel_sources)
+    panel_figures = _load_panel_figures_for_layout(panel_sources, format_type)
+
+    # Use new grid creation utility with aspect ratio preservation
+    from ..display.utils import _create_subplot_grid
+    fig, axes, _ = _create_subplot_grid(
+        num_panels,
+        panel_layout,
+        figsize=None,
+        source_figures=panel_figures,
+    )
+    _render_combined_panels(axes, panel_sources, panel_figures, format_type, plt_module)
+
+    # Hide unused subplots
+    for i in range(num_panels, len(axes)):
+        axes[i].set_visible(False)
+
+    # Apply standardized layout (no overall title by default for consistency)
+    from ..display.utils import _apply_standard_layout
+    _apply_standard_layout(fig, show_overall_title=False, show_panel_titles=False)
+
+    return fig
+
 
-        # Hide unused subplots
-        for i in range(num_panels, len(axes)):
-            axes[i].set_visible(False)
+# In-memory export (no temporary files)
 
-        # Apply standardized layout (no overall title by default for consistency)
-        from ..display.utils import _apply_standard_layout
-        _apply_standard_layout(fig, show_overall_title=False, show_panel_titles=False)
+# Default panel size used when a chart has not been laid out yet
+_DEFAULT_CHART_SIZE = (400, 400)
 
-        return fig
+
+def _convert_snt_chart_in_memory(chart: Any, format_type: str, scale: float, max_panels: int,
+                                 panel_layout: str, is_combined: bool) -> Optional[Figure]:
+    """
+    Convert an SNTChart to a matplotlib figure without touching the filesystem.
+
+    Each panel's underlying JFreeChart is rendered into a Java in-memory stream and
+    the resulting bytes are handed directly to the rasterizers (cairosvg, fitz, or
+    matplotlib). Combined charts are handled by collecting every ChartPanel in the
+    chart's frame.
+
+    Parameters
+    ----------
+    chart : SNT Chart
+        The chart object to convert
+    format_type : str
+        File format ('svg', 'pdf', 'png')
+    scale : float
+        Scaling factor
+    max_panels : int
+        Maximum number of panels to render for combined charts
+    panel_layout : str or tuple
+        Layout for panels ('auto', 'horizontal', 'vertical', or (rows, cols))
+    is_combined : bool
+        Whether the chart is a combined (multipanel) chart
+
+    Returns
+    -------
+    matplotlib.figure.Figure or None
+        The converted figure, or None if in-memory export is not possible, in which
+        case callers should fall back to file-based export
+    """
+    try:
+        panels = _collect_chart_panels(chart, is_combined)
+        if not panels:
+            logger.debug("In-memory chart export: no exportable panels found")
+            return None
+        if len(panels) > max_panels:
+            logger.warning(f"Found {len(panels)} chart panels, limiting to {max_panels}")
+            panels = panels[:max_panels]
+
+        panel_bytes = [_export_chart_bytes(panel, format_type, scale) for panel in panels]
+        _record_transfer('org.jfree.chart.JFreeChart', sum(len(b) for b in panel_bytes))
+        logger.debug(f"In-memory chart export: {len(panel_bytes)} panel(s), "
+                     f"{sum(len(b) for b in panel_bytes)} bytes ({format_type})")
+
+        if not is_combined:
+            return _load_figure_by_format(panel_bytes[0], format_type, figsize=None)
+        plt = _setup_matplotlib_interactive()
+        return _assemble_combined_figure(panel_bytes, format_type, panel_layout, plt)
+    except Exception as e:
+        logger.debug(f"In-memory chart export failed, falling back to file export: {e}")
+        return None
+
+
+def _collect_chart_panels(chart: Any, is_combined: bool) -> List[Any]:
+    """
+    Collect the ChartPanels holding the JFreeCharts to be exported.
+
+    A single SNTChart is itself a ChartPanel. For combined charts, the AWT component
+    tree of the hosting frame is walked (in display order) to find every panel.
+    """
+    if not is_combined:
+        return [chart] if hasattr(chart, 'getChart') and chart.getChart() is not None else []
+
+    import scyjava
+    ChartPanel = scyjava.jimport('org.jfree.chart.ChartPanel')
+    root = chart.getFrame() if hasattr(chart, 'getFrame') else None
+    if root is None:
+        return []
+
+    panels: List[Any] = []
+    stack = [root]
+    while stack:
+        component = stack.pop(0)
+        if isinstance(component, ChartPanel):
+            if component.getChart() is not None:
+                panels.append(component)
+            continue
+        if hasattr(component, 'getComponents'):
+            stack[0:0] = list(component.getComponents())
+    return panels
+
+
+def _chart_panel_size(panel: Any) -> Tuple[int, int]:
+    """Return the (width, height) of a chart panel, using a default for unrealized panels."""
+    try:
+        width, height = int(panel.getWidth()), int(panel.getHeight())
+        if width > 0 and height > 0:
+            return width, height
+    except Exception as e:
+        logger.debug(f"Could not read chart panel dimensions: {e}")
+    return _DEFAULT_CHART_SIZE
+
+
+def _export_chart_bytes(panel: Any, format_type: str, scale: float) -> bytes:
+    """
+    Render a ChartPanel's JFreeChart into an in-memory buffer.
+
+    Parameters
+    ----------
+    panel : ChartPanel
+        Panel (e.g., an SNTChart) holding the JFreeChart to export
+    format_type : str
+        File format ('svg', 'pdf', 'png'). Unknown formats fall back to PNG
+    scale : float
+        Scaling factor applied to the panel dimensions
+
+    Returns
+    -------
+    bytes
+        Encoded chart contents
+    """
+    import scyjava
+
+    jchart = panel.getChart()
+    width, height = _chart_panel_size(panel)
+    width, height = max(1, int(round(width * scale))), max(1, int(round(height * scale)))
+    Rectangle2D = scyjava.jimport('java.awt.geom.Rectangle2D$Double')
+
+    if format_type == 'svg':
+        SVGGraphics2D = _jimport_first('org.jfree.svg.SVGGraphics2D', 'org.jfree.graphics2d.svg.SVGGraphics2D')
+        g2 = SVGGraphics2D(width, height)
+        jchart.draw(g2, Rectangle2D(0.0, 0.0, float(width), float(height)))
+        return str(g2.getSVGDocument()).encode('utf-8')
+
+    if format_type == 'pdf':
+        PDFDocument = scyjava.jimport('com.orsonpdf.PDFDocument')
+        Rectangle = scyjava.jimport('java.awt.Rectangle')
+        doc = PDFDocument()
+        page = doc.createPage(Rectangle(width, height))
+        g2 = page.getGraphics2D()
+        jchart.draw(g2, Rectangle2D(0.0, 0.0, float(width), float(height)))
+        return bytes(doc.getPDFBytes())
+
+    # PNG format (default fallback)
+    ChartUtils = _jimport_first('org.jfree.chart.ChartUtils', 'org.jfree.chart.ChartUtilities')
+    ByteArrayOutputStream = scyjava.jimport('java.io.ByteArrayOutputStream')
+    stream = ByteArrayOutputStream()
+    ChartUtils.writeChartAsPNG(stream, jchart, width, height)
+    return bytes(stream.toByteArray())
+
+
+def _jimport_first(*class_names: str) -> Any:
+    """Import the first available Java class among alternatives (e.g., across library versions)."""
+    import scyjava
+
+    last_error: Optional[Exception] = None
+    for class_name in class_names:
+        try:
+            return scyjava.jimport(class_name)
+        except Exception as e:
+            last_error = e
+    raise ImportError(f"None of the Java classes {class_names} are available: {last_error}")
 
 
 # Format conversion utilities
@@ -420,6 +621,18 @@ import numpy as np
 from io import BytesIO
 
 
+def _read_source_bytes(source) -> bytes:
+    """Return the contents of a path, bytes-like object, or file-like object as bytes."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if hasattr(source, 'read'):
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        return source.read()
+    with open(source, 'rb') as f:
+        return f.read()
+
+
 def _create_figure_with_image(img_array, figsize=None, title=None, dpi=None, tight_layout=True):
     """
     Unified figure creation with consistent formatting.
@@ -473,7 +686,7 @@ def _svg_to_matplotlib(svg_file, dpi=None, figsize=None, background='white'):
     Convert an SVG file to a matplotlib Figure object using cairosvg.
 
     Args:
-        svg_file: Path to the SVG file or file-like object
+        svg_file: Path to the SVG file, SVG bytes, or file-like object
         dpi: Resolution for rendering (default: 300)
         figsize: Tuple (width, height). If None, auto-sizes based on SVG
         background: Background color (default: 'white', use None for transparent)
@@ -498,8 +711,7 @@ def _svg_to_matplotlib(svg_file, dpi=None, figsize=None, background='white'):
 
     try:
         # Try to read and validate SVG file first
-        with open(svg_file, 'rb') as f:
-            svg_content = f.read()
+        svg_content = _read_source_bytes(svg_file)
         
         # Check if file is actually SVG (should start with <?xml, <!DOCTYPE, or <svg)
         svg_start = svg_content[:100].decode('utf-8', errors='ignore').strip()
@@ -529,9 +741,9 @@ def _svg_to_matplotlib(svg_file, dpi=None, figsize=None, background='white'):
         logger.error(f"Failed to convert SVG with cairosvg: {e}")
         # Log first few lines of SVG for debugging
         try:
-            with open(svg_file, 'r', encoding='utf-8', errors='ignore') as f:
-                first_lines = ''.join(f.readlines()[:5])
-                logger.debug(f"First lines of SVG file:\n{first_lines}")
+            text = _read_source_bytes(svg_file).decode('utf-8', errors='ignore')
+            first_lines = ''.join(text.splitlines(keepends=True)[:5])
+            logger.debug(f"First lines of SVG file:\n{first_lines}")
         except:
             pass
         raise
@@ -554,7 +766,7 @@ def _pdf_to_matplotlib(pdf_file, page=0, dpi=None, figsize=None):
     Convert a PDF file (or specific page) to a matplotlib Figure object using PyMuPDF (fitz).
 
     Args:
-        pdf_file: Path to the PDF file or file-like object
+        pdf_file: Path to the PDF file, PDF bytes, or file-like object
         page: Page number to convert (0-indexed, default: 0 for first page)
         dpi: Resolution for rendering (default: 300 for print quality)
         figsize: Tuple (width, height) in inches. If None, auto-sizes based on PDF
@@ -579,8 +791,11 @@ def _pdf_to_matplotlib(pdf_file, page=0, dpi=None, figsize=None):
     if dpi is None:
         dpi = get_option('display.chart_dpi')
 
-    # Open PDF
-    doc = fitz.open(pdf_file)
+    # Open PDF (in-memory sources are opened as streams)
+    if isinstance(pdf_file, (str, os.PathLike)):
+        doc = fitz.open(pdf_file)
+    else:
+        doc = fitz.open(stream=_read_source_bytes(pdf_file), filetype='pdf')
 
     # Check if page exists
     if page >= len(doc):
@@ -632,14 +847,14 @@ def _pdf_to_matplotlib(pdf_file, page=0, dpi=None, figsize=None):
     )
 
 
-def _png_to_matplotlib(png_file: str, figsize=None) -> Figure:
+def _png_to_matplotlib(png_file: Union[str, bytes], figsize=None) -> Figure:
     """
     Convert PNG file to matplotlib figure.
     
     Parameters
     ----------
-    png_file : str
-        Path to PNG file
+    png_file : str, bytes, or file-like
+        Path to PNG file, PNG bytes, or file-like object
     figsize : tuple, optional
         Figure size (width, height)
         
@@ -650,7 +865,9 @@ def _png_to_matplotlib(png_file: str, figsize=None) -> Figure:
     """
     try:
         # Load PNG image
-        img = mpimg.imread(png_file)
+        if isinstance(png_file, (bytes, bytearray, memoryview)):
+            png_file = BytesIO(png_file)
+        img = mpimg.imread(png_file, format='png')
 
         # Estimate size if not provided
         if figsize is None:
@@ -7,6 +7,7 @@ Auto-generated stub file.
 from typing import Any, Dict, List, Optional, Union, Callable, Tuple
 
 logger: Any
+_DEFAULT_CHART_SIZE: Any
 def _is_snt_chart(obj: Any) -> bool: ...
 
 def _convert_snt_chart(chart: Any, **kwargs: Any) -> SNTObject: ...
@@ -15,10 +16,24 @@ def _convert_single_snt_chart(chart: Any, format_type: str, temp_dir: Optional[s
 
 def _convert_combined_snt_chart(chart: Any, format_type: str, temp_dir: Optional[str], scale: float, max_panels: int, panel_layout: str) -> Figure: ...
 
+def _assemble_combined_figure(panel_sources: List[Union[str, bytes]], format_type: str, panel_layout: str, plt_module: Any) -> Figure: ...
+
+def _convert_snt_chart_in_memory(chart: Any, format_type: str, scale: float, max_panels: int, panel_layout: str, is_combined: bool) -> Optional[Figure]: ...
+
+def _collect_chart_panels(chart: Any, is_combined: bool) -> List[Any]: ...
+
+def _chart_panel_size(panel: Any) -> Tuple[int, int]: ...
+
+def _export_chart_bytes(panel: Any, format_type: str, scale: float) -> bytes: ...
+
+def _jimport_first(*class_names: str) -> Any: ...
+
+def _read_source_bytes(source: Any) -> bytes: ...
+
 def _create_figure_with_image(img_array: Any, figsize: Any, title: Any, dpi: Any, tight_layout: Any) -> Any: ...
 
 def _svg_to_matplotlib(svg_file: Any, dpi: Any, figsize: Any, background: Any) -> Any: ...
 
 def _pdf_to_matplotlib(pdf_file: Any, page: Any, dpi: Any, figsize: Any) -> Any: ...
 
-def _png_to_matplotlib(png_file: str, figsize: Any) -> Figure: ...
+def _png_to_matplotlib(png_file: Union[str, bytes], figsize: Any) -> Figure: ...
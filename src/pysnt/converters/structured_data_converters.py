@@ -6,15 +6,18 @@ This module handles conversion of SNT structured (tabular-like) data objects
 - Structured data predicate functions for type detection
 - Converter functions for tabular data (SNTTable)
 - Path conversion functions for SNT Path coordinate sequences
-- ImagePlus metadata extraction utilities
+- ImagePlus metadata extraction and direct pixel transfer utilities
 
 Dependencies: core.py
 """
 
-from typing import Any
+import sys
+from typing import Any, Optional
 
+import numpy as np
 import xarray  # noqa
 
+from ..profiling import _record_transfer
 from .core import (
     logger,
     HAS_PANDAS,
@@ -251,3 +254,108 @@ def _extract_imageplus_metadata(imageplus: Any, **kwargs) -> dict:
     except Exception as e:
         logger.error(f"Failed to extract ImagePlus metadata: {e}")
         return {}
+
+
+# ImageJ stores unsigned 8/16-bit pixels in signed Java arrays: reinterpret them
+_UNSIGNED_PIXEL_TYPES = {np.dtype(np.int8): np.uint8, np.dtype(np.int16): np.uint16}
+
+# Byte offsets of R, G, B within a packed 0xAARRGGBB int, as laid out in memory
+_RGB_BYTE_ORDER = [2, 1, 0] if sys.byteorder == 'little' else [1, 2, 3]
+
+
+def _pixels_to_numpy(pixels: Any, width: int, height: int, is_rgb: bool = False) -> np.ndarray:
+    """
+    Map an ImageProcessor pixel array onto a NumPy array.
+
+    The primitive Java array (byte[], short[], float[] or int[]) is read through the
+    buffer protocol in a single bulk transfer; the returned array is a view of that
+    buffer (no per-element conversion or intermediate copies).
+
+    Parameters
+    ----------
+    pixels : Java primitive array or buffer
+        The array returned by ImageProcessor.getPixels()
+    width, height : int
+        Image dimensions
+    is_rgb : bool, default False
+        Whether pixels are packed RGB ints (ColorProcessor)
+
+    Returns
+    -------
+    numpy.ndarray
+        (height, width) array, or (height, width, 3) uint8 array for RGB images
+    """
+    try:
+        flat = np.asarray(memoryview(pixels))
+    except TypeError:
+        flat = np.asarray(pixels)
+    flat = flat.reshape(-1)
+    if flat.size != width * height:
+        raise ValueError(f"Pixel array has {flat.size} elements, expected {width}x{height}")
+
+    if is_rgb or flat.dtype == np.int32:
+        # Packed 0xAARRGGBB: view the ints as bytes and pick the channels
+        packed = np.ascontiguousarray(flat, dtype=np.int32)
+        return packed.view(np.uint8).reshape(height, width, 4)[..., _RGB_BYTE_ORDER]
+
+    unsigned = _UNSIGNED_PIXEL_TYPES.get(flat.dtype)
+    if unsigned is not None:
+        flat = flat.view(unsigned)
+    return flat.reshape(height, width)
+
+
+def _imageplus_pixels_to_xarray(imageplus: Any) -> Optional[xarray.DataArray]:
+    """
+    Convert the current processor of a 2D ImagePlus to a xarray DataArray.
+
+    This is the fast path used for display: it bypasses the generic
+    ij().py.from_java() conversion and maps the processor's pixel array straight
+    into NumPy. The number of bytes read from the Java array is stored in the
+    'bytes_transferred' attribute.
+
+    Parameters
+    ----------
+    imageplus : ImagePlus
+        A single-plane ImagePlus (e.g., the output of ImpUtils.convertToSimple2D)
+
+    Returns
+    -------
+    xarray.DataArray or None
+        DataArray with dims ('row', 'col') or ('row', 'col', 'ch'), or None if the
+        image has no pixel data
+    """
+    processor = imageplus.getProcessor()
+    if processor is None:
+        return None
+    pixels = processor.getPixels()
+    if pixels is None:
+        return None
+
+    width, height = int(processor.getWidth()), int(processor.getHeight())
+    is_rgb = imageplus.getType() == 4  # ImagePlus.COLOR_RGB
+    data = _pixels_to_numpy(pixels, width, height, is_rgb=is_rgb)
+
+    dims = ('row', 'col', 'ch') if data.ndim == 3 else ('row', 'col')
+    bytes_transferred = width * height * (4 if data.ndim == 3 else data.itemsize)
+    _record_transfer('ij.process.ImageProcessor', bytes_transferred)
+    logger.debug(f"Transferred {bytes_transferred} bytes of pixel data ({width}x{height}, {data.dtype})")
+    return xarray.DataArray(data, dims=dims, name=imageplus.getTitle(),
+                            attrs={'bytes_transferred': bytes_transferred})
+
+
+def _imageplus_to_xarray(imageplus: Any) -> Optional[xarray.DataArray]:
+    """
+    Convert a 2D ImagePlus to xarray, preferring the direct pixel transfer.
+
+    Falls back to ij().py.from_java() when the fast path is unavailable (e.g.,
+    virtual stacks without a loaded processor or unexpected pixel types).
+    """
+    try:
+        data = _imageplus_pixels_to_xarray(imageplus)
+        if data is not None:
+            return data
+    except Exception as e:
+        logger.debug(f"Direct pixel transfer failed, using ij().py.from_java(): {e}")
+
+    from ..core import ij
+    return ij().py.from_java(imageplus)
@@ -13,3 +13,11 @@ def _convert_snt_table(table: Any, **kwargs: Any) -> SNTObject: ...
 def _convert_path_to_xarray(path: Any) -> Any: ...
 
 def _extract_imageplus_metadata(imageplus: Any, **kwargs: Any) -> dict: ...
+
+_UNSIGNED_PIXEL_TYPES: Any
+_RGB_BYTE_ORDER: Any
+def _pixels_to_numpy(pixels: Any, width: int, height: int, is_rgb: bool) -> Any: ...
+
+def _imageplus_pixels_to_xarray(imageplus: Any) -> Optional[Any]: ...
+
+def _imageplus_to_xarray(imageplus: Any) -> Optional[Any]: ...
@@ -5,13 +5,33 @@ This module provides functions to convert SNT Tree objects into Python data stru
 """
 
 import logging
+import threading
 import numpy as np
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from .core import _create_converter_result
 
 logger = logging.getLogger(__name__)
 
+# Packs the (id, parent, type, x, y, z, radius) fields of the SWCPoints of a Tree
+# into a single double[], row by row
+_SWC_PACK_SCRIPT = """
+{ tree ->
+    def points = tree.getNodesAsSWCPoints()
+    double[] table = new double[points.size() * 7]
+    int i = 0
+    for (p in points) {
+        table[i++] = p.id; table[i++] = p.parent; table[i++] = p.type
+        table[i++] = p.x; table[i++] = p.y; table[i++] = p.z; table[i++] = p.radius
+    }
+    table
+}
+"""
+
+# Compiled packing closure (False once Groovy is known to be unavailable)
+_swc_packer = None
+_swc_packer_lock = threading.Lock()
+
 
 def _is_snt_tree(obj) -> bool:
     """
@@ -148,4 +168,123 @@ def tree_to_points(tree):
         return result['data']
     else:
         error_msg = result.get('error', 'Unknown error') if result else 'Conversion failed'
-        raise RuntimeError(f"Tree conversion failed: {error_msg}")
\ No newline at end of file
+        raise RuntimeError(f"Tree conversion failed: {error_msg}")
+
+def _extract_tree_arrays(tree) -> Dict[str, np.ndarray]:
+    """
+    Extract node and segment arrays from an SNT Tree in a single pass.
+
+    The fields of all nodes (``Tree.getNodesAsSWCPoints()``) are packed into a
+    primitive array on the JVM side (with a small Groovy closure, compiled once
+    per session) and copied into NumPy in a single transfer. If Groovy is not
+    available, the fields of each node are read one by one.
+
+    Parameters
+    ----------
+    tree : Tree
+        SNT Tree object
+
+    Returns
+    -------
+    dict
+        Dictionary of numpy arrays:
+        - 'xyz': (N, 3) float array of node coordinates
+        - 'radius': (N,) float array of node radii
+        - 'type': (N,) int array of SWC types
+        - 'parent': (N,) int array of parent row indices (-1 for roots)
+        - 'segments': (M, 2) int array of (parent, child) row indices
+    """
+    packer = _get_swc_packer()
+    if packer:
+        table = np.array(packer.call(tree), dtype=np.float64)
+    else:
+        points = tree.getNodesAsSWCPoints()
+        table = np.array([(p.id, p.parent, p.type, p.x, p.y, p.z, p.radius) for p in points], dtype=np.float64)
+    return _arrays_from_swc_table(table.reshape(-1, 7))
+
+
+def _get_swc_packer() -> Any:
+    """Compile the SWCPoint packing closure once per session; None/False if unavailable."""
+    global _swc_packer
+    with _swc_packer_lock:
+        if _swc_packer is None:
+            try:
+                import scyjava
+                if not scyjava.jvm_started():
+                    return None
+                _swc_packer = scyjava.jimport('groovy.lang.GroovyShell')().evaluate(_SWC_PACK_SCRIPT)
+            except Exception as e:
+                _swc_packer = False
+                logger.warning(f"Groovy is not available ({e}): reading tree nodes one by one")
+        return _swc_packer
+
+
+def _arrays_from_swc_table(table: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Build node/segment arrays from an (N, 7) SWC-like table.
+
+    Parameters
+    ----------
+    table : np.ndarray
+        Array with columns (id, parent_id, type, x, y, z, radius)
+
+    Returns
+    -------
+    dict
+        See _extract_tree_arrays()
+    """
+    table = np.asarray(table, dtype=np.float64).reshape(-1, 7)
+    ids = table[:, 0].astype(np.int64)
+    parent_ids = table[:, 1].astype(np.int64)
+
+    # Map parent ids to row indices (SWC ids need not be contiguous)
+    if len(ids):
+        order = np.argsort(ids, kind='stable')
+        sorted_ids = ids[order]
+        pos = np.clip(np.searchsorted(sorted_ids, parent_ids), 0, len(ids) - 1)
+        parent = np.where(sorted_ids[pos] == parent_ids, order[pos], -1).astype(np.int64)
+    else:
+        parent = np.empty(0, dtype=np.int64)
+
+    children = np.flatnonzero(parent >= 0)
+    segments = np.column_stack((parent[children], children)).astype(np.int64)
+
+    return {
+        'xyz': np.ascontiguousarray(table[:, 3:6]),
+        'radius': table[:, 6].copy(),
+        'type': table[:, 2].astype(np.int64),
+        'parent': parent,
+        'segments': segments.reshape(-1, 2),
+    }
+
+
+def tree_to_arrays(tree) -> Dict[str, np.ndarray]:
+    """
+    Extract node and segment arrays from a Tree for bulk processing and rendering.
+
+    Parameters
+    ----------
+    tree : Tree
+        PySNT Tree object
+
+    Returns
+    -------
+    dict
+        Dictionary of numpy arrays with keys 'xyz' (N, 3), 'radius' (N,),
+        'type' (N,), 'parent' (N,) (row index of parent node, -1 for roots)
+        and 'segments' (M, 2) (parent/child row indices of each segment)
+
+    Examples
+    --------
+    >>> arrays = pysnt.tree_to_arrays(tree)
+    >>> xyz, segments = arrays['xyz'], arrays['segments']
+    >>> lengths = np.linalg.norm(xyz[segments[:, 1]] - xyz[segments[:, 0]], axis=1)
+    >>> print(lengths.sum())  # cable length
+    """
+    if not _is_snt_tree(tree):
+        raise ValueError("Object is not an SNT Tree")
+
+    try:
+        return _extract_tree_arrays(tree)
+    except Exception as e:
+        raise RuntimeError(f"Tree conversion failed: {e}") from e
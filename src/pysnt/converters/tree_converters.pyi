@@ -7,8 +7,19 @@ Auto-generated stub file.
 from typing import Any, Dict, List, Optional, Union, Callable, Tuple
 
 logger: Any
+_SWC_PACK_SCRIPT: Any
+_swc_packer: Any
+_swc_packer_lock: Any
 def _is_snt_tree(obj: Any) -> bool: ...
 
 def _convert_tree_to_points(tree: Any, **kwargs: Any) -> Optional[dict]: ...
 
 def tree_to_points(tree: Any) -> Any: ...
+
+def _extract_tree_arrays(tree: Any) -> Dict[str, Any]: ...
+
+def _get_swc_packer() -> Any: ...
+
+def _arrays_from_swc_table(table: Any) -> Dict[str, Any]: ...
+
+def tree_to_arrays(tree: Any) -> Dict[str, Any]: ...
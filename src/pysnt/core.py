@@ -22,6 +22,7 @@ logger = logging.getLogger(__name__)
 _ij = None
 _jvm_started = False
 _mode = None
+_jvm_settings = None
 
 
 class FijiNotFoundError(RuntimeError):
@@ -31,7 +32,8 @@ class FijiNotFoundError(RuntimeError):
     pass
 
 
-def _configure_jvm(max_heap: Optional[str] = None, min_heap: Optional[str] = None, jvm_args: Optional[List[str]] = None) -> None:
+def _configure_jvm(max_heap: Optional[str] = None, min_heap: Optional[str] = None, jvm_args: Optional[List[str]] = None,
+                   profile: Optional[str] = None) -> Dict[str, Any]:
     """
     Configure JVM parameters before startup.
     
@@ -43,28 +45,31 @@ def _configure_jvm(max_heap: Optional[str] = None, min_heap: Optional[str] = Non
         Initial heap size (e.g., "2g", "1024m")
     jvm_args : List[str], optional
         Additional JVM arguments
+    profile : str, optional
+        JVM tuning profile (see pysnt.list_jvm_profiles()). The heap is sized from
+        available memory when max_heap is not given
+
+    Returns
+    -------
+    dict
+        The resolved settings (see jvm_profiles.resolve_jvm_settings())
     """
-    if max_heap is None and min_heap is None and (jvm_args is None or len(jvm_args) == 0):
-        return  # Nothing to configure
+    global _jvm_settings
+    from .jvm_profiles import resolve_jvm_settings
+
+    settings = resolve_jvm_settings(profile, max_heap, min_heap, jvm_args)
+    _jvm_settings = settings
+    if not settings['options']:
+        return settings  # Nothing to configure
     
     logger.info("Configuring JVM parameters...")
+    if profile is not None:
+        logger.info(f"Using JVM profile: {profile}")
     
-    # Configure heap sizes
-    if max_heap is not None:
-        max_heap_arg = f"-Xmx{max_heap}"
-        scyjava.config.add_option(max_heap_arg)
-        logger.info(f"Set maximum heap size: {max_heap_arg}")
-    
-    if min_heap is not None:
-        min_heap_arg = f"-Xms{min_heap}"
-        scyjava.config.add_option(min_heap_arg)
-        logger.info(f"Set initial heap size: {min_heap_arg}")
-    
-    # Configure additional JVM arguments
-    if jvm_args is not None:
-        for arg in jvm_args:
-            scyjava.config.add_option(arg)
-            logger.info(f"Added JVM argument: {arg}")
+    # Configure heap sizes and profile/additional JVM arguments
+    for arg in settings['options']:
+        scyjava.config.add_option(arg)
+        logger.info(f"Added JVM argument: {arg}")
     
     # Add logging system properties based on current configuration
     from .config import get_option
@@ -118,10 +123,12 @@ def _configure_jvm(max_heap: Optional[str] = None, min_heap: Optional[str] = Non
         logger.debug(f"Failed to add logging properties: {e}")
     
     logger.info("JVM configuration complete")
+    return settings
 
 
 def initialize(fiji_path: Optional[str] = None, interactive: bool = True, ensure_java: bool = True, mode: str = "headless", 
-               max_heap: Optional[str] = None, min_heap: Optional[str] = None, jvm_args: Optional[List[str]] = None) -> None:
+               max_heap: Optional[str] = None, min_heap: Optional[str] = None, jvm_args: Optional[List[str]] = None,
+               jvm_profile: Optional[str] = None) -> None:
     """
     Initialize the SNT environment with ImageJ/Fiji.
     
@@ -138,7 +145,9 @@ def initialize(fiji_path: Optional[str] = None, interactive: bool = True, ensure
         to install OpenJDK if Java is not found or version is too old.
     mode : str, default "headless"
         pyimagej initialization mode. Either "headless", "gui", "interactive",
-        or "interactive:force"
+        or "interactive:force". "lean" skips ImageJ and starts a headless JVM with
+        only SNT and its dependencies on the classpath, for faster startup in jobs
+        using classes such as Tree, TreeStatistics or SNTTable (see pysnt.lean)
     max_heap : str, optional
         Maximum JVM heap size (e.g., "8g", "4096m", "2G"). 
         Convenient alternative to manually configuring JVM args.
@@ -148,6 +157,12 @@ def initialize(fiji_path: Optional[str] = None, interactive: bool = True, ensure
     jvm_args : List[str], optional
         Additional JVM arguments to pass (e.g., ["-XX:+UseG1GC", "-Xss2m"]).
         For advanced users who need full control over JVM configuration.
+    jvm_profile : str, optional
+        Workload-based JVM tuning profile: "batch-throughput", "interactive-low-latency"
+        or "memory-constrained" (see pysnt.list_jvm_profiles()). Unless max_heap is
+        given, the heap is sized from the container (cgroup) memory limit or physical
+        memory. Explicit max_heap/min_heap/jvm_args take precedence over the profile
+        (default: pysnt.get_option('java.jvm_profile'))
         
     Examples
     --------
@@ -158,10 +173,16 @@ def initialize(fiji_path: Optional[str] = None, interactive: bool = True, ensure
     >>> pysnt.initialize("gui")
     >>> pysnt.initialize("interactive")
     >>> 
+    >>> # Only SNT and its dependencies (no ImageJ, ij() unavailable)
+    >>> pysnt.initialize("lean")
+    >>> 
     >>> # Memory configuration
     >>> pysnt.initialize(max_heap="8g")  # 8GB heap
     >>> pysnt.initialize(max_heap="16g", min_heap="4g")  # 16GB max, 4GB initial
     >>> 
+    >>> # Workload-based tuning (heap sized from available memory)
+    >>> pysnt.initialize(jvm_profile="batch-throughput")
+    >>> 
     >>> # Advanced JVM configuration
     >>> pysnt.initialize(jvm_args=["-Xmx8g", "-XX:+UseG1GC"])
     >>> 
@@ -177,12 +198,12 @@ def initialize(fiji_path: Optional[str] = None, interactive: bool = True, ensure
         
     Notes
     -----
-    JVM memory configuration (max_heap, min_heap, jvm_args) must be specified
+    JVM memory configuration (max_heap, min_heap, jvm_args, jvm_profile) must be specified
     on the first call to initialize(). Subsequent calls will ignore these
     parameters since the JVM cannot be reconfigured once started.
     """
     # Handle convenience syntax: initialize("gui") -> initialize(mode="gui")
-    valid_modes = {"headless", "gui", "interactive", "interactive:force"}
+    valid_modes = {"headless", "gui", "interactive", "interactive:force", "lean"}
     if fiji_path in valid_modes:
         # Shift parameters: fiji_path is actually the mode
         mode = fiji_path
@@ -278,7 +299,12 @@ def initialize(fiji_path: Optional[str] = None, interactive: bool = True, ensure
             
         # Configure JVM BEFORE it starts
         if not scyjava.jvm_started():
-            _configure_jvm(max_heap, min_heap, jvm_args)
+            if jvm_profile is None:
+                from .config import get_option
+                jvm_profile = get_option('java.jvm_profile')
+            if mode != "lean":  # CDS archives are recorded with the full Fiji classpath
+                jvm_args = list(jvm_args or []) + _cds_jvm_args(fiji_path, jvm_args)
+            _configure_jvm(max_heap, min_heap, jvm_args, jvm_profile)
         
         # Register SNT converters BEFORE JVM starts
         if not scyjava.jvm_started():
@@ -290,9 +316,17 @@ def initialize(fiji_path: Optional[str] = None, interactive: bool = True, ensure
             except Exception as e:
                 logger.warning(f"Failed to register SNT converters: {e}")
         
-        # Initialize PyImageJ from local Fiji
-        logger.info(f"Initializing ImageJ with Fiji at: {fiji_path}")
-        _ij = imagej.init(fiji_path, mode=mode)
+        if mode == "lean":
+            # Start the JVM with SNT and its dependencies only, without ImageJ
+            from .config import get_option
+            from .lean import start_lean_jvm
+            logger.info(f"Initializing lean SNT classpath from Fiji at: {fiji_path}")
+            start_lean_jvm(fiji_path, services=get_option('java.lean.services'),
+                           extra_artifacts=get_option('java.lean.extra_artifacts'))
+        else:
+            # Initialize PyImageJ from local Fiji
+            logger.info(f"Initializing ImageJ with Fiji at: {fiji_path}")
+            _ij = imagej.init(fiji_path, mode=mode)
         
         # Store the mode for later retrieval
         _mode = mode
@@ -316,6 +350,18 @@ def initialize(fiji_path: Optional[str] = None, interactive: bool = True, ensure
             
         _jvm_started = True
         logger.info("SNT initialization complete")
+        if _jvm_settings is not None:
+            for line in _format_startup_report(_jvm_settings):
+                logger.info(line)
+
+        # Start JVM heap monitoring if requested
+        try:
+            from .config import get_option
+            if get_option('diagnostics.monitor'):
+                from .diagnostics import start_heap_monitor
+                start_heap_monitor()
+        except Exception as e:
+            logger.warning(f"Failed to start JVM heap monitor: {e}")
         
     except FijiNotFoundError:
         # Re-raise FijiNotFoundError as-is (it already has helpful messages)
@@ -530,6 +576,9 @@ def ij():
         If SNT has not been initialized.
     """
     if _ij is None:
+        if _mode == "lean":
+            raise RuntimeError("ImageJ is not available in lean mode. Call initialize() without mode='lean' "
+                               "in a new Python session to use ImageJ.")
         raise RuntimeError("SNT not initialized. Call initialize() first.")
     return _ij
 
@@ -537,13 +586,16 @@ def ij():
 def is_initialized() -> bool:
     """
     Check if SNT has been initialized.
+
+    In lean mode (see initialize()), SNT is initialized without an ImageJ
+    instance: use get_mode() to check whether ij() is available.
     
     Returns
     -------
     bool
         True if initialized, False otherwise.
     """
-    return _jvm_started and _ij is not None
+    return _jvm_started and (_ij is not None or _mode == "lean")
 
 
 def get_mode() -> Optional[str]:
@@ -579,6 +631,56 @@ def get_mode() -> Optional[str]:
     return _mode
 
 
+def get_jvm_settings() -> Optional[Dict[str, Any]]:
+    """
+    Get the JVM settings applied when SNT was initialized.
+
+    Returns
+    -------
+    dict or None
+        'profile', 'max_heap', 'min_heap', 'heap_source', 'available_memory',
+        'memory_source', 'gc' and 'options' (see pysnt.jvm_profiles), or None if
+        the JVM was not configured by pysnt (not initialized, or started elsewhere)
+
+    Examples
+    --------
+    >>> pysnt.initialize(jvm_profile="memory-constrained")
+    >>> pysnt.get_jvm_settings()['max_heap']
+    '2g'
+    """
+    return _jvm_settings
+
+
+def _cds_jvm_args(fiji_path: str, jvm_args: Optional[List[str]]) -> List[str]:
+    """Return the JVM arguments using the Class Data Sharing archive of this Fiji installation, if any."""
+    from .config import get_option
+
+    if not get_option('java.cds'):
+        return []
+    try:
+        from .cds import cds_jvm_args
+        args = cds_jvm_args(fiji_path, jvm_args)
+    except Exception as e:
+        logger.debug(f"Could not look up CDS archive: {e}")
+        return []
+    if args:
+        logger.info(f"Using CDS archive: {args[0].split('=', 1)[1]}")
+    return args
+
+
+def _format_startup_report(settings: Dict[str, Any]) -> List[str]:
+    """Describe the applied JVM settings, including the heap size the JVM actually uses."""
+    from .jvm_profiles import format_jvm_settings
+
+    lines = format_jvm_settings(settings)
+    try:
+        Runtime = scyjava.jimport('java.lang.Runtime')
+        lines.append(f"Effective max heap: {int(Runtime.getRuntime().maxMemory()) / 1024 ** 3:.2f} GB")
+    except Exception as e:
+        logger.debug(f"Could not read effective heap size: {e}")
+    return lines
+
+
 def dispose() -> None:
     """
     Dispose of PySNT resources and shut down the JVM.
@@ -629,7 +731,26 @@ def dispose() -> None:
             finally:
                 _ij = None
         
-        # 2. Shut down the JVM if it was started
+        # 2. Dispose of the lean SciJava context, if any
+        try:
+            from .lean import dispose_lean_context
+            dispose_lean_context()
+        except Exception as e:
+            logger.debug(f"Error disposing lean context: {e}")
+
+        # 3. Stop JVM heap monitoring and asynchronous tasks
+        try:
+            from .diagnostics import stop_heap_monitor
+            stop_heap_monitor()
+        except Exception as e:
+            logger.debug(f"Error stopping JVM heap monitor: {e}")
+        try:
+            from .async_utils import shutdown_executor
+            shutdown_executor(wait=False)
+        except Exception as e:
+            logger.debug(f"Error shutting down async worker pool: {e}")
+
+        # 4. Shut down the JVM if it was started
         if _jvm_started and scyjava.jvm_started():
             try:
                 logger.debug("Shutting down JVM...")
@@ -638,7 +759,7 @@ def dispose() -> None:
             except Exception as e:
                 logger.warning(f"Error shutting down JVM: {e}")
         
-        # 3. Reset state variables
+        # 5. Reset state variables
         _jvm_started = False
         _mode = None
         
@@ -10,12 +10,13 @@ logger: Any
 _ij: Any
 _jvm_started: Any
 _mode: Any
+_jvm_settings: Any
 class FijiNotFoundError:
     pass
 
-def _configure_jvm(max_heap: Optional[str], min_heap: Optional[str], jvm_args: Optional[List[str]]) -> None: ...
+def _configure_jvm(max_heap: Optional[str], min_heap: Optional[str], jvm_args: Optional[List[str]], profile: Optional[str]) -> Dict[str, Any]: ...
 
-def initialize(fiji_path: Optional[str], interactive: bool, ensure_java: bool, mode: str, max_heap: Optional[str], min_heap: Optional[str], jvm_args: Optional[List[str]]) -> None: ...
+def initialize(fiji_path: Optional[str], interactive: bool, ensure_java: bool, mode: str, max_heap: Optional[str], min_heap: Optional[str], jvm_args: Optional[List[str]], jvm_profile: Optional[str]) -> None: ...
 
 def _find_fiji(interactive: bool) -> Optional[str]: ...
 
@@ -29,6 +30,12 @@ def is_initialized() -> bool: ...
 
 def get_mode() -> Optional[str]: ...
 
+def get_jvm_settings() -> Optional[Dict[str, Any]]: ...
+
+def _cds_jvm_args(fiji_path: str, jvm_args: Optional[List[str]]) -> List[str]: ...
+
+def _format_startup_report(settings: Dict[str, Any]) -> List[str]: ...
+
 def dispose() -> None: ...
 
 def setup_dynamic_imports(module_globals: Dict[str, Any], package_name: str, known_classes: Optional[List[str]], include_abstract: bool, include_interfaces: bool) -> Dict[str, Any]: ...
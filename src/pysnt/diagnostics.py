@@ -0,0 +1,400 @@
+"""
+JVM memory and garbage collection diagnostics for PySNT.
+
+The JVM heap is sized once, when SNT is initialized (see initialize(max_heap=...)).
+This module reports how that heap is being used while jobs are running, through the
+JVM's management beans (java.lang.management):
+
+- jvm_memory(), gc_stats() and jvm_snapshot() sample heap/non-heap usage and
+  garbage collection counts and times
+- A background heap monitor logs samples periodically and notifies callbacks when
+  heap usage crosses a threshold, so that memory pressure in long batch runs is
+  noticed before the JVM throws OutOfMemoryError
+
+The monitor is configured with the 'diagnostics.*' options (see pysnt.describe_option()).
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_MB = 1024 ** 2
+
+# Heap usage fraction must fall this far below the threshold to re-arm the warning
+_THRESHOLD_HYSTERESIS = 0.05
+
+# Callbacks notified when heap usage crosses the warning threshold
+_heap_warning_callbacks: List[Callable[[Dict[str, Any]], None]] = []
+
+# The running heap monitor (at most one at a time)
+_monitor: Optional['HeapMonitor'] = None
+_monitor_lock = threading.Lock()
+
+
+def jvm_memory() -> Dict[str, Any]:
+    """
+    Sample JVM heap and non-heap memory usage.
+
+    Returns
+    -------
+    dict
+        'heap_used', 'heap_committed', 'heap_max', 'non_heap_used' and
+        'non_heap_committed' in bytes, and 'heap_fraction': used heap as a fraction
+        of the maximum heap (of the committed heap if no maximum is defined)
+
+    Raises
+    ------
+    RuntimeError
+        If the JVM is not running
+
+    Examples
+    --------
+    >>> memory = pysnt.diagnostics.jvm_memory()
+    >>> print(f"{memory['heap_used'] / 2**30:.1f} GB used ({memory['heap_fraction']:.0%})")
+    """
+    memory_bean = _management_factory().getMemoryMXBean()
+    heap = memory_bean.getHeapMemoryUsage()
+    non_heap = memory_bean.getNonHeapMemoryUsage()
+
+    heap_used, heap_committed, heap_max = int(heap.getUsed()), int(heap.getCommitted()), int(heap.getMax())
+    limit = heap_max if heap_max > 0 else heap_committed
+    return {
+        'heap_used': heap_used,
+        'heap_committed': heap_committed,
+        'heap_max': heap_max,
+        'heap_fraction': heap_used / limit if limit > 0 else 0.0,
+        'non_heap_used': int(non_heap.getUsed()),
+        'non_heap_committed': int(non_heap.getCommitted()),
+    }
+
+
+def gc_stats() -> List[Dict[str, Any]]:
+    """
+    Sample garbage collection statistics.
+
+    Returns
+    -------
+    list of dict
+        One entry per garbage collector with 'name', 'count' (collections since JVM
+        start) and 'time_ms' (accumulated collection time). Counts and times are -1
+        if the collector does not report them
+
+    Raises
+    ------
+    RuntimeError
+        If the JVM is not running
+    """
+    return [
+        {
+            'name': str(bean.getName()),
+            'count': int(bean.getCollectionCount()),
+            'time_ms': int(bean.getCollectionTime()),
+        }
+        for bean in _management_factory().getGarbageCollectorMXBeans()
+    ]
+
+
+def jvm_snapshot() -> Dict[str, Any]:
+    """
+    Sample JVM memory usage and garbage collection statistics together.
+
+    Returns
+    -------
+    dict
+        The jvm_memory() entries, plus 'timestamp' (time.time()), 'uptime_s' (JVM
+        uptime), 'gc' (the gc_stats() list), 'gc_count' and 'gc_time_ms' (totals over
+        all collectors)
+
+    Raises
+    ------
+    RuntimeError
+        If the JVM is not running
+
+    Examples
+    --------
+    >>> before = pysnt.diagnostics.jvm_snapshot()
+    >>> run_batch()
+    >>> after = pysnt.diagnostics.jvm_snapshot()
+    >>> print(f"GC time during batch: {after['gc_time_ms'] - before['gc_time_ms']} ms")
+    """
+    snapshot = jvm_memory()
+    collectors = gc_stats()
+    snapshot.update(
+        timestamp=time.time(),
+        uptime_s=int(_management_factory().getRuntimeMXBean().getUptime()) / 1000.0,
+        gc=collectors,
+        gc_count=sum(max(c['count'], 0) for c in collectors),
+        gc_time_ms=sum(max(c['time_ms'], 0) for c in collectors),
+    )
+    return snapshot
+
+
+def format_snapshot(snapshot: Dict[str, Any]) -> str:
+    """
+    Format a jvm_memory() or jvm_snapshot() sample as a one-line summary.
+
+    Examples
+    --------
+    >>> print(pysnt.diagnostics.format_snapshot(pysnt.diagnostics.jvm_snapshot()))
+    heap 1843/8192 MB (22%), committed 2048 MB, non-heap 96 MB, GC 14 collections in 312 ms
+    """
+    heap_max = snapshot['heap_max']
+    text = (f"heap {snapshot['heap_used'] / _MB:.0f}/{heap_max / _MB:.0f} MB "
+            if heap_max > 0 else f"heap {snapshot['heap_used'] / _MB:.0f} MB ")
+    text += (f"({snapshot['heap_fraction']:.0%}), committed {snapshot['heap_committed'] / _MB:.0f} MB, "
+             f"non-heap {snapshot['non_heap_used'] / _MB:.0f} MB")
+    if 'gc_count' in snapshot:
+        text += f", GC {snapshot['gc_count']} collections in {snapshot['gc_time_ms']} ms"
+    return text
+
+
+def add_heap_warning_callback(callback: Callable[[Dict[str, Any]], None]) -> None:
+    """
+    Register a function called when heap usage crosses the warning threshold.
+
+    The callback receives the jvm_snapshot() sample that crossed the threshold. It
+    is called from the heap monitor thread, once per crossing: it is re-armed when
+    usage falls 5 percentage points below the threshold.
+
+    Parameters
+    ----------
+    callback : callable
+        Function taking a snapshot dict
+
+    Examples
+    --------
+    >>> def on_pressure(snapshot):
+    ...     pipeline.pause()
+    >>> pysnt.diagnostics.add_heap_warning_callback(on_pressure)
+    >>> pysnt.diagnostics.start_heap_monitor(threshold=0.8)
+    """
+    if not callable(callback):
+        raise TypeError(f"Callback must be callable, got {type(callback).__name__}")
+    if callback not in _heap_warning_callbacks:
+        _heap_warning_callbacks.append(callback)
+
+
+def remove_heap_warning_callback(callback: Callable[[Dict[str, Any]], None]) -> None:
+    """Unregister a callback added with add_heap_warning_callback()."""
+    try:
+        _heap_warning_callbacks.remove(callback)
+    except ValueError:
+        pass
+
+
+class HeapMonitor:
+    """
+    Background thread sampling JVM memory at a fixed interval.
+
+    Each sample is logged (if enabled) and checked against the heap warning
+    threshold. Unless given explicitly, the interval, threshold and logging settings
+    are read from the 'diagnostics.*' options at every sample, so that changes made
+    with pysnt.set_option() take effect while the monitor runs.
+
+    Use start_heap_monitor() / stop_heap_monitor() rather than creating instances
+    directly.
+    """
+
+    def __init__(self, interval: Optional[float] = None, threshold: Optional[float] = None,
+                 log: Optional[bool] = None, sampler: Callable[[], Dict[str, Any]] = jvm_snapshot):
+        self._interval = interval
+        self._threshold = threshold
+        self._log = log
+        self._sampler = sampler
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._armed = True
+        self.last_snapshot: Optional[Dict[str, Any]] = None
+        self.peak_heap_fraction = 0.0
+        self.samples = 0
+        self.warnings = 0
+
+    @property
+    def interval(self) -> float:
+        """Sampling interval in seconds."""
+        return self._interval if self._interval is not None else _option('diagnostics.monitor_interval')
+
+    @property
+    def threshold(self) -> float:
+        """Heap usage fraction above which warnings are issued."""
+        return self._threshold if self._threshold is not None else _option('diagnostics.heap_warning_threshold')
+
+    @property
+    def running(self) -> bool:
+        """Whether the monitor thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> 'HeapMonitor':
+        """Start sampling in a daemon thread."""
+        if self.running:
+            return self
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='pysnt-heap-monitor', daemon=True)
+        self._thread.start()
+        logger.info(f"Started JVM heap monitor (every {self.interval:g}s, warning at {self.threshold:.0%})")
+        return self
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop sampling and wait for the thread to finish."""
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def sample(self) -> Dict[str, Any]:
+        """Take one sample, log it and check it against the threshold."""
+        snapshot = self._sampler()
+        self.last_snapshot = snapshot
+        self.samples += 1
+        self.peak_heap_fraction = max(self.peak_heap_fraction, snapshot['heap_fraction'])
+
+        log = self._log if self._log is not None else _option('diagnostics.monitor_log')
+        if log:
+            logger.info(f"JVM memory: {format_snapshot(snapshot)}")
+
+        threshold = self.threshold
+        if snapshot['heap_fraction'] >= threshold:
+            if self._armed:
+                self._armed = False
+                self.warnings += 1
+                self._warn(snapshot, threshold)
+        elif snapshot['heap_fraction'] < threshold - _THRESHOLD_HYSTERESIS:
+            self._armed = True
+        return snapshot
+
+    def _warn(self, snapshot: Dict[str, Any], threshold: float) -> None:
+        logger.warning(f"JVM heap usage above {threshold:.0%}: {format_snapshot(snapshot)}. "
+                       f"Consider a larger heap (pysnt.initialize(max_heap=...)) or smaller batches")
+        for callback in list(_heap_warning_callbacks):
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logger.error(f"Heap warning callback {callback!r} failed: {e}")
+
+    def _run(self) -> None:
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    self.sample()
+                except Exception as e:
+                    logger.debug(f"JVM memory sampling failed: {e}")
+                    if not _jvm_running():
+                        logger.info("JVM stopped; heap monitor exiting")
+                        break
+                self._stop_event.wait(self.interval)
+        finally:
+            _detach_thread()
+
+
+def start_heap_monitor(interval: Optional[float] = None, threshold: Optional[float] = None,
+                       log: Optional[bool] = None,
+                       callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> HeapMonitor:
+    """
+    Start (or return) the background JVM heap monitor.
+
+    Parameters
+    ----------
+    interval : float, optional
+        Seconds between samples (default: pysnt.get_option('diagnostics.monitor_interval'))
+    threshold : float, optional
+        Heap usage fraction (0-1] triggering warnings
+        (default: pysnt.get_option('diagnostics.heap_warning_threshold'))
+    log : bool, optional
+        Log every sample at INFO level (default: pysnt.get_option('diagnostics.monitor_log'))
+    callback : callable, optional
+        Heap warning callback to register (see add_heap_warning_callback())
+
+    Returns
+    -------
+    HeapMonitor
+        The running monitor. If a monitor is already running it is returned
+        unchanged (besides registering ``callback``)
+
+    Raises
+    ------
+    RuntimeError
+        If the JVM is not running
+
+    Examples
+    --------
+    >>> pysnt.initialize(max_heap='8g')
+    >>> monitor = pysnt.diagnostics.start_heap_monitor(interval=30, threshold=0.85)
+    >>> run_batch()
+    >>> print(f"Peak heap usage: {monitor.peak_heap_fraction:.0%}")
+    >>> pysnt.diagnostics.stop_heap_monitor()
+    """
+    global _monitor
+
+    if not _jvm_running():
+        raise RuntimeError("JVM not running. Call pysnt.initialize() before starting the heap monitor.")
+    if threshold is not None:
+        from .config import _fraction_validator
+        threshold = _fraction_validator(threshold)
+    if callback is not None:
+        add_heap_warning_callback(callback)
+
+    with _monitor_lock:
+        if _monitor is not None and _monitor.running:
+            return _monitor
+        _monitor = HeapMonitor(interval=interval, threshold=threshold, log=log).start()
+        return _monitor
+
+
+def stop_heap_monitor() -> Optional[HeapMonitor]:
+    """
+    Stop the background JVM heap monitor, if running.
+
+    Returns
+    -------
+    HeapMonitor or None
+        The stopped monitor (its statistics remain available), or None if no
+        monitor was running
+    """
+    global _monitor
+
+    with _monitor_lock:
+        monitor, _monitor = _monitor, None
+    if monitor is not None:
+        monitor.stop()
+        logger.info(f"Stopped JVM heap monitor after {monitor.samples} sample(s), "
+                    f"peak heap usage {monitor.peak_heap_fraction:.0%}")
+    return monitor
+
+
+def get_heap_monitor() -> Optional[HeapMonitor]:
+    """Return the running heap monitor, or None."""
+    return _monitor if _monitor is not None and _monitor.running else None
+
+
+def _management_factory():
+    """Return java.lang.management.ManagementFactory (requires a running JVM)."""
+    if not _jvm_running():
+        raise RuntimeError("JVM not running. Call pysnt.initialize() first.")
+    import scyjava
+    return scyjava.jimport('java.lang.management.ManagementFactory')
+
+
+def _jvm_running() -> bool:
+    try:
+        import scyjava
+        return bool(scyjava.jvm_started())
+    except Exception:
+        return False
+
+
+def _detach_thread() -> None:
+    """Detach the current (monitor) thread from the JVM, if attached."""
+    try:
+        import jpype
+        if jpype.isJVMStarted() and jpype.java.lang.Thread.isAttached():
+            jpype.java.lang.Thread.detach()
+    except Exception as e:
+        logger.debug(f"Could not detach heap monitor thread from JVM: {e}")
+
+
+def _option(key: str) -> Any:
+    from .config import get_option
+    return get_option(key)
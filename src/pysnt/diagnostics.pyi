@@ -0,0 +1,57 @@
+"""
+Type stubs for diagnostics.py
+
+Auto-generated stub file.
+"""
+
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple
+
+logger: Any
+_MB: Any
+_THRESHOLD_HYSTERESIS: Any
+_heap_warning_callbacks: Any
+_monitor: Any
+_monitor_lock: Any
+def jvm_memory() -> Dict[str, Any]: ...
+
+def gc_stats() -> List[Dict[str, Any]]: ...
+
+def jvm_snapshot() -> Dict[str, Any]: ...
+
+def format_snapshot(snapshot: Dict[str, Any]) -> str: ...
+
+def add_heap_warning_callback(callback: Callable[[Dict[str, Any]], None]) -> None: ...
+
+def remove_heap_warning_callback(callback: Callable[[Dict[str, Any]], None]) -> None: ...
+
+class HeapMonitor:
+    last_snapshot: Optional[Dict[str, Any]]
+    peak_heap_fraction: float
+    samples: int
+    warnings: int
+    def __init__(self, interval: Optional[float], threshold: Optional[float], log: Optional[bool], sampler: Callable[[], Dict[str, Any]]) -> None: ...
+    @property
+    def interval(self) -> float: ...
+    @property
+    def threshold(self) -> float: ...
+    @property
+    def running(self) -> bool: ...
+    def start(self) -> HeapMonitor: ...
+    def stop(self, timeout: Optional[float]) -> None: ...
+    def sample(self) -> Dict[str, Any]: ...
+    def _warn(self, snapshot: Dict[str, Any], threshold: float) -> None: ...
+    def _run(self) -> None: ...
+
+def start_heap_monitor(interval: Optional[float], threshold: Optional[float], log: Optional[bool], callback: Optional[Callable[[Dict[str, Any]], None]]) -> HeapMonitor: ...
+
+def stop_heap_monitor() -> Optional[HeapMonitor]: ...
+
+def get_heap_monitor() -> Optional[HeapMonitor]: ...
+
+def _management_factory() -> Any: ...
+
+def _jvm_running() -> bool: ...
+
+def _detach_thread() -> None: ...
+
+def _option(key: str) -> Any: ...
@@ -16,6 +16,7 @@ The main display function is available directly:
 
 # Import main functions from core module
 from .core import display
+from .visual_display import plot_trees
 
 # Import utilities from  utils module
 from .utils import (
@@ -37,5 +38,6 @@ from .utils import register_display_handler
 # Main public API
 __all__ = [
     "display",
+    "plot_trees",
     "register_display_handler",
 ]
@@ -7,7 +7,8 @@ and SNT-specific object handling.
 
 import logging
 import traceback
-from typing import Any, Callable, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
 
 # Import utilities from our utils module
 from .utils import (
@@ -20,7 +21,7 @@ from .utils import (
 )
 
 # Import from converters for functions we haven't imported
-from ..converters.structured_data_converters import _convert_path_to_xarray, _is_snt_table, _convert_snt_table, _extract_imageplus_metadata
+from ..converters.structured_data_converters import _convert_path_to_xarray, _is_snt_table, _convert_snt_table, _extract_imageplus_metadata, _imageplus_to_xarray
 from ..converters.chart_converters import _is_snt_chart, _convert_snt_chart
 from ..converters.graph_converters import _is_snt_graph, _convert_snt_graph
 from ..converters.core import _create_converter_result
@@ -132,10 +133,16 @@ def _convert_objects_to_figures(obj_list, converter_func, obj_type_name, **kwarg
     titles = []
     custom_titles = kwargs.get('panel_titles', None)
 
-    for i, obj in enumerate(obj_list):
-        try:
-            converted = converter_func(obj, **kwargs)
+    # Conversion (Java export + rasterization) runs on a bounded pool; results keep input order
+    max_workers = _resolve_conversion_workers(len(obj_list), creates_figures=True, **kwargs)
+    results = _run_conversion_pool(lambda obj: converter_func(obj, **kwargs), obj_list, max_workers)
+
+    for i, (obj, (converted, error)) in enumerate(zip(obj_list, results)):
+        if error is not None:
+            logger.warning(f"Failed to convert {obj_type_name} {i + 1}: {error}")
+            continue
 
+        try:
             if converted is None:
                 logger.warning(f"Failed to convert {obj_type_name} {i + 1} - got None")
                 continue
@@ -164,6 +171,77 @@ def _convert_objects_to_figures(obj_list, converter_func, obj_type_name, **kwarg
     return figures, titles
 
 
+# Backends that never open windows, for which figures can safely be created off the main thread
+_NON_INTERACTIVE_BACKENDS = ('agg', 'cairo', 'pdf', 'pgf', 'ps', 'svg', 'template', 'inline')
+
+
+def _resolve_conversion_workers(num_items, creates_figures=False, **kwargs):
+    """
+    Determine the number of worker threads for a list conversion stage.
+
+    Parameters
+    ----------
+    num_items : int
+        Number of objects to convert
+    creates_figures : bool
+        Whether the conversion creates matplotlib figures. If so, and the active
+        backend is interactive while GUI safe mode is enabled, conversion is
+        kept on the calling thread
+    **kwargs
+        Display arguments. 'max_workers' overrides the 'display.conversion_workers' option
+
+    Returns
+    -------
+    int
+        Number of workers (1 means sequential conversion)
+    """
+    from ..config import get_option
+
+    max_workers = kwargs.get('max_workers') or get_option('display.conversion_workers')
+    max_workers = max(1, min(int(max_workers), num_items))
+
+    if max_workers > 1 and creates_figures and get_option('display.gui_safe_mode'):
+        import matplotlib
+        backend = matplotlib.get_backend().lower()
+        if not any(name in backend for name in _NON_INTERACTIVE_BACKENDS):
+            logger.debug(f"Interactive backend '{backend}' in GUI safe mode: converting sequentially")
+            return 1
+    return max_workers
+
+
+def _run_conversion_pool(func, items, max_workers) -> List[Tuple[Any, Optional[Exception]]]:
+    """
+    Apply func to each item on a bounded thread pool, preserving input order.
+
+    Parameters
+    ----------
+    func : callable
+        Single-argument conversion function
+    items : list
+        Objects to convert
+    max_workers : int
+        Maximum number of worker threads (1 converts sequentially on the calling thread)
+
+    Returns
+    -------
+    list of tuple
+        (result, error) pairs in input order. Exactly one of the two is meaningful:
+        error is None on success, result is None on failure
+    """
+    def _safe_call(item):
+        try:
+            return func(item), None
+        except Exception as e:
+            return None, e
+
+    if max_workers <= 1 or len(items) <= 1:
+        return [_safe_call(item) for item in items]
+
+    logger.debug(f"Converting {len(items)} objects on {max_workers} worker threads")
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pysnt-convert') as executor:
+        return list(executor.map(_safe_call, items))
+
+
 def _extract_title(obj, default_title):
     """Extract title from an object using common methods."""
     try:
@@ -412,7 +490,6 @@ def _convert_viewer2d_to_chart(viewer2d, **kwargs):
 def _convert_imageplus_to_xarray(imageplus, index, **kwargs):
     """Convert a single ImagePlus to xarray data with metadata."""
     from ..util import ImpUtils
-    from ..core import ij
 
     metadata = _extract_imageplus_metadata(imageplus, **kwargs)
     frame = int(metadata.get('frame', 1))
@@ -423,11 +500,12 @@ def _convert_imageplus_to_xarray(imageplus, index, **kwargs):
         logger.debug(f"ImpUtils.convertToSimple2D failed for ImagePlus {index + 1}: {e}")
         converted_imp = imageplus
 
-    xarray_data = ij().py.from_java(converted_imp)
+    xarray_data = _imageplus_to_xarray(converted_imp)
 
     if xarray_data is None:
         logger.warning(f"Failed to convert ImagePlus {index + 1} to xarray - got None")
         return None, None, None
+    metadata['bytes_transferred'] = getattr(xarray_data, 'attrs', {}).get('bytes_transferred')
 
     try:
         image_title = imageplus.getTitle() if hasattr(imageplus, 'getTitle') else f'Image {index + 1}'
@@ -542,6 +620,9 @@ def display(obj: Any, show: bool = True, **kwargs) -> Any:
         - orthoview: bool, for 3D viewers
         - panel_layout: str, layout for multi-panel displays
         - max_panels: int, maximum panels to display
+        - max_workers: int, worker threads used to convert lists (default: 'display.conversion_workers')
+        - renderer: str, 'viewer2d' or 'native' for Trees (default: 'display.tree_renderer').
+          The native renderer accepts the options of pysnt.plot_trees() (projection, color_by, etc.)
         - origin: str, origin for image display ('upper', 'lower', 'auto')
 
     Returns
@@ -570,6 +651,8 @@ def display(obj: Any, show: bool = True, **kwargs) -> Any:
         # Handle special SNT object types that need preprocessing
         if _is_snt_tree(obj):
             logger.debug(f"Detected SNT Tree: {type(obj)}")
+            if _use_native_tree_renderer(**kwargs):
+                return _display_trees_native([obj], show=show, **kwargs)
             obj = _tree_to_chart(obj)
         elif _is_java_type(obj, 'ImagePlus'):
             # Check if this ImagePlus might be a skeleton
@@ -633,6 +716,64 @@ def _tree_to_chart(obj):
     return obj
 
 
+def _use_native_tree_renderer(**kwargs) -> bool:
+    """Check whether Trees should be rendered natively (matplotlib) rather than via Viewer2D."""
+    from ..config import get_option
+    return kwargs.get('renderer', get_option('display.tree_renderer')) == 'native'
+
+
+@handle_display_errors("display Trees (native renderer)")
+def _display_trees_native(tree_list: list, show: bool = True, **kwargs) -> Any:
+    """
+    Display Trees with the native LineCollection renderer.
+
+    Node/segment arrays are extracted on the conversion pool; rendering happens on
+    the calling thread. Lists are shown one panel per tree unless overlay=True.
+    """
+    from .visual_display import _trees_to_matplotlib, _display_matplotlib_figure
+    from ..converters.tree_converters import _extract_tree_arrays
+
+    max_workers = _resolve_conversion_workers(len(tree_list), **kwargs)
+    results = _run_conversion_pool(_extract_tree_arrays, tree_list, max_workers)
+
+    arrays_list, titles = [], []
+    for i, (tree, (arrays, error)) in enumerate(zip(tree_list, results)):
+        if error is not None:
+            logger.warning(f"Failed to extract arrays from Tree {i + 1}: {error}")
+            continue
+        arrays_list.append(arrays)
+        titles.append(_extract_tree_label(tree, f"Tree {i + 1}"))
+
+    if not arrays_list:
+        logger.error("No Tree objects could be converted to arrays")
+        return None
+
+    render_kwargs = {k: v for k, v in kwargs.items() if k not in ('title', '_internal', 'metadata')}
+    render_kwargs.setdefault('overlay', len(arrays_list) == 1)
+    render_kwargs.setdefault('titles', kwargs.get('panel_titles', titles))
+    fig = _trees_to_matplotlib(arrays_list, **render_kwargs)
+    _display_matplotlib_figure(fig, show=show, **kwargs)
+
+    metadata = {
+        'tree_count': len(tree_list),
+        'displayed_count': len(arrays_list),
+        'segment_count': int(sum(len(a['segments']) for a in arrays_list)),
+        'projection': kwargs.get('projection', 'xy'),
+        'title': kwargs.get('title', None),
+    }
+    source_type = 'Tree' if len(tree_list) == 1 else 'Tree_List'
+    return _create_converter_result(fig, source_type, **metadata)
+
+
+def _extract_tree_label(tree, default_label):
+    """Return a Tree's label, or default_label if unavailable."""
+    try:
+        label = tree.getLabel()
+        return label if label else default_label
+    except Exception:
+        return default_label
+
+
 def _get_display_handler(obj: Any) -> Tuple[str, Optional[Callable]]:
     """
     Determine the appropriate display handler for an object.
@@ -936,6 +1077,9 @@ def _display_viewer2d(obj, show: bool = True, **kwargs):
 @handle_display_errors("display ImgLib2 RandomAccessibleInterval")
 def _display_imglib2_rai(obj, show: bool = True, **kwargs):
     """Handler function for RandomAccessibleInterval display."""
+    if _use_lazy_image(obj, **kwargs):
+        return _display_lazy_image(obj, show=show, source_type='RandomAccessibleInterval', **kwargs)
+
     logger.info("Detected RandomAccessibleInterval object - converting to ImagePlus for display...")
 
     import scyjava
@@ -956,6 +1100,9 @@ def _display_imglib2_rai(obj, show: bool = True, **kwargs):
 @handle_display_errors("display ImgPlus")
 def _display_imgplus(obj, show: bool = True, **kwargs):
     """Handler function for ImgPlus display."""
+    if _use_lazy_image(obj, **kwargs):
+        return _display_lazy_image(obj, show=show, source_type='ImgPlus', **kwargs)
+
     logger.info("Detected ImgPlus object - converting to ImagePlus for display...")
 
     import scyjava
@@ -972,6 +1119,75 @@ def _display_imgplus(obj, show: bool = True, **kwargs):
     return _display_imageplus(imageplus, show=show, **kwargs)
 
 
+def _use_lazy_image(img, **kwargs) -> bool:
+    """
+    Decide whether an ImgLib2 image should be displayed through on-demand reads.
+
+    The 'lazy' kwarg forces the choice; otherwise images larger than the
+    'display.lazy_image_mb' option are read lazily when dask is available.
+    """
+    if kwargs.get('lazy') is not None:
+        return bool(kwargs['lazy'])
+    try:
+        import dask.array  # noqa: F401
+    except ImportError:
+        return False
+
+    import numpy as np
+    from ..config import get_option
+    from ..io.images import _image_dtype
+    try:
+        n_pixels = 1
+        for d in range(int(img.numDimensions())):
+            n_pixels *= int(img.dimension(d))
+        dtype = _image_dtype(img)
+        n_bytes = n_pixels * (np.dtype(dtype).itemsize if dtype is not None else 4)
+    except Exception as e:
+        logger.debug(f"Could not estimate image size: {e}")
+        return False
+    return n_bytes >= get_option('display.lazy_image_mb') * 1024 ** 2
+
+
+def _select_display_plane(data, **kwargs):
+    """
+    Select the 2D plane of a (lazy) image xarray to display.
+
+    Frames, Z-slices and channels are chosen with the 1-based 'frame' (or 't'),
+    'z' and 'channel' kwargs; by default the first frame and channel and the
+    middle Z-slice are shown. Any other non-spatial dimension is reduced to its
+    first position.
+    """
+    kwargs_lower = {k.lower(): v for k, v in kwargs.items()}
+    positions = {
+        't': next((kwargs_lower[k] for k in ('frame', 't', 'time', 'timepoint') if k in kwargs_lower), 1),
+        'pln': kwargs_lower.get('z'),
+        'ch': kwargs_lower.get('channel', 1),
+    }
+    indexers = {}
+    for dim, size in data.sizes.items():
+        if dim in ('row', 'col'):
+            continue
+        position = positions.get(dim)
+        index = size // 2 if position is None and dim == 'pln' else int(position or 1) - 1
+        indexers[dim] = min(max(index, 0), size - 1)
+    return data.isel(indexers)
+
+
+def _display_lazy_image(img, show: bool = True, source_type: str = 'ImgPlus', **kwargs):
+    """Display one plane of a large ImgLib2 image, reading only that plane from the JVM."""
+    from ..io.images import lazy_xarray
+    from .data_display import _display_xarray
+
+    data = lazy_xarray(img)
+    plane = _select_display_plane(data, **kwargs)
+    logger.info(f"Displaying {source_type} lazily: reading a {dict(plane.sizes)} plane of {dict(data.sizes)}")
+    plane = plane.compute()
+
+    kwargs = _add_metadata(kwargs, source_type=source_type, lazy=True, original_shape=tuple(data.shape),
+                           dtype=str(data.dtype), is_rgb=False)
+    return _display_xarray(plane, show=show, **kwargs)
+
+
 @handle_display_errors("display NetworkX graph")
 def _display_networkx_graph(graph, show: bool = True, **kwargs):
     """Handler function for direct NetworkX graph display."""
@@ -1139,20 +1355,24 @@ def _display_tree_list(tree_list: list, show: bool = True, **kwargs) -> Any:
     max_panels = kwargs.get('max_panels', 20)
     tree_list = _limit_list_size(tree_list, "Tree", max_panels)
 
+    if _use_native_tree_renderer(**kwargs):
+        logger.info(f"Rendering {len(tree_list)} Tree objects natively")
+        return _display_trees_native(tree_list, show=show, **kwargs)
+
     logger.info(f"Converting {len(tree_list)} Tree objects to 2D skeletons")
 
+    max_workers = _resolve_conversion_workers(len(tree_list), **kwargs)
+    results = _run_conversion_pool(_tree_to_chart, tree_list, max_workers)
+
     displayable_list = []
-    for i, tree in enumerate(tree_list):
-        try:
-            dis_tree = _tree_to_chart(tree)
-            if dis_tree is not None:
-                displayable_list.append(dis_tree)
-                logger.debug(f"Successfully converted Tree {i + 1} to skeleton: {tree.getLabel()}")
-            else:
-                logger.warning(f"Tree {i + 1} conversion returned None")
-        except Exception as e:
-            logger.warning(f"Failed to convert Tree {i + 1} to skeleton: {e}")
-            continue
+    for i, (tree, (dis_tree, error)) in enumerate(zip(tree_list, results)):
+        if error is not None:
+            logger.warning(f"Failed to convert Tree {i + 1} to skeleton: {error}")
+        elif dis_tree is not None:
+            displayable_list.append(dis_tree)
+            logger.debug(f"Successfully converted Tree {i + 1} to skeleton: {tree.getLabel()}")
+        else:
+            logger.warning(f"Tree {i + 1} conversion returned None")
 
     if not displayable_list:
         logger.error("No Tree objects could be converted to skeletons")
@@ -1260,15 +1480,21 @@ def _display_imageplus_list(imageplus_list: list, show: bool = True, **kwargs) -
     xarray_data_list = []
     image_titles = []
 
-    for i, imageplus in enumerate(imageplus_list):
-        try:
-            xarray_data, metadata, image_title = _convert_imageplus_to_xarray(imageplus, i, **kwargs)
-            if xarray_data is not None:
-                xarray_data_list.append((xarray_data, metadata))
-                image_titles.append(image_title)
-        except Exception as e:
-            logger.warning(f"Failed to convert ImagePlus {i + 1}: {e}")
+    max_workers = _resolve_conversion_workers(len(imageplus_list), **kwargs)
+    results = _run_conversion_pool(
+        lambda indexed: _convert_imageplus_to_xarray(indexed[1], indexed[0], **kwargs),
+        list(enumerate(imageplus_list)),
+        max_workers,
+    )
+
+    for i, (converted, error) in enumerate(results):
+        if error is not None:
+            logger.warning(f"Failed to convert ImagePlus {i + 1}: {error}")
             continue
+        xarray_data, metadata, image_title = converted
+        if xarray_data is not None:
+            xarray_data_list.append((xarray_data, metadata))
+            image_titles.append(image_title)
 
     if not xarray_data_list:
         logger.error("No ImagePlus objects could be converted successfully")
@@ -7,6 +7,7 @@ Auto-generated stub file.
 from typing import Any, Dict, List, Optional, Union, Callable, Tuple
 
 logger: Any
+_NON_INTERACTIVE_BACKENDS: Any
 def _add_metadata(kwargs: Any, **metadata_updates: Any) -> Any: ...
 
 def _is_java_type(obj: Any, *type_names: Any) -> Any: ...
@@ -15,6 +16,10 @@ def handle_display_errors(operation_name: str) -> Any: ...
 
 def _convert_objects_to_figures(obj_list: Any, converter_func: Any, obj_type_name: Any, **kwargs: Any) -> Any: ...
 
+def _resolve_conversion_workers(num_items: Any, creates_figures: Any, **kwargs: Any) -> Any: ...
+
+def _run_conversion_pool(func: Any, items: Any, max_workers: Any) -> List[Tuple[Any, Optional[Exception]]]: ...
+
 def _extract_title(obj: Any, default_title: Any) -> Any: ...
 
 def _create_combined_figure(figures: Any, titles: Any, obj_type_name: Any, obj_count: Any, **kwargs: Any) -> Any: ...
@@ -43,6 +48,12 @@ def display(obj: Any, show: bool, **kwargs: Any) -> Any: ...
 
 def _tree_to_chart(obj: Any) -> Any: ...
 
+def _use_native_tree_renderer(**kwargs: Any) -> bool: ...
+
+def _display_trees_native(tree_list: list, show: bool, **kwargs: Any) -> Any: ...
+
+def _extract_tree_label(tree: Any, default_label: Any) -> Any: ...
+
 def _get_display_handler(obj: Any) -> Tuple[str, Optional[Callable]]: ...
 
 def _handle_snt_object_display(obj: Any, show: bool, **kwargs: Any) -> Any: ...
@@ -67,6 +78,12 @@ def _display_imglib2_rai(obj: Any, show: bool, **kwargs: Any) -> Any: ...
 
 def _display_imgplus(obj: Any, show: bool, **kwargs: Any) -> Any: ...
 
+def _use_lazy_image(img: Any, **kwargs: Any) -> bool: ...
+
+def _select_display_plane(data: Any, **kwargs: Any) -> Any: ...
+
+def _display_lazy_image(img: Any, show: bool, source_type: str, **kwargs: Any) -> Any: ...
+
 def _display_networkx_graph(graph: Any, show: bool, **kwargs: Any) -> Any: ...
 
 def _display_with_auto_conversion(obj: Any, show: bool, **kwargs: Any) -> Any: ...
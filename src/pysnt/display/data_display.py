@@ -356,8 +356,7 @@ def _display_imageplus(obj, show: bool = True, **kwargs):
     logger.info("Detected ImagePlus object - extracting metadata and converting...")
     try:
         from ..util import ImpUtils
-        from ..core import ij
-        from ..converters.structured_data_converters import _extract_imageplus_metadata
+        from ..converters.structured_data_converters import _extract_imageplus_metadata, _imageplus_to_xarray
         
         # Extract metadata first (before conversion to avoid recursion)
         metadata = _extract_imageplus_metadata(obj, **kwargs)
@@ -371,13 +370,13 @@ def _display_imageplus(obj, show: bool = True, **kwargs):
             converted_imp = ImpUtils.convertToSimple2D(obj, frame)
         except (TypeError, AttributeError) as e:
             logger.warning(f"ImpUtils.convertToSimple2D failed: {e}")
-            logger.info("Falling back to direct ij().py.from_java() conversion...")
+            logger.info("Falling back to converting the ImagePlus as is...")
             # Fallback: try direct conversion without ImpUtils
             converted_imp = obj
         
-        # Use ij().py.from_java() but with recursion protection
-        logger.debug("Converting to xarray using ij().py.from_java()...")
-        xarray_data = ij().py.from_java(converted_imp)
+        # Map the pixel array directly (falls back to ij().py.from_java())
+        logger.debug("Converting to xarray via direct pixel transfer...")
+        xarray_data = _imageplus_to_xarray(converted_imp)
         
         if xarray_data is None:
             logger.error("Failed to convert ImagePlus to xarray - got None")
@@ -386,6 +385,7 @@ def _display_imageplus(obj, show: bool = True, **kwargs):
         # Update metadata with actual xarray information
         metadata['original_shape'] = getattr(xarray_data, 'shape', None)
         metadata['dtype'] = str(getattr(xarray_data, 'dtype', 'unknown'))
+        metadata['bytes_transferred'] = getattr(xarray_data, 'attrs', {}).get('bytes_transferred')
         
         # Add metadata to kwargs for display functions
         kwargs_with_metadata = kwargs.copy()
@@ -427,7 +427,7 @@ def _display_xarray_dataset(dataset: Any, **kwargs) -> Any:
         The xarray Dataset to display
     **kwargs
         Additional arguments for display:
-        - plot_type: 'auto', 'dataframe', 'heatmap', 'heatmap_norm', 'summary' (default: uses pysnt.get_option('display.table_mode'))
+        - plot_type: 'auto', 'dataframe', 'heatmap', 'heatmap_norm', 'heatmap_binned', 'summary' (default: uses pysnt.get_option('display.table_mode'))
         - max_vars: Maximum number of variables to display (default: 10)
         - figsize: Figure size (default: uses pysnt.get_option('plotting.figure_size'))
         - title: Plot title (default: 'SNT Table Data')
@@ -488,11 +488,13 @@ def _display_xarray_dataset(dataset: Any, **kwargs) -> Any:
             return _display_dataset_as_heatmap(dataset, **kwargs)
         elif plot_type == 'heatmap_norm':
             return _display_dataset_as_heatmap_normalized(dataset, **kwargs)
+        elif plot_type == 'heatmap_binned':
+            return _display_dataset_as_binned_heatmap(dataset, **kwargs)
         elif plot_type == 'summary':
             return _display_dataset_as_summary(dataset, **kwargs)
         else:
             logger.warning(
-                f"Unknown plot_type: {plot_type}. Available options: 'auto', 'dataframe', 'pandasgui', 'heatmap', 'heatmap_norm', 'summary'")
+                f"Unknown plot_type: {plot_type}. Available options: 'auto', 'dataframe', 'pandasgui', 'heatmap', 'heatmap_norm', 'heatmap_binned', 'summary'")
             return False
 
     except Exception as e:
@@ -583,13 +585,25 @@ def _display_dataset_as_dataframe(dataset: Any, **kwargs) -> bool:
         return False
 
 
+def _use_binned_heatmap(dataset: Any, **kwargs) -> bool:
+    """Check whether a heatmap should aggregate rows (forced with binned=True/False)."""
+    from ..config import get_option
+
+    if kwargs.get('binned') is not None:
+        return bool(kwargs['binned'])
+    n_rows = max(dataset.sizes.values(), default=0)
+    return n_rows > get_option('display.heatmap_max_rows')
+
+
 def _display_dataset_as_heatmap(dataset: Any, **kwargs) -> bool:
     """
     Display xarray Dataset as a heatmap visualization.
     
     This function converts the dataset to a pandas DataFrame, converts all values
     to numeric (replacing None and empty strings with NaN), and creates a heatmap
-    visualization using matplotlib.
+    visualization using matplotlib. Tables with more rows than the
+    'display.heatmap_max_rows' option are drawn as binned heatmaps instead
+    (see _display_dataset_as_binned_heatmap()).
     
     Parameters
     ----------
@@ -622,6 +636,9 @@ def _display_dataset_as_heatmap(dataset: Any, **kwargs) -> bool:
         import pandas as pd
         import matplotlib.pyplot as plt
         
+        if _use_binned_heatmap(dataset, **kwargs):
+            return _display_dataset_as_binned_heatmap(dataset, normalize=False, **kwargs)
+
         # Convert dataset to DataFrame
         df = dataset.to_dataframe()
         
@@ -683,7 +700,9 @@ def _display_dataset_as_heatmap_normalized(dataset: Any, **kwargs) -> bool:
     
     This function converts the dataset to a pandas DataFrame, converts all values
     to numeric (replacing None and empty strings with NaN), normalizes each column
-    to 0-1 range, and creates a heatmap visualization using matplotlib.
+    to 0-1 range, and creates a heatmap visualization using matplotlib. Tables with
+    more rows than the 'display.heatmap_max_rows' option are drawn as binned
+    heatmaps instead (see _display_dataset_as_binned_heatmap()).
     
     Parameters
     ----------
@@ -716,6 +735,9 @@ def _display_dataset_as_heatmap_normalized(dataset: Any, **kwargs) -> bool:
         import pandas as pd
         import matplotlib.pyplot as plt
         
+        if _use_binned_heatmap(dataset, **kwargs):
+            return _display_dataset_as_binned_heatmap(dataset, normalize=True, **kwargs)
+
         # Convert dataset to DataFrame
         df = dataset.to_dataframe()
         
@@ -796,6 +818,255 @@ def _display_dataset_as_heatmap_normalized(dataset: Any, **kwargs) -> bool:
         return False
 
 
+# Rows processed per pass when aggregating large tables
+_AGGREGATE_CHUNK_ROWS = 65536
+
+# Row orderings supported by binned heatmaps
+_ROW_ORDERS = ('table', 'pc1')
+
+
+def _to_numeric_array(values: Any) -> np.ndarray:
+    """Convert a column of values to float64, coercing non-numeric entries to NaN."""
+    values = np.asarray(values)
+    if values.dtype.kind in 'biuf':
+        return values.astype(np.float64, copy=False)
+    import pandas as pd
+    return pd.to_numeric(pd.Series(values.ravel()), errors='coerce').to_numpy(dtype=np.float64)
+
+
+def _numeric_block(dataset: Any, columns: list, rows: Any) -> np.ndarray:
+    """Read a block of rows (slice or index array) of the given columns as a float matrix."""
+    # Select rows before converting, so that lazily loaded (e.g., dask) columns only load the block
+    return np.column_stack([_to_numeric_array(np.asarray(dataset[col].isel({dataset[col].dims[0]: rows})))
+                            for col in columns])
+
+
+def _iter_row_blocks(n_rows: int, chunk_rows: int, order: Any = None):
+    """Yield (start, stop, rows) for consecutive chunks of (optionally reordered) rows."""
+    for start in range(0, n_rows, chunk_rows):
+        stop = min(start + chunk_rows, n_rows)
+        yield start, stop, slice(start, stop) if order is None else order[start:stop]
+
+
+def _column_statistics(dataset: Any, columns: list, chunk_rows: int = _AGGREGATE_CHUNK_ROWS) -> dict:
+    """
+    Compute per-column statistics of a tabular Dataset in chunked, vectorized passes.
+
+    Parameters
+    ----------
+    dataset : xarray.Dataset
+        One-dimensional (row-indexed) dataset
+    columns : list
+        Data variables to include
+    chunk_rows : int
+        Number of rows converted per pass
+
+    Returns
+    -------
+    dict
+        Arrays (one value per column) for 'count', 'min', 'max', 'mean' and 'std'
+    """
+    n_rows = dataset.sizes[next(iter(dataset[columns[0]].dims))]
+    n_cols = len(columns)
+    count = np.zeros(n_cols)
+    total = np.zeros(n_cols)
+    total_sq = np.zeros(n_cols)
+    col_min = np.full(n_cols, np.inf)
+    col_max = np.full(n_cols, -np.inf)
+
+    for _, _, rows in _iter_row_blocks(n_rows, chunk_rows):
+        block = _numeric_block(dataset, columns, rows)
+        valid = ~np.isnan(block)
+        filled = np.where(valid, block, 0.0)
+        count += valid.sum(axis=0)
+        total += filled.sum(axis=0)
+        total_sq += (filled ** 2).sum(axis=0)
+        col_min = np.fmin(col_min, np.where(valid, block, np.inf).min(axis=0))
+        col_max = np.fmax(col_max, np.where(valid, block, -np.inf).max(axis=0))
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+        std = np.sqrt(np.maximum(total_sq / count - mean ** 2, 0.0))
+    empty = count == 0
+    col_min[empty] = col_max[empty] = np.nan
+    return {'count': count, 'min': col_min, 'max': col_max, 'mean': mean, 'std': std}
+
+
+def _pc1_row_order(dataset: Any, columns: list, stats: dict,
+                   chunk_rows: int = _AGGREGATE_CHUNK_ROWS) -> np.ndarray:
+    """
+    Order rows by their score on the first principal component of the standardized data.
+
+    Rows with similar profiles end up adjacent, so binning them yields a clustered
+    heatmap. Two chunked passes are used (covariance, then scores); missing values
+    are treated as the column mean.
+    """
+    n_rows = dataset.sizes[next(iter(dataset[columns[0]].dims))]
+    scale = np.where(stats['std'] > 0, stats['std'], 1.0)
+    mean = np.nan_to_num(stats['mean'])
+
+    def standardized(rows):
+        return np.nan_to_num((_numeric_block(dataset, columns, rows) - mean) / scale)
+
+    covariance = np.zeros((len(columns), len(columns)))
+    for _, _, rows in _iter_row_blocks(n_rows, chunk_rows):
+        block = standardized(rows)
+        covariance += block.T @ block
+    _, eigenvectors = np.linalg.eigh(covariance)
+    component = eigenvectors[:, -1]
+
+    scores = np.empty(n_rows)
+    for start, stop, rows in _iter_row_blocks(n_rows, chunk_rows):
+        scores[start:stop] = standardized(rows) @ component
+    return np.argsort(scores, kind='stable')
+
+
+def _aggregate_row_bins(dataset: Any, columns: list, n_bins: int, order: Any = None,
+                        chunk_rows: int = _AGGREGATE_CHUNK_ROWS) -> dict:
+    """
+    Average consecutive blocks of rows into at most ``n_bins`` bins.
+
+    Parameters
+    ----------
+    dataset : xarray.Dataset
+        One-dimensional (row-indexed) dataset
+    columns : list
+        Data variables to include
+    n_bins : int
+        Maximum number of row bins
+    order : numpy.ndarray, optional
+        Row permutation applied before binning (default: table order)
+    chunk_rows : int
+        Number of rows converted per pass
+
+    Returns
+    -------
+    dict
+        'means' (n_bins x n_columns, NaN-aware), 'counts' (valid values per cell)
+        and 'edges' (first row position of each bin, plus the row count)
+    """
+    n_rows = dataset.sizes[next(iter(dataset[columns[0]].dims))]
+    n_bins = max(1, min(n_bins, n_rows))
+    edges = (np.arange(n_bins + 1) * n_rows) // n_bins
+    sums = np.zeros((n_bins, len(columns)))
+    counts = np.zeros((n_bins, len(columns)))
+
+    for start, stop, rows in _iter_row_blocks(n_rows, chunk_rows, order):
+        block = _numeric_block(dataset, columns, rows)
+        valid = ~np.isnan(block)
+        bins = np.searchsorted(edges, np.arange(start, stop), side='right') - 1
+        # Bins are contiguous runs within a chunk: sum each run with reduceat
+        run_starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+        sums[bins[run_starts]] += np.add.reduceat(np.where(valid, block, 0.0), run_starts, axis=0)
+        counts[bins[run_starts]] += np.add.reduceat(valid.astype(np.float64), run_starts, axis=0)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+    return {'means': means, 'counts': counts, 'edges': edges}
+
+
+def _display_dataset_as_binned_heatmap(dataset: Any, normalize: bool = True, **kwargs) -> bool:
+    """
+    Display a large xarray Dataset as an aggregated (binned) heatmap.
+
+    Rows are averaged into a fixed number of bins, so drawing cost does not grow
+    with the row count. Column statistics and bin averages are computed in chunked,
+    vectorized passes over the data.
+
+    Parameters
+    ----------
+    dataset : xarray.Dataset
+        The dataset to display
+    normalize : bool, default True
+        Min-max normalize each column (using full-table statistics)
+    **kwargs
+        Additional arguments for display:
+        - bins : int, optional
+          Number of row bins (default: uses pysnt.get_option('display.heatmap_max_rows'))
+        - row_order : str, optional
+          'table' (default) keeps the table order; 'pc1' sorts rows by their first
+          principal component score before binning, clustering similar rows
+        - chunk_rows : int, optional
+          Rows processed per pass (default: 65536)
+        - title, xlabel, ylabel, cmap, figsize : as for heatmap display
+
+    Returns
+    -------
+    bool
+        True if successful, False otherwise
+    """
+    from ..config import get_option
+
+    try:
+        import matplotlib.pyplot as plt
+
+        columns = list(dataset.data_vars.keys())
+        if not columns or dataset.sizes.get(next(iter(dataset[columns[0]].dims)), 0) == 0:
+            logger.warning("Dataset is empty, cannot create binned heatmap")
+            return False
+
+        n_bins = int(kwargs.get('bins', get_option('display.heatmap_max_rows')))
+        row_order = kwargs.get('row_order', 'table')
+        chunk_rows = int(kwargs.get('chunk_rows', _AGGREGATE_CHUNK_ROWS))
+        if row_order not in _ROW_ORDERS:
+            raise ValueError(f"Invalid row_order '{row_order}'. Must be one of {_ROW_ORDERS}")
+
+        stats = _column_statistics(dataset, columns, chunk_rows)
+        numeric = stats['count'] > 0
+        columns = [col for col, keep in zip(columns, numeric) if keep]
+        if not columns:
+            logger.warning("Dataset has no numeric columns, cannot create binned heatmap")
+            return False
+        stats = {key: value[numeric] for key, value in stats.items()}
+
+        order = _pc1_row_order(dataset, columns, stats, chunk_rows) if row_order == 'pc1' else None
+        binned = _aggregate_row_bins(dataset, columns, n_bins, order, chunk_rows)
+        values = binned['means']
+        if normalize:
+            span = stats['max'] - stats['min']
+            values = np.where(span > 0, (values - stats['min']) / np.where(span > 0, span, 1.0), 0.5)
+            values[np.isnan(binned['means'])] = np.nan
+
+        edges = binned['edges']
+        n_rows = int(edges[-1])
+        logger.info(f"Displaying Dataset as binned heatmap: {n_rows} rows in {len(edges) - 1} bins × "
+                    f"{len(columns)} columns")
+
+        config = _extract_display_config(**kwargs)
+        figsize = config.get('figsize', get_option('plotting.figure_size'))
+        default_title = 'Normalized Dataset Heatmap' if normalize else 'Dataset Heatmap'
+        title = kwargs.get('title', f"{default_title} ({n_rows:,} rows, binned)")
+        ylabel = kwargs.get('ylabel', 'Rows (PC1 order)' if row_order == 'pc1' else 'Rows')
+
+        _setup_matplotlib_interactive()
+        fig, ax = plt.subplots(figsize=figsize)
+        # Empty (all-NaN) bins in gray, on a copy of the colormap
+        cmap = plt.get_cmap(kwargs.get('cmap', 'viridis')).with_extremes(bad='lightgray')
+        im = ax.imshow(values, aspect='auto', cmap=cmap,
+                       interpolation='nearest', **({'vmin': 0, 'vmax': 1} if normalize else {}))
+
+        ax.set_xticks(np.arange(len(columns)))
+        ax.set_xticklabels(columns, rotation=90, ha='right', fontsize=8)
+        tick_bins = np.unique(np.linspace(0, len(edges) - 2, min(10, len(edges) - 1)).astype(int))
+        ax.set_yticks(tick_bins)
+        ax.set_yticklabels([f"{edges[b]:,}–{edges[b + 1] - 1:,}" for b in tick_bins], fontsize=8)
+
+        plt.colorbar(im, ax=ax, label='Normalized mean (0-1)' if normalize else 'Mean value')
+        ax.set_xlabel(kwargs.get('xlabel', 'Metrics'))
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+
+        plt.tight_layout()
+        plt.show()
+
+        logger.info(f"Successfully displayed Dataset as binned heatmap: '{title}'")
+        return True
+
+    except Exception as e:
+        _handle_display_error(e, "Dataset binned heatmap display", "Dataset")
+        return False
+
+
 def _display_dataset_as_summary(dataset: Any, **kwargs) -> bool:
     """
     Display xarray Dataset as a text-based summary.
@@ -19,10 +19,28 @@ def _display_xarray_dataset(dataset: Any, **kwargs: Any) -> Any: ...
 
 def _display_dataset_as_dataframe(dataset: Any, **kwargs: Any) -> bool: ...
 
+def _use_binned_heatmap(dataset: Any, **kwargs: Any) -> bool: ...
+
 def _display_dataset_as_heatmap(dataset: Any, **kwargs: Any) -> bool: ...
 
 def _display_dataset_as_heatmap_normalized(dataset: Any, **kwargs: Any) -> bool: ...
 
+_AGGREGATE_CHUNK_ROWS: Any
+_ROW_ORDERS: Any
+def _to_numeric_array(values: Any) -> Any: ...
+
+def _numeric_block(dataset: Any, columns: list, rows: Any) -> Any: ...
+
+def _iter_row_blocks(n_rows: int, chunk_rows: int, order: Any) -> Any: ...
+
+def _column_statistics(dataset: Any, columns: list, chunk_rows: int) -> dict: ...
+
+def _pc1_row_order(dataset: Any, columns: list, stats: dict, chunk_rows: int) -> Any: ...
+
+def _aggregate_row_bins(dataset: Any, columns: list, n_bins: int, order: Any, chunk_rows: int) -> dict: ...
+
+def _display_dataset_as_binned_heatmap(dataset: Any, normalize: bool, **kwargs: Any) -> bool: ...
+
 def _display_dataset_as_summary(dataset: Any, **kwargs: Any) -> bool: ...
 
 def _summarize_dataframe(df: Any, name: Any) -> Any: ...
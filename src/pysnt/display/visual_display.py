@@ -211,9 +211,8 @@ def _get_default_layout_for_graph_type(graph_type: str) -> str:
     
     # Map graph types to configuration keys
     config_keys = {
-        'DirectedWeightedGraph': 'graph.layout.directed_weighted',
-        'SNTGraph': 'graph.layout.snt_graph',
-        'AnnotationGraph': 'graph.layout.annotation_graph',
+        'DirectedWeightedGraph': 'graph.layout.DirectedWeightedGraph',
+        'AnnotationGraph': 'graph.layout.AnnotationGraph',
     }
     
     # Check for exact matches first
@@ -229,6 +228,182 @@ def _get_default_layout_for_graph_type(graph_type: str) -> str:
     return get_option('graph.layout.default')
 
 
+def _resolve_graph_lod(graph, lod=None) -> bool:
+    """
+    Decide whether level-of-detail rendering applies to a graph.
+
+    Parameters
+    ----------
+    graph : networkx.Graph
+        Graph to be rendered
+    lod : bool, 'auto' or None
+        Requested mode. None uses the 'graph.display.lod' option; 'auto' enables LOD
+        for graphs larger than 'graph.display.lod_threshold' nodes
+
+    Returns
+    -------
+    bool
+        True if degree-2 chains should be collapsed
+    """
+    from ..config import get_option
+
+    if lod is None:
+        lod = get_option('graph.display.lod')
+    if lod == 'auto':
+        return graph.number_of_nodes() > get_option('graph.display.lod_threshold')
+    return bool(lod)
+
+
+def _spatial_node_positions(graph):
+    """Return {node: (x, y)} from node 'x'/'y' attributes, or None if any node lacks them."""
+    pos = {}
+    for node, attrs in graph.nodes(data=True):
+        try:
+            pos[node] = (float(attrs['x']), float(attrs['y']))
+        except (KeyError, TypeError, ValueError):
+            return None
+    return pos if pos else None
+
+
+def _collapse_degree2_chains(graph):
+    """
+    Collapse chains of degree-2 nodes into single edges.
+
+    Branch points, tips and roots (and one node per isolated cycle) are kept; every
+    run of pass-through nodes between two kept nodes becomes one edge whose 'weight'
+    is the sum of the chain's edge weights (1 per edge when unweighted).
+
+    Parameters
+    ----------
+    graph : networkx.Graph or networkx.DiGraph
+        Graph to simplify
+
+    Returns
+    -------
+    tuple
+        (reduced_graph, chains) where chains maps each reduced edge (u, v) to a list
+        of node sequences (from u to v, endpoints included) in the original graph
+    """
+    directed = graph.is_directed()
+
+    def is_pass_through(node):
+        if graph.has_edge(node, node):
+            return False
+        if directed:
+            return graph.in_degree(node) == 1 and graph.out_degree(node) == 1
+        return graph.degree(node) == 2
+
+    kept = {node for node in graph.nodes() if not is_pass_through(node)}
+    reduced = nx.DiGraph() if directed else nx.Graph()
+    reduced.graph.update(graph.graph)
+    chains = {}
+    visited = set()
+    walked = set()
+
+    def walk(start, first):
+        chain = [start, first]
+        prev, cur = start, first
+        while cur not in kept:
+            visited.add(cur)
+            if directed:
+                nxt = next(iter(graph.successors(cur)))
+            else:
+                nxt = next((n for n in graph.neighbors(cur) if n != prev), prev)
+            prev, cur = cur, nxt
+            chain.append(cur)
+        return chain
+
+    def add_chains_from(node):
+        neighbors = graph.successors(node) if directed else graph.neighbors(node)
+        for first in list(neighbors):
+            if not directed and (node, first) in walked:
+                continue
+            chain = walk(node, first)
+            end = chain[-1]
+            walked.add((node, first))
+            walked.add((end, chain[-2]))
+            weight = sum(graph.edges[a, b].get('weight', 1.0) for a, b in zip(chain[:-1], chain[1:]))
+            if reduced.has_edge(node, end):
+                chains[(node, end) if (node, end) in chains else (end, node)].append(chain)
+            else:
+                reduced.add_edge(node, end, weight=weight, chain_length=len(chain) - 2)
+                chains[(node, end)] = [chain]
+
+    for node in graph.nodes():
+        if node in kept:
+            reduced.add_node(node, **graph.nodes[node])
+    for node in list(reduced.nodes()):
+        add_chains_from(node)
+
+    # Cycles made only of pass-through nodes: keep one node per cycle
+    for node in graph.nodes():
+        if node not in kept and node not in visited:
+            kept.add(node)
+            reduced.add_node(node, **graph.nodes[node])
+            add_chains_from(node)
+
+    return reduced, chains
+
+
+def _simplify_polyline(points, tolerance):
+    """
+    Drop consecutive polyline vertices that fall in the same tolerance-sized grid cell.
+
+    Endpoints are always kept, so simplified chains remain connected.
+    """
+    if len(points) <= 2 or tolerance <= 0:
+        return points
+    bins = np.floor(points / tolerance).astype(np.int64)
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:] = np.any(bins[1:] != bins[:-1], axis=1)
+    keep[-1] = True
+    return points[keep]
+
+
+def _draw_lod_chains(ax, full_graph, reduced, chains, edge_color, edge_width, figsize, dpi):
+    """
+    Draw collapsed chains as a single LineCollection of pixel-simplified polylines.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        Target axis
+    full_graph : networkx.Graph
+        Original graph (provides positions of pass-through nodes)
+    reduced : networkx.Graph
+        Collapsed graph whose edges index chains
+    chains : dict
+        Mapping of reduced edges to node sequences (see _collapse_degree2_chains())
+    edge_color : str
+        Color of the edges
+    edge_width : float or list
+        Edge width, or one width per reduced edge
+    figsize : tuple
+        Figure size in inches, used to estimate the data size of one pixel
+    dpi : float
+        Figure resolution
+    """
+    from matplotlib.collections import LineCollection
+
+    xy = {node: (float(attrs['x']), float(attrs['y'])) for node, attrs in full_graph.nodes(data=True)}
+    coords = np.array(list(xy.values())) if xy else np.zeros((1, 2))
+    extent = float(np.ptp(coords, axis=0).max()) if len(coords) > 1 else 0.0
+    tolerance = extent / (max(figsize) * dpi) if extent > 0 else 0.0
+
+    widths = edge_width if isinstance(edge_width, list) else None
+    polylines, line_widths = [], []
+    for i, (u, v) in enumerate(reduced.edges()):
+        for chain in chains.get((u, v)) or chains.get((v, u)) or []:
+            polylines.append(_simplify_polyline(np.array([xy[n] for n in chain]), tolerance))
+            line_widths.append(widths[i] if widths is not None else edge_width)
+
+    n_vertices = sum(len(p) for p in polylines)
+    logger.debug(f"LOD edges: {len(polylines)} polylines, {n_vertices} vertices "
+                 f"(of {full_graph.number_of_nodes()} nodes, tolerance {tolerance:.3g})")
+    ax.add_collection(LineCollection(polylines, colors=edge_color, linewidths=line_widths, zorder=1))
+    ax.autoscale_view()
+
+
 def _graph_to_matplotlib(graph, **kwargs) -> Figure:
     """
     Convert a NetworkX graph to a matplotlib figure for display.
@@ -252,7 +427,11 @@ def _graph_to_matplotlib(graph, **kwargs) -> Figure:
         - figsize: tuple, figure size (default: (10, 8))
         - title: str, plot title (default: 'NetworkX Graph')
         - seed: int, random seed for layout (default: 42)
-        - use_node_positions: bool, use node spatial coordinates if available (default: True)
+        - use_node_positions: bool, use node spatial coordinates if available, unless a
+          layout is explicitly requested (default: True)
+        - lod: bool or 'auto', level-of-detail rendering: degree-2 chains are collapsed and,
+          with spatial positions, drawn as polylines simplified to the pixel grid
+          (default: pysnt.get_option('graph.display.lod'))
         
     Returns
     -------
@@ -281,38 +460,34 @@ def _graph_to_matplotlib(graph, **kwargs) -> Figure:
     arrowsize = kwargs.get('arrowsize', 10)
     arrowstyle = kwargs.get('arrowstyle', '->')
     
+    # Level of detail: collapse degree-2 chains before layout and drawing
+    full_graph = graph
+    chains = None
+    if _resolve_graph_lod(graph, kwargs.get('lod', None)):
+        graph, chains = _collapse_degree2_chains(full_graph)
+        logger.info(f"Level-of-detail rendering: {full_graph.number_of_nodes()} nodes collapsed to "
+                    f"{graph.number_of_nodes()} branch/end nodes")
+    
     # Create figure
     fig, ax = plt.subplots(figsize=figsize)
     
     try:
         # Determine node positions
+        pos = None
+        spatial = False
         if isinstance(layout, dict):
             # Use provided position dictionary
             pos = layout
-        elif layout == 'spatial' or (use_node_positions and layout == 'spring'):
-            # Try to use spatial coordinates from SWCPoint nodes
-            pos = {}
-            has_spatial_coords = False
-            
-            for node in graph.nodes():
-                try:
-                    # Try to get coordinates from SWCPoint attributes
-                    if 'x' in graph.nodes[node] and 'y' in graph.nodes[node]:
-                        # Use node attributes if available
-                        x = float(graph.nodes[node]['x'])
-                        y = float(graph.nodes[node]['y'])
-                        pos[node] = (x, y)
-                        has_spatial_coords = True
-                except Exception as e:
-                    logger.debug(f"Could not extract spatial coordinates from node {node}: {e}")
-            
-            # Fall back to spring layout if no spatial coordinates found
-            if not has_spatial_coords or len(pos) != graph.number_of_nodes():
-                logger.debug("No spatial coordinates found, using spring layout")
-                pos = nx.spring_layout(graph, seed=seed)
-        else:
+        elif layout == 'spatial' or (use_node_positions and (layout == 'spring' or 'layout' not in kwargs)):
+            # Spatial coordinates (e.g., from SWCPoint nodes) are used by default when available
+            pos = _spatial_node_positions(graph)
+            spatial = pos is not None
+            if not spatial:
+                logger.debug(f"No spatial coordinates found, using {layout} layout")
+        
+        if pos is None:
             # Use specified layout algorithm
-            if layout == 'spring':
+            if layout == 'spring' or layout == 'spatial':
                 pos = nx.spring_layout(graph, seed=seed)
             elif layout == 'circular':
                 pos = nx.circular_layout(graph)
@@ -417,25 +592,35 @@ def _graph_to_matplotlib(graph, **kwargs) -> Figure:
             edge_width = edge_widths
         
         # Draw the graph
-        nx.draw(graph, pos,
-                node_color=node_color,
-                node_size=node_size,
-                edge_color=edge_color,
-                width=edge_width,
-                with_labels=with_labels,
-                ax=ax,
-                arrows=arrows,
-                arrowsize=arrowsize,
-                arrowstyle=arrowstyle
-                )
+        if chains is not None and spatial:
+            # Edges follow the collapsed chains as pixel-simplified polylines (one collection)
+            _draw_lod_chains(ax, full_graph, graph, chains, edge_color, edge_width, figsize, fig.dpi)
+            nx.draw_networkx_nodes(graph, pos, node_color=node_color, node_size=node_size, ax=ax)
+            if with_labels:
+                nx.draw_networkx_labels(graph, pos, ax=ax)
+            ax.set_axis_off()
+        else:
+            nx.draw(graph, pos,
+                    node_color=node_color,
+                    node_size=node_size,
+                    edge_color=edge_color,
+                    width=edge_width,
+                    with_labels=with_labels,
+                    ax=ax,
+                    arrows=arrows,
+                    arrowsize=arrowsize,
+                    arrowstyle=arrowstyle
+                    )
         
         # Note: Title is handled by _display_matplotlib_figure via fig.suptitle()
         # Don't set ax.set_title() here to avoid duplication
         
         # Add graph statistics as text
-        stats_text = f"Nodes: {graph.number_of_nodes()}, Edges: {graph.number_of_edges()}"
+        stats_text = f"Nodes: {full_graph.number_of_nodes()}, Edges: {full_graph.number_of_edges()}"
         if hasattr(graph, 'is_directed') and graph.is_directed():
             stats_text += " (Directed)"
+        if chains is not None:
+            stats_text += f"\nLOD: {graph.number_of_nodes()} nodes shown"
         
         ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
@@ -464,6 +649,308 @@ def _graph_to_matplotlib(graph, **kwargs) -> Figure:
         return fig
 
 
+# Axis indices (horizontal, vertical) of (x, y, z) coordinates for each 2D projection
+_PROJECTION_AXES = {'xy': (0, 1), 'xz': (0, 2), 'zy': (2, 1)}
+
+# Built-in per-node metrics that can be used to color tree segments
+_TREE_COLOR_METRICS = ('x', 'y', 'z', 'radius', 'type', 'path_distance')
+
+
+def _as_tree_arrays(obj) -> dict:
+    """Return node/segment arrays for a Tree, or pass through an existing arrays dict."""
+    if isinstance(obj, dict) and 'xyz' in obj and 'segments' in obj:
+        return obj
+    from ..converters.tree_converters import _extract_tree_arrays
+    return _extract_tree_arrays(obj)
+
+
+def _tree_path_distances(arrays) -> np.ndarray:
+    """
+    Compute the path distance from the root to every node of a tree.
+
+    Uses pointer jumping over the parent array, so the number of vectorized
+    passes grows with log(depth) rather than with the number of nodes.
+    """
+    xyz = arrays['xyz']
+    parent = arrays['parent']
+    has_parent = parent >= 0
+    acc = np.zeros(len(parent))
+    acc[has_parent] = np.linalg.norm(xyz[has_parent] - xyz[parent[has_parent]], axis=1)
+    anc = parent.copy()
+    while True:
+        jump = anc >= 0
+        if not jump.any():
+            return acc
+        targets = anc[jump]
+        acc_next = acc.copy()
+        acc_next[jump] += acc[targets]
+        anc[jump] = anc[targets]
+        acc = acc_next
+
+
+def _tree_node_metric(arrays, color_by) -> np.ndarray:
+    """
+    Resolve a per-node metric used for coloring tree segments.
+
+    Parameters
+    ----------
+    arrays : dict
+        Node/segment arrays (see pysnt.tree_to_arrays())
+    color_by : str, array-like or callable
+        One of 'x', 'y', 'z', 'radius', 'type', 'path_distance', an array with one
+        value per node, or a callable mapping the arrays dict to such an array
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (N,) with one value per node
+    """
+    if isinstance(color_by, str):
+        if color_by in ('x', 'y', 'z'):
+            return arrays['xyz'][:, 'xyz'.index(color_by)]
+        if color_by == 'radius':
+            return arrays['radius']
+        if color_by == 'type':
+            return arrays['type'].astype(np.float64)
+        if color_by == 'path_distance':
+            return _tree_path_distances(arrays)
+        raise ValueError(f"Unknown color metric '{color_by}'. Must be one of {_TREE_COLOR_METRICS}, "
+                         f"an array of per-node values, or a callable")
+
+    values = color_by(arrays) if callable(color_by) else color_by
+    values = np.asarray(values, dtype=np.float64)
+    if values.shape != (len(arrays['xyz']),):
+        raise ValueError(f"Per-node metric has shape {values.shape}, expected ({len(arrays['xyz'])},)")
+    return values
+
+
+def _trees_to_segment_data(arrays_list, projection='xy', color_by=None, linewidth=1.0, width_by_radius=False):
+    """
+    Stack the projected segments of several trees into bulk arrays.
+
+    Parameters
+    ----------
+    arrays_list : list of dict
+        Node/segment arrays, one per tree
+    projection : str
+        'xy', 'xz' or 'zy'
+    color_by : str, array-like, callable or None
+        Per-node metric (see _tree_node_metric()). Segments take the value of their child node
+    linewidth : float
+        Base line width in points
+    width_by_radius : bool
+        Scale widths by the mean radius of each segment's nodes, relative to the
+        median radius of all nodes
+
+    Returns
+    -------
+    tuple
+        (segments, values, widths, tree_index) where segments has shape (M, 2, 2),
+        values is (M,) or None, widths is (M,) or a scalar and tree_index (M,)
+        maps each segment to its tree
+    """
+    if projection not in _PROJECTION_AXES:
+        raise ValueError(f"Invalid projection '{projection}'. Must be one of {list(_PROJECTION_AXES)}")
+    h, v = _PROJECTION_AXES[projection]
+
+    segments, values, radii, tree_index = [], [], [], []
+    for i, arrays in enumerate(arrays_list):
+        seg = arrays['segments']
+        xy = arrays['xyz'][:, (h, v)]
+        segments.append(np.stack((xy[seg[:, 0]], xy[seg[:, 1]]), axis=1))
+        tree_index.append(np.full(len(seg), i, dtype=np.int64))
+        if color_by is not None:
+            values.append(_tree_node_metric(arrays, color_by)[seg[:, 1]])
+        if width_by_radius:
+            r = arrays['radius']
+            radii.append(0.5 * (r[seg[:, 0]] + r[seg[:, 1]]))
+
+    segments = np.concatenate(segments) if segments else np.empty((0, 2, 2))
+    tree_index = np.concatenate(tree_index) if tree_index else np.empty(0, dtype=np.int64)
+    values = np.concatenate(values) if color_by is not None and values else None
+
+    widths = linewidth
+    if width_by_radius and radii:
+        radii = np.concatenate(radii)
+        positive = radii[radii > 0]
+        reference = np.median(positive) if len(positive) else 1.0
+        widths = np.clip(linewidth * radii / reference, 0.1 * linewidth, None)
+
+    return segments, values, widths, tree_index
+
+
+def _draw_trees_on_axis(ax, arrays_list, **kwargs):
+    """
+    Draw one or more trees on an axis as a single LineCollection.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        Target axis
+    arrays_list : list of dict
+        Node/segment arrays, one per tree
+    **kwargs
+        Rendering options (see plot_trees()) plus an optional 'norm'
+        shared across panels
+
+    Returns
+    -------
+    matplotlib.collections.LineCollection
+        The collection added to the axis
+    """
+    from matplotlib.collections import LineCollection
+
+    projection = kwargs.get('projection', 'xy')
+    color_by = kwargs.get('color_by', None)
+    segments, values, widths, tree_index = _trees_to_segment_data(
+        arrays_list,
+        projection=projection,
+        color_by=color_by,
+        linewidth=kwargs.get('linewidth', 1.0),
+        width_by_radius=kwargs.get('width_by_radius', False),
+    )
+
+    collection = LineCollection(segments, linewidths=widths, capstyle='round')
+    if values is not None:
+        collection.set_array(values)
+        collection.set_cmap(kwargs.get('cmap', 'viridis'))
+        if kwargs.get('norm') is not None:
+            collection.set_norm(kwargs['norm'])
+    else:
+        colors = kwargs.get('colors', None)
+        if colors is None:
+            colors = plt.get_cmap('tab10').colors if len(arrays_list) > 1 else ['black']
+        elif isinstance(colors, str):
+            colors = [colors]
+        import matplotlib.colors as mcolors
+        rgba = np.array([mcolors.to_rgba(c) for c in colors])
+        collection.set_color(rgba[tree_index % len(rgba)])
+
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    ax.set_aspect('equal', adjustable='datalim')
+    if kwargs.get('invert_y', True) and projection in ('xy', 'zy') and not ax.yaxis_inverted():
+        ax.invert_yaxis()
+    ax.set_xlabel(projection[0].upper())
+    ax.set_ylabel(projection[1].upper())
+    return collection
+
+
+def _trees_to_matplotlib(trees, **kwargs) -> Figure:
+    """
+    Render trees with matplotlib LineCollections (no Java rendering round trip).
+
+    Parameters
+    ----------
+    trees : Tree, dict, or list of Tree/dict
+        Trees (or node/segment arrays from pysnt.tree_to_arrays()) to render
+    **kwargs
+        Rendering options (see plot_trees()) plus:
+        - overlay: bool, draw all trees in a single panel (default: True)
+        - titles: list of str, panel titles when overlay is False
+        - panel_layout: str or tuple, layout for panels when overlay is False
+        - figsize: tuple, figure size
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        Figure containing the rendered trees
+    """
+    plt = _setup_matplotlib_interactive()
+    import matplotlib.colors as mcolors
+
+    if not isinstance(trees, (list, tuple)):
+        trees = [trees]
+    arrays_list = [_as_tree_arrays(t) for t in trees]
+    color_by = kwargs.get('color_by', None)
+    ax = kwargs.get('ax', None)
+    overlay = kwargs.get('overlay', True) or ax is not None
+
+    # Shared color normalization across all trees/panels
+    norm = None
+    if color_by is not None:
+        all_values = np.concatenate([_tree_node_metric(a, color_by) for a in arrays_list]) \
+            if arrays_list else np.empty(0)
+        vmin = kwargs.get('vmin', np.nanmin(all_values) if all_values.size else 0.0)
+        vmax = kwargs.get('vmax', np.nanmax(all_values) if all_values.size else 1.0)
+        norm = mcolors.Normalize(vmin=vmin, vmax=vmax)
+    draw_kwargs = {**kwargs, 'norm': norm}
+
+    if overlay:
+        if ax is None:
+            fig, ax = plt.subplots(figsize=kwargs.get('figsize', None))
+        else:
+            fig = ax.figure
+        collection = _draw_trees_on_axis(ax, arrays_list, **draw_kwargs)
+        axes = [ax]
+    else:
+        from .utils import _create_subplot_grid
+        fig, axes, _ = _create_subplot_grid(len(arrays_list), kwargs.get('panel_layout', 'auto'),
+                                            kwargs.get('figsize', None))
+        titles = kwargs.get('titles', None) or []
+        collection = None
+        for i, arrays in enumerate(arrays_list):
+            collection = _draw_trees_on_axis(axes[i], [arrays], **draw_kwargs)
+            if i < len(titles) and titles[i]:
+                axes[i].set_title(titles[i], fontsize=10)
+        for i in range(len(arrays_list), len(axes)):
+            axes[i].set_visible(False)
+
+    if color_by is not None and collection is not None and kwargs.get('colorbar', True):
+        label = color_by if isinstance(color_by, str) else None
+        fig.colorbar(collection, ax=axes[:len(arrays_list)] if not overlay else ax, label=label, shrink=0.8)
+
+    n_segments = sum(len(a['segments']) for a in arrays_list)
+    logger.info(f"Rendered {len(arrays_list)} tree(s) with {n_segments} segments ({kwargs.get('projection', 'xy')})")
+    return fig
+
+
+def plot_trees(trees, projection: str = 'xy', color_by=None, **kwargs) -> Figure:
+    """
+    Plot one or more Trees as 2D projections using matplotlib LineCollections.
+
+    Node coordinates are transferred once per tree as bulk arrays and all segments
+    are drawn in a single collection, so this scales to large reconstructions and
+    to many trees at once.
+
+    Parameters
+    ----------
+    trees : Tree, dict, or list of Tree/dict
+        Trees to plot, or node/segment arrays obtained from pysnt.tree_to_arrays()
+    projection : str, default 'xy'
+        Projection plane: 'xy', 'xz' or 'zy'
+    color_by : str, array-like, callable, or None
+        Per-segment coloring metric: 'x', 'y', 'z', 'radius', 'type', 'path_distance',
+        an array of per-node values, or a callable mapping the arrays dict of a tree
+        to such an array. If None, each tree gets a solid color
+    **kwargs
+        Additional rendering options:
+        - cmap: str, colormap for color_by (default: 'viridis')
+        - vmin, vmax: float, color limits (default: data range across all trees)
+        - colors: str or list, solid colors (cycled per tree) when color_by is None
+        - linewidth: float, base line width in points (default: 1.0)
+        - width_by_radius: bool, scale line widths by node radii (default: False)
+        - overlay: bool, draw all trees in one panel rather than one panel per tree (default: True)
+        - titles: list of str, panel titles when overlay is False
+        - panel_layout: str or tuple, panel layout when overlay is False (default: 'auto')
+        - colorbar: bool, add a colorbar when color_by is set (default: True)
+        - invert_y: bool, use image convention (y increasing downward) for 'xy'/'zy' (default: True)
+        - ax: matplotlib Axes to draw into
+        - figsize: tuple, figure size
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        Figure containing the plot
+
+    Examples
+    --------
+    >>> trees = [Tree.fromFile(f) for f in swc_files]
+    >>> fig = pysnt.plot_trees(trees, projection='xz', color_by='path_distance', width_by_radius=True)
+    """
+    return _trees_to_matplotlib(trees, projection=projection, color_by=color_by, **kwargs)
+
+
 def _display_array_data(data, source_type="array", show: bool = True, **kwargs):
     """
     Unified array display for numpy arrays, xarray values, etc.
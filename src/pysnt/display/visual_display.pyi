@@ -7,14 +7,40 @@ Auto-generated stub file.
 from typing import Any, Dict, List, Optional, Union, Callable, Tuple
 
 logger: Any
+_PROJECTION_AXES: Any
+_TREE_COLOR_METRICS: Any
 def _display_matplotlib_figure(fig: Figure, show: bool, **kwargs: Any) -> None: ...
 
 def _show_matplotlib_figure(fig: Any, **kwargs: Any) -> bool: ...
 
 def _get_default_layout_for_graph_type(graph_type: str) -> str: ...
 
+def _resolve_graph_lod(graph: Any, lod: Any) -> bool: ...
+
+def _spatial_node_positions(graph: Any) -> Any: ...
+
+def _collapse_degree2_chains(graph: Any) -> Any: ...
+
+def _simplify_polyline(points: Any, tolerance: Any) -> Any: ...
+
+def _draw_lod_chains(ax: Any, full_graph: Any, reduced: Any, chains: Any, edge_color: Any, edge_width: Any, figsize: Any, dpi: Any) -> Any: ...
+
 def _graph_to_matplotlib(graph: Any, **kwargs: Any) -> Figure: ...
 
+def _as_tree_arrays(obj: Any) -> dict: ...
+
+def _tree_path_distances(arrays: Any) -> Any: ...
+
+def _tree_node_metric(arrays: Any, color_by: Any) -> Any: ...
+
+def _trees_to_segment_data(arrays_list: Any, projection: Any, color_by: Any, linewidth: Any, width_by_radius: Any) -> Any: ...
+
+def _draw_trees_on_axis(ax: Any, arrays_list: Any, **kwargs: Any) -> Any: ...
+
+def _trees_to_matplotlib(trees: Any, **kwargs: Any) -> Figure: ...
+
+def plot_trees(trees: Any, projection: str, color_by: Any, **kwargs: Any) -> Figure: ...
+
 def _display_array_data(data: Any, source_type: Any, show: bool, **kwargs: Any) -> Any: ...
 
 def _should_preserve_aspect(image_array: Any) -> Any: ...
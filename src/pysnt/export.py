@@ -0,0 +1,282 @@
+"""
+Batch figure export for PySNT.
+
+This module renders many objects (or reconstruction files) to image files in one
+go: a single headless SNT context is shared by all items, items are rendered on a
+bounded worker pool, outputs that are already up to date are skipped, and a JSON
+manifest records per-item timing and errors.
+"""
+
+import json
+import logging
+import os
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+# Reconstruction file extensions that can be loaded as SNT Trees
+RECONSTRUCTION_EXTENSIONS = ('.swc', '.eswc', '.traces', '.json', '.ndf')
+
+# Output formats supported by both SNTChart and matplotlib
+EXPORT_FORMATS = ('png', 'svg', 'pdf')
+
+MANIFEST_FILENAME = 'manifest.json'
+
+
+def export_figures(
+    objects_or_paths: Union[Any, Sequence[Any]],
+    out_dir: Union[str, os.PathLike],
+    format: str = 'png',
+    dpi: Optional[int] = None,
+    overwrite: bool = False,
+    max_workers: Optional[int] = None,
+    manifest: bool = True,
+    **kwargs,
+) -> Dict[str, Any]:
+    """
+    Export figures for many objects or reconstruction files.
+
+    Each item is rendered with the same machinery as pysnt.display() (SNTCharts are
+    exported natively by SNT) and saved to ``out_dir``. SNT is initialized once, in
+    headless mode, if any item requires it.
+
+    Parameters
+    ----------
+    objects_or_paths : object, path, or sequence of objects/paths
+        Displayable objects (SNTChart, Tree, ImagePlus, matplotlib Figure, ...) and/or
+        paths to reconstruction files (.swc, .eswc, .traces, .json, .ndf)
+    out_dir : str or path-like
+        Output directory (created if needed)
+    format : str, default 'png'
+        Output format: 'png', 'svg' or 'pdf'
+    dpi : int, optional
+        Output resolution (default: pysnt.get_option('display.chart_dpi'))
+    overwrite : bool, default False
+        Re-export items whose output is already up to date. Outputs of file inputs
+        are up to date when newer than the input file; outputs of in-memory objects
+        are always re-exported
+    max_workers : int, optional
+        Number of worker threads (default: pysnt.get_option('display.conversion_workers'))
+    manifest : bool, default True
+        Write a JSON manifest (manifest.json) to ``out_dir``
+    **kwargs
+        Additional display options passed to the renderer (e.g., renderer='native',
+        projection='xz', color_by='path_distance' for Trees)
+
+    Returns
+    -------
+    dict
+        The manifest: export settings, total time, and one record per item with
+        'index', 'source', 'output', 'status' ('exported', 'skipped' or 'error'),
+        'seconds' and 'error'
+
+    Examples
+    --------
+    >>> import glob
+    >>> manifest = pysnt.export_figures(glob.glob('cells/*.swc'), 'figures', format='svg')
+    >>> [item['output'] for item in manifest['items'] if item['status'] == 'error']
+    []
+    """
+    from .config import get_option, option_context
+    from .display.core import _resolve_conversion_workers, _run_conversion_pool
+
+    format = format.lower()
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Invalid export format '{format}'. Must be one of {EXPORT_FORMATS}")
+    if dpi is None:
+        dpi = get_option('display.chart_dpi')
+
+    items = list(objects_or_paths) if isinstance(objects_or_paths, (list, tuple)) else [objects_or_paths]
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    jobs = _plan_export_jobs(items, out_dir, format, overwrite)
+    pending = [job for job in jobs if job['status'] is None]
+
+    if any(_requires_snt(job['item']) for job in pending):
+        _ensure_headless_context()
+
+    workers = _resolve_conversion_workers(len(pending), creates_figures=True, max_workers=max_workers)
+    logger.info(f"Exporting {len(pending)} of {len(jobs)} item(s) to {out_dir} ({format}, {workers} worker(s))")
+
+    with option_context(pyplot_ion=False):
+        results = _run_conversion_pool(lambda job: _export_one(job, format, dpi, **kwargs), pending, workers)
+
+    for job, (_, error) in zip(pending, results):
+        if error is not None:
+            job['status'] = 'error'
+            job['error'] = f"{type(error).__name__}: {error}"
+            logger.warning(f"Failed to export item {job['index'] + 1} ({job['source']}): {error}")
+
+    records = [{key: job[key] for key in ('index', 'source', 'output', 'status', 'seconds', 'error')}
+               for job in jobs]
+    result = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'out_dir': str(out_dir),
+        'format': format,
+        'dpi': dpi,
+        'total_seconds': round(time.perf_counter() - start, 4),
+        'counts': {status: sum(r['status'] == status for r in records)
+                   for status in ('exported', 'skipped', 'error')},
+        'items': records,
+    }
+
+    if manifest:
+        with open(out_dir / MANIFEST_FILENAME, 'w') as f:
+            json.dump(result, f, indent=2)
+
+    logger.info(f"Export finished in {result['total_seconds']:.2f}s: {result['counts']}")
+    return result
+
+
+def _plan_export_jobs(items: List[Any], out_dir: Path, format: str, overwrite: bool) -> List[Dict[str, Any]]:
+    """Assign unique output paths to items and mark those already up to date as skipped."""
+    jobs = []
+    used_names = set()
+    for index, item in enumerate(items):
+        stem = _safe_stem(_item_label(item, index))
+        name, n = stem, 1
+        while name in used_names:
+            n += 1
+            name = f"{stem}_{n}"
+        used_names.add(name)
+
+        output = out_dir / f"{name}.{format}"
+        job = {
+            'index': index,
+            'item': item,
+            'source': str(item) if _is_path(item) else type(item).__name__,
+            'output': str(output),
+            'status': None,
+            'seconds': 0.0,
+            'error': None,
+        }
+        if not overwrite and _is_up_to_date(item, output):
+            job['status'] = 'skipped'
+            logger.debug(f"Skipping up-to-date output: {output}")
+        jobs.append(job)
+    return jobs
+
+
+def _export_one(job: Dict[str, Any], format: str, dpi: int, **kwargs) -> None:
+    """Render and save one job, recording timing and status in the job dict."""
+    t0 = time.perf_counter()
+    try:
+        obj = _load_item(job['item'])
+        if _is_snt_chart_object(obj):
+            _save_snt_chart(obj, job['output'], format, dpi)
+        else:
+            fig = _render_figure(obj, **kwargs)
+            fig.savefig(job['output'], format=format, dpi=dpi, bbox_inches='tight')
+            if fig is not obj:
+                _close_figure(fig)
+        job['status'] = 'exported'
+    finally:
+        job['seconds'] = round(time.perf_counter() - t0, 4)
+
+
+def _render_figure(obj: Any, **kwargs) -> Any:
+    """Render an object to a matplotlib Figure via the display machinery."""
+    from matplotlib.figure import Figure
+    from .core import extract_figure
+    from .display import display
+
+    fig = obj if isinstance(obj, Figure) else extract_figure(display(obj, show=False, **kwargs))
+    if not isinstance(fig, Figure):
+        raise TypeError(f"Object of type {type(obj).__name__} did not produce a matplotlib figure")
+    return fig
+
+
+def _save_snt_chart(chart: Any, output: str, format: str, dpi: int) -> None:
+    """Save an SNTChart with SNT's own exporters (no matplotlib round trip)."""
+    from .converters.chart_converters import _save_chart_by_format
+
+    # SNT's exporters use a scale factor relative to screen resolution (72 dpi)
+    scale = 1.0 if format != 'png' else max(dpi / 72.0, 1.0)
+    _save_chart_by_format(chart, output, format, scale)
+    if not os.path.exists(output):
+        raise FileNotFoundError(f"SNTChart export did not create {output}")
+
+
+def _close_figure(fig: Any) -> None:
+    """Release a figure created during export."""
+    try:
+        import matplotlib.pyplot as plt
+        plt.close(fig)
+    except Exception as e:
+        logger.debug(f"Could not close figure: {e}")
+
+
+def _load_item(item: Any) -> Any:
+    """Load reconstruction files as SNT Trees; pass other objects through."""
+    if not _is_path(item):
+        return item
+    path = Path(item)
+    if not path.exists():
+        raise FileNotFoundError(f"No such file: {path}")
+    if path.suffix.lower() not in RECONSTRUCTION_EXTENSIONS:
+        raise ValueError(f"Unsupported file type '{path.suffix}'. Supported: {RECONSTRUCTION_EXTENSIONS}")
+    import scyjava
+    Tree = scyjava.jimport('sc.fiji.snt.Tree')
+    tree = Tree(str(path))
+    if tree.isEmpty():
+        raise ValueError(f"No reconstruction could be loaded from {path}")
+    return tree
+
+
+def _ensure_headless_context() -> None:
+    """Initialize SNT once, in headless mode, unless it is already running."""
+    from .core import initialize, is_initialized
+
+    if not is_initialized():
+        logger.info("Initializing SNT in headless mode for export")
+        initialize(interactive=False, mode='headless')
+
+
+def _requires_snt(item: Any) -> bool:
+    """Check whether exporting an item requires a running SNT context."""
+    return _is_path(item) or 'java' in str(type(item)).lower()
+
+
+def _is_snt_chart_object(obj: Any) -> bool:
+    from .converters.chart_converters import _is_snt_chart
+    return 'java' in str(type(obj)).lower() and _is_snt_chart(obj)
+
+
+def _is_path(item: Any) -> bool:
+    return isinstance(item, (str, os.PathLike))
+
+
+def _is_up_to_date(item: Any, output: Path) -> bool:
+    """An output is up to date if it exists and is newer than its source file."""
+    if not _is_path(item) or not output.exists():
+        return False
+    try:
+        return output.stat().st_mtime >= Path(item).stat().st_mtime
+    except OSError:
+        return False
+
+
+def _item_label(item: Any, index: int) -> str:
+    """Derive an output file stem for an item."""
+    if _is_path(item):
+        return Path(item).stem
+    for getter in ('getLabel', 'getTitle'):
+        try:
+            label = getattr(item, getter)()
+            if label:
+                return str(label)
+        except Exception:
+            continue
+    return f"figure_{index + 1:03d}"
+
+
+def _safe_stem(label: str) -> str:
+    """Make a label safe for use as a file name."""
+    stem = re.sub(r'[^\w.\-]+', '_', label).strip('._')
+    return stem or 'figure'
@@ -0,0 +1,39 @@
+"""
+Type stubs for export.py
+
+Auto-generated stub file.
+"""
+
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple
+
+logger: Any
+RECONSTRUCTION_EXTENSIONS: Any
+EXPORT_FORMATS: Any
+MANIFEST_FILENAME: Any
+def export_figures(objects_or_paths: Any, out_dir: Any, format: str, dpi: Optional[int], overwrite: bool, max_workers: Optional[int], manifest: bool, **kwargs: Any) -> Dict[str, Any]: ...
+
+def _plan_export_jobs(items: List[Any], out_dir: Any, format: str, overwrite: bool) -> List[Dict[str, Any]]: ...
+
+def _export_one(job: Dict[str, Any], format: str, dpi: int, **kwargs: Any) -> None: ...
+
+def _render_figure(obj: Any, **kwargs: Any) -> Any: ...
+
+def _save_snt_chart(chart: Any, output: str, format: str, dpi: int) -> None: ...
+
+def _close_figure(fig: Any) -> None: ...
+
+def _load_item(item: Any) -> Any: ...
+
+def _ensure_headless_context() -> None: ...
+
+def _requires_snt(item: Any) -> bool: ...
+
+def _is_snt_chart_object(obj: Any) -> bool: ...
+
+def _is_path(item: Any) -> bool: ...
+
+def _is_up_to_date(item: Any, output: Any) -> bool: ...
+
+def _item_label(item: Any, index: int) -> str: ...
+
+def _safe_stem(label: str) -> str: ...
@@ -53,6 +53,14 @@ get_extended_classes = _module_funcs['get_extended_classes']
 __getattr__ = _module_funcs['create_getattr']('pysnt.filter')
 __dir__ = _module_funcs['create_dir']()
 
+# Import filter cache utilities
+from .cache import (
+    cached_filter,
+    clear_filter_cache,
+    default_filter_cache_dir,
+    source_identity,
+)
+
 # =============================================================================
 # MODULE EXPORTS
 # =============================================================================
@@ -66,6 +74,11 @@ __all__ = [
     "list_classes",
     "get_curated_classes",
     "get_extended_classes",
+    # Filter cache
+    "cached_filter",
+    "clear_filter_cache",
+    "default_filter_cache_dir",
+    "source_identity",
     # Constants (standard for all modules)
     "CURATED_CLASSES",
     "EXTENDED_CLASSES",
@@ -119,4 +119,8 @@ class Tubeness:
 
 
 # Imported functions
+def cached_filter(image: Any, filter: str = 'tubeness', scales: Any = (1.0,), spacing: Optional[Any] = None, roi: Optional[Any] = None, source_id: Optional[str] = None, cache_dir: Optional[str] = None, block_size: Optional[int] = None, workers: Optional[int] = None, cache_format: str = 'n5') -> Any: ...
+def clear_filter_cache(cache_dir: Optional[str] = None) -> int: ...
+def default_filter_cache_dir() -> Any: ...
+def source_identity(source: Any) -> str: ...
 def setup_module_classes(*args: Any, **kwargs: Any) -> Any: ...
\ No newline at end of file
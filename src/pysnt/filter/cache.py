@@ -0,0 +1,453 @@
+"""
+Persistent, chunked cache of filtered (secondary) images.
+
+Hessian-based filters (Tubeness, Frangi) are expensive, and tracing the same
+volume repeatedly recomputes them. cached_filter() computes a filter block by
+block and stores the blocks in an N5 (or Zarr) container on disk, keyed on the
+source image identity, the region of interest and the filter parameters
+(filter, scales, spacing and, for Frangi, the intensity maximum of the source).
+The maximum of each source is computed once and remembered next to the cache
+entries, so that cache hits do not read the source. Blocks are computed in parallel, each with a margin
+so that results do not depend on block boundaries, and only blocks missing from
+the cache are computed: later calls (or interrupted runs) reuse what is already
+on disk. The result is opened lazily (blocks are read on access) and can be
+passed wherever SNT expects a secondary image, e.g., pysnt.tracing.trace_batch().
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+FILTERS = {
+    'tubeness': 'sc.fiji.snt.filter.Tubeness',
+    'frangi': 'sc.fiji.snt.filter.Frangi',
+}
+CACHE_FORMATS = ('n5', 'zarr')
+MANIFEST_NAME = 'cache.json'
+MANIFEST_VERSION = 1
+
+# Intensity maxima of sources (Frangi normalization), by source identity
+MAXIMA_NAME = 'source_maxima.json'
+
+# Dataset holding the filtered blocks within each container
+_DATASET = 'filtered'
+
+# Block margin, in Gaussian standard deviations of the largest scale
+_MARGIN_SIGMAS = 3
+
+# Guards the maxima file of cache directories
+_maxima_lock = threading.Lock()
+
+# Completed blocks between manifest updates while computing (the manifest is
+# also written when computation ends)
+_MANIFEST_INTERVAL = 16
+
+
+def default_filter_cache_dir() -> Path:
+    """Return the directory holding filter caches (a 'filter_cache' folder in the pysnt config directory)."""
+    from ..setup_utils import get_config_dir
+    return get_config_dir() / 'filter_cache'
+
+
+def source_identity(source: Any) -> str:
+    """
+    Identify the source of an image for caching.
+
+    Parameters
+    ----------
+    source : str, Path or ImagePlus
+        Path to the image file (or directory, e.g., a Zarr container), or an
+        ImagePlus opened from a file
+
+    Returns
+    -------
+    str
+        Resolved path, size and modification time of the file: modifying the file
+        invalidates caches derived from it
+
+    Raises
+    ------
+    ValueError
+        If the source has no file to identify it by
+    """
+    path = source
+    if hasattr(source, 'getOriginalFileInfo'):  # ImagePlus
+        info = source.getOriginalFileInfo()
+        path = os.path.join(str(info.directory), str(info.fileName)) if info is not None and info.fileName else None
+    if not isinstance(path, (str, Path)) or not Path(path).exists():
+        raise ValueError("Cannot identify the source image from a file: pass source_id (e.g., the path of the "
+                         "image, or any string identifying its content)")
+    path = Path(path).resolve()
+    stat = path.stat()
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def cache_key(source_id: str, filter: str, scales: Sequence[float], spacing: Sequence[float],
+              roi: Optional[Tuple[Sequence[int], Sequence[int]]] = None, stack_max: Optional[float] = None) -> str:
+    """
+    Compute the cache key of a filtered image.
+
+    Parameters
+    ----------
+    source_id : str
+        Identity of the source image (see source_identity())
+    filter : str
+        Filter name ('tubeness' or 'frangi')
+    scales : sequence of float
+        Filter scales (calibrated units)
+    spacing : sequence of float
+        Voxel spacing
+    roi : tuple of sequence of int, optional
+        (min, max) voxel coordinates of the region of interest (max exclusive)
+    stack_max : float, optional
+        Intensity maximum of the source, used by Frangi to normalize its output
+
+    Returns
+    -------
+    str
+        Hexadecimal key
+    """
+    params = {
+        'source': source_id,
+        'filter': filter,
+        'scales': [float(s) for s in scales],
+        'spacing': [float(s) for s in spacing],
+        'roi': None if roi is None else [[int(v) for v in roi[0]], [int(v) for v in roi[1]]],
+    }
+    if stack_max is not None:
+        params['stack_max'] = float(stack_max)
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def cached_filter(image: Any, filter: str = 'tubeness', scales: Sequence[float] = (1.0,),
+                  spacing: Optional[Sequence[float]] = None, roi: Optional[Tuple[Sequence[int], Sequence[int]]] = None,
+                  source_id: Optional[str] = None, cache_dir: Optional[str] = None,
+                  block_size: Optional[int] = None, workers: Optional[int] = None,
+                  cache_format: str = 'n5', stack_max: Optional[float] = None) -> Any:
+    """
+    Filter an image through a persistent, chunked disk cache.
+
+    Parameters
+    ----------
+    image : ImagePlus or RandomAccessibleInterval
+        Source image
+    filter : str, default 'tubeness'
+        'tubeness' or 'frangi'
+    scales : sequence of float, default (1.0,)
+        Filter scales (calibrated units), e.g., the expected radii of neurites
+    spacing : sequence of float, optional
+        Voxel spacing (default: the ImagePlus' calibration, or 1)
+    roi : tuple of sequence of int, optional
+        (min, max) voxel coordinates of the region to filter (max exclusive).
+        Default: the whole image
+    source_id : str, optional
+        Identity of the source image (default: source_identity(image), which
+        requires an image opened from a file)
+    cache_dir : str, optional
+        Cache directory (default: pysnt.get_option('filter.cache_dir'), or
+        default_filter_cache_dir())
+    block_size : int, optional
+        Edge length of cached blocks in voxels (default:
+        pysnt.get_option('filter.cache_block_size')). Fixed when a cache entry is
+        created
+    workers : int, optional
+        Number of blocks computed in parallel (default:
+        pysnt.get_option('filter.cache_workers'))
+    cache_format : str, default 'n5'
+        Container format: 'n5' or 'zarr'
+    stack_max : float, optional
+        Intensity maximum of the source, normalizing Frangi's output (default:
+        the maximum remembered for source_id, or computed from the whole source
+        on first use). Ignored by Tubeness
+
+    Returns
+    -------
+    RandomAccessibleInterval
+        Lazily loaded FloatType image covering the ROI, in source coordinates
+
+    Examples
+    --------
+    >>> from pysnt.filter import cached_filter
+    >>> tubeness = cached_filter(imp, 'tubeness', scales=[0.5, 1.0])
+    >>> paths = pysnt.tracing.trace_batch(tubeness, starts, goals)
+    """
+    from ..config import get_option
+
+    if filter not in FILTERS:
+        raise ValueError(f"Invalid filter '{filter}'. Must be one of {tuple(FILTERS)}")
+    if cache_format not in CACHE_FORMATS:
+        raise ValueError(f"Invalid cache format '{cache_format}'. Must be one of {CACHE_FORMATS}")
+    if not scales:
+        raise ValueError("At least one scale is required")
+
+    source, calibrated = _as_source(image)
+    shape = _dimensions(source)
+    spacing = [float(s) for s in (spacing or calibrated or [1.0] * len(shape))]
+    if len(spacing) != len(shape):
+        raise ValueError(f"spacing has {len(spacing)} values for a {len(shape)}D image")
+    roi_min, roi_max = _roi_bounds(roi, shape)
+    if source_id is None:
+        source_id = source_identity(image)
+
+    root = Path(cache_dir or get_option('filter.cache_dir') or default_filter_cache_dir())
+    # Frangi normalizes by the intensity maximum of the whole source, not of each block
+    if filter != 'frangi':
+        stack_max = None
+    elif stack_max is None:
+        stack_max = _source_max(root, source_id, source)
+    key = cache_key(source_id, filter, scales, spacing, roi, stack_max)
+    entry = root / f"{key}.{cache_format}"
+    manifest = _read_manifest(entry)
+    roi_shape = [hi - lo for lo, hi in zip(roi_min, roi_max)]
+    store = _open_store(entry, cache_format)
+    if manifest is None:
+        size = int(block_size or get_option('filter.cache_block_size'))
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'key': key,
+            'source': source_id,
+            'filter': filter,
+            'scales': [float(s) for s in scales],
+            'spacing': spacing,
+            'stack_max': stack_max,
+            'roi': [roi_min, roi_max],
+            'shape': roi_shape,
+            'block_size': [min(size, extent) for extent in roi_shape],
+            'format': cache_format,
+            'complete': [],
+        }
+        _create_dataset(store, roi_shape, manifest['block_size'])
+        _write_manifest(entry, manifest)
+
+    grid = _block_grid(roi_shape, manifest['block_size'])
+    done = {tuple(position) for position in manifest['complete']}
+    pending = [position for position in grid if position not in done]
+    if pending:
+        op_factory = _filter_factory(filter, scales, spacing, stack_max)
+        margin = [math.ceil(_MARGIN_SIGMAS * max(scales) / s) for s in spacing]
+        _compute_blocks(source, op_factory, store, entry, manifest, pending, roi_min, margin,
+                        int(workers or get_option('filter.cache_workers')))
+    else:
+        logger.info(f"Filter cache hit: {filter} {list(scales)} ({len(grid)} blocks in {entry})")
+    return _open_dataset(store, roi_min)
+
+
+def clear_filter_cache(cache_dir: Optional[str] = None) -> int:
+    """
+    Remove all cached filtered images.
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        Cache directory (default: pysnt.get_option('filter.cache_dir'), or
+        default_filter_cache_dir())
+
+    Returns
+    -------
+    int
+        Number of cache entries removed
+    """
+    from ..config import get_option
+
+    root = Path(cache_dir or get_option('filter.cache_dir') or default_filter_cache_dir())
+    if not root.is_dir():
+        return 0
+    removed = 0
+    for entry in root.iterdir():
+        if entry.suffix.lstrip('.') in CACHE_FORMATS and (entry / MANIFEST_NAME).exists():
+            shutil.rmtree(entry)
+            removed += 1
+    (root / MAXIMA_NAME).unlink(missing_ok=True)
+    return removed
+
+
+def _compute_blocks(source: Any, op_factory: Any, store: Any, entry: Path, manifest: Dict[str, Any],
+                    pending: List[Tuple[int, ...]], roi_min: List[int], margin: List[int], workers: int) -> None:
+    """Compute and store missing blocks in parallel, recording completed blocks in the manifest."""
+    from ..async_utils import _attach_daemon
+
+    block_size = manifest['block_size']
+    shape = manifest['shape']
+    lock = threading.Lock()
+    start_time = time.perf_counter()
+
+    def compute(position):
+        block_min = [lo + p * size for lo, p, size in zip(roi_min, position, block_size)]
+        block_max = [lo + min((p + 1) * size, extent) for lo, p, size, extent
+                     in zip(roi_min, position, block_size, shape)]
+        _write_block(source, op_factory(), store, position, block_min, block_max, margin)
+        with lock:
+            manifest['complete'].append(list(position))
+            # Persist progress periodically, so that a killed process loses at most a few blocks
+            if len(manifest['complete']) % _MANIFEST_INTERVAL == 0:
+                _write_manifest(entry, manifest)
+
+    logger.info(f"Computing {len(pending)} of {len(_block_grid(shape, block_size))} {manifest['filter']} blocks "
+                f"with {workers} workers")
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending))), thread_name_prefix='pysnt-filter',
+                                initializer=_attach_daemon) as executor:
+            for future in [executor.submit(compute, position) for position in pending]:
+                future.result()
+    finally:
+        # Keep completed blocks even if others failed: the next call resumes from here
+        with lock:
+            _write_manifest(entry, manifest)
+    logger.info(f"Computed {len(pending)} blocks in {time.perf_counter() - start_time:.1f}s")
+
+
+def _block_grid(shape: Sequence[int], block_size: Sequence[int]) -> List[Tuple[int, ...]]:
+    """Return the grid positions of the blocks covering an image."""
+    return list(product(*(range(math.ceil(extent / size)) for extent, size in zip(shape, block_size))))
+
+
+def _roi_bounds(roi: Optional[Tuple[Sequence[int], Sequence[int]]], shape: List[int]) -> Tuple[List[int], List[int]]:
+    """Validate a (min, max) region of interest against an image shape."""
+    if roi is None:
+        return [0] * len(shape), list(shape)
+    roi_min, roi_max = [int(v) for v in roi[0]], [int(v) for v in roi[1]]
+    if len(roi_min) != len(shape) or len(roi_max) != len(shape) or any(
+            not 0 <= lo < hi <= extent for lo, hi, extent in zip(roi_min, roi_max, shape)):
+        raise ValueError(f"Invalid ROI {roi} for an image of shape {tuple(shape)}")
+    return roi_min, roi_max
+
+
+def _read_manifest(entry: Path) -> Optional[Dict[str, Any]]:
+    try:
+        manifest = json.loads((entry / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get('version') == MANIFEST_VERSION else None
+
+
+def _write_manifest(entry: Path, manifest: Dict[str, Any]) -> None:
+    entry.mkdir(parents=True, exist_ok=True)
+    partial = entry / f"{MANIFEST_NAME}.partial"
+    partial.write_text(json.dumps(manifest))
+    os.replace(partial, entry / MANIFEST_NAME)
+
+
+def _as_source(image: Any) -> Tuple[Any, Optional[List[float]]]:
+    """Return the zero-min RandomAccessibleInterval of an image and its spacing (None if uncalibrated)."""
+    import scyjava
+
+    spacing = None
+    if hasattr(image, 'getCalibration') and hasattr(image, 'getStack'):  # ImagePlus
+        cal = image.getCalibration()
+        spacing = [cal.pixelWidth, cal.pixelHeight] + ([cal.pixelDepth] if image.getNSlices() > 1 else [])
+        image = scyjava.jimport('net.imglib2.img.display.imagej.ImageJFunctions').wrapReal(image)
+    return scyjava.jimport('net.imglib2.view.Views').zeroMin(image), spacing
+
+
+def _dimensions(image: Any) -> List[int]:
+    return [int(image.dimension(d)) for d in range(int(image.numDimensions()))]
+
+
+def _source_max(root: Path, source_id: str, source: Any) -> float:
+    """Return the intensity maximum of a source, computing it only if not remembered in root."""
+    path = root / MAXIMA_NAME
+    with _maxima_lock:
+        try:
+            maxima = json.loads(path.read_text())
+        except (OSError, ValueError):
+            maxima = {}
+        if source_id not in maxima:
+            logger.info("Computing the intensity maximum of the source (once per source)")
+            maxima[source_id] = _stack_max(source)
+            root.mkdir(parents=True, exist_ok=True)
+            partial = root / f"{MAXIMA_NAME}.partial"
+            partial.write_text(json.dumps(maxima))
+            os.replace(partial, path)
+        return float(maxima[source_id])
+
+
+def _stack_max(source: Any) -> float:
+    """Return the intensity maximum of an image."""
+    import scyjava
+
+    Util = scyjava.jimport('net.imglib2.util.Util')
+    ComputeMinMax = scyjava.jimport('net.imglib2.algorithm.stats.ComputeMinMax')
+    pixel_type = Util.getTypeFromInterval(source)
+    minimum, maximum = pixel_type.createVariable(), pixel_type.createVariable()
+    ComputeMinMax.computeMinMax(source, minimum, maximum)
+    return float(maximum.getRealDouble())
+
+
+def _filter_factory(filter: str, scales: Sequence[float], spacing: Sequence[float],
+                    stack_max: Optional[float] = None):
+    """Return a function creating a single-threaded filter op (blocks are parallelized instead)."""
+    import jpype
+    import scyjava
+
+    Filter = scyjava.jimport(FILTERS[filter])
+    java_scales = jpype.JArray(jpype.JDouble)([float(s) for s in scales])
+    java_spacing = jpype.JArray(jpype.JDouble)([float(s) for s in spacing])
+    if filter == 'frangi':
+        return lambda: Filter(java_scales, java_spacing, float(stack_max), 1)
+    return lambda: Filter(java_scales, java_spacing, 1)
+
+
+def _open_store(entry: Path, cache_format: str) -> Any:
+    """Open an N5 or Zarr container for writing."""
+    import scyjava
+
+    if cache_format == 'zarr':
+        return scyjava.jimport('org.janelia.saalfeldlab.n5.zarr.N5ZarrWriter')(str(entry))
+    return scyjava.jimport('org.janelia.saalfeldlab.n5.N5FSWriter')(str(entry))
+
+
+def _create_dataset(store: Any, shape: Sequence[int], block_size: Sequence[int]) -> None:
+    """Create the (float32, gzip-compressed) dataset of a cache entry."""
+    import jpype
+    import scyjava
+
+    DatasetAttributes = scyjava.jimport('org.janelia.saalfeldlab.n5.DatasetAttributes')
+    DataType = scyjava.jimport('org.janelia.saalfeldlab.n5.DataType')
+    GzipCompression = scyjava.jimport('org.janelia.saalfeldlab.n5.GzipCompression')
+    attributes = DatasetAttributes(jpype.JArray(jpype.JLong)(list(shape)), jpype.JArray(jpype.JInt)(list(block_size)),
+                                   DataType.FLOAT32, GzipCompression())
+    store.createDataset(_DATASET, attributes)
+
+
+def _write_block(source: Any, op: Any, store: Any, position: Sequence[int], block_min: Sequence[int],
+                 block_max: Sequence[int], margin: Sequence[int]) -> None:
+    """Filter one block (with margin, mirroring at image borders) and write it to the store."""
+    import jpype
+    import scyjava
+
+    Views = scyjava.jimport('net.imglib2.view.Views')
+    ArrayImgs = scyjava.jimport('net.imglib2.img.array.ArrayImgs')
+    N5Utils = scyjava.jimport('org.janelia.saalfeldlab.n5.imglib2.N5Utils')
+    longs = jpype.JArray(jpype.JLong)
+
+    low = [lo - m for lo, m in zip(block_min, margin)]
+    high = [hi - 1 + m for hi, m in zip(block_max, margin)]
+    padded = Views.zeroMin(Views.interval(Views.extendMirrorSingle(source), longs(low), longs(high)))
+    output = ArrayImgs.floats(longs([h - l + 1 for l, h in zip(low, high)]))
+    op.compute(padded, output)
+    block = Views.interval(output, longs(list(margin)),
+                           longs([m + hi - lo - 1 for m, lo, hi in zip(margin, block_min, block_max)]))
+    N5Utils.saveBlock(Views.zeroMin(block), store, _DATASET, longs(list(position)))
+
+
+def _open_dataset(store: Any, roi_min: Sequence[int]) -> Any:
+    """Open the cached dataset lazily, translated to source coordinates."""
+    import jpype
+    import scyjava
+
+    N5Utils = scyjava.jimport('org.janelia.saalfeldlab.n5.imglib2.N5Utils')
+    image = N5Utils.open(store, _DATASET)
+    if any(roi_min):
+        image = scyjava.jimport('net.imglib2.view.Views').translate(image, jpype.JArray(jpype.JLong)(list(roi_min)))
+    return image
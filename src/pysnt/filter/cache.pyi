@@ -0,0 +1,56 @@
+"""
+Type stubs for cache.py
+
+Auto-generated stub file.
+"""
+
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple, Sequence
+from pathlib import Path
+
+logger: Any
+FILTERS: Any
+CACHE_FORMATS: Any
+MANIFEST_NAME: Any
+MANIFEST_VERSION: Any
+MAXIMA_NAME: Any
+_DATASET: Any
+_MARGIN_SIGMAS: Any
+_maxima_lock: Any
+_MANIFEST_INTERVAL: Any
+def default_filter_cache_dir() -> Path: ...
+
+def source_identity(source: Any) -> str: ...
+
+def cache_key(source_id: str, filter: str, scales: Sequence[float], spacing: Sequence[float], roi: Optional[Tuple[Sequence[int], Sequence[int]]], stack_max: Optional[float]) -> str: ...
+
+def cached_filter(image: Any, filter: str, scales: Sequence[float], spacing: Optional[Sequence[float]], roi: Optional[Tuple[Sequence[int], Sequence[int]]], source_id: Optional[str], cache_dir: Optional[str], block_size: Optional[int], workers: Optional[int], cache_format: str, stack_max: Optional[float]) -> Any: ...
+
+def clear_filter_cache(cache_dir: Optional[str]) -> int: ...
+
+def _compute_blocks(source: Any, op_factory: Any, store: Any, entry: Path, manifest: Dict[str, Any], pending: List[Tuple[int, ...]], roi_min: List[int], margin: List[int], workers: int) -> None: ...
+
+def _block_grid(shape: Sequence[int], block_size: Sequence[int]) -> List[Tuple[int, ...]]: ...
+
+def _roi_bounds(roi: Optional[Tuple[Sequence[int], Sequence[int]]], shape: List[int]) -> Tuple[List[int], List[int]]: ...
+
+def _read_manifest(entry: Path) -> Optional[Dict[str, Any]]: ...
+
+def _write_manifest(entry: Path, manifest: Dict[str, Any]) -> None: ...
+
+def _as_source(image: Any) -> Tuple[Any, Optional[List[float]]]: ...
+
+def _dimensions(image: Any) -> List[int]: ...
+
+def _source_max(root: Path, source_id: str, source: Any) -> float: ...
+
+def _stack_max(source: Any) -> float: ...
+
+def _filter_factory(filter: str, scales: Sequence[float], spacing: Sequence[float], stack_max: Optional[float]) -> Callable[[], Any]: ...
+
+def _open_store(entry: Path, cache_format: str) -> Any: ...
+
+def _create_dataset(store: Any, shape: Sequence[int], block_size: Sequence[int]) -> None: ...
+
+def _write_block(source: Any, op: Any, store: Any, position: Sequence[int], block_min: Sequence[int], block_max: Sequence[int], margin: Sequence[int]) -> None: ...
+
+def _open_dataset(store: Any, roi_min: Sequence[int]) -> Any: ...
@@ -167,6 +167,7 @@ from .images import (
     imgplus_from_zarr,
     inspect_zarr,
     detect_zarr_layout,
+    lazy_xarray,
     get_available_levels,
     get_dataset_path,
     get_dataset_path_from_metadata,
@@ -175,6 +176,7 @@ from .images import (
     LAYOUT_BIOFORMATS2RAW,
     LAYOUT_OME_NGFF,
     LAYOUT_UNKNOWN,
+    AXIS_DIMS,
 )
 
 # Static __all__ with curated classes always available
@@ -194,10 +196,12 @@ __all__ = [
     "get_zattrs_path",
     "imgplus_from_zarr",
     "inspect_zarr",
+    "lazy_xarray",
     # Layout constants
     "LAYOUT_BIOFORMATS2RAW",
     "LAYOUT_OME_NGFF",
     "LAYOUT_UNKNOWN",
+    "AXIS_DIMS",
     # Constants (standard for all modules)
     "CURATED_CLASSES",
     "EXTENDED_CLASSES",
@@ -279,6 +279,7 @@ class WekaModelLoader:
 LAYOUT_BIOFORMATS2RAW: Any
 LAYOUT_OME_NGFF: Any
 LAYOUT_UNKNOWN: Any
+AXIS_DIMS: Any
 
 # Imported functions
 def detect_zarr_layout(*args: Any, **kwargs: Any) -> Any: ...
@@ -288,6 +289,7 @@ def get_dataset_path_from_metadata() -> Any: ...
 def get_zattrs_path() -> Any: ...
 def imgplus_from_zarr(*args: Any, **kwargs: Any) -> Any: ...
 def inspect_zarr(*args: Any, **kwargs: Any) -> Any: ...
+def lazy_xarray(*args: Any, **kwargs: Any) -> Any: ...
 def setup_module_classes(*args: Any, **kwargs: Any) -> Any: ...
 
 # Imported classes
@@ -2,12 +2,15 @@
 Image format utilities for pysnt.
 
 This module provides functions for loading various image formats for use with SNT.
-Supports both bioformats2raw and OME-NGFF layouts.
+Supports both bioformats2raw and OME-NGFF layouts. It also provides lazy, chunked
+access to ImgPlus/RandomAccessibleInterval data as dask-backed xarray objects.
 """
 
 import logging
 from pathlib import Path
-from typing import Union, Optional, Tuple
+from typing import Any, Dict, List, Union, Optional, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +19,28 @@ LAYOUT_BIOFORMATS2RAW = "bioformats2raw"
 LAYOUT_OME_NGFF = "ome-ngff"
 LAYOUT_UNKNOWN = "unknown"
 
+# ImageJ axis labels mapped to the dimension names used by pyimagej
+AXIS_DIMS = {'X': 'col', 'Y': 'row', 'Z': 'pln', 'Channel': 'ch', 'Time': 't'}
+
+# Axis labels assumed for RandomAccessibleIntervals without axis metadata
+_DEFAULT_AXIS_LABELS = ('X', 'Y', 'Z', 'Channel', 'Time')
+
+# ImgLib2 pixel types mapped to NumPy dtypes
+_IMGLIB2_DTYPES = {
+    'BitType': np.bool_,
+    'ByteType': np.int8,
+    'UnsignedByteType': np.uint8,
+    'ShortType': np.int16,
+    'UnsignedShortType': np.uint16,
+    'IntType': np.int32,
+    'UnsignedIntType': np.uint32,
+    'ARGBType': np.uint32,
+    'LongType': np.int64,
+    'UnsignedLongType': np.uint64,
+    'FloatType': np.float32,
+    'DoubleType': np.float64,
+}
+
 
 def detect_zarr_layout(path: Union[str, Path]) -> str:
     """
@@ -309,7 +334,7 @@ def get_available_levels(path: Union[str, Path], series: int = 0) -> list:
     return levels
 
 
-def imgplus_from_zarr(path: Union[str, Path], level: int = 0, series: int = 0):
+def imgplus_from_zarr(path: Union[str, Path], level: int = 0, series: int = 0, cache_cells: Optional[int] = None):
     """
     Load an OME-ZARR image as a calibrated ImgPlus from local or remote sources.
     Supports both bioformats2raw and OME-NGFF layouts.
@@ -325,6 +350,9 @@ def imgplus_from_zarr(path: Union[str, Path], level: int = 0, series: int = 0):
         Resolution level to load (0 = full resolution). Default: 0
     series : int, optional
         Series index for multi-series datasets (bioformats2raw). Default: 0
+    cache_cells : int, optional
+        Maximum number of chunks kept in memory once loaded. Default: None
+        (chunks are kept until the JVM needs the memory)
 
     Returns
     -------
@@ -390,13 +418,13 @@ def imgplus_from_zarr(path: Union[str, Path], level: int = 0, series: int = 0):
 
     # Try N5 readers first for all URLs (local, S3, HTTP) - much faster when available
     try:
-        return _imgplus_from_zarr_n5(path_str, level, series)
+        return _imgplus_from_zarr_n5(path_str, level, series, cache_cells)
     except Exception as n5_error:
         logger.warning(f"N5 readers failed: {n5_error}, falling back to Python zarr")
         raise
 
 
-def _imgplus_from_zarr_n5(path_str: str, level: int = 0, series: int = 0):
+def _imgplus_from_zarr_n5(path_str: str, level: int = 0, series: int = 0, cache_cells: Optional[int] = None):
     """
     Load OME-ZARR using N5Factory - unified approach for all protocols (local, S3, HTTP).
     Supports both bioformats2raw and OME-NGFF layouts, including non-standard dataset paths.
@@ -481,8 +509,11 @@ def _imgplus_from_zarr_n5(path_str: str, level: int = 0, series: int = 0):
         logger.debug(f"  Dimensions: {list(attrs.getDimensions())}")
         logger.debug(f"  Data type: {attrs.getDataType()}")
 
-        # Read the image data
-        img_data = N5Utils.open(n5_reader, dataset_path)
+        # Read the image data (lazily, one chunk at a time)
+        if cache_cells:
+            img_data = N5Utils.openWithBoundedSoftRefCache(n5_reader, dataset_path, int(cache_cells))
+        else:
+            img_data = N5Utils.open(n5_reader, dataset_path)
         logger.debug(f"Image data loaded: {type(img_data)}")
 
         # Wrap as Img and create ImgPlus
@@ -634,4 +665,203 @@ def _inspect_zarr_n5(path_str: str, max_depth: int = 3) -> dict:
 
     Deprecated: Use inspect_zarr() which now uses Python zarr directly.
     """
-    return inspect_zarr(path_str, max_depth)
\ No newline at end of file
+    return inspect_zarr(path_str, max_depth)
+
+def lazy_xarray(img: Any, chunks: Union[None, str, tuple, Dict[str, int]] = None, name: Optional[str] = None):
+    """
+    Wrap an ImgPlus or RandomAccessibleInterval as a lazy, dask-backed xarray.DataArray.
+
+    No pixel data is copied when the array is created: each chunk is read from the
+    JVM on demand, as an ImgLib2 interval view, when it is computed. Slicing,
+    projections and downsampling therefore only pay for the chunks they touch,
+    which makes images larger than memory usable from Python.
+
+    Parameters
+    ----------
+    img : ImgPlus or RandomAccessibleInterval
+        The image to wrap
+    chunks : None, 'auto', tuple or dict, optional
+        Chunking, in NumPy (reversed ImgLib2) axis order. None (default) uses one
+        full XY plane per chunk; a dict maps dimension names ('row', 'col', 'pln',
+        'ch', 't') to chunk sizes, with unspecified dimensions chunked per plane;
+        other values are passed to dask.array.from_array()
+    name : str, optional
+        Name of the DataArray (default: the ImgPlus name, if any)
+
+    Returns
+    -------
+    xarray.DataArray
+        Lazy array with dims in NumPy order (e.g., ('t', 'ch', 'pln', 'row', 'col'))
+        and coordinates calibrated from the ImgPlus axes. Attributes include 'units'
+        and 'source_type'
+
+    Raises
+    ------
+    ImportError
+        If dask is not installed
+
+    Examples
+    --------
+    >>> from pysnt.io import imgplus_from_zarr, lazy_xarray
+    >>> img = imgplus_from_zarr('s3://bucket/lightsheet.ome.zarr')
+    >>> stack = lazy_xarray(img)
+    >>> mip = stack.isel(t=0, ch=0).max('pln').compute()  # reads one channel of one frame
+    >>> overview = stack.isel(t=0, ch=0, pln=100).coarsen(row=8, col=8, boundary='trim').mean()
+    """
+    try:
+        import dask.array as da
+    except ImportError as e:
+        raise ImportError("dask is required for lazy image conversion. "
+                          "Install it with: pip install 'dask[array]'") from e
+    import xarray as xr
+
+    reader = _IntervalReader(img)
+    axes = _image_axes(img)[::-1]  # NumPy order
+    dims = _unique_dims([AXIS_DIMS.get(axis['label'], axis['label'].lower()) for axis in axes])
+
+    data = da.from_array(reader, chunks=_resolve_chunks(chunks, dims, reader.shape), asarray=True,
+                         fancy=False, meta=np.empty((0,) * reader.ndim, dtype=reader.dtype), name=False)
+    coords = {dim: axis['origin'] + axis['scale'] * np.arange(size)
+              for dim, axis, size in zip(dims, axes, reader.shape)}
+    if name is None:
+        name = _image_name(img)
+
+    logger.debug(f"Created lazy xarray {dict(zip(dims, reader.shape))} ({reader.dtype}), "
+                 f"{data.npartitions} chunk(s)")
+    return xr.DataArray(data, dims=dims, coords=coords, name=name,
+                        attrs={'units': {dim: axis['unit'] for dim, axis in zip(dims, axes)},
+                               'source_type': 'ImgPlus' if hasattr(img, 'axis') else 'RandomAccessibleInterval'})
+
+
+class _IntervalReader:
+    """
+    Array-like view of a RandomAccessibleInterval that reads pixels on demand.
+
+    Indexing (basic slices and integers, in NumPy axis order) copies exactly the
+    requested ImgLib2 interval out of the JVM. Instances are used as the backing
+    store of dask arrays.
+    """
+
+    def __init__(self, rai: Any):
+        self.rai = rai
+        n = int(rai.numDimensions())
+        self._mins = [int(rai.min(d)) for d in range(n)]
+        self.shape = tuple(int(rai.dimension(d)) for d in reversed(range(n)))
+        self.ndim = n
+        self.dtype = np.dtype(_image_dtype(rai) or self._probe_dtype())
+
+    def __getitem__(self, key) -> np.ndarray:
+        if not isinstance(key, tuple):
+            key = (key,)
+        key = key + (slice(None),) * (self.ndim - len(key))
+
+        starts, stops, steps, squeeze = [], [], [], []
+        for axis, (k, size) in enumerate(zip(key, self.shape)):
+            if isinstance(k, slice):
+                start, stop, step = k.indices(size)
+                if step < 1:
+                    raise IndexError("Only positive slice steps are supported")
+            else:
+                start = int(k) + size if int(k) < 0 else int(k)
+                if not 0 <= start < size:
+                    raise IndexError(f"Index {k} out of bounds for axis {axis} with size {size}")
+                stop, step = start + 1, 1
+                squeeze.append(axis)
+            starts.append(start)
+            stops.append(max(stop, start))
+            steps.append(step)
+
+        if any(stop <= start for start, stop in zip(starts, stops)):
+            block = np.empty([stop - start for start, stop in zip(starts, stops)], dtype=self.dtype)
+        else:
+            block = self._read_interval(starts, stops)
+        block = block[tuple(slice(None, None, step) for step in steps)]
+        return block.squeeze(axis=tuple(squeeze)) if squeeze else block
+
+    def _read_interval(self, starts: List[int], stops: List[int]) -> np.ndarray:
+        """Copy a block (NumPy-order bounds, stop exclusive) out of the JVM."""
+        import scyjava
+        from ..core import ij
+        from ..profiling import _record_transfer
+
+        Views = scyjava.jimport('net.imglib2.view.Views')
+        # ImgLib2 axis order is the reverse of NumPy's
+        mins = [m + s for m, s in zip(self._mins, reversed(starts))]
+        maxs = [m + s - 1 for m, s in zip(self._mins, reversed(stops))]
+        view = Views.zeroMin(Views.interval(self.rai, mins, maxs))
+        block = np.asarray(ij().py.from_java(view))
+        _record_transfer('net.imglib2.RandomAccessibleInterval', block.nbytes)
+        expected = tuple(stop - start for start, stop in zip(starts, stops))
+        return block.reshape(expected).astype(self.dtype, copy=False)
+
+    def _probe_dtype(self) -> np.dtype:
+        """Determine the pixel dtype by reading a single pixel."""
+        return self._read_interval([0] * self.ndim, [1] * self.ndim).dtype
+
+
+def _image_dtype(rai: Any) -> Optional[type]:
+    """Map the ImgLib2 pixel type of an image to a NumPy dtype (None if unknown)."""
+    pixel_type = None
+    try:
+        pixel_type = rai.getType()
+    except Exception:
+        try:
+            import scyjava
+            pixel_type = scyjava.jimport('net.imglib2.util.Util').getTypeFromInterval(rai)
+        except Exception as e:
+            logger.debug(f"Could not determine pixel type: {e}")
+    if pixel_type is None:
+        return None
+    return _IMGLIB2_DTYPES.get(str(pixel_type.getClass().getSimpleName()))
+
+
+def _image_axes(img: Any) -> List[Dict[str, Any]]:
+    """Axis label, origin, scale and unit for each ImgLib2 dimension of an image."""
+    n = int(img.numDimensions())
+    axes = []
+    for d in range(n):
+        axis = {'label': _DEFAULT_AXIS_LABELS[d] if d < len(_DEFAULT_AXIS_LABELS) else f'dim{d}',
+                'origin': 0.0, 'scale': 1.0, 'unit': None}
+        if hasattr(img, 'axis'):
+            try:
+                calibrated = img.axis(d)
+                axis['label'] = str(calibrated.type().getLabel())
+                axis['origin'] = float(calibrated.calibratedValue(0))
+                axis['scale'] = float(calibrated.averageScale(0, 1))
+                unit = calibrated.unit()
+                axis['unit'] = str(unit) if unit else None
+            except Exception as e:
+                logger.debug(f"Could not read calibration of axis {d}: {e}")
+        axes.append(axis)
+    return axes
+
+
+def _image_name(img: Any) -> Optional[str]:
+    try:
+        name = img.getName()
+        return str(name) if name else None
+    except Exception:
+        return None
+
+
+def _unique_dims(dims: List[str]) -> List[str]:
+    """Disambiguate repeated dimension names (e.g., two unknown axes)."""
+    seen: Dict[str, int] = {}
+    unique = []
+    for dim in dims:
+        seen[dim] = seen.get(dim, 0) + 1
+        unique.append(dim if seen[dim] == 1 else f"{dim}{seen[dim] - 1}")
+    return unique
+
+
+def _resolve_chunks(chunks: Any, dims: List[str], shape: Tuple[int, ...]) -> Any:
+    """Translate the chunks argument of lazy_xarray() into dask chunks."""
+    if chunks is not None and not isinstance(chunks, dict):
+        return chunks
+    plane_dims = ('row', 'col')
+    resolved = [size if dim in plane_dims else 1 for dim, size in zip(dims, shape)]
+    for dim, size in (chunks or {}).items():
+        if dim not in dims:
+            raise ValueError(f"Unknown dimension '{dim}'. Image dimensions: {dims}")
+        resolved[dims.index(dim)] = min(int(size), shape[dims.index(dim)])
+    return tuple(resolved)
@@ -10,6 +10,9 @@ logger: Any
 LAYOUT_BIOFORMATS2RAW: Any
 LAYOUT_OME_NGFF: Any
 LAYOUT_UNKNOWN: Any
+AXIS_DIMS: Any
+_DEFAULT_AXIS_LABELS: Any
+_IMGLIB2_DTYPES: Any
 def detect_zarr_layout(path: Union[str, Path]) -> str: ...
 
 def get_dataset_path(layout: str, level: int, series: int) -> str: ...
@@ -20,10 +23,32 @@ def get_zattrs_path(layout: str, zarr_path: str, series: int) -> str: ...
 
 def get_available_levels(path: Union[str, Path], series: int) -> list: ...
 
-def imgplus_from_zarr(path: Union[str, Path], level: int, series: int) -> Any: ...
+def imgplus_from_zarr(path: Union[str, Path], level: int, series: int, cache_cells: Optional[int]) -> Any: ...
 
-def _imgplus_from_zarr_n5(path_str: str, level: int, series: int) -> Any: ...
+def _imgplus_from_zarr_n5(path_str: str, level: int, series: int, cache_cells: Optional[int]) -> Any: ...
 
 def inspect_zarr(path: Union[str, Path], max_depth: int) -> dict: ...
 
 def _inspect_zarr_n5(path_str: str, max_depth: int) -> dict: ...
+
+def lazy_xarray(img: Any, chunks: Union[None, str, tuple, Dict[str, int]], name: Optional[str]) -> Any: ...
+
+class _IntervalReader:
+    rai: Any
+    shape: Tuple[int, ...]
+    ndim: int
+    dtype: Any
+    def __init__(self, rai: Any) -> None: ...
+    def __getitem__(self, key: Any) -> Any: ...
+    def _read_interval(self, starts: List[int], stops: List[int]) -> Any: ...
+    def _probe_dtype(self) -> Any: ...
+
+def _image_dtype(rai: Any) -> Optional[type]: ...
+
+def _image_axes(img: Any) -> List[Dict[str, Any]]: ...
+
+def _image_name(img: Any) -> Optional[str]: ...
+
+def _unique_dims(dims: List[str]) -> List[str]: ...
+
+def _resolve_chunks(chunks: Any, dims: List[str], shape: Tuple[int, ...]) -> Any: ...
@@ -0,0 +1,307 @@
+"""
+Workload-based JVM tuning profiles for PySNT.
+
+A JVM profile bundles garbage collector and memory flags suited to a type of
+workload, and sizes the heap from the memory actually available to the process
+(the cgroup limit in containers, physical memory otherwise) when no explicit heap
+size is given. Profiles are selected with initialize(jvm_profile=...) or the
+'java.jvm_profile' option:
+
+- 'batch-throughput': parallel collector and a large young generation, for
+  unattended batch jobs where total run time matters more than pause times
+- 'interactive-low-latency': ZGC (G1 with a pause-time goal on older JVMs), for
+  GUI and notebook sessions
+- 'memory-constrained': serial collector, compressed pointers and small
+  metaspace/code cache, for small containers and CI runners
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MB = 1024 ** 2
+_GB = 1024 ** 3
+
+# cgroup memory limit files (v2, then v1); 'max' or very large values mean "no limit"
+_CGROUP_LIMIT_FILES = ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes')
+_CGROUP_UNLIMITED = 1 << 60
+
+# Never size the heap below this
+_MIN_AUTO_HEAP = 256 * _MB
+
+# Largest heap for which the JVM can use compressed object pointers
+_COMPRESSED_OOPS_LIMIT = 31 * _GB
+
+# Flags selecting a garbage collector: user-supplied ones replace the profile's collector
+_GC_SELECTION_FLAGS = ('-XX:+UseSerialGC', '-XX:+UseParallelGC', '-XX:+UseG1GC', '-XX:+UseZGC',
+                       '-XX:+UseShenandoahGC', '-XX:+UseEpsilonGC')
+
+JVM_PROFILES: Dict[str, Dict[str, Any]] = {
+    'batch-throughput': {
+        'description': 'Parallel GC with a large young generation, for throughput in batch jobs',
+        'heap_fraction': 0.75,
+        'pin_heap': True,
+        'gc': ['-XX:+UseParallelGC'],
+        'options': ['-XX:NewRatio=1', '-XX:+UseNUMA'],
+    },
+    'interactive-low-latency': {
+        'description': 'ZGC (or G1 with a 50 ms pause goal), for interactive sessions',
+        'heap_fraction': 0.5,
+        'pin_heap': False,
+        'gc': ['-XX:+UseZGC'],
+        'gc_fallback': ['-XX:+UseG1GC', '-XX:MaxGCPauseMillis=50'],
+        'options': ['-XX:+UseStringDeduplication'],
+    },
+    'memory-constrained': {
+        'description': 'Serial GC, compressed pointers and small metaspace, for small containers',
+        'heap_fraction': 0.5,
+        'pin_heap': False,
+        'max_heap_bytes': _COMPRESSED_OOPS_LIMIT,
+        'gc': ['-XX:+UseSerialGC'],
+        'options': ['-XX:+UseCompressedOops', '-XX:+UseCompressedClassPointers', '-XX:MaxMetaspaceSize=256m',
+                    '-XX:ReservedCodeCacheSize=64m', '-Xss512k'],
+    },
+}
+
+
+def list_jvm_profiles() -> Dict[str, str]:
+    """
+    List available JVM profiles.
+
+    Returns
+    -------
+    dict
+        Profile name -> description
+
+    Examples
+    --------
+    >>> for name, description in pysnt.list_jvm_profiles().items():
+    ...     print(f"{name}: {description}")
+    """
+    return {name: profile['description'] for name, profile in JVM_PROFILES.items()}
+
+
+def available_memory() -> Tuple[Optional[int], Optional[str]]:
+    """
+    Determine the memory available to this process.
+
+    A cgroup memory limit (containers, cgroup v2 or v1) takes precedence over
+    physical memory.
+
+    Returns
+    -------
+    tuple
+        (bytes, source) with source 'cgroup' or 'physical', or (None, None) if the
+        amount cannot be determined
+    """
+    limit = _cgroup_memory_limit()
+    if limit is not None:
+        return limit, 'cgroup'
+    physical = _physical_memory()
+    if physical is not None:
+        return physical, 'physical'
+    return None, None
+
+
+def auto_heap_size(fraction: float, memory: Optional[int] = None, limit: Optional[int] = None) -> Optional[str]:
+    """
+    Compute a heap size as a fraction of available memory.
+
+    Parameters
+    ----------
+    fraction : float
+        Fraction of available memory to use (0-1]
+    memory : int, optional
+        Available memory in bytes (default: available_memory())
+    limit : int, optional
+        Maximum heap size in bytes
+
+    Returns
+    -------
+    str or None
+        Heap size in JVM notation (e.g., '6g', '1536m'), or None if the available
+        memory cannot be determined
+    """
+    if memory is None:
+        memory, _ = available_memory()
+        if memory is None:
+            return None
+    size = max(int(memory * fraction), _MIN_AUTO_HEAP)
+    if limit is not None:
+        size = min(size, limit)
+    return format_memory_size(size)
+
+
+def format_memory_size(nbytes: int) -> str:
+    """Format a byte count in JVM notation ('g' when a whole number of GB, 'm' otherwise)."""
+    mb = nbytes // _MB
+    return f"{mb // 1024}g" if mb % 1024 == 0 else f"{mb}m"
+
+
+def resolve_jvm_settings(profile: Optional[str] = None, max_heap: Optional[str] = None,
+                         min_heap: Optional[str] = None, jvm_args: Optional[List[str]] = None,
+                         java_version: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Resolve a JVM profile and explicit settings into JVM options.
+
+    Explicit settings take precedence over the profile: a given max_heap/min_heap
+    (or -Xmx/-Xms in jvm_args) is used as is, and a collector selected in jvm_args (e.g., '-XX:+UseG1GC') replaces
+    the profile's collector flags. Without a profile, only the explicit settings are
+    applied (the JVM chooses its own defaults otherwise).
+
+    Parameters
+    ----------
+    profile : str, optional
+        Profile name (see list_jvm_profiles())
+    max_heap, min_heap : str, optional
+        Heap sizes in JVM notation (e.g., '8g')
+    jvm_args : list of str, optional
+        Additional JVM arguments
+    java_version : int, optional
+        Major Java version, used to choose between profile alternatives
+        (default: detected if the profile needs it)
+
+    Returns
+    -------
+    dict
+        'profile', 'max_heap', 'min_heap', 'heap_source' ('argument', 'cgroup',
+        'physical' or 'jvm-default'), 'available_memory' (bytes or None),
+        'memory_source', 'gc' (collector flags) and 'options' (all JVM options to
+        add, in order)
+
+    Raises
+    ------
+    ValueError
+        If the profile is unknown
+    """
+    if profile is not None and profile not in JVM_PROFILES:
+        raise ValueError(f"Unknown JVM profile '{profile}'. Must be one of {sorted(JVM_PROFILES)}")
+    spec = JVM_PROFILES.get(profile, {})
+    jvm_args = list(jvm_args or [])
+
+    # Heap sizes passed as JVM arguments count as explicit settings
+    for arg in list(jvm_args):
+        if arg.startswith('-Xmx') and max_heap is None:
+            max_heap = arg[4:]
+            jvm_args.remove(arg)
+        elif arg.startswith('-Xms') and min_heap is None:
+            min_heap = arg[4:]
+            jvm_args.remove(arg)
+
+    memory, memory_source = available_memory()
+    heap_source = 'argument' if max_heap is not None else 'jvm-default'
+    if max_heap is None and spec and memory is not None:
+        max_heap = auto_heap_size(spec['heap_fraction'], memory, spec.get('max_heap_bytes'))
+        heap_source = memory_source
+    if min_heap is None and spec.get('pin_heap') and heap_source != 'jvm-default':
+        min_heap = max_heap
+
+    user_gc = [arg for arg in jvm_args if arg in _GC_SELECTION_FLAGS]
+    if user_gc:
+        gc = []
+    elif 'gc_fallback' in spec:
+        if java_version is None:
+            java_version = _detect_java_version()
+        gc = list(spec['gc'] if java_version is not None and java_version >= 21 else spec['gc_fallback'])
+        if gc == ['-XX:+UseZGC'] and java_version in (21, 22):
+            gc.append('-XX:+ZGenerational')  # default (and flag deprecated) from Java 23
+    else:
+        gc = list(spec.get('gc', []))
+
+    options = []
+    if max_heap is not None:
+        options.append(f"-Xmx{max_heap}")
+    if min_heap is not None:
+        options.append(f"-Xms{min_heap}")
+    options.extend(gc)
+    options.extend(opt for opt in spec.get('options', []) if opt not in jvm_args)
+    options.extend(jvm_args)
+
+    return {
+        'profile': profile,
+        'max_heap': max_heap,
+        'min_heap': min_heap,
+        'heap_source': heap_source,
+        'available_memory': memory,
+        'memory_source': memory_source,
+        'gc': user_gc or gc,
+        'options': options,
+    }
+
+
+def format_jvm_settings(settings: Dict[str, Any]) -> List[str]:
+    """
+    Describe resolved JVM settings, one line per item (for startup reports).
+
+    Parameters
+    ----------
+    settings : dict
+        Settings returned by resolve_jvm_settings()
+
+    Returns
+    -------
+    list of str
+        Report lines
+    """
+    lines = [f"JVM profile: {settings['profile'] or 'none'}"]
+    if settings['max_heap'] is not None:
+        heap = f"Max heap: {settings['max_heap']} ({settings['heap_source']}"
+        if settings['heap_source'] in ('cgroup', 'physical') and settings['available_memory']:
+            heap += f", {settings['available_memory'] / _GB:.1f} GB available"
+        lines.append(heap + ")")
+    else:
+        lines.append("Max heap: JVM default")
+    if settings['min_heap'] is not None:
+        lines.append(f"Initial heap: {settings['min_heap']}")
+    lines.append(f"Garbage collector: {' '.join(settings['gc']) if settings['gc'] else 'JVM default'}")
+    tuning = [opt for opt in settings['options']
+              if not opt.startswith(('-Xmx', '-Xms')) and opt not in settings['gc']]
+    if tuning:
+        lines.append(f"JVM options: {' '.join(tuning)}")
+    return lines
+
+
+def _cgroup_memory_limit() -> Optional[int]:
+    """Return the cgroup memory limit in bytes, or None if there is none."""
+    for path in _CGROUP_LIMIT_FILES:
+        try:
+            value = Path(path).read_text().strip()
+        except OSError:
+            continue
+        if value == 'max':
+            return None
+        try:
+            limit = int(value)
+        except ValueError:
+            continue
+        if 0 < limit < _CGROUP_UNLIMITED:
+            physical = _physical_memory()
+            return min(limit, physical) if physical else limit
+        return None
+    return None
+
+
+def _physical_memory() -> Optional[int]:
+    """Return the total physical memory in bytes, or None if unknown."""
+    try:
+        return int(os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES'))
+    except (AttributeError, ValueError, OSError):
+        pass
+    try:
+        import psutil
+        return int(psutil.virtual_memory().total)
+    except Exception:
+        return None
+
+
+def _detect_java_version() -> Optional[int]:
+    """Return the major version of the Java installation that will be used, if known."""
+    try:
+        from .java_utils import check_java_installation
+        return check_java_installation().get('version')
+    except Exception as e:
+        logger.debug(f"Could not detect Java version: {e}")
+        return None
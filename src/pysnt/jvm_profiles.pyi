@@ -0,0 +1,34 @@
+"""
+Type stubs for jvm_profiles.py
+
+Auto-generated stub file.
+"""
+
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple
+
+logger: Any
+_MB: Any
+_GB: Any
+_CGROUP_LIMIT_FILES: Any
+_CGROUP_UNLIMITED: Any
+_MIN_AUTO_HEAP: Any
+_COMPRESSED_OOPS_LIMIT: Any
+_GC_SELECTION_FLAGS: Any
+JVM_PROFILES: Any
+def list_jvm_profiles() -> Dict[str, str]: ...
+
+def available_memory() -> Tuple[Optional[int], Optional[str]]: ...
+
+def auto_heap_size(fraction: float, memory: Optional[int], limit: Optional[int]) -> Optional[str]: ...
+
+def format_memory_size(nbytes: int) -> str: ...
+
+def resolve_jvm_settings(profile: Optional[str], max_heap: Optional[str], min_heap: Optional[str], jvm_args: Optional[List[str]], java_version: Optional[int]) -> Dict[str, Any]: ...
+
+def format_jvm_settings(settings: Dict[str, Any]) -> List[str]: ...
+
+def _cgroup_memory_limit() -> Optional[int]: ...
+
+def _physical_memory() -> Optional[int]: ...
+
+def _detect_java_version() -> Optional[int]: ...
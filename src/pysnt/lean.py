@@ -0,0 +1,324 @@
+"""
+Lean initialization: start the JVM with only SNT and its dependencies.
+
+initialize(mode='lean') does not boot ImageJ2. Instead of putting every jar of
+the Fiji installation on the classpath, it resolves the jars SNT depends on
+(transitively, from the Maven POMs embedded in the jars) and starts the JVM
+with those only. No SciJava context is created unless services are requested
+with the 'java.lean.services' option. This is suited to headless jobs that only
+use classes such as Tree, TreeStatistics or SNTTable, and gives a faster
+startup and a smaller heap footprint.
+
+Classes outside the resolved classpath cannot be loaded in lean mode: requesting
+one raises LeanClasspathError naming the class, rather than a bare
+ClassNotFoundException. Extra artifacts can be added with the
+'java.lean.extra_artifacts' option.
+"""
+
+import logging
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Artifact whose dependencies make up the lean classpath
+ROOT_ARTIFACT = 'SNT'
+
+# Classpath directories of a Fiji installation
+_CLASSPATH_DIRS = ('jars', 'plugins')
+
+# Dependency scopes not needed at runtime
+_SKIPPED_SCOPES = ('test', 'system')
+
+# Java errors raised when a class is not on the classpath
+_MISSING_CLASS_ERRORS = ('ClassNotFoundException', 'NoClassDefFoundError')
+
+# Lean session state (set by start_lean_jvm())
+_classpath: Optional[Dict[str, Any]] = None
+_context = None
+
+
+class LeanClasspathError(RuntimeError):
+    """
+    Exception raised when a class outside the lean classpath is requested.
+    """
+    pass
+
+
+def resolve_lean_classpath(fiji_path: str, extra_artifacts: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Resolve the jars of a Fiji installation needed by SNT.
+
+    Starting from the SNT jar, runtime dependencies declared in the POM embedded
+    in each jar are followed transitively (test-scoped and optional dependencies
+    are skipped) and matched to jars by artifact ID.
+
+    Parameters
+    ----------
+    fiji_path : str
+        Path to the Fiji installation
+    extra_artifacts : iterable of str, optional
+        Additional artifact IDs to include, with their dependencies
+        (e.g., 'imagej-ops')
+
+    Returns
+    -------
+    dict
+        'jars' (sorted list of jar paths), 'artifacts' (sorted artifact IDs on the
+        classpath), 'missing' (dependencies with no jar in the installation) and
+        'total_jars' (number of jars in the installation)
+
+    Raises
+    ------
+    FileNotFoundError
+        If the installation has no SNT jar
+    """
+    index = _index_jars(Path(fiji_path))
+    if ROOT_ARTIFACT not in index:
+        raise FileNotFoundError(f"No {ROOT_ARTIFACT} jar found in {fiji_path}. Is SNT installed (Fiji update site)?")
+
+    resolved = set()
+    missing = set()
+    queue = deque([ROOT_ARTIFACT, *(extra_artifacts or [])])
+    while queue:
+        artifact = queue.popleft()
+        if artifact in resolved or artifact in missing:
+            continue
+        if artifact not in index:
+            missing.add(artifact)
+            continue
+        resolved.add(artifact)
+        for jar in index[artifact]:
+            queue.extend(dep for dep in _pom_dependencies(jar, artifact) if dep not in resolved)
+
+    if missing:
+        logger.debug(f"Lean classpath: no jar for {len(missing)} dependencies: {sorted(missing)}")
+    return {
+        'jars': sorted(str(jar) for artifact in resolved for jar in index[artifact]),
+        'artifacts': sorted(resolved),
+        'missing': sorted(missing),
+        'total_jars': sum(len(jars) for jars in index.values()),
+    }
+
+
+def start_lean_jvm(fiji_path: str, services: Optional[Iterable[str]] = None,
+                   extra_artifacts: Optional[Iterable[str]] = None, headless: bool = True) -> Dict[str, Any]:
+    """
+    Start the JVM with the lean classpath of a Fiji installation.
+
+    Parameters
+    ----------
+    fiji_path : str
+        Path to the Fiji installation
+    services : iterable of str, optional
+        SciJava service classes to start in a minimal context (e.g.,
+        'org.scijava.log.LogService'). No context is created if empty
+    extra_artifacts : iterable of str, optional
+        Additional artifact IDs to put on the classpath
+    headless : bool, default True
+        Start the JVM in headless mode
+
+    Returns
+    -------
+    dict
+        The resolved classpath (see resolve_lean_classpath())
+
+    Raises
+    ------
+    RuntimeError
+        If the JVM is already running
+    """
+    global _classpath, _context
+    import scyjava
+
+    if scyjava.jvm_started():
+        raise RuntimeError("Lean mode requires starting the JVM: it is already running")
+
+    classpath = resolve_lean_classpath(fiji_path, extra_artifacts)
+    logger.info(f"Lean classpath: {len(classpath['jars'])} of {classpath['total_jars']} jars "
+                f"({len(classpath['artifacts'])} artifacts)")
+    for jar in classpath['jars']:
+        scyjava.config.add_classpath(jar)
+    if headless:
+        scyjava.config.enable_headless_mode()
+    scyjava.start_jvm()
+    _classpath = classpath
+
+    services = list(services or [])
+    if services:
+        _context = _create_context(services)
+        logger.info(f"Started SciJava context with {len(services)} services")
+    return classpath
+
+
+def get_lean_classpath() -> Optional[Dict[str, Any]]:
+    """
+    Get the classpath used by a lean session.
+
+    Returns
+    -------
+    dict or None
+        The resolved classpath (see resolve_lean_classpath()), or None if SNT
+        was not initialized in lean mode
+
+    Examples
+    --------
+    >>> pysnt.initialize(mode='lean')
+    >>> len(pysnt.lean.get_lean_classpath()['jars'])
+    """
+    return _classpath
+
+
+def get_context() -> Any:
+    """
+    Get the SciJava context of a lean session.
+
+    Returns
+    -------
+    org.scijava.Context or None
+        The context holding the services in 'java.lean.services', or None if no
+        services were requested
+    """
+    return _context
+
+
+def is_lean() -> bool:
+    """Return True if SNT was initialized in lean mode."""
+    return _classpath is not None
+
+
+def jimport(class_name: str) -> Any:
+    """
+    Import a Java class, with a clear error if it is outside the lean classpath.
+
+    Parameters
+    ----------
+    class_name : str
+        Fully qualified class name
+
+    Returns
+    -------
+    Java class
+
+    Raises
+    ------
+    LeanClasspathError
+        If running in lean mode and the class cannot be loaded
+    """
+    import scyjava
+
+    try:
+        return scyjava.jimport(class_name)
+    except Exception as e:
+        error = missing_class_error(class_name, e)
+        if error is not None:
+            raise error from e
+        raise
+
+
+def missing_class_error(class_name: str, error: Exception) -> Optional[LeanClasspathError]:
+    """
+    Translate a class loading failure in lean mode into a LeanClasspathError.
+
+    Parameters
+    ----------
+    class_name : str
+        Class that was requested
+    error : Exception
+        Error raised while loading or using the class
+
+    Returns
+    -------
+    LeanClasspathError or None
+        The error to raise, or None if not in lean mode or the error is not
+        caused by a class missing from the classpath
+    """
+    if _classpath is None:
+        return None
+    message = f"{type(error).__name__}: {error}"
+    if isinstance(error, ImportError) or (isinstance(error, TypeError) and 'not found' in message) or any(
+            name in message for name in _MISSING_CLASS_ERRORS):
+        return LeanClasspathError(
+            f"'{class_name}' is not available in lean mode: it (or a class it uses) is outside the lean "
+            f"classpath ({message}). Add the artifact providing it with "
+            f"pysnt.set_option('java.lean.extra_artifacts', [...]) before initialize(), "
+            f"or initialize without mode='lean'")
+    return None
+
+
+def dispose_lean_context() -> None:
+    """Dispose of the lean session's SciJava context (if any) and reset lean state."""
+    global _classpath, _context
+    if _context is not None:
+        try:
+            _context.dispose()
+        except Exception as e:
+            logger.warning(f"Error disposing SciJava context: {e}")
+    _context = None
+    _classpath = None
+
+
+def _index_jars(root: Path) -> Dict[str, List[Path]]:
+    """Map artifact IDs to the jars of a Fiji installation (several with classifiers, e.g., natives)."""
+    index: Dict[str, List[Path]] = {}
+    for name in _CLASSPATH_DIRS:
+        if (root / name).is_dir():
+            for jar in (root / name).rglob('*.jar'):
+                index.setdefault(_artifact_id(jar.name), []).append(jar)
+    return index
+
+
+def _artifact_id(filename: str) -> str:
+    """Extract the artifact ID from a jar file name ('imagej-common-2.0.4.jar' -> 'imagej-common')."""
+    parts = filename[:-len('.jar')].split('-')
+    for i, part in enumerate(parts[1:], 1):
+        if re.match(r'\d', part):
+            return '-'.join(parts[:i])
+    return '-'.join(parts)
+
+
+def _pom_dependencies(jar: Path, artifact: str) -> List[str]:
+    """Return the artifact IDs of the runtime dependencies declared in the POM embedded in a jar."""
+    try:
+        with zipfile.ZipFile(jar) as archive:
+            poms = [name for name in archive.namelist()
+                    if name.startswith('META-INF/maven/') and name.endswith(f"/{artifact}/pom.xml")]
+            if not poms:
+                return []
+            root = ET.fromstring(archive.read(poms[0]))
+    except (OSError, zipfile.BadZipFile, ET.ParseError) as e:
+        logger.debug(f"Could not read POM of {jar}: {e}")
+        return []
+
+    dependencies = []
+    for element in root:
+        if _local_name(element.tag) != 'dependencies':
+            continue  # Skips dependencyManagement and profiles
+        for dependency in element:
+            fields = {_local_name(child.tag): (child.text or '').strip() for child in dependency}
+            if fields.get('scope') in _SKIPPED_SCOPES or fields.get('optional') == 'true':
+                continue
+            artifact_id = fields.get('artifactId', '')
+            if artifact_id and '${' not in artifact_id:
+                dependencies.append(artifact_id)
+    return dependencies
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from a tag."""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _create_context(services: List[str]) -> Any:
+    """Create a SciJava context with only the given services."""
+    import scyjava
+
+    ArrayList = scyjava.jimport('java.util.ArrayList')
+    classes = ArrayList()
+    for name in services:
+        classes.add(jimport(name).class_)
+    return scyjava.jimport('org.scijava.Context')(classes)
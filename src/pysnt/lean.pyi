@@ -0,0 +1,44 @@
+"""
+Type stubs for lean.py
+
+Auto-generated stub file.
+"""
+
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple, Iterable
+from pathlib import Path
+
+logger: Any
+ROOT_ARTIFACT: Any
+_CLASSPATH_DIRS: Any
+_SKIPPED_SCOPES: Any
+_MISSING_CLASS_ERRORS: Any
+_classpath: Any
+_context: Any
+class LeanClasspathError:
+    pass
+
+def resolve_lean_classpath(fiji_path: str, extra_artifacts: Optional[Iterable[str]]) -> Dict[str, Any]: ...
+
+def start_lean_jvm(fiji_path: str, services: Optional[Iterable[str]], extra_artifacts: Optional[Iterable[str]], headless: bool) -> Dict[str, Any]: ...
+
+def get_lean_classpath() -> Optional[Dict[str, Any]]: ...
+
+def get_context() -> Any: ...
+
+def is_lean() -> bool: ...
+
+def jimport(class_name: str) -> Any: ...
+
+def missing_class_error(class_name: str, error: Exception) -> Optional[LeanClasspathError]: ...
+
+def dispose_lean_context() -> None: ...
+
+def _index_jars(root: Path) -> Dict[str, List[Path]]: ...
+
+def _artifact_id(filename: str) -> str: ...
+
+def _pom_dependencies(jar: Path, artifact: str) -> List[str]: ...
+
+def _local_name(tag: str) -> str: ...
+
+def _create_context(services: List[str]) -> Any: ...
@@ -0,0 +1,402 @@
+"""
+Java boundary-crossing profiler for PySNT.
+
+Every call from Python into the JVM goes through JPype and carries a fixed cost that
+dominates converters and extractors working on many small objects. This module
+provides an opt-in profiler that counts and times these crossings:
+
+- Java method invocations and field reads, per Java class and member
+- Object conversions (scyjava.to_python()/to_java(), ij().py.from_java()/to_java())
+- Bulk array transfers between Python and Java, with bytes moved
+
+Instrumentation is only installed inside a profile_java() block and is fully removed
+on exit.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Java classes instrumented by default: those pysnt converters and extractors touch most
+DEFAULT_PROFILED_CLASSES = (
+    'sc.fiji.snt.Tree',
+    'sc.fiji.snt.Path',
+    'sc.fiji.snt.util.PointInImage',
+    'sc.fiji.snt.util.SWCPoint',
+    'sc.fiji.snt.analysis.SNTTable',
+    'sc.fiji.snt.analysis.SNTChart',
+    'sc.fiji.snt.analysis.TreeStatistics',
+    'sc.fiji.snt.analysis.graph.DirectedWeightedGraph',
+    'sc.fiji.snt.analysis.graph.SWCWeightedEdge',
+    'sc.fiji.snt.annotation.BrainAnnotation',
+)
+
+# Record kinds
+KIND_METHOD = 'method'
+KIND_FIELD = 'field'
+KIND_CONVERSION = 'conversion'
+KIND_TRANSFER = 'transfer'
+
+# JPype descriptor types for Java methods and fields
+_JAVA_METHOD_TYPES = ('_JMethod',)
+_JAVA_FIELD_TYPES = ('_JField',)
+
+# Conversion functions wrapped while profiling (scyjava module / ij().py instance)
+_SCYJAVA_CONVERSIONS = ('to_python', 'to_java')
+_IMAGEJ_CONVERSIONS = ('from_java', 'to_java')
+
+_REPORT_COLUMNS = ('kind', 'java_class', 'member', 'calls', 'total_ms', 'mean_us', 'bytes')
+
+# The profile currently collecting records (at most one at a time)
+_active_profile: Optional['JavaProfile'] = None
+
+
+class JavaProfile:
+    """
+    Collected Java boundary-crossing statistics.
+
+    Instances are returned by the profile_java() context manager. Each record is
+    keyed by (kind, Java class, member) and holds the number of crossings, the
+    time spent in them and, for array transfers, the bytes moved.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records: Dict[Tuple[str, str, str], List[float]] = {}
+        self.wall_time = 0.0
+
+    def record(self, kind: str, java_class: str, member: str, seconds: float = 0.0, nbytes: int = 0) -> None:
+        """Add one crossing to the profile."""
+        key = (kind, java_class, member)
+        with self._lock:
+            entry = self._records.get(key)
+            if entry is None:
+                self._records[key] = [1, seconds, nbytes]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                entry[2] += nbytes
+
+    @property
+    def total_calls(self) -> int:
+        """Total number of Java method invocations and field reads."""
+        return sum(int(v[0]) for k, v in self._records.items() if k[0] in (KIND_METHOD, KIND_FIELD))
+
+    @property
+    def total_conversions(self) -> int:
+        """Total number of object conversions."""
+        return sum(int(v[0]) for k, v in self._records.items() if k[0] == KIND_CONVERSION)
+
+    @property
+    def bytes_transferred(self) -> int:
+        """Total number of bytes moved by array transfers."""
+        return sum(int(v[2]) for k, v in self._records.items() if k[0] == KIND_TRANSFER)
+
+    @property
+    def java_time(self) -> float:
+        """Total time (s) spent crossing into Java (conversions include nested calls)."""
+        return sum(v[1] for k, v in self._records.items() if k[0] != KIND_CONVERSION)
+
+    def rows(self, sort_by: str = 'total_ms') -> List[Dict[str, Any]]:
+        """
+        Return the profile as a list of dicts, one per (kind, class, member).
+
+        Parameters
+        ----------
+        sort_by : str, default 'total_ms'
+            Column to sort by (descending): 'calls', 'total_ms', 'mean_us' or 'bytes'
+
+        Returns
+        -------
+        list of dict
+            Rows with keys 'kind', 'java_class', 'member', 'calls', 'total_ms',
+            'mean_us' and 'bytes'
+        """
+        if sort_by not in _REPORT_COLUMNS[3:]:
+            raise ValueError(f"Invalid sort column '{sort_by}'. Must be one of {_REPORT_COLUMNS[3:]}")
+        with self._lock:
+            items = list(self._records.items())
+        rows = [{
+            'kind': kind,
+            'java_class': java_class,
+            'member': member,
+            'calls': int(calls),
+            'total_ms': seconds * 1e3,
+            'mean_us': seconds * 1e6 / calls,
+            'bytes': int(nbytes),
+        } for (kind, java_class, member), (calls, seconds, nbytes) in items]
+        return sorted(rows, key=lambda row: row[sort_by], reverse=True)
+
+    def to_dataframe(self, sort_by: str = 'total_ms'):
+        """
+        Return the profile as a pandas DataFrame.
+
+        Raises
+        ------
+        ImportError
+            If pandas is not installed
+        """
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError("pandas is required for to_dataframe(). Use rows() or report() instead.") from e
+        return pd.DataFrame(self.rows(sort_by), columns=list(_REPORT_COLUMNS))
+
+    def report(self, sort_by: str = 'total_ms', limit: Optional[int] = 20) -> str:
+        """
+        Format the profile as a text table.
+
+        Parameters
+        ----------
+        sort_by : str, default 'total_ms'
+            Column to sort by (descending)
+        limit : int, optional
+            Maximum number of rows (default: 20; None for all)
+
+        Returns
+        -------
+        str
+            Summary line followed by one line per (kind, class, member)
+        """
+        rows = self.rows(sort_by)
+        shown = rows if limit is None else rows[:limit]
+        lines = [f"Java profile: {self.total_calls:,} call(s), {self.total_conversions:,} conversion(s), "
+                 f"{self.bytes_transferred:,} byte(s) transferred; {self.java_time * 1e3:.1f} ms in Java "
+                 f"of {self.wall_time * 1e3:.1f} ms wall time",
+                 f"{'kind':<11}{'class':<28}{'member':<28}{'calls':>10}{'total ms':>11}{'mean us':>10}{'bytes':>13}"]
+        for row in shown:
+            lines.append(f"{row['kind']:<11}{row['java_class'][-27:]:<28}{row['member'][-27:]:<28}"
+                         f"{row['calls']:>10,}{row['total_ms']:>11.2f}{row['mean_us']:>10.1f}{row['bytes']:>13,}")
+        if len(shown) < len(rows):
+            lines.append(f"... {len(rows) - len(shown)} more row(s)")
+        return '\n'.join(lines)
+
+    def __str__(self) -> str:
+        return self.report()
+
+    def __repr__(self) -> str:
+        return (f"JavaProfile(calls={self.total_calls}, conversions={self.total_conversions}, "
+                f"bytes_transferred={self.bytes_transferred})")
+
+
+@contextmanager
+def profile_java(classes: Optional[Iterable[Union[str, Any]]] = None, conversions: bool = True):
+    """
+    Count and time Java boundary crossings made inside a ``with`` block.
+
+    Public methods and fields of the profiled Java classes are wrapped for the
+    duration of the block, as are scyjava's and PyImageJ's conversion functions.
+    Bulk array transfers performed by pysnt (e.g., image pixels, chart bytes) are
+    recorded with the number of bytes moved. Profiling adds overhead to every
+    instrumented call, so absolute timings are inflated; use it to compare code
+    paths and find chatty ones.
+
+    Parameters
+    ----------
+    classes : iterable of str or Java classes, optional
+        Java classes to instrument, as fully qualified names or classes returned by
+        scyjava.jimport() (default: DEFAULT_PROFILED_CLASSES). Methods are counted
+        on the class that declares them, so include base classes as needed
+    conversions : bool, default True
+        Also count object conversions
+
+    Yields
+    ------
+    JavaProfile
+        The profile being collected (complete once the block exits)
+
+    Raises
+    ------
+    RuntimeError
+        If a profile is already active
+
+    Examples
+    --------
+    >>> with pysnt.profile_java() as prof:
+    ...     graph = pysnt.to_python(tree.getGraph())
+    >>> print(prof.report(limit=5))
+    >>> prof.to_dataframe().groupby('java_class')['calls'].sum()
+    """
+    global _active_profile
+    if _active_profile is not None:
+        raise RuntimeError("A Java profile is already active")
+
+    profile = JavaProfile()
+    patches: List[Tuple[Any, str, Any, bool]] = []
+    _active_profile = profile
+    start = time.perf_counter()
+    try:
+        for cls in _resolve_classes(DEFAULT_PROFILED_CLASSES if classes is None else classes):
+            patches.extend(_instrument_class(cls, profile))
+        if conversions:
+            patches.extend(_instrument_conversions(profile))
+        logger.debug(f"Java profiling started ({len(patches)} member(s) instrumented)")
+        yield profile
+    finally:
+        profile.wall_time = time.perf_counter() - start
+        _active_profile = None
+        _restore(patches)
+        logger.debug(f"Java profiling finished: {profile!r}")
+
+
+def _record_transfer(java_class: str, nbytes: int, direction: str = 'java->python', seconds: float = 0.0) -> None:
+    """
+    Record a bulk array transfer in the active profile (no-op when not profiling).
+
+    Parameters
+    ----------
+    java_class : str
+        Label of the Java source/target (e.g., 'ij.process.ImageProcessor')
+    nbytes : int
+        Bytes moved
+    direction : str
+        'java->python' or 'python->java'
+    seconds : float
+        Time spent in the transfer, if measured
+    """
+    profile = _active_profile
+    if profile is not None:
+        profile.record(KIND_TRANSFER, java_class, direction, seconds, int(nbytes))
+
+
+class _ProfiledMethod:
+    """Descriptor wrapping a JPype method to record each invocation."""
+
+    def __init__(self, method: Any, java_class: str, name: str, profile: JavaProfile):
+        self.method = method
+        self.java_class = java_class
+        self.name = name
+        self.profile = profile
+
+    def __get__(self, obj, objtype=None):
+        bound = self.method.__get__(obj, objtype)
+        profile, java_class, name = self.profile, self.java_class, self.name
+
+        def invoke(*args):
+            t0 = time.perf_counter()
+            try:
+                return bound(*args)
+            finally:
+                profile.record(KIND_METHOD, java_class, name, time.perf_counter() - t0)
+
+        return invoke
+
+
+class _ProfiledField:
+    """Descriptor wrapping a JPype field to record each read."""
+
+    def __init__(self, field: Any, java_class: str, name: str, profile: JavaProfile):
+        self.field = field
+        self.java_class = java_class
+        self.name = name
+        self.profile = profile
+
+    def __get__(self, obj, objtype=None):
+        t0 = time.perf_counter()
+        try:
+            return self.field.__get__(obj, objtype)
+        finally:
+            self.profile.record(KIND_FIELD, self.java_class, self.name, time.perf_counter() - t0)
+
+    def __set__(self, obj, value):
+        self.field.__set__(obj, value)
+
+
+def _resolve_classes(classes: Iterable[Union[str, Any]]) -> List[Any]:
+    """Import Java classes given by name; skip those that cannot be loaded."""
+    resolved = []
+    for cls in classes:
+        if not isinstance(cls, str):
+            resolved.append(cls)
+            continue
+        try:
+            import scyjava
+            resolved.append(scyjava.jimport(cls))
+        except Exception as e:
+            logger.debug(f"Not profiling {cls}: {e}")
+    return resolved
+
+
+def _java_class_name(cls: Any) -> str:
+    try:
+        return str(cls.class_.getName())
+    except Exception:
+        return getattr(cls, '__name__', str(cls))
+
+
+def _instrument_class(cls: Any, profile: JavaProfile) -> List[Tuple[Any, str, Any, bool]]:
+    """Wrap the public Java methods and fields declared by a class."""
+    java_class = _java_class_name(cls)
+    patches = []
+    for name, member in list(vars(cls).items()):
+        if name.startswith('_'):
+            continue
+        member_type = type(member).__name__
+        if member_type in _JAVA_METHOD_TYPES:
+            wrapper = _ProfiledMethod(member, java_class, name, profile)
+        elif member_type in _JAVA_FIELD_TYPES:
+            wrapper = _ProfiledField(member, java_class, name, profile)
+        else:
+            continue
+        # Java classes reject attribute assignment; JPype's own customizers use type.__setattr__
+        type.__setattr__(cls, name, wrapper)
+        patches.append((cls, name, member, True))
+    return patches
+
+
+def _instrument_conversions(profile: JavaProfile) -> List[Tuple[Any, str, Any, bool]]:
+    """Wrap scyjava's and (if running) PyImageJ's conversion functions."""
+    targets = []
+    try:
+        import scyjava
+        targets.extend((scyjava, 'scyjava', name) for name in _SCYJAVA_CONVERSIONS)
+    except ImportError:
+        pass
+    try:
+        from . import core
+        if core.is_initialized() and core.get_mode() != 'lean':
+            targets.extend((core.ij().py, 'imagej', name) for name in _IMAGEJ_CONVERSIONS)
+    except Exception as e:
+        logger.debug(f"Not profiling PyImageJ conversions: {e}")
+
+    patches = []
+    for owner, label, name in targets:
+        original = getattr(owner, name, None)
+        if original is None:
+            continue
+        # Attributes set directly on the owner are restored by value; methods found on
+        # its class are restored by deleting the instance override
+        owned = name in getattr(owner, '__dict__', {})
+        setattr(owner, name, _profiled_conversion(original, label, name, profile))
+        patches.append((owner, name, original, owned))
+    return patches
+
+
+def _profiled_conversion(func: Any, label: str, name: str, profile: JavaProfile):
+    def convert(obj, *args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return func(obj, *args, **kwargs)
+        finally:
+            profile.record(KIND_CONVERSION, type(obj).__name__, f"{label}.{name}", time.perf_counter() - t0)
+
+    convert.__wrapped__ = func
+    return convert
+
+
+def _restore(patches: List[Tuple[Any, str, Any, bool]]) -> None:
+    """Undo instrumentation, most recent first."""
+    for owner, name, original, owned in reversed(patches):
+        try:
+            if isinstance(owner, type):
+                type.__setattr__(owner, name, original)
+            elif owned:
+                setattr(owner, name, original)
+            else:
+                delattr(owner, name)
+        except Exception as e:
+            logger.warning(f"Could not remove profiling hook {name} from {owner}: {e}")
@@ -0,0 +1,61 @@
+"""
+Type stubs for profiling.py
+
+Auto-generated stub file.
+"""
+
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple, Iterable
+
+logger: Any
+DEFAULT_PROFILED_CLASSES: Any
+KIND_METHOD: Any
+KIND_FIELD: Any
+KIND_CONVERSION: Any
+KIND_TRANSFER: Any
+_JAVA_METHOD_TYPES: Any
+_JAVA_FIELD_TYPES: Any
+_SCYJAVA_CONVERSIONS: Any
+_IMAGEJ_CONVERSIONS: Any
+_REPORT_COLUMNS: Any
+_active_profile: Any
+
+class JavaProfile:
+    wall_time: float
+    def __init__(self) -> None: ...
+    def record(self, kind: str, java_class: str, member: str, seconds: float, nbytes: int) -> None: ...
+    @property
+    def total_calls(self) -> int: ...
+    @property
+    def total_conversions(self) -> int: ...
+    @property
+    def bytes_transferred(self) -> int: ...
+    @property
+    def java_time(self) -> float: ...
+    def rows(self, sort_by: str) -> List[Dict[str, Any]]: ...
+    def to_dataframe(self, sort_by: str) -> Any: ...
+    def report(self, sort_by: str, limit: Optional[int]) -> str: ...
+
+def profile_java(classes: Optional[Iterable[Union[str, Any]]], conversions: bool) -> Any: ...
+
+def _record_transfer(java_class: str, nbytes: int, direction: str, seconds: float) -> None: ...
+
+class _ProfiledMethod:
+    def __init__(self, method: Any, java_class: str, name: str, profile: JavaProfile) -> None: ...
+    def __get__(self, obj: Any, objtype: Any) -> Any: ...
+
+class _ProfiledField:
+    def __init__(self, field: Any, java_class: str, name: str, profile: JavaProfile) -> None: ...
+    def __get__(self, obj: Any, objtype: Any) -> Any: ...
+    def __set__(self, obj: Any, value: Any) -> None: ...
+
+def _resolve_classes(classes: Iterable[Union[str, Any]]) -> List[Any]: ...
+
+def _java_class_name(cls: Any) -> str: ...
+
+def _instrument_class(cls: Any, profile: JavaProfile) -> List[Tuple[Any, str, Any, bool]]: ...
+
+def _instrument_conversions(profile: JavaProfile) -> List[Tuple[Any, str, Any, bool]]: ...
+
+def _profiled_conversion(func: Any, label: str, name: str, profile: JavaProfile) -> Any: ...
+
+def _restore(patches: List[Tuple[Any, str, Any, bool]]) -> None: ...
@@ -2768,6 +2768,25 @@ __getattr__ = _module_funcs["create_getattr"]("pysnt.tracing", submodules=["arti
 __dir__ = _module_funcs["create_dir"]()
 
 
+# Import batch tracing utilities
+from .batch import (
+    trace_batch,
+    run_searches,
+    path_nodes,
+    default_cost,
+)
+from .cost_volumes import cost_volume, probability_cost, precomputed_cost
+from .filling import fill_batch
+from .fitting import PathFits, fit_paths
+from .node_arrays import explored_nodes, fill_voxels, fill_mask
+from .prefetch import ChunkPrefetcher
+from .search_policy import (
+    SearchImagePolicy,
+    choose_search_image,
+    estimate_search_memory,
+    default_memory_budget,
+)
+
 # Static __all__ with curated classes always available
 # This ensures IDEs know these symbols are available for import
 __all__ = [
@@ -2777,6 +2796,31 @@ __all__ = [
     "list_classes",
     "get_curated_classes",
     "get_extended_classes",
+    # Batch tracing
+    "trace_batch",
+    "run_searches",
+    "path_nodes",
+    "default_cost",
+    # Precomputed cost volumes
+    "cost_volume",
+    "probability_cost",
+    "precomputed_cost",
+    # Batch filling
+    "fill_batch",
+    # Batch path fitting
+    "fit_paths",
+    "PathFits",
+    # Bulk node export
+    "explored_nodes",
+    "fill_voxels",
+    "fill_mask",
+    # Chunk prefetching
+    "ChunkPrefetcher",
+    # Search image selection
+    "SearchImagePolicy",
+    "choose_search_image",
+    "estimate_search_memory",
+    "default_memory_budget",
     # Constants
     "CURATED_CLASSES",
     "EXTENDED_CLASSES",
@@ -353,11 +353,29 @@ class TracerThread:
 # Imported functions
 def artist(*args: Any, **kwargs: Any) -> Any: ...
 def cost(*args: Any, **kwargs: Any) -> Any: ...
+def choose_search_image(shape: Any, expected_fraction: Optional[float] = None, memory_budget: Optional[int] = None, bidirectional: bool = False, dense_threshold: Optional[float] = None) -> Dict[str, Any]: ...
+def cost_volume(costs: Any, min_cost: Optional[float] = None, copy: bool = False) -> Tuple[Any, Any]: ...
+def default_cost(image: Any) -> Any: ...
+def default_memory_budget(concurrency: int = 1) -> Optional[int]: ...
+def estimate_search_memory(shape: Any, explored_fraction: float, search_image: str, bidirectional: bool = False) -> int: ...
+def explored_nodes(search: Any) -> Dict[str, Any]: ...
+def fill_batch(image: Any, seeds: Any, threshold: float, cost: Any = None, calibration: Any = None, output: str = 'labels', search_image: str = 'auto', max_workers: Optional[int] = None, return_report: bool = False) -> Any: ...
+def fill_mask(fill: Any, threshold: Optional[float] = None) -> Dict[str, Any]: ...
+def fit_paths(image: Any, paths: Any, scope: str = 'both', cross_section_radius: Optional[float] = None, max_workers: Optional[int] = None, progress: Optional[Callable[[int, int], None]] = None) -> Any: ...
+def fill_voxels(fill: Any, threshold: Optional[float] = None) -> Dict[str, Any]: ...
 def heuristic(*args: Any, **kwargs: Any) -> Any: ...
 def image(*args: Any, **kwargs: Any) -> Any: ...
+def path_nodes(path: Any) -> Any: ...
+def precomputed_cost(min_cost: float) -> Any: ...
+def probability_cost(probabilities: Any, epsilon: float = 1e-6) -> Any: ...
+def run_searches(searches: Any, max_workers: Optional[int] = None) -> List[Any]: ...
 def setup_module_classes(*args: Any, **kwargs: Any) -> Any: ...
+def trace_batch(image: Any, starts: Any, goals: Any, cost: Any = None, heuristic: Any = None, calibration: Any = None, bidirectional: bool = False, search_image: str = 'auto', output: str = 'path', max_workers: Optional[int] = None, timeout: int = 0, expected_fraction: Optional[float] = None, memory_budget: Optional[int] = None, prefetch: Any = False, return_report: bool = False) -> Any: ...
 
 # Imported classes
 class Any: ...
+class ChunkPrefetcher: ...
 class Dict: ...
-class List: ...
\ No newline at end of file
+class List: ...
+class PathFits: ...
+class SearchImagePolicy: ...
\ No newline at end of file
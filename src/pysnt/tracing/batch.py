@@ -0,0 +1,333 @@
+"""
+Batch point-to-point tracing.
+
+trace_batch() traces many (start, goal) pairs on one image: a search is built
+for each pair with a shared cost function and heuristic, and all searches run
+concurrently on a Java thread pool, so no Python thread (nor the GIL) is
+involved while they run. The searched image (typically the secondary, filtered
+image) is shared by all searches and never copied.
+
+With search_image='auto' (default), the search image backend is chosen from the
+volume size and a memory budget (see pysnt.tracing.search_policy), and searches
+are submitted in waves so that the batch can switch from sparse to dense storage
+once completed searches turn out to explore a large part of the volume.
+
+On lazily loaded (e.g., OME-Zarr/N5) images, prefetch=True loads the image
+chunks ahead of each running search on background threads (see
+pysnt.tracing.prefetch).
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .search_policy import SEARCH_IMAGE_TYPES, SearchImagePolicy
+
+logger = logging.getLogger(__name__)
+
+# Result formats of trace_batch()
+OUTPUT_FORMATS = ('path', 'nodes')
+
+# Searches submitted per worker thread in each wave of an adaptive ('auto') batch
+_WAVE_SIZE = 4
+
+
+def trace_batch(image: Any, starts: Any, goals: Any, cost: Any = None, heuristic: Any = None,
+                calibration: Any = None, bidirectional: bool = False, search_image: str = 'auto',
+                output: str = 'path', max_workers: Optional[int] = None, timeout: int = 0,
+                expected_fraction: Optional[float] = None, memory_budget: Optional[int] = None,
+                prefetch: Any = False,
+                return_report: bool = False) -> Union[List[Any], Tuple[List[Any], Dict[str, Any]]]:
+    """
+    Trace paths between many (start, goal) pairs concurrently.
+
+    Parameters
+    ----------
+    image : ImagePlus or RandomAccessibleInterval
+        Image to search, typically the secondary (e.g., Tubeness-filtered)
+        image. Shared by all searches
+    starts, goals : array-like
+        (N, 3) or (N, 2) voxel coordinates (x, y[, z]) of the start and goal of
+        each search
+    cost : Cost, optional
+        Shared cost function (see pysnt.tracing.cost). Default: Reciprocal scaled
+        to the image's intensity range
+    heuristic : Heuristic, optional
+        Shared heuristic (see pysnt.tracing.heuristic). Default: Euclidean
+    calibration : Calibration, optional
+        Spatial calibration (default: the ImagePlus' calibration, or pixel units)
+    bidirectional : bool, default False
+        Use BiSearch (bidirectional A*) instead of TracerThread
+    search_image : str, default 'auto'
+        Search image backend: 'map' (sparse, low memory), 'array' (dense,
+        fastest on small images) or 'auto' (chosen
+        from the volume size and memory budget, switching to 'array' once
+        searches explore more than the 'tracing.dense_threshold' fraction of
+        the volume)
+    output : str, default 'path'
+        'path' for SNT Path objects, 'nodes' for (M, 3) NumPy arrays of node
+        coordinates (calibrated units)
+    max_workers : int, optional
+        Number of Java threads (default: pysnt.get_option('tracing.batch_workers'))
+    timeout : int, default 0
+        Per-search timeout in seconds (0 for none)
+    expected_fraction : float, optional
+        Expected fraction of the volume explored by each search, used by 'auto'
+        to pick the initial backend (default: sparse)
+    memory_budget : int, optional
+        Bytes available to each search's state, used by 'auto' (default: a
+        share of the free JVM heap, see default_memory_budget())
+    prefetch : bool or ChunkPrefetcher, default False
+        Load image chunks ahead of each search's frontier while it runs (for
+        lazily loaded images). True creates a ChunkPrefetcher for the batch; an
+        existing one is used as is and left open
+    return_report : bool, default False
+        Also return the search image report (see SearchImagePolicy.report()),
+        including the estimated peak search-state memory, and the prefetching
+        statistics ('prefetch', see ChunkPrefetcher.stats()) if enabled
+
+    Returns
+    -------
+    list or tuple
+        One result per pair, in input order: a Path or node array, or None if
+        no path was found or the search failed (failures are logged). With
+        return_report=True, a (results, report) tuple
+
+    Examples
+    --------
+    >>> from pysnt.tracing import cost, heuristic
+    >>> starts = np.array([[10, 12, 3], [40, 8, 5]])
+    >>> goals = np.array([[80, 90, 7], [60, 70, 9]])
+    >>> paths = pysnt.tracing.trace_batch(tubeness_imp, starts, goals,
+    ...                                   cost=cost.Reciprocal(0, 255), output='nodes')
+    """
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"Invalid output '{output}'. Must be one of {OUTPUT_FORMATS}")
+    if search_image != 'auto' and search_image not in SEARCH_IMAGE_TYPES:
+        raise ValueError(f"Invalid search image '{search_image}'. "
+                         f"Must be one of {('auto', *SEARCH_IMAGE_TYPES)}")
+
+    starts, goals = _as_coordinates(starts, goals)
+    if not len(starts):
+        return ([], {}) if return_report else []
+    rai, calibration = _search_inputs(image, calibration)
+    if cost is None:
+        cost = default_cost(rai)
+    if heuristic is None:
+        import scyjava
+        heuristic = scyjava.jimport('sc.fiji.snt.tracing.heuristic.Euclidean')(calibration)
+
+    if max_workers is None:
+        from ..config import get_option
+        max_workers = get_option('tracing.batch_workers')
+    workers = max(1, min(int(max_workers), len(starts)))
+    policy = SearchImagePolicy(_image_shape(rai), expected_fraction, memory_budget, bidirectional,
+                               concurrency=workers, search_image=None if search_image == 'auto' else search_image)
+    wave = workers * _WAVE_SIZE if search_image == 'auto' else len(starts)
+    factories = {}
+    prefetcher = prefetch
+    if prefetch is True:
+        from .prefetch import ChunkPrefetcher
+        prefetcher = ChunkPrefetcher(rai)
+
+    start_time = time.perf_counter()
+    outcomes = []
+    pool = _new_java_pool(workers)
+    try:
+        for first in range(0, len(starts), wave):
+            backend = policy.current
+            if backend not in factories:
+                factories[backend] = _search_factory(rai, calibration, cost, heuristic, bidirectional, backend,
+                                                     timeout)
+            searches = [factories[backend](start, goal)
+                        for start, goal in zip(starts[first:first + wave], goals[first:first + wave])]
+            if prefetcher:
+                for search, start, goal in zip(searches, starts[first:first + wave], goals[first:first + wave]):
+                    prefetcher.watch(search, start, goal, bidirectional)
+            outcomes.extend(_run_on_pool(pool, searches))
+            for search in searches:
+                explored = _explored(search)
+                if explored is not None:
+                    policy.record(explored, backend)
+    finally:
+        pool.shutdownNow()
+        if prefetch is True:
+            prefetcher.close(wait=False)
+    results = []
+    failures = 0
+    for index, (path, error) in enumerate(outcomes):
+        if error is not None:
+            failures += 1
+            logger.warning(f"Search {index} ({tuple(starts[index])} -> {tuple(goals[index])}) failed: {error}")
+        results.append(None if path is None else path_nodes(path) if output == 'nodes' else path)
+    found = sum(result is not None for result in results)
+    report = policy.report()
+    if prefetcher:
+        report['prefetch'] = prefetcher.stats()
+    logger.info(f"Traced {found} of {len(results)} paths in {time.perf_counter() - start_time:.2f}s "
+                f"({failures} failed); search image '{report['search_image']}', estimated peak search state "
+                f"{report['peak_search_bytes'] / 1024 ** 2:.1f} MB")
+    return (results, report) if return_report else results
+
+
+def run_searches(searches: Sequence[Any], max_workers: Optional[int] = None) -> List[Tuple[Any, Optional[Exception]]]:
+    """
+    Run SNT searches concurrently on a Java thread pool.
+
+    Parameters
+    ----------
+    searches : sequence of SearchThread
+        Searches that have not been started (TracerThread, BiSearch, ...)
+    max_workers : int, optional
+        Number of Java threads (default: pysnt.get_option('tracing.batch_workers'))
+
+    Returns
+    -------
+    list of tuple
+        (result, error) pairs in input order: the search's getResult() (None if
+        no path was found) and the exception raised by the search, if any
+    """
+    if max_workers is None:
+        from ..config import get_option
+        max_workers = get_option('tracing.batch_workers')
+    pool = _new_java_pool(max(1, min(int(max_workers), len(searches))))
+    try:
+        return _run_on_pool(pool, searches)
+    finally:
+        pool.shutdownNow()
+
+
+def path_nodes(path: Any) -> np.ndarray:
+    """
+    Return the node coordinates of a Path.
+
+    Parameters
+    ----------
+    path : Path
+        SNT Path
+
+    Returns
+    -------
+    np.ndarray
+        (M, 3) float array of node coordinates (calibrated units)
+    """
+    return np.array([(node.x, node.y, node.z) for node in path.getNodes()], dtype=np.float64).reshape(-1, 3)
+
+
+def default_cost(image: Any) -> Any:
+    """
+    Return SNT's default cost function for an image: Reciprocal over its intensity range.
+
+    Parameters
+    ----------
+    image : RandomAccessibleInterval
+        Image to search
+
+    Returns
+    -------
+    Reciprocal
+        Cost function
+    """
+    import scyjava
+
+    Util = scyjava.jimport('net.imglib2.util.Util')
+    ComputeMinMax = scyjava.jimport('net.imglib2.algorithm.stats.ComputeMinMax')
+    pixel_type = Util.getTypeFromInterval(image)
+    minimum, maximum = pixel_type.createVariable(), pixel_type.createVariable()
+    ComputeMinMax.computeMinMax(image, minimum, maximum)
+    Reciprocal = scyjava.jimport('sc.fiji.snt.tracing.cost.Reciprocal')
+    return Reciprocal(minimum.getRealDouble(), maximum.getRealDouble())
+
+
+def _as_coordinates(starts: Any, goals: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Validate start/goal coordinates as (N, 3) integer arrays (z = 0 for 2D)."""
+    arrays = []
+    for name, coords in (('starts', starts), ('goals', goals)):
+        array = np.asarray(coords)
+        if array.ndim == 1 and array.size in (2, 3):
+            array = array.reshape(1, -1)
+        if array.ndim != 2 or array.shape[1] not in (2, 3):
+            raise ValueError(f"{name} must be an (N, 2) or (N, 3) array of voxel coordinates, "
+                             f"got shape {array.shape}")
+        if array.shape[1] == 2:
+            array = np.column_stack((array, np.zeros(len(array))))
+        arrays.append(np.rint(array).astype(np.int64))
+    if len(arrays[0]) != len(arrays[1]):
+        raise ValueError(f"starts and goals differ in length ({len(arrays[0])} vs {len(arrays[1])})")
+    return arrays[0], arrays[1]
+
+
+def _search_inputs(image: Any, calibration: Any) -> Tuple[Any, Any]:
+    """Return the RandomAccessibleInterval to search and its calibration."""
+    import scyjava
+
+    if hasattr(image, 'getCalibration') and hasattr(image, 'getStack'):  # ImagePlus
+        if calibration is None:
+            calibration = image.getCalibration()
+        image = scyjava.jimport('net.imglib2.img.display.imagej.ImageJFunctions').wrapReal(image)
+    if calibration is None:
+        calibration = scyjava.jimport('ij.measure.Calibration')()
+    return image, calibration
+
+
+def _search_factory(image: Any, calibration: Any, cost: Any, heuristic: Any, bidirectional: bool,
+                    search_image: str, timeout: int):
+    """Return a function building the search between two voxels, sharing image, cost and heuristic."""
+    import scyjava
+
+    search_class = scyjava.jimport('sc.fiji.snt.tracing.' + ('BiSearch' if bidirectional else 'TracerThread'))
+    image_type = _search_image_type(search_image)
+
+    def new_search(start, goal):
+        return search_class(image, calibration, *map(int, start), *map(int, goal), int(timeout), 0,
+                            image_type, cost, heuristic)
+    return new_search
+
+
+def _search_image_type(search_image: str) -> Any:
+    """Return the SNT.SearchImageType constant of a search image backend ('map' or 'array')."""
+    import scyjava
+    return getattr(scyjava.jimport('sc.fiji.snt.SNT$SearchImageType'), search_image.upper())
+
+
+def _run_on_pool(pool: Any, searches: Sequence[Any]) -> List[Tuple[Any, Optional[Exception]]]:
+    """Submit searches to a Java executor and collect (result, error) pairs in input order."""
+    futures = [pool.submit(search) for search in searches]
+    outcomes = []
+    for search, future in zip(searches, futures):
+        try:
+            future.get()
+            outcomes.append((search.getResult(), None))
+        except Exception as e:
+            outcomes.append((None, e))
+    return outcomes
+
+
+def _image_shape(image: Any) -> Tuple[int, ...]:
+    """Return the (x, y[, z]) dimensions of a RandomAccessibleInterval."""
+    return tuple(int(image.dimension(d)) for d in range(min(int(image.numDimensions()), 3)))
+
+
+def _item_paths(item: Any) -> List[Any]:
+    """Return the paths of a Tree, Path or list of Paths."""
+    if hasattr(item, 'getRoot') and hasattr(item, 'list'):  # Tree
+        return list(item.list())
+    if isinstance(item, (list, tuple)) or hasattr(item, 'iterator') and not hasattr(item, 'getNodes'):
+        return list(item)
+    return [item]
+
+
+def _explored(search: Any) -> Optional[int]:
+    """Return the number of voxels a finished search explored, or None if unknown."""
+    try:
+        return int(search.pointsConsideredInSearch())
+    except Exception:
+        return None
+
+
+def _new_java_pool(workers: int) -> Any:
+    """Create a fixed-size Java thread pool."""
+    import scyjava
+    return scyjava.jimport('java.util.concurrent.Executors').newFixedThreadPool(workers)
@@ -0,0 +1,37 @@
+"""
+Type stubs for batch.py
+
+Auto-generated stub file.
+"""
+
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple, Sequence
+import numpy as np
+
+logger: Any
+OUTPUT_FORMATS: Any
+_WAVE_SIZE: Any
+def trace_batch(image: Any, starts: Any, goals: Any, cost: Any, heuristic: Any, calibration: Any, bidirectional: bool, search_image: str, output: str, max_workers: Optional[int], timeout: int, expected_fraction: Optional[float], memory_budget: Optional[int], prefetch: Any, return_report: bool) -> Union[List[Any], Tuple[List[Any], Dict[str, Any]]]: ...
+
+def run_searches(searches: Sequence[Any], max_workers: Optional[int]) -> List[Tuple[Any, Optional[Exception]]]: ...
+
+def path_nodes(path: Any) -> np.ndarray: ...
+
+def default_cost(image: Any) -> Any: ...
+
+def _as_coordinates(starts: Any, goals: Any) -> Tuple[np.ndarray, np.ndarray]: ...
+
+def _search_inputs(image: Any, calibration: Any) -> Tuple[Any, Any]: ...
+
+def _search_factory(image: Any, calibration: Any, cost: Any, heuristic: Any, bidirectional: bool, search_image: str, timeout: int) -> Callable[[Any, Any], Any]: ...
+
+def _search_image_type(search_image: str) -> Any: ...
+
+def _run_on_pool(pool: Any, searches: Sequence[Any]) -> List[Tuple[Any, Optional[Exception]]]: ...
+
+def _image_shape(image: Any) -> Tuple[int, ...]: ...
+
+def _item_paths(item: Any) -> List[Any]: ...
+
+def _explored(search: Any) -> Optional[int]: ...
+
+def _new_java_pool(workers: int) -> Any: ...
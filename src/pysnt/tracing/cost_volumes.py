@@ -0,0 +1,161 @@
+"""
+Precomputed cost volumes for tracing.
+
+SNT searches compute the cost of moving to a voxel by applying a Cost function
+(sc.fiji.snt.tracing.cost) to the voxel's intensity in the searched image. To
+trace with costs computed in NumPy (e.g., from the probability map of a
+machine-learning model), cost_volume() hands the cost array itself to the
+search as the searched image, together with an identity Cost (compiled once
+per session) that returns the voxel value as the cost. Every lookup then
+happens in the JVM, with no Python callback per voxel.
+
+The array is shared with the JVM without copying when possible (through imglyb,
+which pyimagej uses for NumPy arrays), and copied once into a Java float array
+otherwise.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Cost returning the searched image's value: the image holds precomputed costs
+_COST_SCRIPT = """
+import sc.fiji.snt.tracing.cost.Cost
+
+@groovy.transform.CompileStatic
+class PrecomputedCost implements Cost {
+    private final double minimum
+    PrecomputedCost(double minimum) { this.minimum = minimum }
+    double costMovingTo(double valueAtNewPoint) { return valueAtNewPoint }
+    double minStepCost() { return minimum }
+}
+PrecomputedCost
+"""
+
+# Compiled PrecomputedCost class
+_cost_class = None
+_cost_class_lock = threading.Lock()
+
+
+def cost_volume(costs: np.ndarray, min_cost: Optional[float] = None, copy: bool = False) -> Tuple[Any, Any]:
+    """
+    Prepare a NumPy cost volume for SNT searches.
+
+    Parameters
+    ----------
+    costs : np.ndarray
+        (Z, Y, X) or (Y, X) array of positive, finite costs of moving to each voxel
+    min_cost : float, optional
+        Lowest step cost, used by A* heuristics (default: costs.min()). Must not
+        exceed any cost for searches to remain optimal
+    copy : bool, default False
+        Copy the array into the JVM even if it could be shared
+
+    Returns
+    -------
+    tuple
+        (image, cost): the RandomAccessibleInterval to search and the Cost to
+        search it with
+
+    Raises
+    ------
+    ValueError
+        If costs are not positive and finite
+
+    Examples
+    --------
+    >>> costs = pysnt.tracing.probability_cost(probabilities)
+    >>> image, cost = pysnt.tracing.cost_volume(costs)
+    >>> paths = pysnt.tracing.trace_batch(image, starts, goals, cost=cost)
+    """
+    costs = np.asarray(costs)
+    if costs.ndim not in (2, 3):
+        raise ValueError(f"Cost volume must be 2D (Y, X) or 3D (Z, Y, X), got shape {costs.shape}")
+    minimum = float(costs.min()) if costs.size else 0.0
+    if not np.isfinite(costs).all() or minimum <= 0:
+        raise ValueError("Costs must be positive and finite (A* searches require positive step costs)")
+    if min_cost is None:
+        min_cost = minimum
+    elif not 0 < min_cost <= minimum:
+        raise ValueError(f"min_cost must be in (0, {minimum}] (the lowest cost), got {min_cost}")
+    return _to_java(np.ascontiguousarray(costs, dtype=np.float32), copy), precomputed_cost(min_cost)
+
+
+def probability_cost(probabilities: np.ndarray, epsilon: float = 1e-6) -> np.ndarray:
+    """
+    Convert a probability map into costs (negative log-likelihood).
+
+    Parameters
+    ----------
+    probabilities : np.ndarray
+        Per-voxel probabilities (0-1) of belonging to a neurite
+    epsilon : float, default 1e-6
+        Floor for probabilities (and lowest cost), keeping costs finite and positive
+
+    Returns
+    -------
+    np.ndarray
+        float32 costs, -log(p) + epsilon
+    """
+    p = np.clip(np.asarray(probabilities, dtype=np.float32), epsilon, 1.0)
+    return (-np.log(p) + epsilon).astype(np.float32)
+
+
+def precomputed_cost(min_cost: float) -> Any:
+    """
+    Create a Cost returning the searched image's value as the cost.
+
+    Parameters
+    ----------
+    min_cost : float
+        Lowest step cost in the image
+
+    Returns
+    -------
+    Cost
+        Java Cost instance
+    """
+    import jpype
+
+    return jpype.JClass(_get_cost_class())(float(min_cost))
+
+
+def _get_cost_class() -> Any:
+    """Compile the PrecomputedCost class once per session."""
+    global _cost_class
+    with _cost_class_lock:
+        if _cost_class is None:
+            import scyjava
+            try:
+                _cost_class = scyjava.jimport('groovy.lang.GroovyShell')().evaluate(_COST_SCRIPT)
+            except Exception as e:
+                raise RuntimeError(f"Could not compile the precomputed cost function (Groovy is required): {e}")
+        return _cost_class
+
+
+def _to_java(costs: np.ndarray, copy: bool) -> Any:
+    """Share (imglyb) or copy a C-ordered float32 array into an ImgLib2 image with (X, Y[, Z]) axes."""
+    from ..profiling import _record_transfer
+
+    if not copy:
+        try:
+            import imglyb
+            return imglyb.to_imglib(costs)
+        except Exception as e:
+            logger.debug(f"Could not share cost volume with the JVM ({e}): copying it")
+
+    import jpype
+    import scyjava
+
+    start = time.perf_counter()
+    data = jpype.JArray(jpype.JFloat)(costs.ravel())
+    image = scyjava.jimport('net.imglib2.img.array.ArrayImgs').floats(
+        data, jpype.JArray(jpype.JLong)([int(s) for s in reversed(costs.shape)]))
+    _record_transfer('net.imglib2.img.array.ArrayImg', costs.nbytes, direction='python->java',
+                     seconds=time.perf_counter() - start)
+    return image
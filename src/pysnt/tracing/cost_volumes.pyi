@@ -0,0 +1,22 @@
+"""
+Type stubs for cost_volumes.py
+
+Auto-generated stub file.
+"""
+
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple
+import numpy as np
+
+logger: Any
+_COST_SCRIPT: Any
+_cost_class: Any
+_cost_class_lock: Any
+def cost_volume(costs: np.ndarray, min_cost: Optional[float], copy: bool) -> Tuple[Any, Any]: ...
+
+def probability_cost(probabilities: np.ndarray, epsilon: float) -> np.ndarray: ...
+
+def precomputed_cost(min_cost: float) -> Any: ...
+
+def _get_cost_class() -> Any: ...
+
+def _to_java(costs: np.ndarray, copy: bool) -> Any: ...
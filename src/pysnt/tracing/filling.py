@@ -0,0 +1,207 @@
+"""
+Parallel multi-seed filling.
+
+fill_batch() runs one FillerThread per group of seed paths (a path, a tree or a
+list of paths) on worker threads, sharing the searched image and cost function.
+Fillers are created when a worker picks them up, and each fill is reduced to
+its voxel coordinates and merged into the result as soon as it completes, so
+that at most one fill per worker is held in memory at a time. Results are
+either a label volume (each voxel labeled with the group reaching it at the
+lowest distance) or per-group voxel counts and volumes.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .batch import _explored, _image_shape, _item_paths, _search_image_type, _search_inputs, default_cost
+from .node_arrays import fill_voxels
+from .search_policy import SEARCH_IMAGE_TYPES, SearchImagePolicy
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FORMATS = ('labels', 'counts')
+
+# Typical fraction of the volume explored by one fill (the neighborhood of its seed paths), for 'auto'
+_EXPECTED_FILL_FRACTION = 0.05
+
+
+def fill_batch(image: Any, seeds: Sequence[Any], threshold: float, cost: Any = None, calibration: Any = None,
+               output: str = 'labels', search_image: str = 'auto', max_workers: Optional[int] = None,
+               progress: Optional[Callable[[int, int], None]] = None,
+               return_report: bool = False) -> Union[np.ndarray, Dict[str, np.ndarray], Tuple[Any, Dict[str, Any]]]:
+    """
+    Fill from many paths or trees in parallel.
+
+    Parameters
+    ----------
+    image : ImagePlus or RandomAccessibleInterval
+        Image to search (e.g., a Tubeness-filtered image). Shared by all fillers
+    seeds : sequence
+        Seed groups, one filler each: a Path, a Tree (all its paths) or a list of
+        Paths
+    threshold : float
+        Fill distance threshold
+    cost : Cost, optional
+        Shared cost function (default: Reciprocal scaled to the image's intensity range)
+    calibration : Calibration, optional
+        Spatial calibration (default: the ImagePlus' calibration, or pixel units)
+    output : str, default 'labels'
+        'labels' for a (Z, Y, X) uint32 volume labeling each filled voxel with the
+        (1-based) index of the seed group reaching it at the lowest distance (0
+        for unfilled voxels). 'counts' for a dict with per-group 'counts' (voxels)
+        and 'volumes' (calibrated), in which voxels reached by several groups
+        count for each
+    search_image : str, default 'auto'
+        Search image backend: 'map', 'array' or 'auto' (see
+        pysnt.tracing.choose_search_image())
+    max_workers : int, optional
+        Number of fillers running at once (default: pysnt.get_option('tracing.batch_workers'))
+    progress : callable, optional
+        Called as progress(fills_done, fills_total) after each fill is merged
+        (or has failed)
+    return_report : bool, default False
+        Also return a report: 'fills', 'failed', 'filled_voxels', 'peak_fill_voxels'
+        (largest fill held in memory), 'seconds' and 'search_images' (see
+        SearchImagePolicy.report())
+
+    Returns
+    -------
+    np.ndarray, dict or tuple
+        Label volume or counts, or a (result, report) tuple with return_report=True
+
+    Examples
+    --------
+    >>> counts = pysnt.tracing.fill_batch(tubeness_imp, tree.list(), threshold=0.03, output='counts')
+    >>> counts['volumes'].sum()  # cell-wide filled volume
+    """
+    from ..config import get_option
+
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"Invalid output '{output}'. Must be one of {OUTPUT_FORMATS}")
+    if search_image != 'auto' and search_image not in SEARCH_IMAGE_TYPES:
+        raise ValueError(f"Invalid search image '{search_image}'. Must be one of {('auto', *SEARCH_IMAGE_TYPES)}")
+    groups = [_item_paths(group) for group in seeds]
+
+    rai, calibration = _search_inputs(image, calibration)
+    if cost is None:
+        cost = default_cost(rai)
+    shape = _image_shape(rai)
+    workers = max(1, min(int(max_workers or get_option('tracing.batch_workers')), max(len(groups), 1)))
+    policy = SearchImagePolicy(shape, _EXPECTED_FILL_FRACTION, concurrency=workers,
+                               search_image=None if search_image == 'auto' else search_image)
+    factories = {}
+    factory_lock = threading.Lock()
+
+    def run_filler(paths):
+        with factory_lock:
+            backend = policy.current
+            if backend not in factories:
+                factories[backend] = _filler_factory(rai, calibration, cost, threshold, backend)
+            new_filler = factories[backend]
+        filler = new_filler(paths)
+        filler.run()
+        voxels, distances = _fill_voxels(filler, threshold)
+        explored = _explored(filler)
+        with factory_lock:
+            policy.record(len(voxels) if explored is None else explored, backend)
+        return voxels, distances
+
+    zyx = (1,) * (3 - len(shape)) + tuple(reversed(shape))
+    labels = np.zeros(zyx, dtype=np.uint32) if output == 'labels' else None
+    best = np.full(zyx, np.inf, dtype=np.float32) if output == 'labels' else None
+    counts = np.zeros(len(groups), dtype=np.int64)
+    failed = 0
+    done = 0
+    peak = 0
+    start_time = time.perf_counter()
+
+    from ..async_utils import _attach_daemon
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pysnt-fill', initializer=_attach_daemon) as pool:
+        pending = {}
+        queue = iter(enumerate(groups))
+        while True:
+            # At most one queued group per worker: fillers are built on demand and merged as they finish
+            while len(pending) < 2 * workers:
+                item = next(queue, None)
+                if item is None:
+                    break
+                pending[pool.submit(run_filler, item[1])] = item[0]
+            if not pending:
+                break
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index = pending.pop(future)
+                try:
+                    voxels, distances = future.result()
+                except Exception as e:
+                    failed += 1
+                    logger.warning(f"Fill {index} failed: {e}")
+                else:
+                    peak = max(peak, len(voxels))
+                    counts[index] = len(voxels)
+                    if labels is not None and len(voxels):
+                        _merge_labels(labels, best, voxels, distances, index + 1)
+                done += 1
+                if progress is not None:
+                    progress(done, len(groups))
+
+    voxel_volume = _voxel_volume(calibration)
+    report = {
+        'fills': len(groups),
+        'failed': failed,
+        'filled_voxels': int(np.count_nonzero(labels)) if labels is not None else int(counts.sum()),
+        'peak_fill_voxels': peak,
+        'seconds': time.perf_counter() - start_time,
+        'search_images': policy.report(),
+    }
+    logger.info(f"Filled {len(groups) - failed} of {len(groups)} seed groups in {report['seconds']:.2f}s "
+                f"({report['filled_voxels']} voxels)")
+    result = labels if output == 'labels' else {'counts': counts, 'volumes': counts * voxel_volume}
+    return (result, report) if return_report else result
+
+
+def _merge_labels(labels: np.ndarray, best: np.ndarray, voxels: np.ndarray, distances: np.ndarray, label: int) -> None:
+    """Label voxels reached at a lower distance than by previous fills."""
+    z, y, x = voxels[:, 2], voxels[:, 1], voxels[:, 0]
+    closer = distances < best[z, y, x]
+    best[z[closer], y[closer], x[closer]] = distances[closer]
+    labels[z[closer], y[closer], x[closer]] = label
+
+
+def _fill_voxels(filler: Any, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the (N, 3) (x, y, z) voxels and distances of a completed fill within the threshold."""
+    voxels = fill_voxels(filler.getFill(), threshold)
+    return voxels['xyz'].astype(np.int64), voxels['distance'].astype(np.float32)
+
+
+def _voxel_volume(calibration: Any) -> float:
+    try:
+        return float(calibration.pixelWidth * calibration.pixelHeight * calibration.pixelDepth)
+    except Exception:
+        return 1.0
+
+
+def _filler_factory(image: Any, calibration: Any, cost: Any, threshold: float, search_image: str):
+    """Return a function building a FillerThread from seed paths, sharing image and cost."""
+    import scyjava
+
+    FillerThread = scyjava.jimport('sc.fiji.snt.tracing.FillerThread')
+    ArrayList = scyjava.jimport('java.util.ArrayList')
+    image_type = _search_image_type(search_image)
+
+    def new_filler(paths):
+        # (image, calibration, threshold, timeout, report interval, cost, search image type)
+        filler = FillerThread(image, calibration, float(threshold), 0, 0, cost, image_type)
+        sources = ArrayList()
+        for path in paths:
+            sources.add(path)
+        filler.setSourcePaths(sources)
+        filler.setStopAtThreshold(True)
+        filler.setStoreExtraNodes(False)
+        return filler
+    return new_filler
@@ -0,0 +1,21 @@
+"""
+Type stubs for filling.py
+
+Auto-generated stub file.
+"""
+
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple, Sequence
+import numpy as np
+
+logger: Any
+OUTPUT_FORMATS: Any
+_EXPECTED_FILL_FRACTION: Any
+def fill_batch(image: Any, seeds: Sequence[Any], threshold: float, cost: Any, calibration: Any, output: str, search_image: str, max_workers: Optional[int], progress: Optional[Callable[[int, int], None]], return_report: bool) -> Union[np.ndarray, Dict[str, np.ndarray], Tuple[Any, Dict[str, Any]]]: ...
+
+def _merge_labels(labels: np.ndarray, best: np.ndarray, voxels: np.ndarray, distances: np.ndarray, label: int) -> None: ...
+
+def _fill_voxels(filler: Any, threshold: float) -> Tuple[np.ndarray, np.ndarray]: ...
+
+def _voxel_volume(calibration: Any) -> float: ...
+
+def _filler_factory(image: Any, calibration: Any, cost: Any, threshold: float, search_image: str) -> Callable[[List[Any]], Any]: ...
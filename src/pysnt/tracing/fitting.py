@@ -0,0 +1,292 @@
+"""
+Parallel path refinement with PathFitter.
+
+fit_paths() fits every path of one or many trees against a shared image on a
+Java thread pool: PathFitter refines node positions (midpoints) and/or radii
+from cross-sections of the image. Fitters are created as workers become free
+and results are collected as they complete, with a progress callback and
+per-path timing. Fits are returned as NumPy arrays (radii and node offsets) for
+quality control, and paths are left unchanged until the accepted fits are
+applied with PathFits.apply().
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .batch import _item_paths, _new_java_pool, path_nodes
+
+logger = logging.getLogger(__name__)
+
+# Fitting scopes and the matching PathFitter constants
+SCOPES = {
+    'both': 'RADII_AND_MIDPOINTS',
+    'radii': 'RADII',
+    'midpoints': 'MIDPOINTS',
+}
+
+
+class PathFits:
+    """
+    Fitted radii and node offsets of a batch of paths (see fit_paths()).
+
+    Node arrays are concatenated over paths; path_index maps each node to its
+    path, and node_slice() returns the nodes of one path.
+
+    Attributes
+    ----------
+    paths : list
+        Fitted paths, in input order
+    tree_index : np.ndarray
+        (P,) index of the input item (Tree, Path or list) each path came from
+    succeeded : np.ndarray
+        (P,) whether each fit succeeded
+    seconds : np.ndarray
+        (P,) time spent fitting each path
+    path_index : np.ndarray
+        (N,) path of each node
+    radii : np.ndarray
+        (N,) fitted radii (NaN for failed fits)
+    offsets : np.ndarray
+        (N, 3) displacement of each node by the fit, in calibrated units (zero
+        when only radii are fitted; NaN for failed fits)
+    report : dict
+        'paths', 'failed', 'nodes', 'seconds' (wall time) and 'fit_seconds'
+        (summed over paths)
+    """
+
+    def __init__(self, paths: List[Any], tree_index: Sequence[int], fitters: List[Any], fitted: List[Any],
+                 seconds: Sequence[float], wall_seconds: float):
+        self.paths = paths
+        self.tree_index = np.asarray(tree_index, dtype=np.int64)
+        self.fitted = fitted
+        self._fitters = fitters
+        self.seconds = np.asarray(seconds, dtype=np.float64)
+        self.succeeded = np.array([path is not None for path in fitted], dtype=bool)
+
+        radii, offsets, counts = [], [], []
+        for path, result in zip(paths, fitted):
+            nodes = path_nodes(path)
+            counts.append(len(nodes))
+            path_radii, path_offsets = _fit_arrays(nodes, result)
+            radii.append(path_radii)
+            offsets.append(path_offsets)
+        self._bounds = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        self.path_index = np.repeat(np.arange(len(paths)), counts)
+        self.radii = np.concatenate(radii) if radii else np.empty(0)
+        self.offsets = np.concatenate(offsets) if offsets else np.empty((0, 3))
+        self.report = {
+            'paths': len(paths),
+            'failed': int((~self.succeeded).sum()),
+            'nodes': int(self._bounds[-1]),
+            'seconds': wall_seconds,
+            'fit_seconds': float(self.seconds.sum()),
+        }
+
+    def node_slice(self, path: int) -> slice:
+        """Return the slice of the node arrays holding the nodes of a path."""
+        return slice(int(self._bounds[path]), int(self._bounds[path + 1]))
+
+    def apply(self, accept: Optional[Sequence[Any]] = None, replace_nodes: bool = False) -> int:
+        """
+        Apply fits to their paths.
+
+        Parameters
+        ----------
+        accept : sequence of bool or int, optional
+            Paths to update, as a (P,) boolean mask or path indices (default: all
+            successful fits). Failed fits are never applied
+        replace_nodes : bool, default False
+            Replace the nodes of each path with the fitted ones, instead of
+            switching the path to its fitted version
+
+        Returns
+        -------
+        int
+            Number of paths updated
+        """
+        if accept is None:
+            selected = self.succeeded.copy()
+        else:
+            accept = np.asarray(accept)
+            selected = np.zeros(len(self.paths), dtype=bool)
+            if accept.dtype == bool:
+                if accept.shape != selected.shape:
+                    raise ValueError(f"accept mask has {accept.size} entries, expected {len(self.paths)}")
+                selected[:] = accept
+            else:
+                selected[accept.astype(np.int64)] = True
+        applied = 0
+        for index in np.flatnonzero(selected & self.succeeded):
+            fitter = self._fitters[index]
+            fitter.setReplaceNodes(bool(replace_nodes))
+            fitter.applyFit()
+            applied += 1
+        logger.info(f"Applied {applied} of {len(self.paths)} fits")
+        return applied
+
+
+def fit_paths(image: Any, paths: Union[Any, Sequence[Any]], scope: str = 'both',
+              cross_section_radius: Optional[float] = None, max_workers: Optional[int] = None,
+              progress: Optional[Callable[[int, int], None]] = None) -> PathFits:
+    """
+    Fit all paths of one or many trees in parallel.
+
+    Parameters
+    ----------
+    image : ImagePlus or RandomAccessibleInterval
+        Image the paths were traced on (shared by all fitters, not copied)
+    paths : Tree, Path or sequence
+        A Tree (all its paths), a Path, or a sequence of Trees, Paths or lists
+        of Paths
+    scope : str, default 'both'
+        'both' (radii and midpoints), 'radii' or 'midpoints'
+    cross_section_radius : float, optional
+        Radius of the cross-sections fitted around each node (default: SNT's)
+    max_workers : int, optional
+        Number of Java threads (default: pysnt.get_option('tracing.batch_workers'))
+    progress : callable, optional
+        Called as progress(paths_done, paths_total) after each path
+
+    Returns
+    -------
+    PathFits
+        Fitted radii and offsets, per-path timing and success, and apply() to
+        commit accepted fits
+
+    Examples
+    --------
+    >>> fits = pysnt.tracing.fit_paths(imp, trees, progress=lambda done, total: print(done, total))
+    >>> moved = np.linalg.norm(fits.offsets, axis=1)
+    >>> too_far = np.bincount(fits.path_index[moved > 2], minlength=len(fits.paths)) > 0
+    >>> fits.apply(fits.succeeded & ~too_far)  # commit fits moving no node by more than 2 units
+    """
+    from ..config import get_option
+
+    if scope not in SCOPES:
+        raise ValueError(f"Invalid scope '{scope}'. Must be one of {tuple(SCOPES)}")
+    items = paths if isinstance(paths, (list, tuple)) else [paths]
+    flat, tree_index = [], []
+    for index, item in enumerate(items):
+        item_paths = _item_paths(item)
+        flat.extend(item_paths)
+        tree_index.extend([index] * len(item_paths))
+    fitters = [None] * len(flat)
+    fitted = [None] * len(flat)
+    seconds = np.zeros(len(flat))
+    start_time = time.perf_counter()
+    if not flat:
+        return PathFits([], [], [], [], [], 0.0)
+
+    new_fitter = _fitter_factory(_as_imageplus(image), scope, cross_section_radius)
+    workers = max(1, min(int(max_workers or get_option('tracing.batch_workers')), len(flat)))
+    pool = _new_java_pool(workers)
+    service = _completion_service(pool)
+    pending = {}
+    queue = iter(range(len(flat)))
+    done = 0
+    try:
+        while True:
+            # Create fitters as workers become free
+            while len(pending) < 2 * workers:
+                index = next(queue, None)
+                if index is None:
+                    break
+                fitters[index] = new_fitter(flat[index])
+                task, timing = _timed_task(fitters[index])
+                pending[service.submit(task)] = (index, timing)
+            if not pending:
+                break
+            future = service.take()
+            index, timing = pending.pop(future)
+            seconds[index] = timing.get('seconds', 0.0)
+            try:
+                result = future.get()
+                if result is not None and _succeeded(fitters[index]):
+                    fitted[index] = result
+                else:
+                    logger.warning(f"Fit of path {index} ({flat[index]}) failed")
+            except Exception as e:
+                logger.warning(f"Fit of path {index} ({flat[index]}) failed: {e}")
+            done += 1
+            if progress is not None:
+                progress(done, len(flat))
+    finally:
+        pool.shutdownNow()
+
+    fits = PathFits(flat, tree_index, fitters, fitted, seconds, time.perf_counter() - start_time)
+    logger.info(f"Fitted {fits.report['paths'] - fits.report['failed']} of {fits.report['paths']} paths "
+                f"({fits.report['nodes']} nodes) in {fits.report['seconds']:.2f}s using {workers} threads")
+    return fits
+
+
+def _fit_arrays(nodes: np.ndarray, fitted: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the (M,) radii and (M, 3) offsets of a fit of a path with nodes (NaN if missing)."""
+    radii = np.full(len(nodes), np.nan)
+    offsets = np.full((len(nodes), 3), np.nan)
+    if fitted is None:
+        return radii, offsets
+    fitted_nodes = path_nodes(fitted)
+    if len(fitted_nodes) != len(nodes):
+        logger.debug(f"Fitted path has {len(fitted_nodes)} nodes instead of {len(nodes)}: offsets unavailable")
+    else:
+        offsets = fitted_nodes - nodes
+    count = min(len(nodes), len(fitted_nodes))
+    radii[:count] = [float(fitted.getNodeRadius(i)) for i in range(count)]
+    return radii, offsets
+
+
+def _succeeded(fitter: Any) -> bool:
+    try:
+        return bool(fitter.getSucceeded())
+    except Exception:
+        return True
+
+
+def _as_imageplus(image: Any) -> Any:
+    """Return an ImagePlus view of an image (RandomAccessibleIntervals are wrapped, not copied)."""
+    if hasattr(image, 'getCalibration') and hasattr(image, 'getStack'):
+        return image
+    import scyjava
+    return scyjava.jimport('net.imglib2.img.display.imagej.ImageJFunctions').wrap(image, 'pysnt-fit')
+
+
+def _fitter_factory(image: Any, scope: str, cross_section_radius: Optional[float]) -> Callable[[Any], Any]:
+    """Return a function building a PathFitter for a path, sharing the image."""
+    import scyjava
+
+    PathFitter = scyjava.jimport('sc.fiji.snt.PathFitter')
+    scope_value = getattr(PathFitter, SCOPES[scope])
+
+    def new_fitter(path):
+        fitter = PathFitter(image, path)
+        fitter.setScope(scope_value)
+        fitter.setReplaceNodes(False)
+        fitter.setShowAnnotatedView(False)
+        if cross_section_radius is not None:
+            fitter.setCrossSectionRadius(float(cross_section_radius))
+        return fitter
+    return new_fitter
+
+
+def _completion_service(pool: Any) -> Any:
+    """Wrap a Java executor in an ExecutorCompletionService (futures are taken as they complete)."""
+    import scyjava
+    return scyjava.jimport('java.util.concurrent.ExecutorCompletionService')(pool)
+
+
+def _timed_task(fitter: Any) -> Tuple[Any, Dict[str, float]]:
+    """Return a Callable running a fitter and the dict receiving its duration ('seconds')."""
+    import jpype
+
+    timing = {}
+
+    def call():
+        start = time.perf_counter()
+        try:
+            return fitter.call()
+        finally:
+            timing['seconds'] = time.perf_counter() - start
+    return jpype.JProxy('java.util.concurrent.Callable', dict={'call': call}), timing
@@ -0,0 +1,29 @@
+"""
+Type stubs for fitting.py
+
+Auto-generated stub file.
+"""
+
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple, Sequence
+import numpy as np
+
+logger: Any
+SCOPES: Any
+class PathFits:
+    def __init__(self, paths: List[Any], tree_index: Sequence[int], fitters: List[Any], fitted: List[Any], seconds: Sequence[float], wall_seconds: float) -> None: ...
+    def node_slice(self, path: int) -> slice: ...
+    def apply(self, accept: Optional[Sequence[Any]], replace_nodes: bool) -> int: ...
+
+def fit_paths(image: Any, paths: Union[Any, Sequence[Any]], scope: str, cross_section_radius: Optional[float], max_workers: Optional[int], progress: Optional[Callable[[int, int], None]]) -> PathFits: ...
+
+def _fit_arrays(nodes: np.ndarray, fitted: Any) -> Tuple[np.ndarray, np.ndarray]: ...
+
+def _succeeded(fitter: Any) -> bool: ...
+
+def _as_imageplus(image: Any) -> Any: ...
+
+def _fitter_factory(image: Any, scope: str, cross_section_radius: Optional[float]) -> Callable[[Any], Any]: ...
+
+def _completion_service(pool: Any) -> Any: ...
+
+def _timed_task(fitter: Any) -> Tuple[Any, Dict[str, float]]: ...
@@ -0,0 +1,205 @@
+"""
+Bulk export of search and fill nodes to NumPy.
+
+Reading explored nodes one SearchNode (or Fill.Node) at a time costs several
+Python/Java round trips per node. The functions in this module instead pack the
+coordinates and scores of all nodes into primitive Java arrays on the JVM side
+(with a small Groovy closure, compiled once per session), and copy each array
+into NumPy in a single transfer. If Groovy is not available (e.g., in lean mode
+without it on the classpath), nodes are read one by one, with a warning.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Packs (x, y, z) and a score of an iterable of nodes (or of an iterable of
+# iterables, as the per-slice search images of a search) into int[] and double[].
+# A search is read from its (protected) search image stack
+_PACK_SCRIPT = """
+{ Object source, String score ->
+    if (!(source instanceof Iterable)) source = source.@nodes_as_image_from_start
+    def xyz = new ArrayList<Integer>()
+    def scores = new ArrayList<Double>()
+    def add = { node ->
+        if (node == null) return
+        xyz << (node.x as int) << (node.y as int) << (node.z as int)
+        scores << (node."${score}" as double)
+    }
+    for (item in source) {
+        if (item instanceof Iterable) { for (node in item) add(node) } else add(item)
+    }
+    [xyz as int[], scores as double[]] as Object[]
+}
+"""
+
+# Compiled packing closure (False once Groovy is known to be unavailable)
+_packer = None
+_packer_lock = threading.Lock()
+_warned_fallback = False
+
+
+def explored_nodes(search: Any) -> Dict[str, np.ndarray]:
+    """
+    Export the nodes explored by a search.
+
+    Parameters
+    ----------
+    search : SearchThread
+        A finished TracerThread or FillerThread (nodes are read from its search
+        images, which must still be in memory)
+
+    Returns
+    -------
+    dict
+        'xyz': (N, 3) int32 voxel coordinates and 'g': (N,) float64 g-scores
+        (cost from the start)
+
+    Examples
+    --------
+    >>> explored = pysnt.tracing.explored_nodes(tracer)
+    >>> explored['xyz'].shape, explored['g'].max()
+    """
+    xyz, scores = _pack(search, 'g', 'sc.fiji.snt.tracing.SearchThread')
+    return {'xyz': xyz, 'g': scores}
+
+
+def fill_voxels(fill: Any, threshold: Optional[float] = None) -> Dict[str, np.ndarray]:
+    """
+    Export the voxels of a fill as a sparse voxel list.
+
+    Parameters
+    ----------
+    fill : Fill or FillerThread
+        Fill (or the filler that computed it)
+    threshold : float, optional
+        Keep voxels at most this distance (default: the fill's threshold)
+
+    Returns
+    -------
+    dict
+        'xyz': (N, 3) int32 voxel coordinates and 'distance': (N,) float64
+        distances
+    """
+    if hasattr(fill, 'getFill') and not hasattr(fill, 'getNodeList'):  # FillerThread
+        fill = fill.getFill()
+    xyz, distances = _pack(fill.getNodeList(), 'distance', 'sc.fiji.snt.Fill')
+    if threshold is None:
+        threshold = getattr(fill, 'distanceThreshold', None)
+    if threshold is not None:
+        keep = distances <= float(threshold)
+        xyz, distances = xyz[keep], distances[keep]
+    return {'xyz': xyz, 'distance': distances}
+
+
+def fill_mask(fill: Any, threshold: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Export a fill as a dense mask cropped to its bounding box.
+
+    Parameters
+    ----------
+    fill : Fill or FillerThread
+        Fill (or the filler that computed it)
+    threshold : float, optional
+        Keep voxels at most this distance (default: the fill's threshold)
+
+    Returns
+    -------
+    dict
+        'mask': (Z, Y, X) bool array, 'distance': (Z, Y, X) float32 array (NaN
+        outside the fill) and 'origin': (x, y, z) voxel coordinates of the
+        mask's first voxel
+
+    Examples
+    --------
+    >>> cropped = pysnt.tracing.fill_mask(filler)
+    >>> cropped['mask'].sum()  # filled voxels
+    """
+    voxels = fill_voxels(fill, threshold)
+    xyz = voxels['xyz']
+    if not len(xyz):
+        return {'mask': np.zeros((0, 0, 0), dtype=bool), 'distance': np.zeros((0, 0, 0), dtype=np.float32),
+                'origin': np.zeros(3, dtype=np.int64)}
+    origin = xyz.min(axis=0).astype(np.int64)
+    local = xyz - origin
+    shape = tuple(local.max(axis=0)[::-1] + 1)
+    mask = np.zeros(shape, dtype=bool)
+    distance = np.full(shape, np.nan, dtype=np.float32)
+    mask[local[:, 2], local[:, 1], local[:, 0]] = True
+    distance[local[:, 2], local[:, 1], local[:, 0]] = voxels['distance']
+    return {'mask': mask, 'distance': distance, 'origin': origin}
+
+
+def _pack(source: Any, score: str, java_class: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the (N, 3) coordinates and (N,) scores of the nodes in source."""
+    from ..profiling import _record_transfer
+
+    start = time.perf_counter()
+    packer = _get_packer()
+    if packer:
+        packed = packer.call(source, score)
+        xyz = np.array(packed[0], dtype=np.int32).reshape(-1, 3)
+        scores = np.array(packed[1], dtype=np.float64)
+    else:
+        if not _is_iterable(source):
+            source = _search_image_stack(source)
+        xyz, scores = _pack_in_python(source, score)
+    _record_transfer(java_class, xyz.nbytes + scores.nbytes, seconds=time.perf_counter() - start)
+    return xyz, scores
+
+
+def _pack_in_python(source: Any, score: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Read nodes one by one (fallback when Groovy is unavailable)."""
+    rows = []
+    for item in source:
+        nodes = item if _is_iterable(item) else (item,)
+        for node in nodes:
+            if node is not None:
+                rows.append((_field(node, 'x'), _field(node, 'y'), _field(node, 'z'), _field(node, score)))
+    table = np.array(rows, dtype=np.float64).reshape(-1, 4)
+    return table[:, :3].astype(np.int32), table[:, 3].copy()
+
+
+def _field(node: Any, name: str) -> float:
+    """Read a public field or, failing that, its getter (e.g., g or getG())."""
+    value = getattr(node, name, None)
+    if value is None or callable(value):
+        value = getattr(node, f"get{name[0].upper()}{name[1:]}")()
+    return float(value)
+
+
+def _is_iterable(item: Any) -> bool:
+    return not hasattr(item, 'x') and (hasattr(item, '__iter__') or hasattr(item, 'iterator'))
+
+
+def _get_packer() -> Any:
+    """Compile the packing closure once per session; None/False if unavailable."""
+    global _packer, _warned_fallback
+    with _packer_lock:
+        if _packer is None:
+            try:
+                import scyjava
+                if not scyjava.jvm_started():
+                    return None
+                _packer = scyjava.jimport('groovy.lang.GroovyShell')().evaluate(_PACK_SCRIPT)
+            except Exception as e:
+                _packer = False
+                if not _warned_fallback:
+                    _warned_fallback = True
+                    logger.warning(f"Groovy is not available ({e}): reading nodes one by one (slow for large "
+                                   f"searches)")
+        return _packer
+
+
+def _search_image_stack(search: Any) -> Any:
+    """Return the per-slice search images of a search through a public getter (Python fallback)."""
+    for getter in ('getNodesAsImageFromStart', 'getNodesAsImage'):
+        if hasattr(search, getter):
+            return getattr(search, getter)()
+    raise ValueError(f"Cannot read explored nodes from {type(search).__name__} without Groovy: expected a "
+                     f"finished TracerThread or FillerThread")
@@ -0,0 +1,31 @@
+"""
+Type stubs for node_arrays.py
+
+Auto-generated stub file.
+"""
+
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple
+import numpy as np
+
+logger: Any
+_PACK_SCRIPT: Any
+_packer: Any
+_packer_lock: Any
+_warned_fallback: Any
+def explored_nodes(search: Any) -> Dict[str, np.ndarray]: ...
+
+def fill_voxels(fill: Any, threshold: Optional[float]) -> Dict[str, np.ndarray]: ...
+
+def fill_mask(fill: Any, threshold: Optional[float]) -> Dict[str, Any]: ...
+
+def _pack(source: Any, score: str, java_class: str) -> Tuple[np.ndarray, np.ndarray]: ...
+
+def _pack_in_python(source: Any, score: str) -> Tuple[np.ndarray, np.ndarray]: ...
+
+def _field(node: Any, name: str) -> float: ...
+
+def _is_iterable(item: Any) -> bool: ...
+
+def _get_packer() -> Any: ...
+
+def _search_image_stack(search: Any) -> Any: ...
@@ -0,0 +1,339 @@
+"""
+Chunk prefetching for out-of-core tracing.
+
+Lazily loaded volumes (e.g., OME-Zarr/N5 images opened with
+pysnt.io.imgplus_from_zarr()) are read one chunk (cell) at a time, the first
+time a search touches a voxel in it, so searches stall on storage whenever they
+expand into unloaded regions. ChunkPrefetcher loads the chunks a search is
+likely to visit next on background threads: those along the straight line from
+the start to the goal, in a window ahead of the search frontier. SNT does not
+expose frontier coordinates while a search runs, so the frontier is estimated
+from the search's progress reports: n explored voxels cover a ball of radius
+(3n / 4pi)^(1/3) around the start (and around the goal for bidirectional
+searches, which explore from both ends).
+
+A chunk is loaded by reading one of its voxels, which makes imglib2 fetch and
+decompress the whole cell into the image's cell cache. The prefetcher keeps at
+most max_chunks chunks queued or recently loaded; to bound memory, open the
+image with a bounded cell cache (imgplus_from_zarr(..., cache_cells=n)) holding
+at least that many chunks.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Chunk edge length (voxels) assumed when the image is not a cell image
+_DEFAULT_CHUNK = 64
+
+
+class ChunkPrefetcher:
+    """
+    Load image chunks ahead of running searches.
+
+    Parameters
+    ----------
+    image : RandomAccessibleInterval
+        Lazily loaded image being searched (e.g., from pysnt.io.imgplus_from_zarr())
+    chunk_shape : sequence of int, optional
+        (x, y[, z]) chunk size in voxels (default: the cell size of the image,
+        or 64 voxels per axis if it is not a cell image)
+    max_chunks : int, optional
+        Number of chunks queued or recently loaded that are tracked; further
+        requests are dropped until queued chunks load (default:
+        pysnt.get_option('tracing.prefetch_chunks'))
+    workers : int, optional
+        Number of loader threads (default: pysnt.get_option('tracing.prefetch_workers'))
+    lookahead : float, optional
+        Chunks loaded ahead of the estimated frontier, in chunk lengths
+        (default: pysnt.get_option('tracing.prefetch_lookahead'))
+    corridor : int, default 1
+        Neighboring chunks loaded on each side of the start-goal line (0 for
+        the chunks on the line only)
+
+    Examples
+    --------
+    >>> img = pysnt.io.imgplus_from_zarr('s3://bucket/neuron.ome.zarr', cache_cells=512)
+    >>> with pysnt.tracing.ChunkPrefetcher(img) as prefetcher:
+    ...     tracer = TracerThread(img, cal, *start, *goal, 0, 0, SNT.SearchImageType.MAP, cost, heuristic)
+    ...     prefetcher.watch(tracer, start, goal)
+    ...     tracer.run()
+    ...     print(prefetcher.stats())
+    """
+
+    def __init__(self, image: Any, chunk_shape: Optional[Sequence[int]] = None, max_chunks: Optional[int] = None,
+                 workers: Optional[int] = None, lookahead: Optional[float] = None, corridor: int = 1):
+        from ..config import get_option
+
+        self._image = image
+        self._dims = _dimensions(image)
+        if chunk_shape is None:
+            chunk_shape = _cell_shape(image)
+        if chunk_shape is None:
+            chunk_shape = (_DEFAULT_CHUNK,) * len(self._dims)
+        if len(chunk_shape) < len(self._dims) or any(int(c) < 1 for c in chunk_shape):
+            raise ValueError(f"chunk_shape must have {len(self._dims)} positive sizes, got {tuple(chunk_shape)}")
+        self.chunk_shape = tuple(int(c) for c in chunk_shape[:len(self._dims)])
+        self._grid = tuple(-(-d // c) for d, c in zip(self._dims, self.chunk_shape))
+        self.max_chunks = int(max_chunks or get_option('tracing.prefetch_chunks'))
+        self.lookahead = float(get_option('tracing.prefetch_lookahead') if lookahead is None else lookahead)
+        self.corridor = max(0, int(corridor))
+
+        from ..async_utils import _attach_daemon
+        self._pool = ThreadPoolExecutor(max_workers=int(workers or get_option('tracing.prefetch_workers')),
+                                        thread_name_prefix='pysnt-prefetch', initializer=_attach_daemon)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._loaded = OrderedDict()
+        self._closed = False
+        self._stats = {'requested': 0, 'loaded': 0, 'skipped': 0, 'dropped': 0, 'failed': 0, 'load_seconds': 0.0}
+
+    def chunk_of(self, voxel: Sequence[float]) -> Tuple[int, ...]:
+        """Return the (x, y[, z]) grid index of the chunk containing a voxel."""
+        return tuple(int(v) // c for v, c in zip(voxel, self.chunk_shape))
+
+    def chunks_along(self, start: Sequence[float], goal: Sequence[float], near: float = 0.0,
+                     far: Optional[float] = None) -> List[Tuple[int, ...]]:
+        """
+        Return the chunks along the line from start to goal, nearest to start first.
+
+        Parameters
+        ----------
+        start, goal : sequence of float
+            (x, y[, z]) voxel coordinates
+        near, far : float
+            Distance window (voxels from start) of the line segment covered
+            (default: the whole line)
+
+        Returns
+        -------
+        list of tuple
+            Chunk grid indices within the image, including the corridor of
+            neighboring chunks around the line
+        """
+        start, goal = self._point(start), self._point(goal)
+        length = float(np.linalg.norm(goal - start))
+        near = max(0.0, float(near))
+        far = length if far is None else min(float(far), length)
+        if near > far:
+            return []
+        step = min(self.chunk_shape) / 2
+        distances = np.append(np.arange(near, far, step), far)
+        direction = (goal - start) / length if length else np.zeros_like(start)
+        offsets = _neighborhood(len(self.chunk_shape), self.corridor)
+        chunks = OrderedDict()
+        for distance in distances:
+            center = np.floor((start + direction * distance) / self.chunk_shape).astype(np.int64)
+            for offset in offsets:
+                chunk = tuple(int(c) for c in center + offset)
+                if all(0 <= c < g for c, g in zip(chunk, self._grid)):
+                    chunks.setdefault(chunk, None)
+        return list(chunks)
+
+    def prefetch(self, chunks: Iterable[Tuple[int, ...]]) -> int:
+        """
+        Queue chunks for loading, in order.
+
+        Chunks queued or recently loaded are skipped, and requests beyond
+        max_chunks queued chunks are dropped.
+
+        Parameters
+        ----------
+        chunks : iterable of tuple
+            Chunk grid indices (see chunk_of() and chunks_along())
+
+        Returns
+        -------
+        int
+            Number of chunks queued
+        """
+        queued = 0
+        with self._lock:
+            if self._closed:
+                return 0
+            for chunk in chunks:
+                chunk = tuple(chunk)
+                self._stats['requested'] += 1
+                if chunk in self._pending or chunk in self._loaded:
+                    self._stats['skipped'] += 1
+                    if chunk in self._loaded:
+                        self._loaded.move_to_end(chunk)
+                    continue
+                if len(self._pending) >= self.max_chunks:
+                    self._stats['dropped'] += 1
+                    continue
+                self._pending.add(chunk)
+                self._pool.submit(self._load, chunk)
+                queued += 1
+        return queued
+
+    def prefetch_toward(self, start: Sequence[float], goal: Sequence[float], radius: float = 0.0,
+                        bidirectional: bool = False) -> int:
+        """
+        Queue the chunks ahead of a search frontier on the line from start to goal.
+
+        Parameters
+        ----------
+        start, goal : sequence of float
+            (x, y[, z]) voxel coordinates of the search's start and goal
+        radius : float, default 0
+            Distance (voxels) from start reached by the frontier (and from goal,
+            for bidirectional searches)
+        bidirectional : bool, default False
+            Also prefetch from the goal towards the start
+
+        Returns
+        -------
+        int
+            Number of chunks queued
+        """
+        window = self.lookahead * max(self.chunk_shape)
+        near = max(0.0, radius - max(self.chunk_shape))
+        chunks = self.chunks_along(start, goal, near, radius + window)
+        if bidirectional:
+            backward = self.chunks_along(goal, start, near, radius + window)
+            interleaved = [chunk for pair in zip(chunks, backward) for chunk in pair]
+            chunks = list(dict.fromkeys(interleaved + chunks[len(backward):] + backward[len(chunks):]))
+        return self.prefetch(chunks)
+
+    def watch(self, search: Any, start: Sequence[float], goal: Sequence[float], bidirectional: bool = False) -> Any:
+        """
+        Prefetch ahead of a search as it runs.
+
+        Chunks around the start (and goal) are queued immediately, and further
+        chunks whenever the search reports progress. Call before starting the
+        search.
+
+        Parameters
+        ----------
+        search : SearchThread or BiSearch
+            Search that has not been started
+        start, goal : sequence of float
+            (x, y[, z]) voxel coordinates of its start and goal
+        bidirectional : bool, default False
+            Whether the search explores from both ends (BiSearch)
+
+        Returns
+        -------
+        SearchProgressCallback or None
+            Listener added to the search, or None if progress cannot be
+            reported (only the initial chunks are then prefetched)
+        """
+        self.prefetch_toward(start, goal, 0.0, bidirectional)
+        sides = 2 if bidirectional else 1
+
+        def on_progress(in_open, in_closed):
+            radius = (3 * (int(in_open) + int(in_closed)) / (4 * math.pi * sides)) ** (1 / 3)
+            self.prefetch_toward(start, goal, radius, bidirectional)
+
+        try:
+            listener = _progress_listener(on_progress)
+            search.addProgressListener(listener)
+            return listener
+        except Exception as e:
+            logger.debug(f"Cannot follow the progress of {type(search).__name__}: {e}")
+            return None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return prefetching statistics.
+
+        Returns
+        -------
+        dict
+            'requested', 'loaded', 'skipped' (already queued or loaded),
+            'dropped' (queue full), 'failed' chunk counts, 'pending' chunks and
+            'load_seconds' (time spent loading, summed over loader threads)
+        """
+        with self._lock:
+            return dict(self._stats, pending=len(self._pending))
+
+    def close(self, wait: bool = True) -> None:
+        """Stop prefetching; with wait=False, queued chunks are discarded."""
+        from ..async_utils import _shutdown_pool
+
+        with self._lock:
+            self._closed = True
+        _shutdown_pool(self._pool, wait=wait, cancel=not wait)
+
+    def __enter__(self) -> 'ChunkPrefetcher':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close(wait=False)
+
+    def _point(self, voxel: Sequence[float]) -> np.ndarray:
+        point = np.zeros(len(self.chunk_shape))
+        values = np.asarray(voxel, dtype=np.float64)[:len(point)]
+        point[:len(values)] = values
+        return point
+
+    def _load(self, chunk: Tuple[int, ...]) -> None:
+        """Read the first voxel of a chunk, loading the whole cell into the image's cache."""
+        started = time.perf_counter()
+        failed = False
+        try:
+            access = getattr(self._local, 'access', None)
+            if access is None:
+                access = self._local.access = self._image.randomAccess()
+            for d, (index, size) in enumerate(zip(chunk, self.chunk_shape)):
+                access.setPosition(int(index * size), d)
+            access.get()
+        except Exception as e:
+            failed = True
+            logger.debug(f"Could not prefetch chunk {chunk}: {e}")
+        with self._lock:
+            self._pending.discard(chunk)
+            self._stats['load_seconds'] += time.perf_counter() - started
+            if failed:
+                self._stats['failed'] += 1
+                return
+            self._stats['loaded'] += 1
+            self._loaded[chunk] = None
+            while len(self._loaded) > self.max_chunks:
+                self._loaded.popitem(last=False)
+
+
+def _dimensions(image: Any) -> Tuple[int, ...]:
+    """Return the (x, y[, z]) dimensions of an image."""
+    return tuple(int(image.dimension(d)) for d in range(min(int(image.numDimensions()), 3)))
+
+
+def _cell_shape(image: Any) -> Optional[Tuple[int, ...]]:
+    """Return the cell size of a (wrapped) cell image, or None if it is not one."""
+    for _ in range(4):  # ImgPlus -> CachedCellImg
+        if hasattr(image, 'getCellGrid'):
+            grid = image.getCellGrid()
+            return tuple(int(grid.cellDimension(d)) for d in range(min(int(grid.numDimensions()), 3)))
+        if not hasattr(image, 'getImg'):
+            return None
+        image = image.getImg()
+    return None
+
+
+def _neighborhood(ndim: int, corridor: int) -> np.ndarray:
+    """Return the chunk offsets within corridor chunks of the line, the line itself first."""
+    axes = [np.arange(-corridor, corridor + 1)] * ndim
+    offsets = np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1).reshape(-1, ndim)
+    return offsets[np.argsort(np.abs(offsets).sum(axis=1), kind='stable')]
+
+
+def _progress_listener(on_progress: Any) -> Any:
+    """Implement SNT's SearchProgressCallback, forwarding explored voxel counts to on_progress."""
+    import jpype
+
+    handlers = {
+        'pointsInSearch': lambda source, in_open, in_closed: on_progress(in_open, in_closed),
+        'finished': lambda source, success: None,
+        'threadStatus': lambda source, status: None,
+    }
+    return jpype.JProxy(['sc.fiji.snt.SearchProgressCallback'], dict=handlers)
@@ -0,0 +1,32 @@
+"""
+Type stubs for prefetch.py
+
+Auto-generated stub file.
+"""
+
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple, Iterable, Sequence
+import numpy as np
+
+logger: Any
+_DEFAULT_CHUNK: Any
+class ChunkPrefetcher:
+    def __init__(self, image: Any, chunk_shape: Optional[Sequence[int]], max_chunks: Optional[int], workers: Optional[int], lookahead: Optional[float], corridor: int) -> None: ...
+    def chunk_of(self, voxel: Sequence[float]) -> Tuple[int, ...]: ...
+    def chunks_along(self, start: Sequence[float], goal: Sequence[float], near: float, far: Optional[float]) -> List[Tuple[int, ...]]: ...
+    def prefetch(self, chunks: Iterable[Tuple[int, ...]]) -> int: ...
+    def prefetch_toward(self, start: Sequence[float], goal: Sequence[float], radius: float, bidirectional: bool) -> int: ...
+    def watch(self, search: Any, start: Sequence[float], goal: Sequence[float], bidirectional: bool) -> Any: ...
+    def stats(self) -> Dict[str, Any]: ...
+    def close(self, wait: bool) -> None: ...
+    def __enter__(self) -> 'ChunkPrefetcher': ...
+    def __exit__(self, *exc_info: Any) -> None: ...
+    def _point(self, voxel: Sequence[float]) -> np.ndarray: ...
+    def _load(self, chunk: Tuple[int, ...]) -> None: ...
+
+def _dimensions(image: Any) -> Tuple[int, ...]: ...
+
+def _cell_shape(image: Any) -> Optional[Tuple[int, ...]]: ...
+
+def _neighborhood(ndim: int, corridor: int) -> np.ndarray: ...
+
+def _progress_listener(on_progress: Any) -> Any: ...
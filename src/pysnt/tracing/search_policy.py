@@ -0,0 +1,293 @@
+"""
+Memory-bounded selection of search image backends.
+
+SNT searches (TracerThread, BiSearch, FillerThread) keep their state in a stack
+of per-slice search images, backed by one of:
+
+- MapSearchImage ('map'): sparse hash map per slice. Memory grows with the
+  number of explored voxels only, but every access is a hash lookup
+- ArraySearchImage ('array'): dense array of node references per slice
+  touched. Fastest access, but costs a reference per voxel of every touched
+  slice regardless of how much of it is explored
+
+choose_search_image() estimates the search-state memory of each backend from the
+volume size and the expected explored fraction, and picks the dense backend
+when the search is expected to explore enough of the volume (see the
+'tracing.dense_threshold' option) and it fits the memory budget, the sparse one
+otherwise. The backend of a running Java search cannot be changed, so
+SearchImagePolicy adapts between searches: batches start sparse and switch to
+dense once completed searches have explored more than the threshold.
+Estimates assume compressed object pointers (heaps below 32 GB).
+"""
+
+import logging
+from typing import Any, Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Search image backends (constants of SNT.SearchImageType)
+SEARCH_IMAGE_TYPES = ('map', 'array')
+
+# Approximate JVM footprint (bytes) of one search node
+_NODE_BYTES = 48
+_BIDIRECTIONAL_NODE_BYTES = 80
+
+# Hash map entry per explored voxel (open addressing at 0.75 load factor, incl. growth slack)
+_MAP_ENTRY_BYTES = 16
+
+# Reference per voxel of a touched slice (dense backends)
+_REFERENCE_BYTES = 4
+
+
+def estimate_search_memory(shape: Sequence[int], explored_fraction: float, search_image: str,
+                           bidirectional: bool = False) -> int:
+    """
+    Estimate the search-state memory of a search.
+
+    Parameters
+    ----------
+    shape : sequence of int
+        Image dimensions (x, y[, z])
+    explored_fraction : float
+        Fraction of voxels the search explores (0-1)
+    search_image : str
+        'map' or 'array'
+    bidirectional : bool, default False
+        Whether the search is bidirectional (BiSearch nodes are larger)
+
+    Returns
+    -------
+    int
+        Estimated bytes (nodes plus backing structure)
+    """
+    if search_image not in SEARCH_IMAGE_TYPES:
+        raise ValueError(f"Invalid search image '{search_image}'. Must be one of {SEARCH_IMAGE_TYPES}")
+    width, height, depth = _dimensions(shape)
+    voxels = width * height * depth
+    explored = int(voxels * min(max(explored_fraction, 0.0), 1.0))
+    nodes = explored * (_BIDIRECTIONAL_NODE_BYTES if bidirectional else _NODE_BYTES)
+    if search_image == 'map':
+        return nodes + explored * _MAP_ENTRY_BYTES
+    # Dense backends allocate whole slices; a search touching a fraction of the volume
+    # usually spans most of its depth
+    slices = depth if explored else 0
+    return nodes + slices * width * height * _REFERENCE_BYTES
+
+
+def choose_search_image(shape: Sequence[int], expected_fraction: Optional[float] = None,
+                        memory_budget: Optional[int] = None, bidirectional: bool = False,
+                        dense_threshold: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Choose the search image backend for a search.
+
+    Parameters
+    ----------
+    shape : sequence of int
+        Image dimensions (x, y[, z])
+    expected_fraction : float, optional
+        Expected fraction of voxels explored (default: 0, i.e., sparse). Point-to-point
+        traces typically explore little; fills often explore much more
+    memory_budget : int, optional
+        Bytes available for the search state (default: default_memory_budget())
+    bidirectional : bool, default False
+        Whether the search is bidirectional
+    dense_threshold : float, optional
+        Explored fraction from which dense storage is preferred (default:
+        pysnt.get_option('tracing.dense_threshold'))
+
+    Returns
+    -------
+    dict
+        'search_image' (chosen backend), 'estimated_bytes' (its estimate),
+        'estimates' (per backend), 'budget' and 'reason'
+
+    Examples
+    --------
+    >>> choice = pysnt.tracing.choose_search_image((2048, 2048, 500), expected_fraction=0.4)
+    >>> choice['search_image'], choice['reason']
+    """
+    if dense_threshold is None:
+        dense_threshold = _option('tracing.dense_threshold')
+    if memory_budget is None:
+        memory_budget = default_memory_budget()
+    fraction = expected_fraction or 0.0
+    estimates = {name: estimate_search_memory(shape, fraction, name, bidirectional)
+                 for name in ('map', 'array')}
+    fits = {name: memory_budget is None or size <= memory_budget for name, size in estimates.items()}
+
+    if fraction >= dense_threshold and fits['array']:
+        choice, reason = 'array', f"explored fraction {fraction:.0%} >= {dense_threshold:.0%} and fits budget"
+    elif fits['map']:
+        choice = 'map'
+        reason = (f"explored fraction {fraction:.0%} < {dense_threshold:.0%}" if fraction < dense_threshold
+                  else "dense storage exceeds budget")
+    else:
+        choice = min(estimates, key=estimates.get)
+        reason = "no backend fits the budget; using the smallest"
+        logger.warning(f"Estimated search state ({_format_bytes(estimates[choice])}) exceeds the memory budget "
+                       f"({_format_bytes(memory_budget)}) for a {'x'.join(map(str, _dimensions(shape)))} volume")
+    return {
+        'search_image': choice,
+        'estimated_bytes': estimates[choice],
+        'estimates': estimates,
+        'budget': memory_budget,
+        'reason': reason,
+    }
+
+
+def default_memory_budget(concurrency: int = 1) -> Optional[int]:
+    """
+    Return the default memory budget of one search.
+
+    A fraction ('tracing.search_memory_fraction' option) of the JVM heap that is
+    not in use, shared by concurrent searches.
+
+    Parameters
+    ----------
+    concurrency : int, default 1
+        Number of searches running at once
+
+    Returns
+    -------
+    int or None
+        Bytes, or None if the JVM is not running (no budget)
+    """
+    try:
+        from ..diagnostics import jvm_memory
+        memory = jvm_memory()
+    except Exception:
+        return None
+    heap_max = memory['heap_max'] if memory['heap_max'] > 0 else memory['heap_committed']
+    free = max(heap_max - memory['heap_used'], 0)
+    return int(free * _option('tracing.search_memory_fraction') / max(concurrency, 1))
+
+
+class SearchImagePolicy:
+    """
+    Adaptive search image selection across a series of searches.
+
+    Searches start with the backend chosen for the expected explored fraction.
+    After each search, record() updates the explored fraction observed so far;
+    once it passes the dense threshold (and dense storage fits the budget),
+    later searches use the dense backend. Peak search-state memory is tracked
+    for reporting.
+
+    Parameters
+    ----------
+    shape : sequence of int
+        Image dimensions (x, y[, z])
+    expected_fraction : float, optional
+        Initial expected explored fraction
+    memory_budget : int, optional
+        Bytes available per search (default: default_memory_budget(concurrency))
+    bidirectional : bool, default False
+        Whether searches are bidirectional
+    concurrency : int, default 1
+        Number of searches running at once (divides the default budget)
+    dense_threshold : float, optional
+        Explored fraction from which dense storage is preferred (default:
+        pysnt.get_option('tracing.dense_threshold'))
+    search_image : str, optional
+        Fixed backend ('map' or 'array'): disables switching, searches
+        are only recorded for reporting
+    """
+
+    def __init__(self, shape: Sequence[int], expected_fraction: Optional[float] = None,
+                 memory_budget: Optional[int] = None, bidirectional: bool = False, concurrency: int = 1,
+                 dense_threshold: Optional[float] = None, search_image: Optional[str] = None):
+        if search_image is not None and search_image not in SEARCH_IMAGE_TYPES:
+            raise ValueError(f"Invalid search image '{search_image}'. Must be one of {SEARCH_IMAGE_TYPES}")
+        self.shape = tuple(_dimensions(shape))
+        self.bidirectional = bidirectional
+        self.dense_threshold = dense_threshold if dense_threshold is not None else _option('tracing.dense_threshold')
+        self.memory_budget = memory_budget if memory_budget is not None else default_memory_budget(concurrency)
+        self.searches = 0
+        self.peak_fraction = 0.0
+        self.peak_bytes = 0
+        self.switches = []
+        self.adaptive = search_image is None
+        if self.adaptive:
+            self.current = choose_search_image(self.shape, expected_fraction, self.memory_budget, bidirectional,
+                                               self.dense_threshold)['search_image']
+        else:
+            self.current = search_image
+
+    @property
+    def voxels(self) -> int:
+        """Number of voxels in the volume."""
+        width, height, depth = self.shape
+        return width * height * depth
+
+    def record(self, explored: int, search_image: Optional[str] = None) -> str:
+        """
+        Record a completed search and return the backend to use next.
+
+        Parameters
+        ----------
+        explored : int
+            Number of voxels the search explored (e.g., pointsConsideredInSearch())
+        search_image : str, optional
+            Backend the search used (default: the current one)
+
+        Returns
+        -------
+        str
+            Backend for the next searches
+        """
+        fraction = explored / self.voxels if self.voxels else 0.0
+        used = search_image or self.current
+        self.searches += 1
+        self.peak_fraction = max(self.peak_fraction, fraction)
+        self.peak_bytes = max(self.peak_bytes, estimate_search_memory(self.shape, fraction, used,
+                                                                      self.bidirectional))
+        if self.adaptive and self.current != 'array' and self.peak_fraction >= self.dense_threshold:
+            choice = choose_search_image(self.shape, self.peak_fraction, self.memory_budget, self.bidirectional,
+                                         self.dense_threshold)['search_image']
+            if choice != self.current:
+                logger.info(f"Switching search image from '{self.current}' to '{choice}' after {self.searches} "
+                            f"searches (explored fraction {self.peak_fraction:.1%})")
+                self.switches.append({'after': self.searches, 'from': self.current, 'to': choice,
+                                      'explored_fraction': self.peak_fraction})
+                self.current = choice
+        return self.current
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Summarize the searches recorded so far.
+
+        Returns
+        -------
+        dict
+            'searches', 'search_image' (current backend), 'peak_explored_fraction',
+            'peak_search_bytes' (estimated peak search-state memory of one search),
+            'memory_budget' and 'switches'
+        """
+        return {
+            'searches': self.searches,
+            'search_image': self.current,
+            'peak_explored_fraction': self.peak_fraction,
+            'peak_search_bytes': self.peak_bytes,
+            'memory_budget': self.memory_budget,
+            'switches': list(self.switches),
+        }
+
+
+def _dimensions(shape: Sequence[int]):
+    """Return (width, height, depth) from a 2D or 3D shape."""
+    dims = [int(d) for d in shape]
+    if len(dims) == 2:
+        dims.append(1)
+    if len(dims) != 3:
+        raise ValueError(f"Shape must have 2 or 3 dimensions (x, y[, z]), got {tuple(shape)}")
+    return dims
+
+
+def _format_bytes(nbytes: Optional[int]) -> str:
+    if nbytes is None:
+        return 'unlimited'
+    return f"{nbytes / 1024 ** 2:.0f} MB"
+
+
+def _option(key: str) -> Any:
+    from ..config import get_option
+    return get_option(key)
@@ -0,0 +1,32 @@
+"""
+Type stubs for search_policy.py
+
+Auto-generated stub file.
+"""
+
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple, Sequence
+
+logger: Any
+SEARCH_IMAGE_TYPES: Any
+_NODE_BYTES: Any
+_BIDIRECTIONAL_NODE_BYTES: Any
+_MAP_ENTRY_BYTES: Any
+_REFERENCE_BYTES: Any
+def estimate_search_memory(shape: Sequence[int], explored_fraction: float, search_image: str, bidirectional: bool) -> int: ...
+
+def choose_search_image(shape: Sequence[int], expected_fraction: Optional[float], memory_budget: Optional[int], bidirectional: bool, dense_threshold: Optional[float]) -> Dict[str, Any]: ...
+
+def default_memory_budget(concurrency: int) -> Optional[int]: ...
+
+class SearchImagePolicy:
+    def __init__(self, shape: Sequence[int], expected_fraction: Optional[float], memory_budget: Optional[int], bidirectional: bool, concurrency: int, dense_threshold: Optional[float], search_image: Optional[str]) -> None: ...
+    @property
+    def voxels(self) -> int: ...
+    def record(self, explored: int, search_image: Optional[str]) -> str: ...
+    def report(self) -> Dict[str, Any]: ...
+
+def _dimensions(shape: Sequence[int]) -> List[int]: ...
+
+def _format_bytes(nbytes: Optional[int]) -> str: ...
+
+def _option(key: str) -> Any: ...
@@ -0,0 +1,201 @@
+"""
+Tests for the asynchronous API (pysnt.async_utils).
+
+These tests do not require SNT/Java initialization: searches, parsers and loaders
+are faked with Python objects mimicking the SNT methods used.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import CancelledError
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+import pysnt
+from pysnt import async_utils
+
+
+class FakeTracerThread:
+    """Search that runs until requestStop() and reports progress to its listeners."""
+
+    def __init__(self, steps=None):
+        self.steps = steps
+        self.listeners = []
+        self.stop = threading.Event()
+        self.started = threading.Event()
+
+    def addProgressListener(self, listener):
+        self.listeners.append(listener)
+
+    def requestStop(self):
+        self.stop.set()
+
+    def run(self):
+        self.started.set()
+        step = 0
+        while not self.stop.is_set() and (self.steps is None or step < self.steps):
+            step += 1
+            for listener in self.listeners:
+                listener.pointsInSearch(self, step, 2 * step)
+            time.sleep(0.001)
+        for listener in self.listeners:
+            listener.finished(self, not self.stop.is_set())
+
+    def getResult(self):
+        return 'path' if not self.stop.is_set() else None
+
+
+class FakeParser:
+    def __init__(self, success=True):
+        self.success = success
+        self.terminated = False
+
+    def parse(self):
+        pass
+
+    def successful(self):
+        return self.success
+
+    def terminate(self):
+        self.terminated = True
+
+    def getProfile(self):
+        return 'profile'
+
+
+def _proxy(task, search):
+    """Stand-in for the JPype proxy: forward listener calls to task.report()."""
+    class Listener:
+        def pointsInSearch(self, source, in_open, in_closed):
+            task.report('points', open=in_open, closed=in_closed)
+
+        def finished(self, source, success):
+            task.report('finished', success=success)
+    return Listener()
+
+
+@pytest.fixture(autouse=True)
+def _pool():
+    with patch.object(async_utils, '_search_progress_proxy', side_effect=_proxy):
+        yield
+    async_utils.shutdown_executor()
+    pysnt.reset_option('async.max_workers')
+
+
+class TestJavaTask:
+    """Test results, errors and progress of tasks."""
+
+    def test_submit(self):
+        task = async_utils.submit(lambda a, b=0: a + b, 1, b=2, name='add')
+        assert task.result(timeout=5) == 3 and task.done() and not task.cancelled()
+        assert task.name == 'add'
+
+    def test_error_propagates(self):
+        task = async_utils.submit(lambda: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            task.result(timeout=5)
+
+    def test_await(self):
+        async def main():
+            return await async_utils.submit(lambda: 'done')
+        assert asyncio.run(main()) == 'done'
+
+    def test_failing_progress_callback(self):
+        task = async_utils.JavaTask('t')
+        events = []
+        task.add_progress_callback(lambda event: 1 / 0)
+        task.add_progress_callback(events.append)
+        task.report('points', open=1)
+        assert events == [{'task': 't', 'event': 'points', 'open': 1}]
+        with pytest.raises(TypeError):
+            task.add_progress_callback('not callable')
+
+
+class TestSearch:
+    """Test searches, progress bridging and cancellation propagated to Java."""
+
+    def test_result_and_progress(self):
+        events = []
+        task = async_utils.search_async(FakeTracerThread(steps=3), progress=events.append)
+        assert task.result(timeout=5) == 'path'
+        assert [e['open'] for e in events if e['event'] == 'points'] == [1, 2, 3]
+        assert events[-1] == {'task': 'FakeTracerThread', 'event': 'finished', 'success': True}
+
+    def test_cancel_requests_stop(self):
+        search = FakeTracerThread()
+        task = async_utils.search_async(search)
+        assert search.started.wait(5)
+        assert task.cancel()
+        with pytest.raises(CancelledError):
+            task.result(timeout=5)
+        assert search.stop.is_set() and task.cancelled()
+
+    def test_asyncio_cancellation_stops_search(self):
+        search = FakeTracerThread()
+
+        async def main():
+            waiter = asyncio.ensure_future(async_utils.search_async(search))
+            await asyncio.get_running_loop().run_in_executor(None, search.started.wait, 5)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+        asyncio.run(main())
+        assert search.stop.wait(5)
+
+    def test_pending_task_cancelled_on_shutdown(self):
+        pysnt.set_option('async.max_workers', 1)
+        async_utils.shutdown_executor()
+        blocker = FakeTracerThread()
+        running = async_utils.search_async(blocker)
+        pending = async_utils.submit(lambda: 'never')
+        assert blocker.started.wait(5)
+        async_utils.shutdown_executor()
+        assert pending.cancelled() and blocker.stop.is_set()
+        assert running.done()
+
+    def test_shutdown_without_cancel_futures(self):
+        # Python 3.8: ThreadPoolExecutor.shutdown() has no cancel_futures argument
+        pool = async_utils.ThreadPoolExecutor(max_workers=1)
+        release = threading.Event()
+        running = pool.submit(release.wait, 5)
+        queued = pool.submit(lambda: 'never')
+        shutdown = pool.shutdown
+        with patch.object(async_utils.sys, 'version_info', (3, 8)), \
+                patch.object(pool, 'shutdown', side_effect=lambda wait=True: shutdown(wait=wait)):
+            async_utils._shutdown_pool(pool, wait=False, cancel=True)
+        release.set()
+        assert queued.cancelled() and running.result(5) is True
+
+
+class TestWrappers:
+    """Test the Sholl, loader, snapshot and chart wrappers."""
+
+    def test_sholl(self):
+        events = []
+        assert async_utils.sholl_async(FakeParser(), progress=events.append).result(timeout=5) == 'profile'
+        assert [e['event'] for e in events] == ['started', 'finished']
+        with pytest.raises(RuntimeError):
+            async_utils.sholl_async(FakeParser(success=False)).result(timeout=5)
+
+    def test_loader_and_snapshot(self):
+        class Loader:
+            def getTree(self, compartment):
+                return f"tree:{compartment}"
+
+        class Viewer:
+            def snapshot(self):
+                return 'imp'
+        task = async_utils.load_tree_async(Loader(), 'axon')
+        assert task.result(timeout=5) == 'tree:axon' and task.name == 'Loader.getTree'
+        assert async_utils.snapshot_async(Viewer()).result(timeout=5) == 'imp'
+
+    def test_export_chart(self, tmp_path):
+        output = tmp_path / 'chart.svg'
+        with patch('pysnt.export._save_snt_chart') as save:
+            assert async_utils.export_chart_async('chart', output, dpi=150).result(timeout=5) == str(output)
+        save.assert_called_once_with('chart', str(output), 'svg', 150)
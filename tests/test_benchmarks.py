@@ -0,0 +1,155 @@
+"""
+Tests for the benchmark harness in benchmarks/ (registry, timing and comparison).
+
+These tests do not require SNT/Java initialization.
+"""
+
+import json
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, 'src')
+sys.path.insert(0, '.')
+
+from benchmarks import bench_tracing, synthetic
+from benchmarks.harness import (
+    Benchmark,
+    compare_results,
+    missing_requirement,
+    run_benchmarks,
+    save_results,
+    time_callable,
+)
+
+
+def _results(*records):
+    return {'results': [dict(name=name, params=params, median=median) for name, params, median in records]}
+
+
+class TestHarness:
+    """Test timing, requirements and result files."""
+
+    def test_time_callable(self):
+        calls = []
+        timing = time_callable(lambda: calls.append(1), repeat=3)
+        assert timing['repeat'] == 3
+        assert timing['number'] > 1
+        assert timing['min'] <= timing['median'] <= max(timing['mean'], timing['median'])
+        assert len(calls) > timing['number'] * 3  # warm-up, calibration rounds and samples
+
+    def test_one_shot_and_self_timed(self):
+        assert time_callable(lambda: None, repeat=5, one_shot=True)['repeat'] == 1
+        assert time_callable(lambda: 2.0, repeat=3, self_timed=True)['median'] == 2.0
+
+    def test_self_timed_metrics(self):
+        samples = iter([{'seconds': 1.0, 'nodes': 10}, {'seconds': 3.0, 'nodes': 30}, {'seconds': 2.0, 'nodes': 50}])
+        timing = time_callable(lambda: next(samples), repeat=3, self_timed=True)
+        assert timing['median'] == 2.0 and timing['metrics'] == {'nodes': 30.0}
+
+    def test_requirements(self):
+        assert missing_requirement(['json']) is None
+        assert 'not installed' in missing_requirement(['no_such_module_xyz'])
+        assert 'disabled' in missing_requirement(['java'], java=False)
+
+    def test_run_and_save(self, tmp_path):
+        benches = [
+            Benchmark(lambda n: (lambda: sum(range(n))), 'sum', {'n': (10, 100, 1000)}, (), 2, False, False),
+            Benchmark(lambda: None, 'java_only', {}, ('java',), None, False, False),
+            Benchmark(lambda: 1 / 0, 'broken', {}, (), None, False, False),
+        ]
+        results = run_benchmarks(benches, repeat=2, quick=True)
+        assert [r['params'] for r in results[:2]] == [{'n': 10}, {'n': 100}]
+        assert 'skipped' in results[2] and 'ZeroDivisionError' in results[3]['error']
+
+        document = save_results(results, tmp_path / 'out.json', java=False, quick=True)
+        assert json.loads((tmp_path / 'out.json').read_text())['results'] == json.loads(
+            json.dumps(document['results']))
+        assert document['environment']['versions']['numpy']
+
+
+class TestCompare:
+    """Test regression detection."""
+
+    def test_statuses(self):
+        baseline = _results(('a', {}, 1.0), ('b', {'n': 1}, 1.0), ('c', {}, 1.0), ('gone', {}, 1.0))
+        current = _results(('a', {}, 1.5), ('b', {'n': 1}, 0.5), ('c', {}, 1.1), ('new', {}, 1.0))
+        rows = {row['name']: row for row in compare_results(baseline, current, threshold=1.25)}
+        assert set(rows) == {'a', 'b', 'c'}
+        assert rows['a']['status'] == 'regression'
+        assert rows['b']['status'] == 'improvement'
+        assert rows['c']['status'] == 'unchanged'
+
+    def test_metrics(self):
+        def results(**values):
+            return {'results': [dict(name=name, params={}, median=1.0, metrics={'nodes_per_second': value,
+                                                                                 'max_error': value})
+                                for name, value in values.items()]}
+        baseline, current = results(a=100.0, b=100.0), results(a=50.0, b=200.0)
+        rows = {row['name']: row for row in compare_results(baseline, current, metric='nodes_per_second')}
+        assert rows['a']['status'] == 'regression' and rows['b']['status'] == 'improvement'
+        rows = {row['name']: row for row in compare_results(baseline, current, metric='max_error')}
+        assert rows['a']['status'] == 'improvement' and rows['b']['status'] == 'regression'
+        assert compare_results(baseline, current, metric='missing') == []
+
+    def test_params_distinguish_cases(self):
+        rows = compare_results(_results(('a', {'n': 1}, 1.0)), _results(('a', {'n': 2}, 1.0)))
+        assert rows == []
+
+
+class TestSynthetic:
+    """Test the synthetic data generators."""
+
+    def test_swc_table_is_a_connected_tree(self):
+        table = synthetic.swc_table(500)
+        ids, parents = table[:, 0], table[:, 6]
+        assert parents[0] == -1
+        assert (parents[1:] < ids[1:]).all() and (parents[1:] >= 1).all()
+        assert (synthetic.swc_table(500) == table).all()
+
+    def test_graph_matches_tree(self):
+        tree = synthetic.Tree(200)
+        graph = synthetic.DirectedWeightedGraph(tree)
+        assert len(graph.vertexSet()) == 200 and len(graph.edgeSet()) == 199
+
+    def test_tubular_volume(self):
+        volume, centerline = synthetic.tubular_volume((16, 48, 64), radius=1.5, noise=0.1)
+        assert volume.shape == (16, 48, 64) and volume.dtype == np.float32
+        assert 0 <= volume.min() and volume.max() <= 255
+        x, y, z = np.rint(centerline).astype(int).T
+        assert volume[z, y, x].mean() > 3 * volume.mean()
+        assert np.allclose(np.linalg.norm(np.diff(centerline, axis=0), axis=1), 0.5, atol=0.05)
+        again, _ = synthetic.tubular_volume((16, 48, 64), radius=1.5, noise=0.1)
+        assert (again == volume).all()
+
+    def test_tubular_image_2d(self):
+        volume, centerline = synthetic.tubular_volume((40, 40))
+        assert volume.shape == (40, 40) and (centerline[:, 2] == 0).all()
+        with pytest.raises(ValueError, match='too small'):
+            synthetic.tubular_volume((10, 10), radius=3)
+
+
+class TestTracingMetrics:
+    """Test the path accuracy and throughput measurements of the tracing benchmarks."""
+
+    def test_path_accuracy(self):
+        centerline = np.column_stack((np.arange(0, 20, 0.5), np.zeros(40), np.zeros(40)))
+        exact = bench_tracing.path_accuracy(centerline[::2], centerline)
+        assert exact == {'mean_error': 0.0, 'max_error': 0.0, 'coverage': 1.0}
+        half = np.column_stack((np.arange(10.0), np.ones(10), np.zeros(10)))
+        accuracy = bench_tracing.path_accuracy(half, centerline, tolerance=1.5)
+        assert accuracy['mean_error'] == pytest.approx(1.0) and accuracy['coverage'] == pytest.approx(21 / 40)
+        assert bench_tracing.path_accuracy(np.empty((0, 3)), centerline)['coverage'] == 0.0
+
+    def test_trace_metrics(self):
+        centerline = np.column_stack((np.arange(0, 3, 0.5), np.zeros(6), np.zeros(6)))
+        nodes = [SimpleNamespace(x=float(x), y=0.0, z=0.0) for x in range(3)]
+        path = SimpleNamespace(getNodes=lambda: nodes)
+        tracer = SimpleNamespace(getResult=lambda: path, pointsConsideredInSearch=lambda: 500)
+        metrics = bench_tracing.trace_metrics(tracer, centerline, seconds=0.5)
+        assert metrics['nodes_per_second'] == 1000 and metrics['found'] == 1.0
+        assert metrics['max_error'] == 0.0
+        failed = bench_tracing.trace_metrics(SimpleNamespace(getResult=lambda: None), centerline, seconds=1.0)
+        assert failed['found'] == 0.0 and np.isnan(failed['nodes_per_second'])
@@ -0,0 +1,132 @@
+"""
+Tests for Class Data Sharing archives (pysnt.cds) and their use by initialize().
+
+These tests do not require SNT/Java initialization: the Fiji installation is a
+directory of fake jars and the recording process is mocked.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+import pysnt
+from pysnt import cds, core
+
+
+@pytest.fixture
+def fiji(tmp_path):
+    root = tmp_path / 'Fiji.app'
+    (root / 'jars').mkdir(parents=True)
+    (root / 'plugins').mkdir()
+    (root / 'jars' / 'imagej.jar').write_bytes(b'ij')
+    (root / 'plugins' / 'SNT.jar').write_bytes(b'snt')
+    return root
+
+
+@pytest.fixture
+def cds_dir(tmp_path):
+    return str(tmp_path / 'cds')
+
+
+def _fake_record(returncode=0, write=True):
+    """Fake subprocess.run for the recording process, writing the archive it is given."""
+    def run(cmd, **kwargs):
+        if write:
+            Path(cmd[3]).write_bytes(b'archive')
+        return subprocess.CompletedProcess(cmd, returncode, stdout='', stderr='java.lang.Error: boom')
+    return run
+
+
+def _build(fiji, cds_dir, **kwargs):
+    with patch.object(cds.subprocess, 'run', side_effect=_fake_record(**kwargs)) as run, \
+            patch('pysnt.jvm_profiles._detect_java_version', return_value=21):
+        manifest = cds.build_cds_archive(str(fiji), cds_dir)
+    return manifest, run
+
+
+class TestFingerprint:
+    """Test the classpath fingerprint."""
+
+    def test_changes_with_classpath(self, fiji):
+        before = cds.classpath_fingerprint(str(fiji))
+        assert cds.classpath_fingerprint(str(fiji)) == before
+        (fiji / 'jars' / 'extra.jar').write_bytes(b'x')
+        assert cds.classpath_fingerprint(str(fiji)) != before
+
+    def test_ignores_non_jars(self, fiji):
+        before = cds.classpath_fingerprint(str(fiji))
+        (fiji / 'plugins' / 'notes.txt').write_text('not on the classpath')
+        assert cds.classpath_fingerprint(str(fiji)) == before
+
+
+class TestBuild:
+    """Test recording archives and their manifests."""
+
+    def test_build_writes_manifest(self, fiji, cds_dir):
+        manifest, run = _build(fiji, cds_dir)
+        cmd = run.call_args.args[0]
+        assert cmd[0] == sys.executable and cmd[4:] == [str(fiji), '1']
+        assert manifest['jar_count'] == 2 and manifest['java_version'] == 21
+        assert manifest['archive_size'] == len(b'archive')
+        assert Path(manifest['archive']).is_file()
+        assert cds.read_manifest(str(fiji), cds_dir)['fingerprint'] == cds.classpath_fingerprint(str(fiji))
+        assert not list(Path(manifest['archive']).parent.glob('*.partial'))
+
+    def test_failed_recording_keeps_previous_archive(self, fiji, cds_dir):
+        manifest, _ = _build(fiji, cds_dir)
+        with pytest.raises(RuntimeError, match='boom'):
+            _build(fiji, cds_dir, returncode=1, write=False)
+        assert cds.find_cds_archive(str(fiji), cds_dir) == Path(manifest['archive'])
+
+    def test_requires_java_13(self, fiji, cds_dir):
+        with patch('pysnt.jvm_profiles._detect_java_version', return_value=11):
+            with pytest.raises(RuntimeError, match='Java 13'):
+                cds.build_cds_archive(str(fiji), cds_dir)
+
+    def test_requires_fiji(self, tmp_path, cds_dir):
+        with pytest.raises(pysnt.FijiNotFoundError):
+            cds.build_cds_archive(str(tmp_path / 'missing'), cds_dir)
+
+
+class TestLookup:
+    """Test archive validation and the JVM arguments passed by initialize()."""
+
+    def test_no_archive(self, fiji, cds_dir):
+        assert cds.find_cds_archive(str(fiji), cds_dir) is None
+        assert cds.cds_jvm_args(str(fiji), cds_dir=cds_dir) == []
+
+    def test_valid_archive(self, fiji, cds_dir):
+        manifest, _ = _build(fiji, cds_dir)
+        assert cds.cds_jvm_args(str(fiji), cds_dir=cds_dir) == [
+            f"-XX:SharedArchiveFile={manifest['archive']}", '-Xshare:auto']
+
+    def test_stale_archive_ignored(self, fiji, cds_dir, caplog):
+        _build(fiji, cds_dir)
+        jar = fiji / 'plugins' / 'SNT.jar'
+        jar.write_bytes(b'updated snt')
+        os.utime(jar, ns=(0, 0))
+        assert cds.find_cds_archive(str(fiji), cds_dir) is None
+        assert '--build-cds' in caplog.text
+
+    def test_user_cds_flags_take_precedence(self, fiji, cds_dir):
+        _build(fiji, cds_dir)
+        assert cds.cds_jvm_args(str(fiji), ['-Xshare:off'], cds_dir) == []
+
+    def test_initialize_uses_archive(self, fiji, cds_dir):
+        with patch.object(cds, 'find_cds_archive', return_value=Path('/tmp/snt.jsa')):
+            assert core._cds_jvm_args(str(fiji), ['-Xmx2g']) == ['-XX:SharedArchiveFile=/tmp/snt.jsa',
+                                                                  '-Xshare:auto']
+            with pysnt.option_context(**{'java.cds': False}):
+                assert core._cds_jvm_args(str(fiji), None) == []
+
+    def test_remove(self, fiji, cds_dir):
+        _build(fiji, cds_dir)
+        assert cds.remove_cds_archive(str(fiji), cds_dir)
+        assert cds.find_cds_archive(str(fiji), cds_dir) is None
+        assert not cds.remove_cds_archive(str(fiji), cds_dir)
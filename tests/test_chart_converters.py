@@ -0,0 +1,109 @@
+"""
+Tests for pysnt.converters.chart_converters module.
+
+These tests exercise the in-memory rasterization path and do not require
+SNT/Java initialization.
+"""
+
+import sys
+from io import BytesIO
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, 'src')
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from pysnt.converters import chart_converters
+from pysnt.converters.chart_converters import (
+    _convert_snt_chart,
+    _load_figure_by_format,
+    _png_to_matplotlib,
+    _read_source_bytes,
+)
+
+
+def _png_bytes(width=8, height=4):
+    buffer = BytesIO()
+    plt.imsave(buffer, np.zeros((height, width, 3)), format='png')
+    return buffer.getvalue()
+
+
+class TestReadSourceBytes:
+    """Test source normalization for rasterizers."""
+
+    def test_bytes_and_file_like(self):
+        assert _read_source_bytes(b'abc') == b'abc'
+        assert _read_source_bytes(BytesIO(b'abc')) == b'abc'
+
+    def test_path(self, tmp_path):
+        path = tmp_path / 'chart.svg'
+        path.write_bytes(b'<svg/>')
+        assert _read_source_bytes(str(path)) == b'<svg/>'
+
+
+class TestInMemoryRasterization:
+    """Test that rasterizers accept in-memory sources."""
+
+    def test_png_from_bytes(self):
+        fig = _png_to_matplotlib(_png_bytes())
+        image = fig.axes[0].get_images()[0].get_array()
+        assert image.shape[:2] == (4, 8)
+        plt.close(fig)
+
+    def test_pdf_from_bytes(self):
+        fitz = pytest.importorskip('fitz')
+        doc = fitz.open()
+        doc.new_page(width=72, height=36)
+        pdf_bytes = doc.tobytes()
+        doc.close()
+        fig = _load_figure_by_format(pdf_bytes, 'pdf')
+        image = fig.axes[0].get_images()[0].get_array()
+        assert image.shape[1] > image.shape[0]
+        plt.close(fig)
+
+
+class TestConvertSntChartInMemory:
+    """Test the in-memory dispatch of _convert_snt_chart."""
+
+    def _mock_chart(self, combined=False):
+        chart = Mock()
+        chart.isCombined.return_value = combined
+        chart.getTitle.return_value = 'Test chart'
+        return chart
+
+    def test_single_chart_in_memory(self):
+        chart = self._mock_chart()
+        with patch.object(chart_converters, '_export_chart_bytes', return_value=_png_bytes()), \
+                patch.object(chart_converters, '_convert_single_snt_chart') as file_export:
+            result = _convert_snt_chart(chart, format='png', in_memory=True)
+        file_export.assert_not_called()
+        assert result['error'] is None
+        assert result['metadata']['in_memory'] is True
+        plt.close(result['data'])
+
+    def test_combined_chart_in_memory(self):
+        chart = self._mock_chart(combined=True)
+        panels = [Mock() for _ in range(3)]
+        with patch.object(chart_converters, '_collect_chart_panels', return_value=panels), \
+                patch.object(chart_converters, '_export_chart_bytes', return_value=_png_bytes()), \
+                patch.object(chart_converters, '_convert_combined_snt_chart') as file_export:
+            result = _convert_snt_chart(chart, format='png', in_memory=True, max_panels=2)
+        file_export.assert_not_called()
+        visible_axes = [ax for ax in result['data'].axes if ax.get_visible()]
+        assert len(visible_axes) == 2
+        plt.close(result['data'])
+
+    def test_falls_back_to_file_export(self):
+        chart = self._mock_chart()
+        fallback_fig = plt.figure()
+        with patch.object(chart_converters, '_export_chart_bytes', side_effect=RuntimeError('no stream')), \
+                patch.object(chart_converters, '_convert_single_snt_chart', return_value=fallback_fig):
+            result = _convert_snt_chart(chart, format='png', in_memory=True)
+        assert result['data'] is fallback_fig
+        assert result['metadata']['in_memory'] is False
+        plt.close(fallback_fig)
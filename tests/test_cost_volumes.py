@@ -0,0 +1,66 @@
+"""
+Tests for precomputed cost volumes (pysnt.tracing.cost_volumes).
+
+These tests do not require SNT/Java initialization: the Java transfer and cost
+class are faked.
+"""
+
+import sys
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, 'src')
+
+import pysnt
+from pysnt.tracing import cost_volumes as cv
+
+
+@pytest.fixture
+def fake_java():
+    transfers = []
+
+    def to_java(costs, copy):
+        transfers.append((costs, copy))
+        return 'image'
+
+    with patch.object(cv, '_to_java', side_effect=to_java), \
+            patch.object(cv, 'precomputed_cost', side_effect=lambda minimum: ('cost', minimum)):
+        yield transfers
+
+
+class TestCostVolume:
+    """Test validation and preparation of cost volumes."""
+
+    def test_prepares_image_and_cost(self, fake_java):
+        costs = np.full((4, 5, 6), 2.0)
+        costs[1, 2, 3] = 0.5
+        image, cost = cv.cost_volume(costs)
+        assert image == 'image' and cost == ('cost', 0.5)
+        shared, copy = fake_java[0]
+        assert shared.dtype == np.float32 and shared.flags['C_CONTIGUOUS'] and not copy
+        assert cv.cost_volume(costs, min_cost=0.25, copy=True)[1] == ('cost', 0.25)
+        assert fake_java[1][1]
+
+    def test_no_copy_for_float32_arrays(self, fake_java):
+        costs = np.ones((3, 3), dtype=np.float32)
+        cv.cost_volume(costs)
+        assert fake_java[0][0] is costs
+
+    def test_validation(self, fake_java):
+        with pytest.raises(ValueError, match='positive'):
+            cv.cost_volume(np.zeros((2, 2)))
+        with pytest.raises(ValueError, match='positive'):
+            cv.cost_volume(np.array([[1.0, np.inf]]))
+        with pytest.raises(ValueError, match='min_cost'):
+            cv.cost_volume(np.ones((2, 2)), min_cost=2)
+        with pytest.raises(ValueError, match='2D'):
+            cv.cost_volume(np.ones(3))
+
+    def test_probability_cost(self):
+        costs = cv.probability_cost(np.array([[1.0, 0.5, 0.0]]))
+        assert costs.dtype == np.float32 and (costs > 0).all()
+        assert costs[0, 0] < costs[0, 1] < costs[0, 2]
+        np.testing.assert_allclose(costs[0, 1], np.log(2) + 1e-6, rtol=1e-6)
+        assert pysnt.tracing.cost_volume is cv.cost_volume
@@ -0,0 +1,142 @@
+"""
+Tests for JVM heap and GC telemetry in pysnt.diagnostics.
+
+These tests do not require SNT/Java initialization: the management beans are faked.
+"""
+
+import sys
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+import pysnt
+from pysnt import diagnostics
+
+_GB = 1024 ** 3
+
+
+def _usage(used, committed, maximum):
+    return SimpleNamespace(getUsed=lambda: used, getCommitted=lambda: committed, getMax=lambda: maximum)
+
+
+def _collector(name, count, time_ms):
+    return SimpleNamespace(getName=lambda: name, getCollectionCount=lambda: count,
+                           getCollectionTime=lambda: time_ms)
+
+
+def _factory(heap_used=2 * _GB, heap_max=8 * _GB):
+    memory = SimpleNamespace(getHeapMemoryUsage=lambda: _usage(heap_used, 4 * _GB, heap_max),
+                             getNonHeapMemoryUsage=lambda: _usage(100 * 1024 ** 2, 120 * 1024 ** 2, -1))
+    return SimpleNamespace(
+        getMemoryMXBean=lambda: memory,
+        getGarbageCollectorMXBeans=lambda: [_collector('G1 Young Generation', 12, 250),
+                                            _collector('G1 Old Generation', 1, 80)],
+        getRuntimeMXBean=lambda: SimpleNamespace(getUptime=lambda: 42_000),
+    )
+
+
+def _sampler(fractions):
+    """Sampler returning snapshots with the given heap fractions in turn."""
+    values = iter(fractions)
+
+    def sample():
+        fraction = next(values)
+        return {'heap_used': int(fraction * 8 * _GB), 'heap_committed': 8 * _GB, 'heap_max': 8 * _GB,
+                'heap_fraction': fraction, 'non_heap_used': 0, 'non_heap_committed': 0}
+    return sample
+
+
+@pytest.fixture(autouse=True)
+def _clean_state():
+    yield
+    diagnostics.stop_heap_monitor()
+    diagnostics._heap_warning_callbacks.clear()
+    for key in ('diagnostics.monitor', 'diagnostics.monitor_interval', 'diagnostics.monitor_log',
+                'diagnostics.heap_warning_threshold'):
+        pysnt.reset_option(key)
+
+
+class TestSnapshots:
+    """Test sampling through the management beans."""
+
+    def test_jvm_snapshot(self):
+        with patch.object(diagnostics, '_management_factory', return_value=_factory()):
+            snapshot = diagnostics.jvm_snapshot()
+        assert snapshot['heap_fraction'] == pytest.approx(0.25)
+        assert snapshot['gc_count'] == 13 and snapshot['gc_time_ms'] == 330
+        assert snapshot['uptime_s'] == 42.0
+        assert [c['name'] for c in snapshot['gc']] == ['G1 Young Generation', 'G1 Old Generation']
+        text = diagnostics.format_snapshot(snapshot)
+        assert '2048/8192 MB (25%)' in text and 'GC 13 collections in 330 ms' in text
+
+    def test_undefined_max_heap_uses_committed(self):
+        with patch.object(diagnostics, '_management_factory', return_value=_factory(heap_max=-1)):
+            assert diagnostics.jvm_memory()['heap_fraction'] == pytest.approx(0.5)
+
+    def test_requires_jvm(self):
+        with patch.object(diagnostics, '_jvm_running', return_value=False):
+            with pytest.raises(RuntimeError):
+                diagnostics.jvm_memory()
+            with pytest.raises(RuntimeError):
+                diagnostics.start_heap_monitor()
+
+
+class TestHeapMonitor:
+    """Test threshold warnings and the background thread."""
+
+    def test_warns_once_per_crossing(self):
+        calls = []
+        diagnostics.add_heap_warning_callback(calls.append)
+        monitor = diagnostics.HeapMonitor(threshold=0.8, log=False,
+                                          sampler=_sampler([0.5, 0.85, 0.95, 0.78, 0.9, 0.7, 0.9]))
+        for _ in range(7):
+            monitor.sample()
+        # 0.78 is within the hysteresis band, so only 0.7 re-arms the warning
+        assert [c['heap_fraction'] for c in calls] == [0.85, 0.9]
+        assert monitor.warnings == 2 and monitor.samples == 7
+        assert monitor.peak_heap_fraction == 0.95
+
+    def test_failing_callback_does_not_stop_monitor(self):
+        diagnostics.add_heap_warning_callback(lambda snapshot: 1 / 0)
+        monitor = diagnostics.HeapMonitor(threshold=0.5, log=False, sampler=_sampler([0.9]))
+        assert monitor.sample()['heap_fraction'] == 0.9
+
+    def test_threshold_from_options(self):
+        monitor = diagnostics.HeapMonitor(log=False, sampler=_sampler([0.75]))
+        pysnt.set_option('diagnostics.heap_warning_threshold', 0.7)
+        monitor.sample()
+        assert monitor.warnings == 1
+
+    def test_background_thread(self):
+        with patch.object(diagnostics, '_jvm_running', return_value=True), \
+                patch.object(diagnostics, '_management_factory', return_value=_factory()):
+            monitor = diagnostics.start_heap_monitor(interval=0.01, log=False)
+            assert diagnostics.start_heap_monitor() is monitor
+            deadline = time.time() + 5
+            while monitor.samples < 3 and time.time() < deadline:
+                time.sleep(0.01)
+            assert diagnostics.get_heap_monitor() is monitor
+            assert diagnostics.stop_heap_monitor() is monitor
+        assert monitor.samples >= 3 and not monitor.running
+        assert diagnostics.get_heap_monitor() is None
+
+    def test_monitor_option(self):
+        with patch.object(diagnostics, '_jvm_running', return_value=True), \
+                patch.object(diagnostics, '_management_factory', return_value=_factory()):
+            pysnt.set_option('diagnostics.monitor_log', False)
+            pysnt.set_option('diagnostics.monitor', True)
+            assert diagnostics.get_heap_monitor() is not None
+            pysnt.set_option('diagnostics.monitor', False)
+            assert diagnostics.get_heap_monitor() is None
+
+    def test_option_validation(self):
+        with pytest.raises(ValueError):
+            pysnt.set_option('diagnostics.heap_warning_threshold', 1.5)
+        with pytest.raises(ValueError):
+            pysnt.set_option('diagnostics.monitor_interval', 0)
+        with pytest.raises(TypeError):
+            diagnostics.add_heap_warning_callback('not callable')
@@ -0,0 +1,82 @@
+"""
+Tests for pysnt.display.core list conversion helpers.
+
+These tests do not require SNT/Java initialization.
+"""
+
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+import matplotlib
+matplotlib.use('Agg')
+
+import pysnt
+from pysnt.display.core import (
+    _convert_objects_to_figures,
+    _resolve_conversion_workers,
+    _run_conversion_pool,
+)
+
+
+class TestConversionPool:
+    """Test the bounded, order-preserving conversion pool."""
+
+    def test_preserves_order(self):
+        def slow_square(x):
+            time.sleep(0.01 * (5 - x))
+            return x * x
+
+        results = _run_conversion_pool(slow_square, list(range(5)), max_workers=4)
+        assert [value for value, _ in results] == [0, 1, 4, 9, 16]
+        assert all(error is None for _, error in results)
+
+    def test_captures_errors_per_item(self):
+        def fail_on_two(x):
+            if x == 2:
+                raise ValueError("bad item")
+            return x
+
+        results = _run_conversion_pool(fail_on_two, [1, 2, 3], max_workers=3)
+        assert results[0] == (1, None)
+        assert results[1][0] is None and isinstance(results[1][1], ValueError)
+        assert results[2] == (3, None)
+
+
+class TestResolveConversionWorkers:
+    """Test worker count resolution."""
+
+    def setup_method(self):
+        pysnt.reset_option('display.conversion_workers')
+
+    def test_bounded_by_item_count(self):
+        assert _resolve_conversion_workers(2) == 2
+        assert _resolve_conversion_workers(1, max_workers=8) == 1
+
+    def test_uses_option(self):
+        pysnt.set_option('display.conversion_workers', 3)
+        assert _resolve_conversion_workers(10) == 3
+        pysnt.reset_option('display.conversion_workers')
+
+    def test_invalid_option(self):
+        with pytest.raises(ValueError):
+            pysnt.set_option('display.conversion_workers', 0)
+
+
+class TestConvertObjectsToFigures:
+    """Test parallel conversion of object lists."""
+
+    def test_order_and_failures(self):
+        def converter(obj, **kwargs):
+            if obj == 'bad':
+                return {'data': None, 'error': RuntimeError('failed')}
+            return {'data': f"figure-{obj}", 'error': None}
+
+        figures, titles = _convert_objects_to_figures(
+            ['a', 'bad', 'c', 'd'], converter, 'Item', max_workers=4,
+            panel_titles=['A', 'B', 'C', 'D'])
+        assert figures == ['figure-a', 'figure-c', 'figure-d']
+        assert titles == ['A', 'C', 'D']
@@ -0,0 +1,76 @@
+"""
+Tests for pysnt.export (batch figure export).
+
+These tests use matplotlib figures only and do not require SNT/Java initialization.
+"""
+
+import json
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+import pysnt
+from pysnt.export import MANIFEST_FILENAME, _safe_stem
+
+
+def _figure(label):
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, 1])
+    fig.suptitle(label)
+    return fig
+
+
+class TestExportFigures:
+    """Test export_figures() with in-memory figures."""
+
+    def test_exports_and_writes_manifest(self, tmp_path):
+        figures = [_figure('a'), _figure('b'), _figure('c')]
+        manifest = pysnt.export_figures(figures, tmp_path, format='png', dpi=50, max_workers=2)
+
+        assert manifest['counts'] == {'exported': 3, 'skipped': 0, 'error': 0}
+        outputs = [item['output'] for item in manifest['items']]
+        assert len(set(outputs)) == 3
+        assert all(os.path.getsize(output) > 0 for output in outputs)
+        assert [item['index'] for item in manifest['items']] == [0, 1, 2]
+        assert all(item['seconds'] >= 0 for item in manifest['items'])
+
+        with open(tmp_path / MANIFEST_FILENAME) as f:
+            assert json.load(f)['counts'] == manifest['counts']
+
+    def test_records_errors(self, tmp_path):
+        manifest = pysnt.export_figures([_figure('ok'), object()], tmp_path, format='svg', manifest=False)
+        statuses = [item['status'] for item in manifest['items']]
+        assert statuses == ['exported', 'error']
+        assert manifest['items'][1]['error']
+        assert not (tmp_path / MANIFEST_FILENAME).exists()
+
+    def test_skips_up_to_date_file_outputs(self, tmp_path):
+        source = tmp_path / 'cell.swc'
+        source.write_text('1 1 0 0 0 1 -1\n')
+        out_dir = tmp_path / 'out'
+        out_dir.mkdir()
+        output = out_dir / 'cell.png'
+        output.write_bytes(b'existing')
+        later = time.time() + 10
+        os.utime(output, (later, later))
+
+        manifest = pysnt.export_figures([str(source)], out_dir)
+        assert manifest['items'][0]['status'] == 'skipped'
+        assert output.read_bytes() == b'existing'
+
+    def test_invalid_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            pysnt.export_figures([_figure('a')], tmp_path, format='tiff')
+
+
+def test_safe_stem():
+    assert _safe_stem('My cell: #1') == 'My_cell_1'
+    assert _safe_stem('///') == 'figure'
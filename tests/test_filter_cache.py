@@ -0,0 +1,193 @@
+"""
+Tests for the persistent filter cache (pysnt.filter.cached_filter).
+
+These tests do not require SNT/Java initialization: the source image, filter ops
+and N5 store are faked.
+"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+import pysnt
+from pysnt.filter import cache
+
+
+class FakeImage:
+    def __init__(self, *shape):
+        self.shape = shape
+
+    def numDimensions(self):
+        return len(self.shape)
+
+    def dimension(self, d):
+        return self.shape[d]
+
+
+@pytest.fixture
+def fakes(tmp_path):
+    state = SimpleNamespace(written=[], threads=set(), fail_at=None, datasets=0, cache_dir=str(tmp_path),
+                            stack_max=255.0)
+    lock = threading.Lock()
+
+    def write_block(source, op, store, position, block_min, block_max, margin):
+        if state.fail_at == tuple(position):
+            raise RuntimeError('out of memory')
+        with lock:
+            state.written.append((tuple(position), list(block_min), list(block_max), list(margin)))
+            state.threads.add(threading.get_ident())
+
+    def create_dataset(store, shape, block_size):
+        state.datasets += 1
+
+    with patch.object(cache, '_as_source', side_effect=lambda image: (image, [1.0, 1.0, 2.0])), \
+            patch.object(cache, '_open_store', return_value='store'), \
+            patch.object(cache, '_create_dataset', side_effect=create_dataset), \
+            patch.object(cache, '_filter_factory', return_value=lambda: 'op') as filter_factory, \
+            patch.object(cache, '_stack_max', side_effect=lambda source: state.stack_max) as stack_max, \
+            patch.object(cache, '_write_block', side_effect=write_block), \
+            patch.object(cache, '_open_dataset', side_effect=lambda store, roi_min: ('lazy', tuple(roi_min))):
+        state.filter_factory, state.stack_max_calls = filter_factory, stack_max
+        yield state
+
+
+def run(fakes, image=None, **kwargs):
+    kwargs.setdefault('source_id', 'volume-1')
+    kwargs.setdefault('block_size', 4)
+    return cache.cached_filter(image or FakeImage(10, 8, 4), cache_dir=fakes.cache_dir, **kwargs)
+
+
+class TestCachedFilter:
+    """Test chunked computation and reuse of cached blocks."""
+
+    def test_computes_all_blocks_then_reuses_them(self, fakes, caplog):
+        assert run(fakes, scales=[1.0, 2.0], workers=3) == ('lazy', (0, 0, 0))
+        assert len(fakes.written) == 3 * 2 * 1 and fakes.datasets == 1
+        last = [w for w in fakes.written if w[0] == (2, 1, 0)][0]
+        assert list(last[1:]) == [[8, 4, 0], [10, 8, 4], [6, 6, 3]]  # edge block clipped; margin = 3 * 2 / spacing
+
+        fakes.written.clear()
+        caplog.set_level('INFO')
+        run(fakes, scales=[1.0, 2.0])
+        assert fakes.written == [] and 'cache hit' in caplog.text
+
+    def test_key_depends_on_parameters(self, fakes):
+        run(fakes)
+        key = cache.cache_key('volume-1', 'tubeness', [1.0], [1.0, 1.0, 2.0])
+        for kwargs in ({'scales': [2.0]}, {'filter': 'frangi'}, {'spacing': [1, 1, 1]},
+                       {'source_id': 'volume-2'}, {'roi': ((0, 0, 0), (4, 4, 4))}):
+            fakes.written.clear()
+            run(fakes, **kwargs)
+            assert fakes.written
+        assert len(list(Path(fakes.cache_dir).glob('*.n5'))) == 6
+        assert (Path(fakes.cache_dir) / f"{key}.n5").is_dir()
+
+    def test_frangi_normalized_by_source_maximum(self, fakes):
+        run(fakes, filter='frangi')
+        assert fakes.filter_factory.call_args.args[3] == 255.0
+        entry = next(Path(fakes.cache_dir).glob('*.n5'))
+        assert json.loads((entry / cache.MANIFEST_NAME).read_text())['stack_max'] == 255.0
+        # A different maximum yields a different cache entry
+        fakes.written.clear()
+        run(fakes, filter='frangi', stack_max=4095.0)
+        assert fakes.written and len(list(Path(fakes.cache_dir).glob('*.n5'))) == 2
+        run(fakes, source_id='volume-2')
+        assert fakes.filter_factory.call_args.args[3] is None  # Tubeness does not normalize
+
+    def test_source_maximum_computed_once(self, fakes, caplog):
+        run(fakes, filter='frangi')
+        assert fakes.stack_max_calls.call_count == 1
+        # Cache hits and other parameters of the same source reuse the remembered maximum
+        caplog.set_level('INFO')
+        run(fakes, filter='frangi')
+        run(fakes, filter='frangi', scales=[2.0])
+        assert fakes.stack_max_calls.call_count == 1 and 'cache hit' in caplog.text
+        # An explicit maximum is used as is
+        run(fakes, filter='frangi', source_id='volume-2', stack_max=100.0)
+        assert fakes.stack_max_calls.call_count == 1 and fakes.filter_factory.call_args.args[3] == 100.0
+        assert cache.clear_filter_cache(fakes.cache_dir) == 3
+        assert not (Path(fakes.cache_dir) / cache.MAXIMA_NAME).exists()
+
+    def test_roi_in_source_coordinates(self, fakes):
+        assert run(fakes, roi=((2, 2, 0), (10, 6, 4))) == ('lazy', (2, 2, 0))
+        assert sorted(w[1] for w in fakes.written) == [[2, 2, 0], [6, 2, 0]]
+        with pytest.raises(ValueError, match='Invalid ROI'):
+            run(fakes, roi=((0, 0, 0), (11, 8, 4)))
+
+    def test_resumes_after_failure(self, fakes):
+        fakes.fail_at = (1, 1, 0)
+        with pytest.raises(RuntimeError, match='out of memory'):
+            run(fakes, workers=1)
+        computed = {w[0] for w in fakes.written}
+        entry = next(Path(fakes.cache_dir).glob('*.n5'))
+        manifest = json.loads((entry / cache.MANIFEST_NAME).read_text())
+        assert {tuple(p) for p in manifest['complete']} == computed
+
+        fakes.fail_at = None
+        fakes.written.clear()
+        run(fakes, workers=1)
+        assert {w[0] for w in fakes.written} == set(cache._block_grid([10, 8, 4], [4, 4, 4])) - computed
+        assert fakes.datasets == 1
+
+    def test_manifest_persisted_while_computing(self, fakes):
+        writes = []
+        write_manifest = cache._write_manifest
+        with patch.object(cache, '_MANIFEST_INTERVAL', 2), \
+                patch.object(cache, '_write_manifest',
+                             side_effect=lambda entry, manifest: (writes.append(len(manifest['complete'])),
+                                                                  write_manifest(entry, manifest))):
+            run(fakes, workers=1)
+        assert writes == [0, 2, 4, 6, 6]  # created, every 2 blocks, final
+
+    def test_workers_and_block_size_from_options(self, fakes):
+        pysnt.set_option('filter.cache_block_size', 5)
+        pysnt.set_option('filter.cache_workers', 2)
+        try:
+            cache.cached_filter(FakeImage(10, 8, 4), source_id='v', cache_dir=fakes.cache_dir)
+        finally:
+            pysnt.reset_option('filter.cache_block_size')
+            pysnt.reset_option('filter.cache_workers')
+        assert len(fakes.written) == 2 * 2 and len(fakes.threads) <= 2
+
+    def test_validation_and_clear(self, fakes):
+        with pytest.raises(ValueError):
+            run(fakes, filter='gaussian')
+        with pytest.raises(ValueError):
+            run(fakes, cache_format='hdf5')
+        with pytest.raises(ValueError, match='spacing'):
+            run(fakes, spacing=[1, 1])
+        with pytest.raises(ValueError, match='source_id'):
+            run(fakes, source_id=None)
+        run(fakes)
+        run(fakes, cache_format='zarr')
+        assert cache.clear_filter_cache(fakes.cache_dir) == 2
+        assert cache.clear_filter_cache(fakes.cache_dir) == 0
+
+
+class TestSourceIdentity:
+    """Test source identification from files."""
+
+    def test_file_identity_changes_with_content(self, tmp_path):
+        path = tmp_path / 'volume.tif'
+        path.write_bytes(b'1234')
+        first = cache.source_identity(str(path))
+        imp = SimpleNamespace(getOriginalFileInfo=lambda: SimpleNamespace(directory=str(tmp_path),
+                                                                          fileName='volume.tif'))
+        assert cache.source_identity(imp) == first
+        path.write_bytes(b'123456')
+        assert cache.source_identity(path) != first
+
+    def test_unidentifiable_sources(self, tmp_path):
+        with pytest.raises(ValueError):
+            cache.source_identity(SimpleNamespace(getOriginalFileInfo=lambda: None))
+        with pytest.raises(ValueError):
+            cache.source_identity(str(tmp_path / 'missing.tif'))
+        with pytest.raises(ValueError):
+            cache.source_identity(FakeImage(2, 2))
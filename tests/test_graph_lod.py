@@ -0,0 +1,114 @@
+"""
+Tests for level-of-detail graph rendering in pysnt.display.visual_display.
+
+These tests do not require SNT/Java initialization.
+"""
+
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, 'src')
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+nx = pytest.importorskip('networkx')
+
+import pysnt
+from pysnt.display.visual_display import (
+    _collapse_degree2_chains,
+    _get_default_layout_for_graph_type,
+    _graph_to_matplotlib,
+    _resolve_graph_lod,
+    _simplify_polyline,
+)
+
+
+def _spatial_tree(n_per_branch=50):
+    """Y-shaped directed tree: a trunk splitting into two long unbranched branches."""
+    graph = nx.DiGraph()
+    graph.add_node(0, x=0.0, y=0.0)
+    graph.add_node(1, x=0.0, y=1.0)
+    graph.add_edge(0, 1)
+    next_id = 2
+    for direction in (-1, 1):
+        prev = 1
+        for i in range(n_per_branch):
+            graph.add_node(next_id, x=direction * (i + 1) * 0.01, y=1.0 + (i + 1) * 0.01)
+            graph.add_edge(prev, next_id)
+            prev, next_id = next_id, next_id + 1
+    return graph
+
+
+class TestCollapseChains:
+    """Test degree-2 chain collapsing."""
+
+    def test_directed_tree(self):
+        graph = _spatial_tree(10)
+        reduced, chains = _collapse_degree2_chains(graph)
+        assert sorted(reduced.nodes()) == [0, 1, 11, 21]
+        assert reduced.number_of_edges() == 3
+        assert reduced.edges[1, 11]['weight'] == 10
+        assert chains[(1, 11)][0] == [1] + list(range(2, 12))
+
+    def test_undirected_path_and_cycle(self):
+        path = nx.path_graph(6)
+        reduced, chains = _collapse_degree2_chains(path)
+        assert sorted(reduced.nodes()) == [0, 5]
+        assert reduced.number_of_edges() == 1
+
+        cycle = nx.cycle_graph(5)
+        reduced, chains = _collapse_degree2_chains(cycle)
+        assert reduced.number_of_nodes() == 1
+        assert sum(len(c) for c in chains.values()) == 1
+
+
+class TestSimplifyPolyline:
+    """Test sub-pixel polyline simplification."""
+
+    def test_drops_points_within_a_pixel(self):
+        points = np.column_stack((np.linspace(0, 1, 101), np.zeros(101)))
+        simplified = _simplify_polyline(points, tolerance=0.1)
+        assert len(simplified) < 15
+        np.testing.assert_allclose(simplified[[0, -1]], points[[0, -1]])
+
+    def test_no_tolerance(self):
+        points = np.random.rand(5, 2)
+        assert _simplify_polyline(points, 0.0) is points
+
+
+class TestGraphLOD:
+    """Test LOD selection and rendering."""
+
+    def setup_method(self):
+        for key in ('graph.display.lod', 'graph.display.lod_threshold'):
+            pysnt.reset_option(key)
+
+    def test_auto_threshold(self):
+        graph = _spatial_tree(10)
+        assert not _resolve_graph_lod(graph)
+        pysnt.set_option('graph.display.lod_threshold', 5)
+        assert _resolve_graph_lod(graph)
+        assert not _resolve_graph_lod(graph, lod=False)
+
+    def test_invalid_option(self):
+        with pytest.raises(ValueError):
+            pysnt.set_option('graph.display.lod', 'sometimes')
+
+    def test_lod_rendering_uses_spatial_polylines(self):
+        fig = _graph_to_matplotlib(_spatial_tree(200), lod=True, graph_type='DirectedWeightedGraph')
+        ax = fig.axes[0]
+        collections = [c for c in ax.collections if type(c) is LineCollection]
+        assert len(collections) == 1
+        assert len(collections[0].get_segments()) == 3
+        assert not ax.patches  # no per-edge arrow patches
+        plt.close(fig)
+
+    def test_default_layout_lookup(self):
+        assert _get_default_layout_for_graph_type('DirectedWeightedGraph') == \
+            pysnt.get_option('graph.layout.DirectedWeightedGraph')
+        assert _get_default_layout_for_graph_type('SNTGraph') == pysnt.get_option('graph.layout.default')
@@ -0,0 +1,86 @@
+"""
+Tests for the direct ImagePlus pixel transfer in pysnt.converters.structured_data_converters.
+
+Java pixel arrays are emulated with NumPy arrays (both expose the buffer protocol).
+These tests do not require SNT/Java initialization.
+"""
+
+import sys
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, 'src')
+
+from pysnt.converters.structured_data_converters import (
+    _imageplus_pixels_to_xarray,
+    _imageplus_to_xarray,
+    _pixels_to_numpy,
+)
+
+
+def _mock_imageplus(pixels, width, height, image_type=0):
+    processor = Mock()
+    processor.getPixels.return_value = pixels
+    processor.getWidth.return_value = width
+    processor.getHeight.return_value = height
+    imp = Mock()
+    imp.getProcessor.return_value = processor
+    imp.getType.return_value = image_type
+    imp.getTitle.return_value = 'test image'
+    return imp
+
+
+class TestPixelsToNumpy:
+    """Test mapping of primitive pixel arrays."""
+
+    def test_unsigned_reinterpretation(self):
+        pixels = np.array([-1, 0, 127, -128, 1, 2], dtype=np.int8)
+        data = _pixels_to_numpy(pixels, 3, 2)
+        assert data.dtype == np.uint8
+        assert data.tolist() == [[255, 0, 127], [128, 1, 2]]
+        assert np.shares_memory(data, pixels)
+
+        shorts = np.array([-1, 1000], dtype=np.int16)
+        assert _pixels_to_numpy(shorts, 2, 1).tolist() == [[65535, 1000]]
+
+    def test_float(self):
+        pixels = np.linspace(0, 1, 6, dtype=np.float32)
+        data = _pixels_to_numpy(pixels, 2, 3)
+        assert data.dtype == np.float32 and data.shape == (3, 2)
+
+    def test_rgb_unpacking(self):
+        packed = np.array([0xFF102030, 0x00FFFFFF, 0x01020304], dtype=np.uint32).view(np.int32)
+        data = _pixels_to_numpy(packed, 3, 1, is_rgb=True)
+        assert data.dtype == np.uint8 and data.shape == (1, 3, 3)
+        assert data[0].tolist() == [[0x10, 0x20, 0x30], [0xFF, 0xFF, 0xFF], [0x02, 0x03, 0x04]]
+
+    def test_size_mismatch(self):
+        with pytest.raises(ValueError):
+            _pixels_to_numpy(np.zeros(5, dtype=np.float32), 2, 2)
+
+
+class TestImagePlusToXarray:
+    """Test DataArray construction and fallback."""
+
+    def test_grayscale(self):
+        imp = _mock_imageplus(np.arange(12, dtype=np.int16), 4, 3, image_type=1)
+        data = _imageplus_pixels_to_xarray(imp)
+        assert data.dims == ('row', 'col')
+        assert data.shape == (3, 4)
+        assert data.attrs['bytes_transferred'] == 24
+
+    def test_rgb(self):
+        imp = _mock_imageplus(np.zeros(6, dtype=np.int32), 3, 2, image_type=4)
+        data = _imageplus_pixels_to_xarray(imp)
+        assert data.dims == ('row', 'col', 'ch')
+        assert data.attrs['bytes_transferred'] == 24
+
+    def test_falls_back_to_from_java(self):
+        imp = _mock_imageplus(None, 2, 2)
+        ij = Mock()
+        ij.return_value.py.from_java.return_value = 'converted'
+        with patch('pysnt.core.ij', ij):
+            assert _imageplus_to_xarray(imp) == 'converted'
+        ij.return_value.py.from_java.assert_called_once_with(imp)
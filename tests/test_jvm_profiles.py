@@ -0,0 +1,110 @@
+"""
+Tests for workload-based JVM tuning profiles (pysnt.jvm_profiles) and their use in
+core._configure_jvm().
+
+These tests do not require SNT/Java initialization (the JVM is never started).
+"""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+import pysnt
+from pysnt import core, jvm_profiles
+
+_GB = 1024 ** 3
+
+
+@pytest.fixture
+def memory_16g():
+    with patch.object(jvm_profiles, 'available_memory', return_value=(16 * _GB, 'cgroup')):
+        yield
+
+
+class TestMemoryDetection:
+    """Test cgroup/physical memory detection and heap sizing."""
+
+    def test_cgroup_v2_limit(self, tmp_path):
+        limit_file = tmp_path / 'memory.max'
+        limit_file.write_text('4294967296\n')
+        with patch.object(jvm_profiles, '_CGROUP_LIMIT_FILES', (str(limit_file),)), \
+                patch.object(jvm_profiles, '_physical_memory', return_value=64 * _GB):
+            assert jvm_profiles.available_memory() == (4 * _GB, 'cgroup')
+
+    def test_unlimited_cgroup_falls_back_to_physical(self, tmp_path):
+        limit_file = tmp_path / 'memory.max'
+        limit_file.write_text('max\n')
+        with patch.object(jvm_profiles, '_CGROUP_LIMIT_FILES', (str(limit_file), str(tmp_path / 'missing'))), \
+                patch.object(jvm_profiles, '_physical_memory', return_value=64 * _GB):
+            assert jvm_profiles.available_memory() == (64 * _GB, 'physical')
+
+    def test_auto_heap_size(self):
+        assert jvm_profiles.auto_heap_size(0.75, 16 * _GB) == '12g'
+        assert jvm_profiles.auto_heap_size(0.5, 3 * _GB) == '1536m'
+        assert jvm_profiles.auto_heap_size(0.5, 100 * _GB, limit=31 * _GB) == '31g'
+        assert jvm_profiles.auto_heap_size(0.5, 128 * 1024 ** 2) == '256m'
+
+
+class TestResolveSettings:
+    """Test profile resolution and precedence of explicit settings."""
+
+    def test_batch_throughput(self, memory_16g):
+        settings = jvm_profiles.resolve_jvm_settings('batch-throughput')
+        assert settings['max_heap'] == settings['min_heap'] == '12g'
+        assert settings['heap_source'] == 'cgroup'
+        assert settings['options'][:3] == ['-Xmx12g', '-Xms12g', '-XX:+UseParallelGC']
+        assert '-XX:NewRatio=1' in settings['options']
+
+    def test_low_latency_collector_by_java_version(self, memory_16g):
+        zgc = jvm_profiles.resolve_jvm_settings('interactive-low-latency', java_version=21)['gc']
+        assert zgc == ['-XX:+UseZGC', '-XX:+ZGenerational']
+        assert jvm_profiles.resolve_jvm_settings('interactive-low-latency', java_version=25)['gc'] == ['-XX:+UseZGC']
+        g1 = jvm_profiles.resolve_jvm_settings('interactive-low-latency', java_version=17)['gc']
+        assert g1 == ['-XX:+UseG1GC', '-XX:MaxGCPauseMillis=50']
+
+    def test_explicit_settings_take_precedence(self, memory_16g):
+        settings = jvm_profiles.resolve_jvm_settings('memory-constrained', jvm_args=['-Xmx1g', '-XX:+UseG1GC'])
+        assert settings['max_heap'] == '1g' and settings['heap_source'] == 'argument'
+        assert '-XX:+UseSerialGC' not in settings['options']
+        assert settings['gc'] == ['-XX:+UseG1GC']
+        assert settings['options'].count('-Xmx1g') == 1
+
+    def test_no_profile_keeps_jvm_defaults(self, memory_16g):
+        settings = jvm_profiles.resolve_jvm_settings()
+        assert settings['options'] == [] and settings['heap_source'] == 'jvm-default'
+        assert 'Max heap: JVM default' in jvm_profiles.format_jvm_settings(settings)
+
+    def test_unknown_profile(self):
+        with pytest.raises(ValueError):
+            jvm_profiles.resolve_jvm_settings('turbo')
+        with pytest.raises(ValueError):
+            pysnt.set_option('java.jvm_profile', 'turbo')
+
+    def test_report(self, memory_16g):
+        lines = jvm_profiles.format_jvm_settings(jvm_profiles.resolve_jvm_settings('batch-throughput'))
+        assert lines[0] == 'JVM profile: batch-throughput'
+        assert 'Max heap: 12g (cgroup, 16.0 GB available)' in lines
+        assert 'Garbage collector: -XX:+UseParallelGC' in lines
+
+
+class TestConfigureJVM:
+    """Test that resolved options are passed to scyjava and recorded."""
+
+    def teardown_method(self):
+        core._jvm_settings = None
+
+    def test_options_added(self, memory_16g):
+        with patch.object(core.scyjava.config, 'add_option') as add_option:
+            settings = core._configure_jvm(profile='memory-constrained')
+        added = [call.args[0] for call in add_option.call_args_list]
+        assert added[:3] == ['-Xmx8g', '-XX:+UseSerialGC', '-XX:+UseCompressedOops']
+        assert core.get_jvm_settings() is settings
+
+    def test_nothing_to_configure(self, memory_16g):
+        with patch.object(core.scyjava.config, 'add_option') as add_option:
+            core._configure_jvm()
+        add_option.assert_not_called()
+        assert core.get_jvm_settings()['profile'] is None
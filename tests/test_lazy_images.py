@@ -0,0 +1,125 @@
+"""
+Tests for lazy, chunked ImgLib2 image access in pysnt.io.images.
+
+ImgLib2 images are emulated with a small class backed by a NumPy array; interval
+reads are counted to verify that only the requested chunks are pulled.
+These tests do not require SNT/Java initialization.
+"""
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, 'src')
+
+from pysnt.io import images
+from pysnt.io.images import _IntervalReader, _resolve_chunks
+
+
+class FakeImage:
+    """Minimal ImgPlus stand-in: ImgLib2 (X, Y, Z) axes over a NumPy (Z, Y, X) array."""
+
+    def __init__(self, array, calibration=(0.5, 0.5, 2.0)):
+        self.array = array
+        self.calibration = calibration
+        self.reads = []
+
+    def numDimensions(self):
+        return self.array.ndim
+
+    def dimension(self, d):
+        return self.array.shape[::-1][d]
+
+    def min(self, d):
+        return 0
+
+    def getType(self):
+        return None
+
+    def getName(self):
+        return 'stack'
+
+    def axis(self, d):
+        label, scale = ('X', 'Y', 'Z')[d], self.calibration[d]
+        return SimpleNamespace(
+            type=lambda: SimpleNamespace(getLabel=lambda: label),
+            calibratedValue=lambda pos: 10.0 * (d == 0) + pos * scale,
+            averageScale=lambda a, b: scale,
+            unit=lambda: 'um',
+        )
+
+
+def _fake_read(self, starts, stops):
+    self.rai.reads.append((tuple(starts), tuple(stops)))
+    return self.rai.array[tuple(slice(a, b) for a, b in zip(starts, stops))]
+
+
+@pytest.fixture
+def image():
+    img = FakeImage(np.arange(4 * 6 * 8, dtype=np.uint16).reshape(4, 6, 8))
+    with patch.object(_IntervalReader, '_read_interval', _fake_read):
+        yield img
+
+
+class TestIntervalReader:
+    """Test on-demand interval indexing."""
+
+    def test_shape_and_probed_dtype(self, image):
+        reader = _IntervalReader(image)
+        assert reader.shape == (4, 6, 8)
+        assert reader.dtype == np.uint16
+
+    def test_slices_steps_and_integers(self, image):
+        reader = _IntervalReader(image)
+        image.reads.clear()
+        np.testing.assert_array_equal(reader[1, 2:5, ::3], image.array[1, 2:5, ::3])
+        assert image.reads == [((1, 2, 0), (2, 5, 8))]
+        assert reader[-1].shape == (6, 8)
+        assert reader[0, 6:6].shape == (0, 8)
+        with pytest.raises(IndexError):
+            reader[4]
+
+
+class TestLazyXarray:
+    """Test the dask-backed DataArray."""
+
+    def test_coords_and_chunked_reads(self, image):
+        pytest.importorskip('dask')
+        data = images.lazy_xarray(image)
+        assert data.dims == ('pln', 'row', 'col')
+        assert data.name == 'stack'
+        np.testing.assert_allclose(data.coords['col'].values[:2], [10.0, 10.5])
+        np.testing.assert_allclose(data.coords['pln'].values, [0.0, 2.0, 4.0, 6.0])
+        assert data.attrs['units']['pln'] == 'um'
+
+        image.reads.clear()
+        plane = data.isel(pln=2).compute()
+        np.testing.assert_array_equal(plane.values, image.array[2])
+        assert len(image.reads) == 1  # only the chunk holding plane 2
+
+        np.testing.assert_array_equal(data.max('pln').values, image.array.max(axis=0))
+
+    def test_resolve_chunks(self):
+        dims, shape = ['pln', 'row', 'col'], (4, 6, 8)
+        assert _resolve_chunks(None, dims, shape) == (1, 6, 8)
+        assert _resolve_chunks({'pln': 2, 'col': 100}, dims, shape) == (2, 6, 8)
+        assert _resolve_chunks('auto', dims, shape) == 'auto'
+        with pytest.raises(ValueError):
+            _resolve_chunks({'t': 1}, dims, shape)
+
+
+class TestLazyDisplay:
+    """Test plane selection for lazy display."""
+
+    def test_select_display_plane(self, image):
+        pytest.importorskip('dask')
+        from pysnt.display.core import _select_display_plane, _use_lazy_image
+
+        data = images.lazy_xarray(image)
+        assert int(_select_display_plane(data)['pln']) == 4  # middle slice (index 2)
+        assert int(_select_display_plane(data, z=1)['pln']) == 0
+        assert _use_lazy_image(image, lazy=True)
+        assert not _use_lazy_image(image)  # below display.lazy_image_mb
@@ -0,0 +1,157 @@
+"""
+Tests for lean initialization (pysnt.lean, initialize(mode='lean')).
+
+These tests do not require SNT/Java initialization: the Fiji installation is a
+directory of fake jars with embedded POMs, and JVM startup is mocked.
+"""
+
+import sys
+import zipfile
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+import pysnt
+from pysnt import core, lean
+
+_POM = """<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <artifactId>{artifact}</artifactId>
+  <dependencyManagement><dependencies>
+    <dependency><artifactId>managed-only</artifactId></dependency>
+  </dependencies></dependencyManagement>
+  <dependencies>{dependencies}</dependencies>
+</project>"""
+
+
+def _jar(path, artifact, dependencies=()):
+    """Write a jar embedding a POM with the given dependencies ((artifactId, extra XML) pairs)."""
+    deps = ''.join(f"<dependency><groupId>org.example</groupId><artifactId>{dep}</artifactId>{extra}</dependency>"
+                   for dep, extra in dependencies)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr(f"META-INF/maven/org.example/{artifact}/pom.xml",
+                         _POM.format(artifact=artifact, dependencies=deps))
+
+
+@pytest.fixture
+def fiji(tmp_path):
+    root = tmp_path / 'Fiji.app'
+    _jar(root / 'plugins' / 'SNT-4.3.0.jar', 'SNT', [
+        ('scijava-common', ''), ('commons-math3', ''), ('jogl-all', ''),
+        ('junit', '<scope>test</scope>'), ('sciview', '<optional>true</optional>'), ('not-in-fiji', '')])
+    _jar(root / 'jars' / 'scijava-common-2.97.0.jar', 'scijava-common', [('parsington', '')])
+    _jar(root / 'jars' / 'parsington-3.1.0.jar', 'parsington')
+    _jar(root / 'jars' / 'commons-math3-3.6.1.jar', 'commons-math3')
+    _jar(root / 'jars' / 'jogl-all-2.4.0.jar', 'jogl-all')
+    _jar(root / 'jars' / 'linux64' / 'jogl-all-2.4.0-natives-linux-amd64.jar', 'jogl-all')
+    for artifact in ('junit', 'sciview', 'imagej-ops', 'imglib2', 'managed-only'):
+        _jar(root / 'jars' / f"{artifact}-1.0.0.jar", artifact)
+    return root
+
+
+@pytest.fixture(autouse=True)
+def _clean_state():
+    yield
+    lean.dispose_lean_context()
+    core._mode = None
+    core._jvm_started = False
+    for key in ('java.lean.services', 'java.lean.extra_artifacts'):
+        pysnt.reset_option(key)
+
+
+class TestResolve:
+    """Test resolution of SNT's dependencies to jars."""
+
+    def test_artifact_id(self):
+        assert lean._artifact_id('imagej-common-2.0.4.jar') == 'imagej-common'
+        assert lean._artifact_id('jogl-all-2.4.0-natives-linux-amd64.jar') == 'jogl-all'
+        assert lean._artifact_id('ij-1.54f.jar') == 'ij'
+        assert lean._artifact_id('commons-math3-3.6.1.jar') == 'commons-math3'
+        assert lean._artifact_id('ij.jar') == 'ij'
+
+    def test_transitive_closure(self, fiji):
+        classpath = lean.resolve_lean_classpath(str(fiji))
+        assert classpath['artifacts'] == ['SNT', 'commons-math3', 'jogl-all', 'parsington', 'scijava-common']
+        assert classpath['missing'] == ['not-in-fiji']
+        assert len(classpath['jars']) == 6 and classpath['total_jars'] == 11
+        assert any(jar.endswith('natives-linux-amd64.jar') for jar in classpath['jars'])
+
+    def test_extra_artifacts(self, fiji):
+        classpath = lean.resolve_lean_classpath(str(fiji), ['imagej-ops'])
+        assert 'imagej-ops' in classpath['artifacts']
+
+    def test_requires_snt(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match='SNT'):
+            lean.resolve_lean_classpath(str(tmp_path))
+
+
+class TestLeanSession:
+    """Test JVM startup and errors for classes outside the lean classpath."""
+
+    def _start(self, fiji, **kwargs):
+        with patch('scyjava.jvm_started', return_value=False), \
+                patch('scyjava.config.add_classpath') as add_classpath, \
+                patch('scyjava.config.enable_headless_mode'), \
+                patch('scyjava.start_jvm') as start_jvm:
+            classpath = lean.start_lean_jvm(str(fiji), **kwargs)
+        return classpath, add_classpath, start_jvm
+
+    def test_start(self, fiji):
+        classpath, add_classpath, start_jvm = self._start(fiji)
+        assert [call.args[0] for call in add_classpath.call_args_list] == classpath['jars']
+        start_jvm.assert_called_once()
+        assert lean.is_lean() and lean.get_lean_classpath() is classpath
+        assert lean.get_context() is None
+
+    def test_jvm_already_running(self, fiji):
+        with patch('scyjava.jvm_started', return_value=True):
+            with pytest.raises(RuntimeError, match='already running'):
+                lean.start_lean_jvm(str(fiji))
+
+    def test_missing_class_error(self, fiji):
+        error = TypeError("Class sc.fiji.snt.viewer.Viewer3D is not found")
+        assert lean.missing_class_error('sc.fiji.snt.viewer.Viewer3D', error) is None  # not lean
+        self._start(fiji)
+        translated = lean.missing_class_error('sc.fiji.snt.viewer.Viewer3D', error)
+        assert isinstance(translated, pysnt.LeanClasspathError)
+        assert 'java.lean.extra_artifacts' in str(translated)
+        assert lean.missing_class_error('x', ValueError('bad argument')) is None
+
+    def test_jimport(self, fiji):
+        self._start(fiji)
+        with patch('scyjava.jimport', side_effect=TypeError('Class net.imagej.ops.OpService is not found')):
+            with pytest.raises(pysnt.LeanClasspathError, match='net.imagej.ops.OpService'):
+                lean.jimport('net.imagej.ops.OpService')
+
+    def test_initialize_lean(self, fiji, capsys):
+        with patch('scyjava.jvm_started', return_value=False), \
+                patch.object(core, '_configure_jvm'), \
+                patch('pysnt.converters.register_snt_converters'), \
+                patch('pysnt.lean.start_lean_jvm') as start_lean_jvm, \
+                patch('scyjava.start_jvm'), \
+                patch('imagej.init') as imagej_init:
+            core.initialize(str(fiji), mode='lean', ensure_java=False)
+        start_lean_jvm.assert_called_once()
+        imagej_init.assert_not_called()
+        assert core.is_initialized() and core.get_mode() == 'lean'
+        # Functions requiring an initialized session must not re-initialize or reject it
+        from pysnt import export
+        with patch.object(core, 'initialize') as initialize:
+            export._ensure_headless_context()
+        initialize.assert_not_called()
+        pysnt.info()
+        assert 'PySNT initialized: Yes' in capsys.readouterr().out
+
+    def test_ij_unavailable(self):
+        core._mode = 'lean'
+        with pytest.raises(RuntimeError, match='lean mode'):
+            core.ij()
+
+    def test_option_validation(self):
+        pysnt.set_option('java.lean.services', 'org.scijava.log.LogService')
+        assert pysnt.get_option('java.lean.services') == ('org.scijava.log.LogService',)
+        with pytest.raises(ValueError):
+            pysnt.set_option('java.lean.extra_artifacts', [1, 2])
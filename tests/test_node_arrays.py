@@ -0,0 +1,95 @@
+"""
+Tests for bulk export of search and fill nodes (pysnt.tracing.node_arrays).
+
+These tests do not require SNT/Java initialization: nodes are faked, and the
+JVM-side packer is faked where tested.
+"""
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, 'src')
+
+import pysnt
+from pysnt.tracing import node_arrays
+
+
+class FakeSearchNode:
+    """Search node exposing coordinates as fields and the g-score through a getter."""
+
+    def __init__(self, x, y, z, g):
+        self.x, self.y, self.z, self._g = x, y, z, g
+
+    def getG(self):
+        return self._g
+
+
+def fill_nodes():
+    return [SimpleNamespace(x=2, y=3, z=1, distance=0.0), SimpleNamespace(x=3, y=3, z=1, distance=0.5),
+            SimpleNamespace(x=2, y=5, z=2, distance=1.0), SimpleNamespace(x=9, y=9, z=9, distance=4.0)]
+
+
+class FakeFill:
+    distanceThreshold = 2.0
+
+    def getNodeList(self):
+        return fill_nodes()
+
+
+class TestFillExport:
+    """Test sparse and dense fill exports."""
+
+    def test_fill_voxels_within_threshold(self):
+        voxels = node_arrays.fill_voxels(FakeFill())
+        assert voxels['xyz'].dtype == np.int32
+        np.testing.assert_array_equal(voxels['xyz'], [[2, 3, 1], [3, 3, 1], [2, 5, 2]])
+        np.testing.assert_allclose(voxels['distance'], [0, 0.5, 1])
+        assert len(node_arrays.fill_voxels(FakeFill(), threshold=0.5)['xyz']) == 2
+        filler = SimpleNamespace(getFill=FakeFill)
+        assert len(node_arrays.fill_voxels(filler, threshold=10)['xyz']) == 4
+
+    def test_fill_mask_cropped_to_bounding_box(self):
+        cropped = node_arrays.fill_mask(FakeFill())
+        np.testing.assert_array_equal(cropped['origin'], [2, 3, 1])
+        assert cropped['mask'].shape == (2, 3, 2) and cropped['mask'].sum() == 3
+        assert cropped['mask'][1, 2, 0] and cropped['distance'][1, 2, 0] == 1.0
+        assert np.isnan(cropped['distance'][0, 1, 0])
+        empty = node_arrays.fill_mask(FakeFill(), threshold=-1)
+        assert empty['mask'].size == 0
+
+
+class TestExploredNodes:
+    """Test the explored set of searches."""
+
+    def test_per_slice_search_images(self):
+        slices = [[FakeSearchNode(1, 2, 0, 0.0), None, FakeSearchNode(2, 2, 0, 1.5)], None,
+                  [FakeSearchNode(4, 4, 2, 3.0)]]
+        search = SimpleNamespace(getNodesAsImageFromStart=lambda: [s for s in slices if s is not None])
+        explored = node_arrays.explored_nodes(search)
+        np.testing.assert_array_equal(explored['xyz'], [[1, 2, 0], [2, 2, 0], [4, 4, 2]])
+        np.testing.assert_allclose(explored['g'], [0, 1.5, 3])
+
+    def test_without_packer_or_getter(self):
+        with pytest.raises(ValueError, match='without Groovy'):
+            node_arrays.explored_nodes(SimpleNamespace())
+
+    def test_single_transfer_with_packer(self):
+        calls = []
+
+        class FakePacker:
+            def call(self, source, score):
+                calls.append(score)
+                return [[1, 2, 3, 4, 5, 6], [0.25, 0.75]]
+
+        with patch.object(node_arrays, '_get_packer', return_value=FakePacker()), \
+                patch('pysnt.profiling._record_transfer') as record:
+            explored = node_arrays.explored_nodes(object())
+        assert calls == ['g']
+        np.testing.assert_array_equal(explored['xyz'], [[1, 2, 3], [4, 5, 6]])
+        record.assert_called_once()
+        assert record.call_args[0][1] == explored['xyz'].nbytes + explored['g'].nbytes
+        assert pysnt.tracing.fill_mask is node_arrays.fill_mask
@@ -0,0 +1,111 @@
+"""
+Tests for the Java boundary-crossing profiler (pysnt.profile_java()).
+
+JPype method and field descriptors are emulated with small descriptor classes
+named like their JPype counterparts. These tests do not require SNT/Java initialization.
+"""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+import pysnt
+from pysnt import profiling
+from pysnt.converters.extractors import SWCPointExtractor
+from pysnt.profiling import _record_transfer, profile_java
+
+
+class _JMethod:
+    def __init__(self, func):
+        self.func = func
+
+    def __get__(self, obj, objtype=None):
+        return self.func if obj is None else self.func.__get__(obj, objtype)
+
+
+class _JField:
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        return obj.values[self.name]
+
+    def __set__(self, obj, value):
+        obj.values[self.name] = value
+
+
+class FakeSWCPoint:
+    x = _JField('x')
+    y = _JField('y')
+    getColor = _JMethod(lambda self: None)
+    distanceTo = _JMethod(lambda self, other: abs(self.x - other.x))
+
+    def __init__(self, x, y):
+        self.values = {'x': x, 'y': y}
+
+
+class TestProfileJava:
+    """Test instrumentation and reporting."""
+
+    def test_counts_methods_and_fields(self):
+        points = [FakeSWCPoint(i, 2 * i) for i in range(5)]
+        with profile_java(classes=[FakeSWCPoint], conversions=False) as prof:
+            for p in points:
+                SWCPointExtractor().extract_attributes(p, ['x', 'y', 'color'])
+            assert points[0].distanceTo(points[3]) == 3
+
+        rows = {(r['kind'], r['member']): r for r in prof.rows()}
+        # hasattr() and getattr() each read the field: a chatty path made visible
+        assert rows[('field', 'x')]['calls'] == 5 * 2 + 2
+        assert rows[('method', 'getColor')]['calls'] == 5
+        assert rows[('method', 'distanceTo')]['calls'] == 1
+        assert prof.total_calls == sum(r['calls'] for r in rows.values())
+
+    def test_instrumentation_is_removed(self):
+        originals = dict(vars(FakeSWCPoint))
+        with profile_java(classes=[FakeSWCPoint], conversions=False):
+            assert type(vars(FakeSWCPoint)['x']).__name__ == '_ProfiledField'
+        assert vars(FakeSWCPoint)['x'] is originals['x']
+        assert vars(FakeSWCPoint)['getColor'] is originals['getColor']
+        point = FakeSWCPoint(1, 2)
+        point.x = 7
+        assert point.x == 7
+
+    def test_conversions_and_transfers(self):
+        import scyjava
+
+        def identity(obj):
+            return obj
+
+        with patch.object(profiling, '_resolve_classes', return_value=[]), \
+                patch.object(scyjava, 'to_python', identity):
+            with profile_java() as prof:
+                assert scyjava.to_python(42) == 42
+                _record_transfer('ij.process.ImageProcessor', 1024)
+                _record_transfer('ij.process.ImageProcessor', 1024)
+            assert scyjava.to_python is identity
+        assert prof.total_conversions == 1
+        assert prof.bytes_transferred == 2048
+        _record_transfer('ij.process.ImageProcessor', 1)  # no-op outside a profile
+        assert prof.bytes_transferred == 2048
+
+    def test_reports(self):
+        with profile_java(classes=[FakeSWCPoint], conversions=False) as prof:
+            FakeSWCPoint(1, 2).x
+        assert 'x' in prof.report()
+        assert list(prof.to_dataframe().columns)[:3] == ['kind', 'java_class', 'member']
+        with pytest.raises(ValueError):
+            prof.rows(sort_by='member')
+
+    def test_nested_profiles_rejected(self):
+        with profile_java(classes=[], conversions=False):
+            with pytest.raises(RuntimeError):
+                with profile_java(classes=[], conversions=False):
+                    pass
+        assert profiling._active_profile is None
+
+    def test_exported(self):
+        assert pysnt.profile_java is profile_java
@@ -0,0 +1,99 @@
+"""
+Tests for memory-bounded search image selection (pysnt.tracing.search_policy).
+
+These tests do not require SNT/Java initialization: JVM memory is faked.
+"""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+import pysnt
+from pysnt.tracing import search_policy
+from pysnt.tracing.search_policy import SearchImagePolicy, choose_search_image, estimate_search_memory
+
+SHAPE = (1000, 1000, 100)  # 1e8 voxels
+
+
+class TestEstimates:
+    """Test search-state memory estimates."""
+
+    def test_sparse_grows_with_explored_fraction(self):
+        assert estimate_search_memory(SHAPE, 0, 'map') == 0
+        assert estimate_search_memory(SHAPE, 0.1, 'map') == int(1e7) * (48 + 16)
+        assert estimate_search_memory(SHAPE, 0.1, 'map', bidirectional=True) > \
+            estimate_search_memory(SHAPE, 0.1, 'map')
+
+    def test_dense_pays_for_whole_slices(self):
+        assert estimate_search_memory(SHAPE, 0.01, 'array') == int(1e6) * 48 + int(1e8) * 4
+        with pytest.raises(ValueError):
+            estimate_search_memory(SHAPE, 0.01, 'list')  # not an SNT.SearchImageType
+        assert estimate_search_memory((10, 10), 1, 'array') == 100 * (48 + 4)
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            estimate_search_memory(SHAPE, 0.1, 'tree')
+        with pytest.raises(ValueError):
+            estimate_search_memory((10,), 0.1, 'map')
+
+
+class TestChooseSearchImage:
+    """Test backend selection."""
+
+    def teardown_method(self):
+        pysnt.reset_option('tracing.dense_threshold')
+        pysnt.reset_option('tracing.search_memory_fraction')
+
+    def test_sparse_for_small_fractions(self):
+        choice = choose_search_image(SHAPE, 0.01, memory_budget=10 ** 10)
+        assert choice['search_image'] == 'map'
+        assert set(choice['estimates']) == {'map', 'array'}
+
+    def test_dense_for_large_fractions(self):
+        assert choose_search_image(SHAPE, 0.5, memory_budget=10 ** 10)['search_image'] == 'array'
+        pysnt.set_option('tracing.dense_threshold', 0.6)
+        assert choose_search_image(SHAPE, 0.5, memory_budget=10 ** 10)['search_image'] == 'map'
+
+    def test_budget(self):
+        # Below the sparse/dense crossover (~25%), dense storage costs more than sparse
+        choice = choose_search_image(SHAPE, 0.15, memory_budget=10 ** 9, dense_threshold=0.1)
+        assert choice['search_image'] == 'map' and 'exceeds budget' in choice['reason']
+        choice = choose_search_image(SHAPE, 0.5, memory_budget=1)
+        assert choice['search_image'] == min(choice['estimates'], key=choice['estimates'].get)
+
+    def test_default_budget_from_free_heap(self):
+        memory = {'heap_used': 2 * 2 ** 30, 'heap_committed': 3 * 2 ** 30, 'heap_max': 6 * 2 ** 30}
+        with patch('pysnt.diagnostics.jvm_memory', return_value=memory):
+            assert search_policy.default_memory_budget() == 2 * 2 ** 30
+            assert search_policy.default_memory_budget(concurrency=4) == 2 ** 29
+        with patch('pysnt.diagnostics.jvm_memory', side_effect=RuntimeError('JVM not running')):
+            assert search_policy.default_memory_budget() is None
+
+
+class TestSearchImagePolicy:
+    """Test adaptive switching and peak memory reporting."""
+
+    def test_switches_once_threshold_is_passed(self):
+        policy = SearchImagePolicy(SHAPE, memory_budget=10 ** 10, dense_threshold=0.2)
+        assert policy.current == 'map'
+        assert policy.record(int(1e6)) == 'map'
+        assert policy.record(int(3e7)) == 'array'
+        report = policy.report()
+        assert report['searches'] == 2 and report['search_image'] == 'array'
+        assert report['peak_explored_fraction'] == pytest.approx(0.3)
+        assert report['peak_search_bytes'] == estimate_search_memory(SHAPE, 0.3, 'map')
+        assert report['switches'] == [{'after': 2, 'from': 'map', 'to': 'array', 'explored_fraction': 0.3}]
+
+    def test_stays_sparse_when_dense_exceeds_budget(self):
+        policy = SearchImagePolicy(SHAPE, memory_budget=10 ** 9, dense_threshold=0.1)
+        assert policy.record(int(1.5e7)) == 'map'
+        assert policy.report()['switches'] == []
+
+    def test_fixed_backend(self):
+        policy = SearchImagePolicy(SHAPE, memory_budget=10 ** 10, dense_threshold=0.2, search_image='map')
+        assert policy.record(int(9e7)) == 'map'
+        with pytest.raises(ValueError):
+            SearchImagePolicy(SHAPE, search_image='tree')
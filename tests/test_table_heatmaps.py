@@ -0,0 +1,135 @@
+"""
+Tests for aggregated (binned) heatmap display of large tables in pysnt.display.data_display.
+
+These tests do not require SNT/Java initialization.
+"""
+
+import sys
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, 'src')
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import xarray as xr
+
+import pysnt
+from pysnt.display import data_display
+from pysnt.display.data_display import (
+    _aggregate_row_bins,
+    _column_statistics,
+    _display_dataset_as_binned_heatmap,
+    _pc1_row_order,
+    _use_binned_heatmap,
+)
+
+
+def _dataset(n_rows=1000):
+    rng = np.random.default_rng(0)
+    length = rng.uniform(0, 100, n_rows)
+    length[::10] = np.nan
+    labels = np.array(['1.5', None, 'x', '4'] * (n_rows // 4), dtype=object)
+    return xr.Dataset({
+        'length': ('row', length),
+        'branches': ('row', np.arange(n_rows)),
+        'label': ('row', labels),
+        'name': ('row', np.array(['cell'] * n_rows, dtype=object)),
+    })
+
+
+class TestAggregation:
+    """Test chunked column statistics and row binning."""
+
+    def test_column_statistics_match_numpy(self):
+        ds = _dataset()
+        stats = _column_statistics(ds, ['length', 'branches', 'label', 'name'], chunk_rows=64)
+        length = ds['length'].values
+        assert stats['count'].tolist() == [900, 1000, 500, 0]
+        np.testing.assert_allclose(stats['mean'][:2], [np.nanmean(length), 499.5])
+        np.testing.assert_allclose(stats['std'][0], np.nanstd(length))
+        assert stats['min'][2] == 1.5 and stats['max'][2] == 4.0
+        assert np.isnan(stats['min'][3])
+
+    def test_blocks_load_only_their_rows(self):
+        class LazyColumn:
+            """Duck array recording the number of values converted to NumPy."""
+
+            def __init__(self, values, loaded):
+                self.values, self.loaded = values, loaded
+                self.shape, self.dtype, self.ndim = values.shape, values.dtype, values.ndim
+
+            def __getitem__(self, key):
+                return LazyColumn(self.values[key], self.loaded)
+
+            def __array__(self, dtype=None, copy=None):
+                self.loaded.append(len(self.values))
+                return self.values
+
+            def __array_function__(self, func, types, args, kwargs):
+                return NotImplemented
+
+            def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+                return NotImplemented
+
+        loaded = []
+        ds = xr.Dataset({'a': ('row', LazyColumn(np.arange(1000.0), loaded))})
+        stats = _column_statistics(ds, ['a'], chunk_rows=100)
+        assert stats['mean'][0] == 499.5
+        assert max(loaded) == 100
+
+    def test_bins_are_nan_aware_means(self):
+        ds = _dataset()
+        binned = _aggregate_row_bins(ds, ['length', 'branches'], n_bins=7, chunk_rows=100)
+        edges = binned['edges']
+        assert binned['means'].shape == (7, 2)
+        assert edges[0] == 0 and edges[-1] == 1000
+        for b in range(7):
+            rows = slice(edges[b], edges[b + 1])
+            np.testing.assert_allclose(binned['means'][b], [np.nanmean(ds['length'].values[rows]),
+                                                            ds['branches'].values[rows].mean()])
+
+    def test_pc1_order_groups_similar_rows(self):
+        values = np.array([0.0, 10.0, 1.0, 11.0, 2.0, 12.0])
+        ds = xr.Dataset({'a': ('row', values), 'b': ('row', values * 2)})
+        stats = _column_statistics(ds, ['a', 'b'])
+        order = _pc1_row_order(ds, ['a', 'b'], stats, chunk_rows=4)
+        assert set(order[:3]) in ({0, 2, 4}, {1, 3, 5})
+
+
+class TestBinnedHeatmap:
+    """Test rendering and automatic selection."""
+
+    def setup_method(self):
+        pysnt.reset_option('display.heatmap_max_rows')
+
+    def test_render_cost_is_bounded(self):
+        with patch.object(plt, 'show'):
+            assert _display_dataset_as_binned_heatmap(_dataset(4000), bins=50, row_order='pc1')
+        image = plt.gcf().axes[0].get_images()[0].get_array()
+        assert image.shape == (50, 3)  # non-numeric 'name' column dropped
+        assert np.nanmin(image) >= 0 and np.nanmax(image) <= 1
+        # Empty bins are gray without altering the registered colormap
+        cmap = plt.gcf().axes[0].get_images()[0].get_cmap()
+        assert cmap.get_bad().tolist() != plt.get_cmap('viridis').get_bad().tolist()
+        plt.close('all')
+
+    def test_invalid_row_order(self):
+        with patch.object(data_display, '_handle_display_error') as handler:
+            assert not _display_dataset_as_binned_heatmap(_dataset(), row_order='random')
+        assert isinstance(handler.call_args[0][0], ValueError)
+
+    def test_auto_selection(self):
+        pysnt.set_option('display.heatmap_max_rows', 100)
+        assert _use_binned_heatmap(_dataset(1000))
+        assert not _use_binned_heatmap(_dataset(1000), binned=False)
+        assert not _use_binned_heatmap(_dataset(100))
+
+    def test_table_mode_option(self):
+        pysnt.set_option('display.table_mode', 'heatmap_binned')
+        pysnt.reset_option('display.table_mode')
+        with pytest.raises(ValueError):
+            pysnt.set_option('display.table_mode', 'heatmap_clustered')
@@ -0,0 +1,114 @@
+"""
+Tests for tiled skeletonization (pysnt.analysis.skeletonize_tiled).
+
+These tests do not require SNT/Java initialization: SkeletonConverter is faked by
+connecting face-adjacent foreground voxels of (already thin) masks.
+"""
+
+import sys
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, 'src')
+
+import pysnt
+from pysnt.analysis import tiled_skeleton
+
+
+def fake_block_trees(mask):
+    """Connect face-adjacent foreground voxels of a (Z, Y, X) mask, in (x, y, z) pixel coordinates."""
+    voxels = np.argwhere(mask)[:, ::-1]
+    lookup = {tuple(v): i for i, v in enumerate(voxels)}
+    segments = []
+    for i, voxel in enumerate(voxels):
+        for offset in np.eye(3, dtype=np.int64):
+            j = lookup.get(tuple(voxel + offset))
+            if j is not None:
+                segments.append((i, j))
+    return [{'xyz': voxels.astype(float), 'segments': np.array(segments, dtype=np.int64).reshape(-1, 2)}]
+
+
+@pytest.fixture
+def fake_converter():
+    with patch.object(tiled_skeleton, '_block_trees', side_effect=fake_block_trees) as block_trees:
+        yield block_trees
+
+
+def run(volume, **kwargs):
+    kwargs.setdefault('output', 'arrays')
+    kwargs.setdefault('return_report', True)
+    return tiled_skeleton.skeletonize_tiled(volume, **kwargs)
+
+
+class TestSkeletonizeTiled:
+    """Test block processing and stitching across block faces."""
+
+    def test_line_across_blocks_is_one_tree(self, fake_converter):
+        volume = np.zeros((6, 10, 30), dtype=np.uint8)
+        volume[2, 5, 1:29] = 1
+        volume[2, 1:5, 20] = 1  # branch
+        trees, report = run(volume, block_size=8, overlap=2, workers=3, spacing=(0.5, 1, 2))
+        assert len(trees) == 1 and report['trees'] == 1
+        tree = trees[0]
+        assert len(tree['xyz']) == 28 + 4 == report['nodes']
+        assert len(tree['segments']) == len(tree['xyz']) - 1
+        assert tree['length'] == pytest.approx(27 * 0.5 + 4)
+        np.testing.assert_allclose(np.unique(tree['xyz'][:, 2]), [4.0])
+        assert report['blocks'] == 4 * 2 and report['empty_blocks'] == 4
+        assert report['loops_broken'] == 0 and report['bridges'] == 0
+
+    def test_edges_kept_once(self, fake_converter):
+        volume = np.zeros((1, 3, 40), dtype=bool)
+        volume[0, 1, :] = True
+        trees, report = run(volume, block_size=(1, 3, 5), overlap=4)
+        assert report['edges'] == 39 and len(trees[0]['xyz']) == 40
+
+    def test_gap_at_block_face_is_bridged(self, fake_converter):
+        volume = np.zeros((1, 4, 12))
+        volume[0, 2, [0, 1, 2, 3, 5, 6, 7]] = 0.9
+        volume[0, 2, 8] = 0.2  # below threshold
+        trees, report = run(volume, threshold=0.5, block_size=(1, 4, 4), overlap=0)
+        assert report['bridges'] == 1 and len(trees) == 1 and len(trees[0]['xyz']) == 7
+        trees, report = run(volume, threshold=0.5, block_size=(1, 4, 4), overlap=0, stitch_distance=0)
+        assert len(trees) == 2 and report['bridges'] == 0
+
+    def test_loops_are_broken(self, fake_converter):
+        volume = np.zeros((8, 8), dtype=np.uint8)  # 2D
+        volume[1, 1:7] = volume[6, 1:7] = volume[1:7, 1] = volume[1:7, 6] = 1
+        trees, report = run(volume, block_size=4, overlap=2)
+        assert len(trees) == 1 and report['loops_broken'] == 1
+        assert len(trees[0]['segments']) == len(trees[0]['xyz']) - 1
+
+    def test_min_length_and_progress(self, fake_converter):
+        volume = np.zeros((1, 10, 10), dtype=np.uint8)
+        volume[0, 1, 1:9] = 1
+        volume[0, 7, 1:3] = 1
+        calls = []
+        trees, _ = run(volume, block_size=5, min_length=2, progress=lambda done, total: calls.append((done, total)))
+        assert len(trees) == 1
+        assert sorted(calls) == [(i, 4) for i in range(1, 5)]
+
+    def test_peak_block_memory_is_bounded_by_workers(self, fake_converter):
+        volume = np.ones((4, 16, 16), dtype=np.uint8)
+        _, report = run(volume, block_size=(4, 4, 4), overlap=0, workers=1)
+        block = 4 * 4 * 4
+        assert report['peak_block_bytes'] == block * 2  # data + mask of a single block
+
+    def test_options_and_validation(self, fake_converter):
+        pysnt.set_option('analysis.skeleton_block_size', 4)
+        try:
+            _, report = run(np.zeros((2, 8, 8)))
+        finally:
+            pysnt.reset_option('analysis.skeleton_block_size')
+        assert report['blocks'] == 4 and report['trees'] == 0
+        with pytest.raises(ValueError):
+            run(np.zeros((2, 2, 2, 2)))
+        with pytest.raises(ValueError):
+            run(np.zeros((2, 2)), output='swc')
+        with pytest.raises(ValueError):
+            run(np.zeros((2, 2)), block_size=(2, 0))
+        with pytest.raises(ValueError):
+            run(np.zeros((2, 2)), spacing=(1, 1))
+        assert pysnt.analysis.skeletonize_tiled is tiled_skeleton.skeletonize_tiled
@@ -0,0 +1,168 @@
+"""
+Tests for batch point-to-point tracing (pysnt.tracing.trace_batch).
+
+These tests do not require SNT/Java initialization: searches and the Java thread
+pool are faked.
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, 'src')
+
+import pysnt
+from pysnt.tracing import batch
+
+
+class FakePath:
+    def __init__(self, start, goal):
+        self.nodes = [SimpleNamespace(x=float(x), y=float(y), z=float(z))
+                      for x, y, z in np.linspace(start, goal, 3)]
+
+    def getNodes(self):
+        return self.nodes
+
+
+class FakeSearch:
+    """Search finding a straight path, failing for a start at the origin."""
+
+    def __init__(self, start, goal, shared, search_image='map'):
+        self.start, self.goal, self.shared, self.result = start, goal, shared, None
+        self.search_image = search_image
+
+    def run(self):
+        if not any(self.start):
+            raise RuntimeError('no path')
+        self.result = FakePath(self.start, self.goal)
+
+    def getResult(self):
+        return self.result
+
+    def pointsConsideredInSearch(self):
+        return 100 * int(self.goal[2])  # 1% of the (100, 100, 10) volume per goal z
+
+
+class FakeJavaPool:
+    """Java ExecutorService stand-in backed by Python threads."""
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(workers)
+        self.shut_down = False
+
+    def submit(self, runnable):
+        future = self.executor.submit(runnable.run)
+        return SimpleNamespace(get=future.result)
+
+    def shutdownNow(self):
+        self.shut_down = True
+        self.executor.shutdown()
+
+
+@pytest.fixture
+def fakes():
+    pools = []
+    searches = []
+    shared = object()
+
+    def factory(image, calibration, cost, heuristic, bidirectional, search_image, timeout):
+        assert cost is shared and heuristic is shared
+
+        def new_search(start, goal):
+            searches.append(FakeSearch(tuple(start), tuple(goal), shared, search_image))
+            return searches[-1]
+        return new_search
+
+    def new_pool(workers):
+        pools.append(FakeJavaPool(workers))
+        return pools[-1]
+
+    with patch.object(batch, '_search_inputs', side_effect=lambda image, calibration: (image, calibration)), \
+            patch.object(batch, '_search_factory', side_effect=factory), \
+            patch.object(batch, '_new_java_pool', side_effect=new_pool), \
+            patch.object(batch, '_image_shape', return_value=(100, 100, 10)):
+        yield SimpleNamespace(pools=pools, searches=searches, shared=shared)
+    pysnt.reset_option('tracing.batch_workers')
+    pysnt.reset_option('tracing.dense_threshold')
+
+
+class TestTraceBatch:
+    """Test concurrent tracing with shared cost/heuristic."""
+
+    def test_paths_in_input_order(self, fakes):
+        starts = np.array([[1, 1, 0], [5, 5, 2], [9, 1, 1]])
+        goals = starts + 10
+        paths = batch.trace_batch('img', starts, goals, cost=fakes.shared, heuristic=fakes.shared, max_workers=2)
+        assert [p.getNodes()[0].x for p in paths] == [1.0, 5.0, 9.0]
+        assert fakes.pools[0].workers == 2 and fakes.pools[0].shut_down
+
+    def test_nodes_output_and_failures(self, fakes, caplog):
+        starts = [[0, 0], [2, 4]]
+        goals = [[3, 3], [4, 8]]
+        results = batch.trace_batch('img', starts, goals, cost=fakes.shared, heuristic=fakes.shared,
+                                    output='nodes')
+        assert results[0] is None and 'no path' in caplog.text
+        np.testing.assert_allclose(results[1], [[2, 4, 0], [3, 6, 0], [4, 8, 0]])
+
+    def test_workers_from_option(self, fakes):
+        pysnt.set_option('tracing.batch_workers', 3)
+        batch.trace_batch('img', np.ones((5, 3)), np.ones((5, 3)) * 4, cost=fakes.shared, heuristic=fakes.shared)
+        assert fakes.pools[0].workers == 3
+
+    def test_validation(self, fakes):
+        with pytest.raises(ValueError, match='differ in length'):
+            batch.trace_batch('img', np.ones((2, 3)), np.ones((3, 3)), cost=1, heuristic=1)
+        with pytest.raises(ValueError, match='voxel coordinates'):
+            batch.trace_batch('img', np.ones((2, 4)), np.ones((2, 4)), cost=1, heuristic=1)
+        with pytest.raises(ValueError):
+            batch.trace_batch('img', [[1, 1]], [[2, 2]], output='swc')
+        with pytest.raises(ValueError):
+            batch.trace_batch('img', [[1, 1]], [[2, 2]], search_image='list')
+        with pytest.raises(ValueError):
+            batch.trace_batch('img', [[1, 1]], [[2, 2]], search_image='hash')
+        assert batch.trace_batch('img', np.empty((0, 3)), np.empty((0, 3))) == []
+
+    def test_auto_switches_to_dense(self, fakes):
+        # First wave explores 1% per search, later ones 30%: switch after the first wave
+        pysnt.set_option('tracing.dense_threshold', 0.25)
+        starts = np.ones((8, 3))
+        goals = np.array([[5, 5, 1]] * 2 + [[5, 5, 300]] * 6)
+        paths, report = batch.trace_batch('img', starts, goals, cost=fakes.shared, heuristic=fakes.shared,
+                                          max_workers=1, memory_budget=10 ** 9, return_report=True)
+        assert len(paths) == 8 and len(fakes.pools) == 1
+        used = [search.search_image for search in fakes.searches]
+        assert used == ['map'] * 4 + ['array'] * 4
+        assert report['switches'][0]['after'] == 3
+        assert report['peak_explored_fraction'] == pytest.approx(0.3)
+        assert report['peak_search_bytes'] > 0
+
+    def test_fixed_search_image_reports(self, fakes):
+        goals = np.array([[5, 5, 300]] * 3)
+        _, report = batch.trace_batch('img', np.ones((3, 3)), goals, cost=fakes.shared, heuristic=fakes.shared,
+                                      search_image='map', memory_budget=10 ** 9, return_report=True)
+        assert {search.search_image for search in fakes.searches} == {'map'}
+        assert report['searches'] == 3 and report['switches'] == []
+
+    @pytest.mark.parametrize('bidirectional, search_class', [(False, 'TracerThread'), (True, 'BiSearch')])
+    def test_search_factory_constructor(self, bidirectional, search_class):
+        # Both searches take the backend as an SNT.SearchImageType constant, after timeout and report interval
+        built = []
+        classes = {
+            f'sc.fiji.snt.tracing.{search_class}': lambda *args: built.append(args) or 'search',
+            'sc.fiji.snt.SNT$SearchImageType': SimpleNamespace(ARRAY='ARRAY', MAP='MAP'),
+        }
+        with patch('scyjava.jimport', side_effect=classes.__getitem__):
+            new_search = batch._search_factory('rai', 'cal', 'cost', 'heuristic', bidirectional, 'array', 30)
+            assert new_search(np.array([1, 2, 3]), (4.0, 5.0, 6.0)) == 'search'
+        assert built == [('rai', 'cal', 1, 2, 3, 4, 5, 6, 30, 0, 'ARRAY', 'cost', 'heuristic')]
+        assert all(type(arg) is int for arg in built[0][2:10])
+
+    def test_path_nodes(self):
+        path = FakePath((0, 0, 0), (2, 2, 2))
+        assert batch.path_nodes(path).shape == (3, 3)
+        assert pysnt.tracing.trace_batch is batch.trace_batch
@@ -0,0 +1,164 @@
+"""
+Tests for parallel multi-seed filling (pysnt.tracing.fill_batch).
+
+These tests do not require SNT/Java initialization: fillers are faked as balls
+of voxels around seed points, with the distance to the seed.
+"""
+
+import sys
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, 'src')
+
+import pysnt
+from pysnt.tracing import filling
+
+SHAPE = (20, 10, 5)  # (x, y, z)
+
+
+class FakePath:
+    def __init__(self, x, y, z):
+        self.seed = np.array([x, y, z])
+
+    def getNodes(self):
+        return [self.seed]
+
+
+class FakeTree:
+    def __init__(self, *paths):
+        self.paths = list(paths)
+
+    def getRoot(self):
+        return self.paths[0]
+
+    def list(self):
+        return self.paths
+
+
+class FakeFiller:
+    """Fill of all voxels within the threshold (Euclidean distance) of any seed path."""
+
+    shape = SHAPE
+    active = 0
+    peak_active = 0
+    lock = threading.Lock()
+
+    def __init__(self, paths, threshold, search_image):
+        self.paths, self.threshold, self.search_image = paths, threshold, search_image
+
+    def run(self):
+        with FakeFiller.lock:
+            FakeFiller.active += 1
+            FakeFiller.peak_active = max(FakeFiller.peak_active, FakeFiller.active)
+        if any(path.seed[0] < 0 for path in self.paths):
+            FakeFiller.active -= 1
+            raise RuntimeError('seed outside image')
+        grid = np.indices(self.shape).reshape(3, -1).T
+        distances = np.min([np.linalg.norm(grid - path.seed, axis=1) for path in self.paths], axis=0)
+        # Include some nodes beyond the threshold, as open nodes of a real fill
+        keep = distances <= self.threshold + 1
+        self.nodes = [SimpleNamespace(x=x, y=y, z=z, distance=d) for (x, y, z), d in zip(grid[keep], distances[keep])]
+        with FakeFiller.lock:
+            FakeFiller.active -= 1
+
+    def getFill(self):
+        return SimpleNamespace(getNodeList=lambda: self.nodes)
+
+    def pointsConsideredInSearch(self):
+        return len(self.nodes)
+
+
+@pytest.fixture
+def fakes():
+    fillers = []
+
+    def factory(image, calibration, cost, threshold, search_image):
+        def new_filler(paths):
+            fillers.append(FakeFiller(paths, threshold, search_image))
+            return fillers[-1]
+        return new_filler
+
+    calibration = SimpleNamespace(pixelWidth=0.5, pixelHeight=0.5, pixelDepth=2.0)
+    FakeFiller.peak_active = 0
+    with patch.object(filling, '_search_inputs', side_effect=lambda image, cal: (image, cal or calibration)), \
+            patch.object(filling, '_filler_factory', side_effect=factory), \
+            patch.object(filling, '_image_shape', return_value=SHAPE):
+        yield SimpleNamespace(fillers=fillers)
+
+
+class TestFillBatch:
+    """Test parallel fills merged into labels or counts."""
+
+    def test_labels_nearest_seed_wins(self, fakes):
+        seeds = [FakePath(3, 5, 2), FakePath(9, 5, 2)]
+        labels = filling.fill_batch('img', seeds, threshold=4, cost='cost', max_workers=2)
+        assert labels.shape == (5, 10, 20) and labels.dtype == np.uint32
+        assert labels[2, 5, 3] == 1 and labels[2, 5, 9] == 2
+        assert labels[2, 5, 5] == 1 and labels[2, 5, 7] == 2  # closer seed wins in the overlap
+        assert labels[2, 5, 15] == 0
+        assert labels[2, 5, 13] == 2 and labels[2, 5, 14] == 0  # threshold applies, open nodes excluded
+
+    def test_labels_2d(self, fakes):
+        with patch.object(filling, '_image_shape', return_value=(20, 10)), \
+                patch.object(FakeFiller, 'shape', (20, 10, 1)):
+            labels = filling.fill_batch('img', [FakePath(3, 5, 0), FakePath(9, 5, 0)], threshold=4, cost='cost')
+        assert labels.shape == (1, 10, 20)
+        assert labels[0, 5, 3] == 1 and labels[0, 5, 7] == 2 and labels[0, 5, 15] == 0
+
+    def test_counts_per_group(self, fakes):
+        seeds = [FakePath(3, 5, 2), FakeTree(FakePath(9, 5, 2), FakePath(15, 5, 2)), [FakePath(0, 0, 0)]]
+        result = filling.fill_batch('img', seeds, threshold=2, cost='cost', output='counts')
+        ball = sum(1 for p in np.indices((5, 5, 5)).reshape(3, -1).T if np.linalg.norm(p - 2) <= 2)
+        assert list(result['counts'][:2]) == [ball, 2 * ball]
+        assert 0 < result['counts'][2] < ball  # clipped at the image corner
+        np.testing.assert_allclose(result['volumes'], result['counts'] * 0.5)
+        assert [len(f.paths) for f in fakes.fillers] == [1, 2, 1]
+
+    def test_failures_and_report(self, fakes, caplog):
+        seeds = [FakePath(3, 5, 2), FakePath(-5, 0, 0), FakePath(12, 5, 2)]
+        calls = []
+        labels, report = filling.fill_batch('img', seeds, threshold=1, cost='cost', return_report=True,
+                                            max_workers=1, progress=lambda done, total: calls.append((done, total)))
+        assert calls == [(1, 3), (2, 3), (3, 3)]  # failed fills count as done
+        assert report['fills'] == 3 and report['failed'] == 1 and 'seed outside image' in caplog.text
+        assert report['filled_voxels'] == np.count_nonzero(labels) == 14
+        assert report['peak_fill_voxels'] == 7
+        assert report['search_images']['searches'] == 2
+        assert set(np.unique(labels)) == {0, 1, 3}
+
+    def test_bounded_concurrency(self, fakes):
+        seeds = [FakePath(x, 5, 2) for x in range(0, 20, 2)]
+        filling.fill_batch('img', seeds, threshold=1, cost='cost', output='counts', max_workers=3)
+        assert len(fakes.fillers) == 10 and FakeFiller.peak_active <= 3
+
+    def test_search_image_selection(self, fakes):
+        filling.fill_batch('img', [FakePath(3, 5, 2)], threshold=1, cost='cost', search_image='array')
+        assert fakes.fillers[-1].search_image == 'array'
+        filling.fill_batch('img', [FakePath(3, 5, 2)], threshold=1, cost='cost')
+        assert fakes.fillers[-1].search_image == 'map'  # small fills stay sparse
+        with pytest.raises(ValueError):
+            filling.fill_batch('img', [], threshold=1, search_image='list')
+        with pytest.raises(ValueError):
+            filling.fill_batch('img', [], threshold=1, output='mask')
+        assert pysnt.tracing.fill_batch is filling.fill_batch
+
+    def test_filler_factory_constructor(self):
+        # FillerThread takes the backend as an SNT.SearchImageType constant, after timeout and report interval
+        built, sources = [], []
+        filler = SimpleNamespace(setSourcePaths=lambda paths: None, setStopAtThreshold=lambda stop: None,
+                                 setStoreExtraNodes=lambda store: None)
+        classes = {
+            'sc.fiji.snt.tracing.FillerThread': lambda *args: built.append(args) or filler,
+            'java.util.ArrayList': lambda: SimpleNamespace(add=sources.append),
+            'sc.fiji.snt.SNT$SearchImageType': SimpleNamespace(ARRAY='ARRAY', MAP='MAP'),
+        }
+        with patch('scyjava.jimport', side_effect=classes.__getitem__):
+            new_filler = filling._filler_factory('rai', 'cal', 'cost', 2, 'map')
+            assert new_filler(['p1', 'p2']) is filler
+        assert built == [('rai', 'cal', 2.0, 0, 0, 'cost', 'MAP')]
+        assert type(built[0][2]) is float and sources == ['p1', 'p2']
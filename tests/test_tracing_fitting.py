@@ -0,0 +1,163 @@
+"""
+Tests for parallel path refinement (pysnt.tracing.fit_paths).
+
+These tests do not require SNT/Java initialization: paths, PathFitter and the
+Java thread pool are faked.
+"""
+
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, 'src')
+
+import pysnt
+from pysnt.tracing import fitting
+
+
+class FakePath:
+    def __init__(self, name, xs, radius=1.0):
+        self.name = name
+        self.nodes = [SimpleNamespace(x=float(x), y=1.0, z=2.0) for x in xs]
+        self.radius = radius
+
+    def getNodes(self):
+        return self.nodes
+
+    def getNodeRadius(self, i):
+        return self.radius
+
+    def __repr__(self):
+        return self.name
+
+
+class FakeTree:
+    def __init__(self, *paths):
+        self.paths = list(paths)
+
+    def getRoot(self):
+        return self.paths[0].nodes[0]
+
+    def list(self):
+        return self.paths
+
+
+class FakeFitter:
+    """PathFitter moving nodes by +0.5 in x with radius 2; fails on 'bad' paths and raises on 'boom' ones."""
+
+    def __init__(self, path, applied):
+        self.path, self.applied, self.replace_nodes = path, applied, None
+        self.ran_on = None
+
+    def call(self):
+        self.ran_on = threading.current_thread().name
+        if self.path.name == 'boom':
+            raise RuntimeError('cross-section failed')
+        return FakePath(self.path.name, [n.x + 0.5 for n in self.path.nodes], radius=2.0)
+
+    def getSucceeded(self):
+        return self.path.name != 'bad'
+
+    def setReplaceNodes(self, replace):
+        self.replace_nodes = replace
+
+    def applyFit(self):
+        self.applied.append((self.path.name, self.replace_nodes))
+
+
+class FakeFuture:
+    def __init__(self, python_future):
+        self.python_future = python_future
+        self.get = python_future.result
+
+
+class FakeCompletionService:
+    """ExecutorCompletionService stand-in backed by Python threads."""
+
+    def __init__(self, pool):
+        self.pool, self.done = pool, queue.Queue()
+
+    def submit(self, task):
+        future = FakeFuture(self.pool.executor.submit(task.call))
+        future.python_future.add_done_callback(lambda _: self.done.put(future))
+        return future
+
+    def take(self):
+        return self.done.get(timeout=5)
+
+
+@pytest.fixture
+def fakes():
+    applied, fitters, pools = [], [], []
+
+    def factory(image, scope, cross_section_radius):
+        def new_fitter(path):
+            fitters.append(FakeFitter(path, applied))
+            return fitters[-1]
+        return new_fitter
+
+    def new_pool(workers):
+        pools.append(SimpleNamespace(workers=workers, executor=ThreadPoolExecutor(workers), shut_down=False))
+        pools[-1].shutdownNow = lambda: setattr(pools[-1], 'shut_down', True)
+        return pools[-1]
+
+    with patch.object(fitting, '_fitter_factory', side_effect=factory), \
+            patch.object(fitting, '_as_imageplus', side_effect=lambda image: image), \
+            patch.object(fitting, '_new_java_pool', side_effect=new_pool), \
+            patch.object(fitting, '_completion_service', side_effect=FakeCompletionService), \
+            patch('jpype.JProxy', side_effect=lambda interface, dict: SimpleNamespace(call=dict['call'])):
+        yield SimpleNamespace(applied=applied, fitters=fitters, pools=pools)
+    pysnt.reset_option('tracing.batch_workers')
+
+
+class TestFitPaths:
+    """Test parallel fitting, QC arrays and applying accepted fits."""
+
+    def test_arrays_and_timing(self, fakes):
+        trees = [FakeTree(FakePath('a', [0, 1, 2]), FakePath('b', [5, 6])), FakeTree(FakePath('c', [9]))]
+        calls = []
+        fits = fitting.fit_paths('imp', trees, max_workers=2,
+                                 progress=lambda done, total: calls.append((done, total)))
+        assert [p.name for p in fits.paths] == ['a', 'b', 'c']
+        assert fits.tree_index.tolist() == [0, 0, 1]
+        assert fits.path_index.tolist() == [0, 0, 0, 1, 1, 2]
+        np.testing.assert_allclose(fits.offsets, [[0.5, 0, 0]] * 6)
+        np.testing.assert_allclose(fits.radii, 2.0)
+        assert fits.node_slice(1) == slice(3, 5)
+        assert calls == [(1, 3), (2, 3), (3, 3)]
+        assert (fits.seconds >= 0).all() and fits.succeeded.all()
+        assert fits.report['nodes'] == 6 and fits.report['failed'] == 0
+        assert fakes.pools[0].workers == 2 and fakes.pools[0].shut_down
+        assert all(f.ran_on != threading.current_thread().name for f in fakes.fitters)
+
+    def test_failures_are_nan(self, fakes, caplog):
+        paths = [FakePath('ok', [0, 1]), FakePath('bad', [3]), FakePath('boom', [4, 5])]
+        fits = fitting.fit_paths('imp', paths)
+        assert fits.succeeded.tolist() == [True, False, False]
+        assert np.isnan(fits.radii[2:]).all() and np.isnan(fits.offsets[2:]).all()
+        assert 'cross-section failed' in caplog.text and fits.report['failed'] == 2
+
+    def test_apply_accepted(self, fakes):
+        paths = [FakePath('a', [0]), FakePath('bad', [1]), FakePath('c', [2])]
+        fits = fitting.fit_paths('imp', [paths])  # one list of paths
+        assert fits.tree_index.tolist() == [0, 0, 0]
+        assert fits.apply([True, True, False], replace_nodes=True) == 1  # failed fits are never applied
+        assert fakes.applied == [('a', True)]
+        assert fits.apply([2]) == 1 and fakes.applied[-1] == ('c', False)
+        assert fits.apply() == 2
+        with pytest.raises(ValueError, match='entries'):
+            fits.apply([True])
+
+    def test_validation_and_empty(self, fakes):
+        with pytest.raises(ValueError, match='scope'):
+            fitting.fit_paths('imp', [], scope='diameters')
+        fits = fitting.fit_paths('imp', [])
+        assert fits.report['paths'] == 0 and fits.radii.shape == (0,) and fits.offsets.shape == (0, 3)
+        assert fakes.pools == []
+        assert pysnt.tracing.fit_paths is fitting.fit_paths
@@ -0,0 +1,186 @@
+"""
+Tests for chunk prefetching ahead of searches (pysnt.tracing.ChunkPrefetcher).
+
+These tests do not require SNT/Java initialization: the lazily loaded image and
+the searches are faked.
+"""
+
+import sys
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, 'src')
+
+import pysnt
+from pysnt import async_utils
+from pysnt.tracing import batch, prefetch
+from pysnt.tracing.prefetch import ChunkPrefetcher
+
+
+class FakeAccess:
+    def __init__(self, image):
+        self.image, self.position = image, [0, 0, 0]
+
+    def setPosition(self, value, d):
+        self.position[d] = value
+
+    def get(self):
+        self.image.gate.wait(5)
+        with self.image.lock:
+            self.image.reads.append(tuple(self.position))
+
+
+class FakeCellImg:
+    """CachedCellImg stand-in recording the voxels read through random accesses."""
+
+    def __init__(self, dims, cells):
+        self.dims, self.cells = dims, cells
+        self.reads, self.lock, self.gate = [], threading.Lock(), threading.Event()
+        self.gate.set()
+
+    def numDimensions(self):
+        return len(self.dims)
+
+    def dimension(self, d):
+        return self.dims[d]
+
+    def getCellGrid(self):
+        return SimpleNamespace(numDimensions=lambda: len(self.cells), cellDimension=lambda d: self.cells[d])
+
+    def randomAccess(self):
+        return FakeAccess(self)
+
+
+class FakeImgPlus:
+    def __init__(self, img):
+        self.img = img
+
+    def numDimensions(self):
+        return self.img.numDimensions()
+
+    def dimension(self, d):
+        return self.img.dimension(d)
+
+    def getImg(self):
+        return self.img
+
+    def randomAccess(self):
+        return self.img.randomAccess()
+
+
+class FakeSearch:
+    def __init__(self):
+        self.listeners = []
+
+    def addProgressListener(self, listener):
+        self.listeners.append(listener)
+
+
+@pytest.fixture
+def image():
+    return FakeCellImg((512, 512, 64), (64, 64, 16))
+
+
+def loaded(prefetcher, image):
+    prefetcher.close()
+    return {tuple(p // c for p, c in zip(read, image.cells)) for read in image.reads}
+
+
+class TestChunkPrefetcher:
+    """Test chunk selection, the bounded queue and frontier-driven prefetching."""
+
+    def test_chunk_shape_from_cell_grid(self, image):
+        prefetcher = ChunkPrefetcher(FakeImgPlus(image), workers=1)
+        assert prefetcher.chunk_shape == (64, 64, 16)
+        assert prefetcher.chunk_of((130, 10, 40)) == (2, 0, 2)
+        prefetcher.close()
+        assert ChunkPrefetcher(SimpleNamespace(numDimensions=lambda: 2, dimension=lambda d: 100),
+                               workers=1).chunk_shape == (64, 64)
+        with pytest.raises(ValueError, match='positive'):
+            ChunkPrefetcher(image, chunk_shape=(64, 0, 16))
+
+    def test_chunks_along_line(self, image):
+        prefetcher = ChunkPrefetcher(image, corridor=0, workers=1)
+        chunks = prefetcher.chunks_along((10, 10, 2), (500, 10, 2))
+        assert chunks == [(x, 0, 0) for x in range(8)]
+        assert prefetcher.chunks_along((10, 10, 2), (500, 10, 2), near=200, far=300) == [(3, 0, 0), (4, 0, 0)]
+        # Corridor chunks are clipped to the grid, line chunks come first
+        prefetcher.corridor = 1
+        chunks = prefetcher.chunks_along((10, 10, 2), (10, 10, 2))
+        assert chunks[0] == (0, 0, 0) and len(chunks) == 8
+        prefetcher.close()
+
+    def test_loads_each_chunk_once(self, image):
+        prefetcher = ChunkPrefetcher(image, corridor=0, workers=2)
+        chunks = [(0, 0, 0), (1, 0, 0), (0, 0, 0)]
+        assert prefetcher.prefetch(chunks) == 2
+        prefetcher._pool.shutdown(wait=True)
+        assert sorted(image.reads) == [(0, 0, 0), (64, 0, 0)]
+        stats = prefetcher.stats()
+        assert stats['loaded'] == 2 and stats['skipped'] == 1 and stats['pending'] == 0
+
+    def test_bounded_queue(self, image):
+        image.gate.clear()  # loads block until released
+        prefetcher = ChunkPrefetcher(image, max_chunks=3, workers=1)
+        assert prefetcher.prefetch([(x, 0, 0) for x in range(5)]) == 3
+        assert prefetcher.stats()['dropped'] == 2
+        image.gate.set()
+        assert loaded(prefetcher, image) == {(0, 0, 0), (1, 0, 0), (2, 0, 0)}
+        assert prefetcher.prefetch([(4, 0, 0)]) == 0  # closed
+
+    def test_close_without_cancel_futures(self, image):
+        # Python 3.8: ThreadPoolExecutor.shutdown() has no cancel_futures argument
+        image.gate.clear()
+        prefetcher = ChunkPrefetcher(image, workers=1)
+        prefetcher.prefetch([(x, 0, 0) for x in range(3)])
+        shutdown = prefetcher._pool.shutdown
+        with patch.object(async_utils.sys, 'version_info', (3, 8)), \
+                patch.object(prefetcher._pool, 'shutdown', side_effect=lambda wait=True: shutdown(wait=wait)):
+            prefetcher.close(wait=False)
+        image.gate.set()
+        prefetcher._pool.shutdown(wait=True)
+        assert len(image.reads) <= 1  # queued chunks were discarded
+
+    def test_watch_follows_frontier(self, image):
+        search = FakeSearch()
+        with patch.object(prefetch, '_progress_listener', side_effect=lambda callback: callback):
+            prefetcher = ChunkPrefetcher(image, corridor=0, lookahead=1, workers=1)
+            on_progress = prefetcher.watch(search, (0, 0, 0), (511, 0, 0))
+            assert search.listeners == [on_progress]
+            initial = prefetcher.stats()['requested']
+            # ~270k explored voxels: frontier radius ~40 voxels, so chunks up to ~104 voxels away
+            on_progress(20000, 250000)
+        assert prefetcher.stats()['requested'] > initial
+        assert loaded(prefetcher, image) == {(0, 0, 0), (1, 0, 0)}
+
+    def test_watch_bidirectional_and_without_listener(self, image):
+        prefetcher = ChunkPrefetcher(image, corridor=0, lookahead=1, workers=1)
+        assert prefetcher.watch(SimpleNamespace(), (0, 0, 0), (511, 0, 0), bidirectional=True) is None
+        assert loaded(prefetcher, image) == {(0, 0, 0), (1, 0, 0), (7, 0, 0), (6, 0, 0)}
+
+    def test_trace_batch_prefetch(self, image):
+        searches = []
+
+        def factory(*args):
+            def new_search(start, goal):
+                searches.append(SimpleNamespace(run=lambda: None, getResult=lambda: None,
+                                                pointsConsideredInSearch=lambda: 1,
+                                                addProgressListener=lambda listener: None))
+                return searches[-1]
+            return new_search
+
+        def new_pool(workers):
+            return SimpleNamespace(submit=lambda search: SimpleNamespace(get=search.run), shutdownNow=lambda: None)
+
+        with patch.object(batch, '_search_inputs', side_effect=lambda image, calibration: (image, calibration)), \
+                patch.object(batch, '_search_factory', side_effect=factory), \
+                patch.object(batch, '_new_java_pool', side_effect=new_pool), \
+                patch.object(prefetch, '_progress_listener', side_effect=lambda callback: callback):
+            _, report = batch.trace_batch(image, [[10, 10, 2]], [[500, 10, 2]], cost=1, heuristic=1,
+                                          prefetch=True, return_report=True)
+        assert len(searches) == 1
+        assert report['prefetch']['requested'] > 0
+        assert pysnt.tracing.ChunkPrefetcher is ChunkPrefetcher
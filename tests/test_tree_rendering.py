@@ -0,0 +1,112 @@
+"""
+Tests for bulk Tree array extraction and the native LineCollection renderer.
+
+These tests do not require SNT/Java initialization.
+"""
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, 'src')
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+import pysnt
+from pysnt.converters import tree_converters
+from pysnt.converters.tree_converters import _arrays_from_swc_table, _extract_tree_arrays
+from pysnt.display.visual_display import _tree_node_metric, _trees_to_segment_data
+
+# id, parent, type, x, y, z, radius: a root with two branches (ids are non-contiguous)
+SWC_TABLE = np.array([
+    [1, -1, 1, 0.0, 0.0, 0.0, 2.0],
+    [5, 1, 3, 3.0, 4.0, 0.0, 1.0],
+    [7, 5, 3, 3.0, 4.0, 2.0, 1.0],
+    [9, 1, 2, 0.0, 0.0, 5.0, 0.5],
+])
+
+
+def _mock_tree(table):
+    tree = Mock()
+    tree.getNodesAsSWCPoints.return_value = [
+        SimpleNamespace(id=r[0], parent=r[1], type=r[2], x=r[3], y=r[4], z=r[5], radius=r[6]) for r in table
+    ]
+    return tree
+
+
+class TestTreeArrays:
+    """Test node/segment array extraction."""
+
+    def test_parent_indices_and_segments(self):
+        arrays = _arrays_from_swc_table(SWC_TABLE)
+        assert arrays['parent'].tolist() == [-1, 0, 1, 0]
+        assert arrays['segments'].tolist() == [[0, 1], [1, 2], [0, 3]]
+        assert arrays['xyz'].shape == (4, 3)
+
+    def test_extract_from_swc_points(self):
+        arrays = _extract_tree_arrays(_mock_tree(SWC_TABLE))
+        np.testing.assert_allclose(arrays['radius'], SWC_TABLE[:, 6])
+        assert arrays['type'].tolist() == [1, 3, 3, 2]
+
+    def test_extract_packed_on_jvm(self):
+        # Fields are copied in one transfer when the Groovy packer is available
+        tree = _mock_tree(SWC_TABLE)
+        packer = SimpleNamespace(call=lambda t: SWC_TABLE.ravel().tolist())
+        with patch.object(tree_converters, '_get_swc_packer', return_value=packer):
+            arrays = _extract_tree_arrays(tree)
+        tree.getNodesAsSWCPoints.assert_not_called()
+        assert arrays['parent'].tolist() == [-1, 0, 1, 0]
+        np.testing.assert_allclose(arrays['xyz'], SWC_TABLE[:, 3:6])
+
+    def test_empty_tree(self):
+        arrays = _arrays_from_swc_table(np.empty((0, 7)))
+        assert arrays['segments'].shape == (0, 2)
+
+
+class TestSegmentData:
+    """Test projection, metrics and widths."""
+
+    def test_projection(self):
+        arrays = _arrays_from_swc_table(SWC_TABLE)
+        segments, _, _, _ = _trees_to_segment_data([arrays], projection='zy')
+        np.testing.assert_allclose(segments[1], [[0.0, 4.0], [2.0, 4.0]])
+        with pytest.raises(ValueError):
+            _trees_to_segment_data([arrays], projection='yx')
+
+    def test_path_distance_metric(self):
+        arrays = _arrays_from_swc_table(SWC_TABLE)
+        np.testing.assert_allclose(_tree_node_metric(arrays, 'path_distance'), [0.0, 5.0, 7.0, 5.0])
+
+    def test_values_widths_and_tree_index(self):
+        arrays = _arrays_from_swc_table(SWC_TABLE)
+        segments, values, widths, tree_index = _trees_to_segment_data(
+            [arrays, arrays], color_by='z', linewidth=2.0, width_by_radius=True)
+        assert segments.shape == (6, 2, 2)
+        assert values.tolist() == [0.0, 2.0, 5.0] * 2
+        assert tree_index.tolist() == [0, 0, 0, 1, 1, 1]
+        assert widths.shape == (6,)
+
+
+class TestPlotTrees:
+    """Test the public plot_trees() API."""
+
+    def test_overlay_single_collection(self):
+        arrays = _arrays_from_swc_table(SWC_TABLE)
+        fig = pysnt.plot_trees([arrays, arrays], color_by='radius')
+        collections = [c for c in fig.axes[0].collections if isinstance(c, LineCollection)]
+        assert len(collections) == 1
+        assert len(collections[0].get_segments()) == 6
+        plt.close(fig)
+
+    def test_panels(self):
+        arrays = _arrays_from_swc_table(SWC_TABLE)
+        fig = pysnt.plot_trees([arrays] * 3, projection='xz', overlay=False, titles=['a', 'b', 'c'])
+        visible = [ax for ax in fig.axes if ax.get_visible() and ax.collections]
+        assert len(visible) == 3
+        plt.close(fig)